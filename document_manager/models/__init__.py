@@ -4,7 +4,7 @@ Models for the document manager pillar.
 This module defines the document data model classes used throughout the application.
 """
 
-from document_manager.models.document import Document, DocumentType
+from document_manager.models.document import Document, DocumentSummary, DocumentType
 from document_manager.models.document_category import DocumentCategory
 from document_manager.models.qgem_document import QGemDocument, QGemDocumentType
 from document_manager.models.kwic_concordance import (
@@ -18,6 +18,7 @@ from document_manager.models.kwic_concordance import (
 
 __all__ = [
     "Document",
+    "DocumentSummary",
     "DocumentType",
     "DocumentCategory",
     "QGemDocument",
@@ -6,6 +6,7 @@ It is responsible for representing documents and their metadata within the appli
 
 Key components:
 - Document: Core model class representing a document with metadata and content
+- DocumentSummary: Listing view of a document without its text
 - DocumentType: Enum representing supported document types
 
 Dependencies:
@@ -16,14 +17,32 @@ Dependencies:
 """
 
 import uuid
+from bisect import bisect_right
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Dict, Optional, Set, TypeVar, Union
+from typing import Dict, List, Optional, Set, TypeVar, Union
 
 from pydantic import BaseModel, Field
 
 
+def format_file_size(size_bytes: int) -> str:
+    """Format a file size for display.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Human-readable file size (e.g., '2.5 MB')
+    """
+    size_float = float(size_bytes)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size_float < 1024 or unit == "TB":
+            break
+        size_float /= 1024
+    return f"{size_float:.2f} {unit}"
+
+
 class ExtractionStatus(Enum):
     """Status of text extraction for a document."""
 
@@ -115,13 +134,14 @@ class Document(BaseModel):
     author: Optional[str] = None
     page_count: Optional[int] = None
     word_count: Optional[int] = None
-    metadata: Dict[str, Union[str, int, float, bool, None]] = Field(
+    metadata: Dict[str, Union[str, int, float, bool, None, List[int]]] = Field(
         default_factory=dict
     )
 
     # Integrity status
     document_extraction_status: ExtractionStatus = ExtractionStatus.NOT_STARTED
     checksum: Optional[str] = None
+    source_path: Optional[str] = None
     integrity_status: str = "UNKNOWN"
 
     class Config:
@@ -170,12 +190,23 @@ class Document(BaseModel):
         Returns:
             Human-readable file size (e.g., '2.5 MB')
         """
-        size_float = float(self.size_bytes)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_float < 1024 or unit == "TB":
-                break
-            size_float /= 1024
-        return f"{size_float:.2f} {unit}"
+        return format_file_size(self.size_bytes)
+
+    def page_number_at(self, position: int) -> Optional[int]:
+        """Get the page containing a character position of the content.
+
+        Uses the page start offsets recorded during PDF extraction.
+
+        Args:
+            position: Character offset in the document content
+
+        Returns:
+            1-based page number, or None if no page offsets are recorded
+        """
+        offsets = self.metadata.get("page_offsets")
+        if not isinstance(offsets, list) or not offsets or position < 0:
+            return None
+        return max(1, bisect_right(offsets, position))
 
     def is_text_extracted(self) -> bool:
         """Check if text has been extracted from the document.
@@ -233,3 +264,35 @@ class Document(BaseModel):
     def is_memory_document(self) -> bool:
         """Check if this is a memory document (no file)."""
         return self.file_type == DocumentType.MEMORY
+
+
+class DocumentSummary(BaseModel):
+    """Listing view of a document.
+
+    Holds what document lists and tables show, without the content,
+    extracted text and metadata, so thousands of documents can be listed
+    cheaply. Open the full Document by ID when its text is needed.
+    """
+
+    id: str
+    name: str
+    file_type: DocumentType
+    size_bytes: int
+    creation_date: datetime
+    last_modified_date: datetime
+    tags: Set[str] = Field(default_factory=set)
+    category: Optional[str] = None
+    author: Optional[str] = None
+    page_count: Optional[int] = None
+    word_count: Optional[int] = None
+
+    # Matching text with <b> highlights, set by full-text searches
+    snippet: Optional[str] = None
+
+    def get_file_size_display(self) -> str:
+        """Get human-readable file size.
+
+        Returns:
+            Human-readable file size (e.g., '2.5 MB')
+        """
+        return format_file_size(self.size_bytes)
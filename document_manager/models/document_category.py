@@ -121,15 +121,10 @@ class DocumentCategory(BaseModel):
         if self.parent_id is None:
             return [self]
 
-        # This needs to be done with a list of all categories
-        # For simplicity, use the service to get all categories
+        # The service looks the ancestors up in one recursive query
         from document_manager.services.category_service import CategoryService
 
-        service = CategoryService()
-        all_categories = service.get_all_categories()
-
-        # Use the helper function to get the path
-        return get_path_to_category(self.id, all_categories)
+        return CategoryService().get_category_path(self.id)
 
     def get_descendant_ids(self) -> Set[str]:
         """Get all descendant category IDs.
@@ -137,15 +132,11 @@ class DocumentCategory(BaseModel):
         Returns:
             Set of category IDs that are descendants of this category
         """
-        # This needs to be done with a list of all categories
-        # For simplicity, use the service to get all categories
+        # The service looks the descendants up in one recursive query
         from document_manager.services.category_service import CategoryService
 
         service = CategoryService()
-        all_categories = service.get_all_categories()
-
-        # Use the helper function to get descendant IDs
-        return get_all_descendant_ids(self.id, all_categories)
+        return {category.id for category in service.get_descendant_categories(self.id)}
 
 
 class CategoryHierarchy:
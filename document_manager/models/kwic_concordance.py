@@ -157,6 +157,7 @@ class ConcordanceExportFormat(BaseModel):
     group_by_keyword: bool = Field(default=False, description="Whether to group by keyword")
     group_by_document: bool = Field(default=False, description="Whether to group by document")
     custom_delimiter: Optional[str] = Field(None, description="Custom delimiter for text formats")
+    compress: bool = Field(default=False, description="Whether to gzip-compress exported files")
     
     @validator('format_type')
     def format_type_must_be_valid(cls, v):
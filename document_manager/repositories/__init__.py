@@ -7,5 +7,11 @@ This module provides repository classes for document data persistence.
 from document_manager.repositories.concordance_repository import ConcordanceRepository
 from document_manager.repositories.document_repository import DocumentRepository
 from document_manager.repositories.category_repository import CategoryRepository
+from document_manager.repositories.token_index_repository import TokenIndexRepository
 
-__all__ = ["ConcordanceRepository", "DocumentRepository", "CategoryRepository"]
+__all__ = [
+    "ConcordanceRepository",
+    "DocumentRepository",
+    "CategoryRepository",
+    "TokenIndexRepository",
+]
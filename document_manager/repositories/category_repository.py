@@ -14,11 +14,30 @@ Dependencies:
 
 import json
 import sqlite3
+from pathlib import Path
 from typing import Any, Dict, List, Optional, TypedDict, cast
 
 from loguru import logger
 
 from document_manager.models.document_category import DocumentCategory
+from shared.repositories.database import track_connection
+
+
+# Number of category edits per database file (by resolved path), shared by
+# every repository on it, so that cached hierarchies can tell when they are
+# out of date
+_revisions: Dict[str, int] = {}
+
+
+# Recursive CTE naming a category (bound to the first parameter) and all of
+# its descendants "subtree"; UNION stops on a cycle in the parent links
+_SUBTREE_CTE = """
+subtree(id) AS (
+    SELECT ?
+    UNION
+    SELECT c.id FROM document_categories c JOIN subtree s ON c.parent_id = s.id
+)
+"""
 
 
 class CategoryRow(TypedDict):
@@ -43,6 +62,9 @@ class CategoryRepository:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # Relative and absolute spellings of a path share one revision
+        self._revision_key = str(Path(db_path).resolve())
+        _revisions.setdefault(self._revision_key, 0)
 
         # Initialize database
         self._init_db()
@@ -83,6 +105,19 @@ class CategoryRepository:
         if self.get_count() == 0:
             self._create_default_categories()
 
+    @property
+    def revision(self) -> int:
+        """Get the edit count of the categories in this database.
+
+        Returns:
+            Number that changes whenever a category is saved or deleted
+        """
+        return _revisions[self._revision_key]
+
+    def _bump_revision(self) -> None:
+        """Record that the categories in this database have changed."""
+        _revisions[self._revision_key] += 1
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection.
 
@@ -91,7 +126,7 @@ class CategoryRepository:
         """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        return conn
+        return track_connection(conn)
 
     def _category_to_row(self, category: DocumentCategory) -> CategoryRow:
         """Convert DocumentCategory object to database row.
@@ -187,6 +222,7 @@ class CategoryRepository:
                 )
 
             conn.commit()
+            self._bump_revision()
             return True
         except Exception as e:
             logger.error(f"Error saving category: {e}")
@@ -233,6 +269,29 @@ class CategoryRepository:
 
         return categories
 
+    def get_tree_rows(self) -> List[Dict[str, Any]]:
+        """Get the columns needed to display the category tree.
+
+        Skips building category objects, which dominates the cost of
+        loading large taxonomies.
+
+        Returns:
+            List of dictionaries with id, name, color, description, icon and
+            parent_id of every category, ordered by name
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT id, name, color, description, icon, parent_id "
+            "FROM document_categories ORDER BY name"
+        )
+
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+
+        return rows
+
     def get_root_categories(self) -> List[DocumentCategory]:
         """Get all root categories (categories without a parent).
 
@@ -273,6 +332,114 @@ class CategoryRepository:
 
         return categories
 
+    def get_ancestors(self, category_id: str) -> List[DocumentCategory]:
+        """Get a category and its ancestors in one recursive query.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            List of categories from the root to the given category
+            (inclusive), or an empty list if the category does not exist
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # The depth limit stops the walk on a cycle in the parent links, and
+        # each category is kept once, at the depth it was first reached
+        cursor.execute(
+            """
+            WITH RECURSIVE ancestors(id, parent_id, depth) AS (
+                SELECT id, parent_id, 0 FROM document_categories WHERE id = ?
+                UNION ALL
+                SELECT c.id, c.parent_id, a.depth + 1
+                FROM document_categories c JOIN ancestors a ON c.id = a.parent_id
+                WHERE a.depth < (SELECT COUNT(*) FROM document_categories)
+            )
+            SELECT c.*
+            FROM (SELECT id, MIN(depth) AS depth FROM ancestors GROUP BY id) a
+            JOIN document_categories c ON c.id = a.id
+            ORDER BY a.depth DESC
+            """,
+            (category_id,),
+        )
+
+        categories = [self._row_to_category(row) for row in cursor.fetchall()]
+        conn.close()
+
+        return categories
+
+    def get_descendants(self, category_id: str) -> List[DocumentCategory]:
+        """Get all descendants of a category in one recursive query.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            List of the categories below the given one (exclusive), by name
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            f"""
+            WITH RECURSIVE {_SUBTREE_CTE}
+            SELECT c.* FROM document_categories c
+            WHERE c.id IN (SELECT id FROM subtree) AND c.id != ?
+            ORDER BY c.name
+            """,
+            (category_id, category_id),
+        )
+
+        categories = [self._row_to_category(row) for row in cursor.fetchall()]
+        conn.close()
+
+        return categories
+
+    def count_subtree_documents(self, category_id: str) -> int:
+        """Count the documents in a category and all of its descendants.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Number of documents (not in the trash) filed under the subtree
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                f"""
+                WITH RECURSIVE {_SUBTREE_CTE}
+                SELECT COUNT(*) AS count FROM documents
+                WHERE is_deleted = 0 AND category IN (SELECT id FROM subtree)
+                """,
+                (category_id,),
+            )
+            return int(cursor.fetchone()["count"])
+        except sqlite3.OperationalError as e:
+            # No documents table in this database
+            logger.error(f"Error counting category documents: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def delete_all(self) -> int:
+        """Delete every category, including the default ones.
+
+        Returns:
+            Number of categories deleted
+        """
+        conn = self._get_connection()
+        try:
+            with conn:
+                cursor = conn.execute("DELETE FROM document_categories")
+            self._bump_revision()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
     def delete(self, category_id: str) -> bool:
         """Delete a category.
 
@@ -308,6 +475,7 @@ class CategoryRepository:
             )
 
             conn.commit()
+            self._bump_revision()
             return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Error deleting category: {e}")
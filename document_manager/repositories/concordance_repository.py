@@ -8,7 +8,9 @@ using SQLite database operations.
 import json
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
 
 from document_manager.models.kwic_concordance import (
     ConcordanceEntry,
@@ -16,7 +18,78 @@ from document_manager.models.kwic_concordance import (
     ConcordanceSettings,
     ConcordanceTable,
 )
-from shared.repositories.database import Database
+from shared.repositories.database import Database, track_connection
+
+# Columns of a concordance entry row, in the order entry_row produces them
+ENTRY_COLUMNS = (
+    'id', 'keyword', 'left_context', 'right_context', 'position',
+    'line_number', 'sentence_number', 'paragraph_number',
+    'document_id', 'document_name', 'created_at'
+)
+
+EntryRow = Tuple
+
+# Entry orders of iter_concordance_entries; ties keep the default order
+ENTRY_ORDERS = {
+    None: 'keyword, position',
+    'keyword': 'py_lower(keyword), keyword, position',
+    'document': 'document_name, keyword, position'
+}
+
+# Entries fetched at a time when iterating over a table
+ENTRY_CHUNK_SIZE = 1000
+
+# Keyset orders for paging through the entries of a table. With the table ID
+# in front, each is the prefix of an index, and each identifies an entry
+# within its table (a keyword is found at most once per document position).
+ENTRY_SORT_KEYS = {
+    'keyword': ('keyword', 'document_id', 'position'),
+    'document': ('document_name', 'document_id', 'position', 'keyword'),
+    'position': ('position', 'document_id', 'keyword')
+}
+
+# Full-text index over entry contexts. Index rows are linked to entries
+# through concordance_entries_fts_rows, whose INTEGER PRIMARY KEY keeps its
+# values across VACUUM (the implicit rowid of concordance_entries does not).
+# The index is contentless, since contexts are always read from the entries.
+# It is kept in sync by the repository's own writes rather than by triggers:
+# FTS5 indexes rows added in bulk many times faster than one row at a time.
+ENTRY_FTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS concordance_entries_fts_rows (
+    id INTEGER PRIMARY KEY,
+    entry_id TEXT NOT NULL UNIQUE
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS concordance_entries_fts USING fts5(
+    left_context, right_context,
+    content = '',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def entry_row(entry: ConcordanceEntry) -> EntryRow:
+    """Convert a concordance entry to a row for add_concordance_entries.
+    
+    Args:
+        entry: The entry to convert
+        
+    Returns:
+        Tuple of the entry's values in ENTRY_COLUMNS order
+    """
+    return (
+        entry.id,
+        entry.keyword,
+        entry.left_context,
+        entry.right_context,
+        entry.position,
+        entry.line_number,
+        entry.sentence_number,
+        entry.paragraph_number,
+        entry.document_id,
+        entry.document_name,
+        entry.created_at.isoformat()
+    )
 
 
 class ConcordanceRepository:
@@ -45,7 +118,7 @@ class ConcordanceRepository:
             # For testing - create direct connection
             conn = sqlite3.connect(self._db_path)
             conn.execute("PRAGMA foreign_keys = ON")
-            return conn
+            return track_connection(conn)
         else:
             # Use shared database connection
             return self.db.connection()
@@ -91,28 +164,63 @@ class ConcordanceRepository:
                 )
             """)
             
-            # Create indexes for better performance
+            # Create indexes for better performance. Entries are always looked
+            # up within a table, so the composite indexes start with its ID and
+            # continue with the columns of one of the ENTRY_SORT_KEYS orders
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_concordance_entries_keyword 
-                ON concordance_entries (keyword)
+                CREATE INDEX IF NOT EXISTS idx_concordance_entries_table_keyword
+                ON concordance_entries (concordance_table_id, keyword, document_id, position)
             """)
             
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_concordance_entries_document 
-                ON concordance_entries (document_id)
+                CREATE INDEX IF NOT EXISTS idx_concordance_entries_table_document
+                ON concordance_entries
+                (concordance_table_id, document_name, document_id, position, keyword)
             """)
             
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_concordance_entries_position 
-                ON concordance_entries (position)
+                CREATE INDEX IF NOT EXISTS idx_concordance_entries_table_position
+                ON concordance_entries (concordance_table_id, position, document_id, keyword)
             """)
             
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_concordance_entries_table 
-                ON concordance_entries (concordance_table_id)
+                CREATE INDEX IF NOT EXISTS idx_concordance_entries_document 
+                ON concordance_entries (document_id)
             """)
             
+            # Single-column indexes superseded by the composite ones
+            for index in ('keyword', 'position', 'table'):
+                cursor.execute(f"DROP INDEX IF EXISTS idx_concordance_entries_{index}")
+            
             conn.commit()
+            
+            self.full_text_search = self._init_search_index(conn)
+    
+    def _init_search_index(self, conn) -> bool:
+        """Create the full-text index of entry contexts, filling it if new.
+        
+        Args:
+            conn: Open database connection
+            
+        Returns:
+            True if full-text search is available, False if SQLite lacks FTS5
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'concordance_entries_fts'"
+        ).fetchone()
+        
+        try:
+            conn.executescript(ENTRY_FTS_SCHEMA)
+            if not exists:
+                self._begin(conn)
+                self._index_entries(conn.cursor(), 0)
+                conn.commit()
+            return True
+        except sqlite3.OperationalError as e:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.warning(f"Concordance context search unavailable, using LIKE: {e}")
+            return False
     
     def save_concordance_table(self, table: ConcordanceTable) -> str:
         """Save a concordance table to the database.
@@ -124,29 +232,10 @@ class ConcordanceRepository:
             The ID of the saved table
         """
         with self.get_connection() as conn:
+            self._begin(conn)
             cursor = conn.cursor()
             
-            # Update the updated_at timestamp
-            table.updated_at = datetime.now()
-            
-            # Insert or update the concordance table
-            cursor.execute("""
-                INSERT OR REPLACE INTO concordance_tables 
-                (id, name, description, keywords, document_ids, settings, 
-                 created_at, updated_at, created_by, tags)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                table.id,
-                table.name,
-                table.description,
-                json.dumps(table.keywords),
-                json.dumps(table.document_ids),
-                table.settings.json(),
-                table.created_at.isoformat(),
-                table.updated_at.isoformat(),
-                table.created_by,
-                json.dumps(table.tags)
-            ))
+            self._save_table_row(cursor, table)
             
             # Delete existing entries for this table
             cursor.execute("""
@@ -154,36 +243,153 @@ class ConcordanceRepository:
             """, (table.id,))
             
             # Insert all entries
-            for entry in table.entries:
-                cursor.execute("""
-                    INSERT INTO concordance_entries 
-                    (id, concordance_table_id, keyword, left_context, right_context,
-                     position, line_number, sentence_number, paragraph_number,
-                     document_id, document_name, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    entry.id,
-                    table.id,
-                    entry.keyword,
-                    entry.left_context,
-                    entry.right_context,
-                    entry.position,
-                    entry.line_number,
-                    entry.sentence_number,
-                    entry.paragraph_number,
-                    entry.document_id,
-                    entry.document_name,
-                    entry.created_at.isoformat()
-                ))
+            self._insert_entries(
+                cursor, table.id, (entry_row(entry) for entry in table.entries)
+            )
             
             conn.commit()
             return table.id
     
-    def get_concordance_table(self, table_id: str) -> Optional[ConcordanceTable]:
+    def create_concordance_table(self, table: ConcordanceTable) -> str:
+        """Save a concordance table's metadata without touching its entries.
+        
+        Used when entries are generated in batches and added with
+        add_concordance_entries as they arrive.
+        
+        Args:
+            table: The concordance table to save (its entries are ignored)
+            
+        Returns:
+            The ID of the saved table
+        """
+        with self.get_connection() as conn:
+            self._begin(conn)
+            self._save_table_row(conn.cursor(), table)
+            conn.commit()
+            return table.id
+    
+    def add_concordance_entries(self, table_id: str, rows: Iterable[EntryRow]) -> int:
+        """Insert a batch of concordance entries in one transaction.
+        
+        Args:
+            table_id: ID of the table the entries belong to
+            rows: Entry rows in ENTRY_COLUMNS order (see entry_row)
+            
+        Returns:
+            Number of entries inserted
+        """
+        with self.get_connection() as conn:
+            self._begin(conn)
+            count = self._insert_entries(conn.cursor(), table_id, rows)
+            conn.commit()
+            return count
+    
+    @staticmethod
+    def _begin(conn) -> None:
+        """Open a transaction (the shared connection is in autocommit mode)."""
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+    
+    def _save_table_row(self, cursor, table: ConcordanceTable) -> None:
+        """Insert or replace the metadata row of a concordance table."""
+        # Replacing the row deletes the table's entries by CASCADE
+        self._unindex_entries(cursor, table.id)
+        
+        # Update the updated_at timestamp
+        table.updated_at = datetime.now()
+        
+        cursor.execute("""
+            INSERT OR REPLACE INTO concordance_tables 
+            (id, name, description, keywords, document_ids, settings, 
+             created_at, updated_at, created_by, tags)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            table.id,
+            table.name,
+            table.description,
+            json.dumps(table.keywords),
+            json.dumps(table.document_ids),
+            table.settings.json(),
+            table.created_at.isoformat(),
+            table.updated_at.isoformat(),
+            table.created_by,
+            json.dumps(table.tags)
+        ))
+    
+    def _insert_entries(self, cursor, table_id: str, rows: Iterable[EntryRow]) -> int:
+        """Insert entry rows for a table and return how many were inserted."""
+        # New rows get rowids above the current maximum
+        last_rowid = cursor.execute(
+            "SELECT COALESCE(MAX(rowid), 0) FROM concordance_entries"
+        ).fetchone()[0]
+        
+        cursor.executemany(f"""
+            INSERT INTO concordance_entries 
+            (concordance_table_id, {', '.join(ENTRY_COLUMNS)})
+            VALUES (?, {', '.join('?' * len(ENTRY_COLUMNS))})
+        """, ((table_id, *row) for row in rows))
+        count = cursor.rowcount
+        
+        if self.full_text_search:
+            self._index_entries(cursor, last_rowid)
+        return count
+    
+    @staticmethod
+    def _index_entries(cursor, after_rowid: int) -> None:
+        """Add the contexts of entries to the full-text index in bulk.
+        
+        Args:
+            cursor: Cursor of the open transaction
+            after_rowid: Index entries whose rowid is greater than this
+        """
+        cursor.execute("""
+            INSERT INTO concordance_entries_fts_rows (entry_id)
+            SELECT id FROM concordance_entries WHERE rowid > ? ORDER BY rowid
+        """, (after_rowid,))
+        cursor.execute("""
+            INSERT INTO concordance_entries_fts (rowid, left_context, right_context)
+            SELECT r.id, e.left_context, e.right_context
+            FROM concordance_entries e
+            JOIN concordance_entries_fts_rows r ON r.entry_id = e.id
+            WHERE e.rowid > ?
+        """, (after_rowid,))
+    
+    def _unindex_entries(self, cursor, table_id: str) -> None:
+        """Remove the entries of a table from the full-text index.
+        
+        Must run before the entries themselves are deleted, because a
+        contentless index needs the indexed values to remove a row.
+        
+        Args:
+            cursor: Cursor of the open transaction
+            table_id: ID of the table whose entries are removed
+        """
+        if not self.full_text_search:
+            return
+        
+        cursor.execute("""
+            INSERT INTO concordance_entries_fts
+            (concordance_entries_fts, rowid, left_context, right_context)
+            SELECT 'delete', r.id, e.left_context, e.right_context
+            FROM concordance_entries e
+            JOIN concordance_entries_fts_rows r ON r.entry_id = e.id
+            WHERE e.concordance_table_id = ?
+        """, (table_id,))
+        cursor.execute("""
+            DELETE FROM concordance_entries_fts_rows WHERE entry_id IN (
+                SELECT id FROM concordance_entries WHERE concordance_table_id = ?
+            )
+        """, (table_id,))
+    
+    def get_concordance_table(
+        self, table_id: str, include_entries: bool = True
+    ) -> Optional[ConcordanceTable]:
         """Retrieve a concordance table by ID.
         
         Args:
             table_id: The ID of the table to retrieve
+            include_entries: Whether to load the entries; without them the
+                table only carries its metadata (see iter_concordance_entries)
             
         Returns:
             The concordance table if found, None otherwise
@@ -203,15 +409,17 @@ class ConcordanceRepository:
                 return None
             
             # Get all entries for this table
-            cursor.execute("""
-                SELECT id, keyword, left_context, right_context, position,
-                       line_number, sentence_number, paragraph_number,
-                       document_id, document_name, created_at
-                FROM concordance_entries WHERE concordance_table_id = ?
-                ORDER BY keyword, position
-            """, (table_id,))
-            
-            entry_rows = cursor.fetchall()
+            entry_rows = []
+            if include_entries:
+                cursor.execute("""
+                    SELECT id, keyword, left_context, right_context, position,
+                           line_number, sentence_number, paragraph_number,
+                           document_id, document_name, created_at
+                    FROM concordance_entries WHERE concordance_table_id = ?
+                    ORDER BY keyword, position
+                """, (table_id,))
+                
+                entry_rows = cursor.fetchall()
             
             # Build the concordance table object
             entries = []
@@ -251,6 +459,76 @@ class ConcordanceRepository:
             
             return table
     
+    def iter_concordance_entries(
+        self,
+        table_id: str,
+        group_by: Optional[str] = None,
+        chunk_size: int = ENTRY_CHUNK_SIZE
+    ) -> Iterator[ConcordanceEntry]:
+        """Iterate over the entries of a table without loading them all.
+        
+        Rows are fetched from an open cursor chunk_size at a time, so memory
+        use does not grow with the size of the table.
+        
+        Args:
+            table_id: The ID of the table
+            group_by: None for keyword then position order (as in
+                get_concordance_table), 'keyword' to group keywords regardless
+                of case, or 'document' to group by document name
+            chunk_size: Number of rows fetched at a time
+            
+        Yields:
+            Concordance entries in the requested order
+        """
+        order = ENTRY_ORDERS[group_by]
+        with self.get_connection() as conn:
+            # SQLite's own lower() only folds ASCII letters
+            conn.create_function('py_lower', 1, str.lower, deterministic=True)
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {', '.join(ENTRY_COLUMNS)}
+                FROM concordance_entries WHERE concordance_table_id = ?
+                ORDER BY {order}
+            """, (table_id,))
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_entry(row)
+    
+    def get_entry_statistics(self, table_id: str) -> Dict[str, int]:
+        """Compute entry counts and column widths of a table in the database.
+        
+        Args:
+            table_id: The ID of the table
+            
+        Returns:
+            Dictionary with total_entries, unique_documents, unique_keywords
+            and the longest keyword, left_context, right_context and
+            document_name (as max_<column>_length)
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*), COUNT(DISTINCT document_id), COUNT(DISTINCT keyword),
+                       MAX(length(keyword)), MAX(length(left_context)),
+                       MAX(length(right_context)), MAX(length(document_name))
+                FROM concordance_entries WHERE concordance_table_id = ?
+            """, (table_id,))
+            row = cursor.fetchone()
+            
+            return {
+                'total_entries': row[0],
+                'unique_documents': row[1],
+                'unique_keywords': row[2],
+                'max_keyword_length': row[3] or 0,
+                'max_left_context_length': row[4] or 0,
+                'max_right_context_length': row[5] or 0,
+                'max_document_name_length': row[6] or 0
+            }
+    
     def get_concordance_table_by_name(self, name: str) -> Optional[ConcordanceTable]:
         """Retrieve a concordance table by name.
         
@@ -329,6 +607,8 @@ class ConcordanceRepository:
                 return False
             
             # Delete the table (entries will be deleted by CASCADE)
+            self._begin(conn)
+            self._unindex_entries(cursor, table_id)
             cursor.execute("""
                 DELETE FROM concordance_tables WHERE id = ?
             """, (table_id,))
@@ -343,9 +623,12 @@ class ConcordanceRepository:
     ) -> List[ConcordanceEntry]:
         """Search for concordance entries with optional filtering.
         
+        Large tables are better browsed with get_entries_after, which loads
+        one page of entries at a time.
+        
         Args:
             table_id: Optional table ID to limit search to specific table
-            filter_criteria: Optional filter criteria
+            filter_criteria: Optional filter criteria (see _build_entry_filters)
             
         Returns:
             List of matching concordance entries
@@ -353,87 +636,316 @@ class ConcordanceRepository:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Build the query
-            query = """
-                SELECT ce.id, ce.keyword, ce.left_context, ce.right_context,
-                       ce.position, ce.line_number, ce.sentence_number,
-                       ce.paragraph_number, ce.document_id, ce.document_name,
-                       ce.created_at
+            filters = self._build_entry_filters(cursor, table_id, filter_criteria)
+            if filters is None:
+                return []
+            conditions, params = filters
+            
+            query = f"""
+                SELECT {', '.join(f'ce.{column}' for column in ENTRY_COLUMNS)}
                 FROM concordance_entries ce
             """
-            
-            conditions = []
-            params = []
-            
-            if table_id:
-                conditions.append("ce.concordance_table_id = ?")
-                params.append(table_id)
-            
-            if filter_criteria:
-                if filter_criteria.keywords:
-                    keyword_conditions = " OR ".join(["ce.keyword LIKE ?" for _ in filter_criteria.keywords])
-                    conditions.append(f"({keyword_conditions})")
-                    params.extend([f"%{kw}%" for kw in filter_criteria.keywords])
-                
-                if filter_criteria.document_ids:
-                    doc_conditions = " OR ".join(["ce.document_id = ?" for _ in filter_criteria.document_ids])
-                    conditions.append(f"({doc_conditions})")
-                    params.extend(filter_criteria.document_ids)
-                
-                if filter_criteria.document_names:
-                    name_conditions = " OR ".join(["ce.document_name LIKE ?" for _ in filter_criteria.document_names])
-                    conditions.append(f"({name_conditions})")
-                    params.extend([f"%{name}%" for name in filter_criteria.document_names])
-                
-                if filter_criteria.left_context_contains:
-                    conditions.append("ce.left_context LIKE ?")
-                    params.append(f"%{filter_criteria.left_context_contains}%")
-                
-                if filter_criteria.right_context_contains:
-                    conditions.append("ce.right_context LIKE ?")
-                    params.append(f"%{filter_criteria.right_context_contains}%")
-                
-                if filter_criteria.min_position is not None:
-                    conditions.append("ce.position >= ?")
-                    params.append(filter_criteria.min_position)
-                
-                if filter_criteria.max_position is not None:
-                    conditions.append("ce.position <= ?")
-                    params.append(filter_criteria.max_position)
-                
-                if filter_criteria.date_from:
-                    conditions.append("ce.created_at >= ?")
-                    params.append(filter_criteria.date_from.isoformat())
-                
-                if filter_criteria.date_to:
-                    conditions.append("ce.created_at <= ?")
-                    params.append(filter_criteria.date_to.isoformat())
-            
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
-            
             query += " ORDER BY ce.keyword, ce.position"
             
             cursor.execute(query, params)
+            return [self._row_to_entry(row) for row in cursor.fetchall()]
+    
+    def get_entries_after(
+        self,
+        table_id: str,
+        filter_criteria: Optional[ConcordanceFilter] = None,
+        sort_by: str = 'keyword',
+        descending: bool = False,
+        after: Optional[Tuple] = None,
+        limit: int = 200
+    ) -> Tuple[List[ConcordanceEntry], Optional[Tuple]]:
+        """Get one page of a table's matching entries using keyset pagination.
+        
+        Entries are ordered by one of the ENTRY_SORT_KEYS orders, which are
+        backed by indexes. Instead of an OFFSET, the next page starts right
+        after the key of the last entry of the previous page, so every page
+        costs the same regardless of how deep into the table it is.
+        
+        Args:
+            table_id: The ID of the table
+            filter_criteria: Optional filter criteria
+            sort_by: 'keyword', 'document' or 'position'
+            descending: Whether to sort in descending order
+            after: Key of the last entry of the previous page, or None for
+                the first page
+            limit: Maximum number of entries to return
             
-            entries = []
-            for row in cursor.fetchall():
-                entry = ConcordanceEntry(
-                    id=row[0],
-                    keyword=row[1],
-                    left_context=row[2],
-                    right_context=row[3],
-                    position=row[4],
-                    line_number=row[5],
-                    sentence_number=row[6],
-                    paragraph_number=row[7],
-                    document_id=row[8],
-                    document_name=row[9],
-                    created_at=datetime.fromisoformat(row[10])
+        Returns:
+            Tuple of (entries, key of the last returned entry)
+        """
+        key_columns = ENTRY_SORT_KEYS.get(sort_by, ENTRY_SORT_KEYS['keyword'])
+        direction = 'DESC' if descending else 'ASC'
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            filters = self._build_entry_filters(cursor, table_id, filter_criteria)
+            if filters is None:
+                return [], after
+            conditions, params = filters
+            
+            key = ', '.join(f'ce.{column}' for column in key_columns)
+            if after is not None:
+                comparison = '<' if descending else '>'
+                conditions.append(
+                    f"({key}) {comparison} ({', '.join('?' * len(key_columns))})"
                 )
-                entries.append(entry)
+                params.extend(after)
+            
+            cursor.execute(f"""
+                SELECT {', '.join(f'ce.{column}' for column in ENTRY_COLUMNS)}
+                FROM concordance_entries ce
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {', '.join(f'ce.{column} {direction}' for column in key_columns)}
+                LIMIT ?
+            """, [*params, limit])
+            rows = cursor.fetchall()
+        
+        if not rows:
+            return [], after
+        
+        last_key = tuple(rows[-1][ENTRY_COLUMNS.index(column)] for column in key_columns)
+        return [self._row_to_entry(row) for row in rows], last_key
+    
+    def count_matching_entries(
+        self, table_id: str, filter_criteria: Optional[ConcordanceFilter] = None
+    ) -> int:
+        """Count the entries of a table matching filter criteria.
+        
+        Args:
+            table_id: The ID of the table
+            filter_criteria: Optional filter criteria
+            
+        Returns:
+            Number of matching entries
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            filters = self._build_entry_filters(cursor, table_id, filter_criteria)
+            if filters is None:
+                return 0
+            conditions, params = filters
+            
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM concordance_entries ce
+                WHERE {' AND '.join(conditions)}
+            """, params)
+            return cursor.fetchone()[0]
+    
+    def get_entry_keywords(self, table_id: str) -> List[str]:
+        """Get the distinct keywords found in a table.
+        
+        Args:
+            table_id: The ID of the table
+            
+        Returns:
+            Keywords as they occur in the entries, in sorted order
+        """
+        with self.get_connection() as conn:
+            values = self._distinct_values(conn.cursor(), table_id, ('keyword',))
+            return [value[0] for value in values]
+    
+    def get_entry_documents(self, table_id: str) -> List[Tuple[str, str]]:
+        """Get the documents that have entries in a table.
+        
+        Args:
+            table_id: The ID of the table
+            
+        Returns:
+            List of (document_id, document_name) tuples ordered by name
+        """
+        with self.get_connection() as conn:
+            values = self._distinct_values(
+                conn.cursor(), table_id, ('document_name', 'document_id')
+            )
+            return [(document_id, name) for name, document_id in values]
+    
+    @staticmethod
+    def _distinct_values(cursor, table_id: str, columns: Tuple[str, ...]) -> List[Tuple]:
+        """Get the distinct values of leading index columns within a table.
+        
+        Skips through the index from one value to the next, so the cost
+        grows with the number of distinct values rather than of entries.
+        
+        Args:
+            cursor: Database cursor
+            table_id: The ID of the table
+            columns: Columns following the table ID in one of the indexes
+            
+        Returns:
+            Distinct value tuples in index order
+        """
+        key = ', '.join(columns)
+        query = f"""
+            SELECT {key} FROM concordance_entries
+            WHERE concordance_table_id = ? {{after}}
+            ORDER BY {key} LIMIT 1
+        """
+        after = f"AND ({key}) > ({', '.join('?' * len(columns))})"
+        
+        values = []
+        row = cursor.execute(query.format(after=''), (table_id,)).fetchone()
+        while row is not None:
+            values.append(tuple(row))
+            row = cursor.execute(
+                query.format(after=after), (table_id, *values[-1])
+            ).fetchone()
+        return values
+    
+    def _build_entry_filters(
+        self,
+        cursor,
+        table_id: Optional[str],
+        filter_criteria: Optional[ConcordanceFilter]
+    ) -> Optional[Tuple[List[str], List[Any]]]:
+        """Build the WHERE conditions for searching entries.
+        
+        Conditions refer to the entry alias ``ce``. Within a table, keyword
+        and document name filters are resolved to the matching keywords and
+        document IDs first, so entries are selected through the composite
+        indexes. Context filters match words of the contexts in the
+        full-text index, the last word also as a prefix; without FTS5 they
+        match substrings.
+        
+        Args:
+            cursor: Database cursor
+            table_id: Optional table ID to limit the search to
+            filter_criteria: Optional filter criteria
+            
+        Returns:
+            Tuple of (conditions, parameters), or None if no entry can match
+        """
+        conditions = []
+        params: List[Any] = []
+        
+        if table_id:
+            conditions.append("ce.concordance_table_id = ?")
+            params.append(table_id)
+        
+        if not filter_criteria:
+            return conditions, params
+        
+        if filter_criteria.keywords:
+            if table_id:
+                keywords = [
+                    keyword
+                    for keyword, in self._distinct_values(cursor, table_id, ('keyword',))
+                    if any(kw.casefold() in keyword.casefold() for kw in filter_criteria.keywords)
+                ]
+                if not keywords:
+                    return None
+                conditions.append(f"ce.keyword IN ({', '.join('?' * len(keywords))})")
+                params.extend(keywords)
+            else:
+                keyword_conditions = " OR ".join(["ce.keyword LIKE ?" for _ in filter_criteria.keywords])
+                conditions.append(f"({keyword_conditions})")
+                params.extend([f"%{kw}%" for kw in filter_criteria.keywords])
+        
+        if filter_criteria.document_ids:
+            doc_conditions = " OR ".join(["ce.document_id = ?" for _ in filter_criteria.document_ids])
+            conditions.append(f"({doc_conditions})")
+            params.extend(filter_criteria.document_ids)
+        
+        if filter_criteria.document_names:
+            if table_id:
+                document_ids = [
+                    document_id
+                    for name, document_id in self._distinct_values(
+                        cursor, table_id, ('document_name', 'document_id')
+                    )
+                    if any(n.casefold() in name.casefold() for n in filter_criteria.document_names)
+                ]
+                if not document_ids:
+                    return None
+                conditions.append(f"ce.document_id IN ({', '.join('?' * len(document_ids))})")
+                params.extend(document_ids)
+            else:
+                name_conditions = " OR ".join(["ce.document_name LIKE ?" for _ in filter_criteria.document_names])
+                conditions.append(f"({name_conditions})")
+                params.extend([f"%{name}%" for name in filter_criteria.document_names])
+        
+        contexts = [
+            ('left_context', filter_criteria.left_context_contains),
+            ('right_context', filter_criteria.right_context_contains)
+        ]
+        if self.full_text_search:
+            match = " ".join(
+                expression
+                for expression in (self._context_match(column, text) for column, text in contexts)
+                if expression
+            )
+            if match:
+                conditions.append("""
+                    ce.id IN (
+                        SELECT r.entry_id FROM concordance_entries_fts
+                        JOIN concordance_entries_fts_rows r
+                            ON r.id = concordance_entries_fts.rowid
+                        WHERE concordance_entries_fts MATCH ?
+                    )
+                """)
+                params.append(match)
+        else:
+            for column, text in contexts:
+                if text:
+                    conditions.append(f"ce.{column} LIKE ?")
+                    params.append(f"%{text}%")
+        
+        if filter_criteria.min_position is not None:
+            conditions.append("ce.position >= ?")
+            params.append(filter_criteria.min_position)
+        
+        if filter_criteria.max_position is not None:
+            conditions.append("ce.position <= ?")
+            params.append(filter_criteria.max_position)
+        
+        if filter_criteria.date_from:
+            conditions.append("ce.created_at >= ?")
+            params.append(filter_criteria.date_from.isoformat())
+        
+        if filter_criteria.date_to:
+            conditions.append("ce.created_at <= ?")
+            params.append(filter_criteria.date_to.isoformat())
+        
+        return conditions, params
+    
+    @staticmethod
+    def _context_match(column: str, text: Optional[str]) -> Optional[str]:
+        """Turn context filter text into an FTS5 match expression.
+        
+        Every word must occur in the given context column. Words are quoted
+        so that FTS5 operators in the text are searched for literally, and
+        the last word also matches as a prefix, so results follow typing.
+        
+        Args:
+            column: Indexed context column
+            text: Filter text as entered
             
-            return entries
+        Returns:
+            Match expression, or None if the text has no words
+        """
+        words = (text or "").split()
+        if not words:
+            return None
+        terms = ['{} : "{}"'.format(column, word.replace('"', '""')) for word in words]
+        terms[-1] += "*"
+        return " ".join(terms)
+    
+    @staticmethod
+    def _row_to_entry(row) -> ConcordanceEntry:
+        """Convert a row of ENTRY_COLUMNS values to a concordance entry."""
+        # Stored entries were validated when they were saved
+        return ConcordanceEntry.model_construct(
+            **dict(zip(ENTRY_COLUMNS[:-1], row[:-1])),
+            created_at=datetime.fromisoformat(row[-1])
+        )
     
     def get_concordance_statistics(self) -> Dict[str, int]:
         """Get overall statistics about concordance data.
@@ -18,11 +18,148 @@ import os
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from loguru import logger
 
-from document_manager.models.document import Document, DocumentType
+from document_manager.models.document import Document, DocumentSummary, DocumentType
+from document_manager.utils.text_compression import compress_text, decompress_text
+from shared.repositories.database import track_connection
+
+# Columns read for document listings; content and extracted text are left out
+SUMMARY_COLUMNS = (
+    "id, name, file_type, size_bytes, creation_date, last_modified_date, "
+    "tags, category, author, page_count, word_count"
+)
+
+# Full-text index over document names, text and notes. The index rows are
+# linked to documents through documents_fts_rows, whose INTEGER PRIMARY KEY
+# keeps its values across VACUUM (the implicit rowid of documents does not).
+# Triggers keep the index in sync with every write to the documents table.
+FTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents_fts_rows (
+    id INTEGER PRIMARY KEY,
+    document_id TEXT NOT NULL UNIQUE
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    name, body, notes,
+    tokenize = 'porter unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS documents_fts_insert AFTER INSERT ON documents
+BEGIN
+    INSERT INTO documents_fts_rows (document_id) VALUES (new.id);
+    INSERT INTO documents_fts (rowid, name, body, notes) VALUES (
+        last_insert_rowid(), new.name,
+        COALESCE(NULLIF(new.extracted_text, ''), new.content), new.notes
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS documents_fts_update
+AFTER UPDATE OF name, content, extracted_text, notes ON documents
+WHEN old.name IS NOT new.name
+    OR old.content IS NOT new.content
+    OR old.extracted_text IS NOT new.extracted_text
+    OR old.notes IS NOT new.notes
+BEGIN
+    UPDATE documents_fts SET
+        name = new.name,
+        body = COALESCE(NULLIF(new.extracted_text, ''), new.content),
+        notes = new.notes
+    WHERE rowid = (SELECT id FROM documents_fts_rows WHERE document_id = new.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS documents_fts_delete AFTER DELETE ON documents
+BEGIN
+    DELETE FROM documents_fts
+    WHERE rowid = (SELECT id FROM documents_fts_rows WHERE document_id = old.id);
+    DELETE FROM documents_fts_rows WHERE document_id = old.id;
+END;
+"""
+
+# One row per tag of each document, so tag filters are index lookups. The
+# JSON tags column stays the copy read into Document.tags; triggers mirror
+# it into this table on every write.
+TAGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS document_tags (
+    document_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (document_id, tag)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_document_tags_tag ON document_tags(tag, document_id);
+
+CREATE TRIGGER IF NOT EXISTS document_tags_insert AFTER INSERT ON documents
+BEGIN
+    INSERT OR IGNORE INTO document_tags (document_id, tag)
+    SELECT new.id, value FROM json_each(COALESCE(new.tags, '[]'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS document_tags_update AFTER UPDATE OF tags ON documents
+WHEN old.tags IS NOT new.tags
+BEGIN
+    DELETE FROM document_tags WHERE document_id = new.id;
+    INSERT OR IGNORE INTO document_tags (document_id, tag)
+    SELECT new.id, value FROM json_each(COALESCE(new.tags, '[]'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS document_tags_delete AFTER DELETE ON documents
+BEGIN
+    DELETE FROM document_tags WHERE document_id = old.id;
+END;
+"""
+
+# Counter bumped whenever a document's content changes, so indexes built
+# from the content can tell which documents are out of date
+REVISION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_documents_revision
+ON documents(is_deleted, id, content_revision);
+
+CREATE TRIGGER IF NOT EXISTS documents_content_revision
+AFTER UPDATE OF content ON documents
+WHEN old.content IS NOT new.content
+BEGIN
+    UPDATE documents SET content_revision = old.content_revision + 1
+    WHERE id = new.id;
+END;
+"""
+
+# HTML bodies of rich text (QGem) documents, kept out of the documents table
+# so listings and scans never read them; they are loaded when a document is
+# opened. Large bodies are compressed (see utils/text_compression.py).
+HTML_SCHEMA = """
+CREATE TABLE IF NOT EXISTS document_html (
+    document_id TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    body BLOB NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS document_html_delete AFTER DELETE ON documents
+BEGIN
+    DELETE FROM document_html WHERE document_id = old.id;
+END;
+"""
+
+# Weights of the name, body and notes columns in BM25 ranking
+FTS_WEIGHTS = "10.0, 1.0, 2.0"
+
+# Number of tokens shown in a search result snippet
+SNIPPET_TOKENS = 16
+
+# Results that get snippets; the rest of a long result list goes without
+MAX_SNIPPETS = 100
+
+
+class SearchSql(NamedTuple):
+    """SQL parts of a document search, built by DocumentRepository._filter_sql."""
+
+    tables: str  # FROM clause; the documents table is aliased d
+    where: str
+    params: List
+    order: str  # ORDER BY expression
+    columns: str  # Extra selected columns, e.g. the full-text index row
 
 
 class DocumentRepository:
@@ -84,9 +221,89 @@ class DocumentRepository:
             "CREATE INDEX IF NOT EXISTS idx_documents_creation_date ON documents(creation_date)"
         )
 
+        # Content checksum and original location, used to skip unchanged imports
+        cursor.execute("PRAGMA table_info(documents)")
+        columns = {row["name"] for row in cursor.fetchall()}
+        for column in ("checksum", "source_path"):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE documents ADD COLUMN {column} TEXT")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_checksum ON documents(checksum)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_source_path ON documents(source_path)"
+        )
+        if "content_revision" not in columns:
+            cursor.execute(
+                "ALTER TABLE documents "
+                "ADD COLUMN content_revision INTEGER NOT NULL DEFAULT 0"
+            )
+        cursor.executescript(REVISION_SCHEMA)
+
+        # Covering index for listings: the summary columns are stored after
+        # the content in each row, so reading them from the table would walk
+        # every document's text
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_documents_summary "
+            f"ON documents(is_deleted, {SUMMARY_COLUMNS})"
+        )
+
+        # Tag table, filled from the JSON tags the first time it is created
+        tags_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'document_tags'"
+        ).fetchone()
+        cursor.executescript(TAGS_SCHEMA)
+        if not tags_exist:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO document_tags (document_id, tag)
+                SELECT d.id, t.value
+                FROM documents d, json_each(COALESCE(d.tags, '[]')) t
+                """
+            )
+
+        cursor.executescript(HTML_SCHEMA)
+
         conn.commit()
+        self.full_text_search = self._init_search_index(conn)
         conn.close()
 
+    def _init_search_index(self, conn: sqlite3.Connection) -> bool:
+        """Create the full-text index, filling it from existing documents.
+
+        Args:
+            conn: Open database connection
+
+        Returns:
+            True if full-text search is available, False if SQLite lacks FTS5
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'documents_fts'"
+        ).fetchone()
+
+        try:
+            with conn:
+                conn.executescript(FTS_SCHEMA)
+                if not exists:
+                    conn.execute(
+                        "INSERT INTO documents_fts_rows (document_id) "
+                        "SELECT id FROM documents"
+                    )
+                    conn.execute(
+                        """
+                        INSERT INTO documents_fts (rowid, name, body, notes)
+                        SELECT r.id, d.name,
+                            COALESCE(NULLIF(d.extracted_text, ''), d.content),
+                            d.notes
+                        FROM documents d
+                        JOIN documents_fts_rows r ON r.document_id = d.id
+                        """
+                    )
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+            return False
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection.
 
@@ -95,7 +312,7 @@ class DocumentRepository:
         """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        return conn
+        return track_connection(conn)
 
     def _document_to_row(self, document: Document) -> Dict:
         """Convert Document object to database row.
@@ -122,7 +339,9 @@ class DocumentRepository:
             "page_count": document.page_count,
             "word_count": document.word_count,
             "metadata": json.dumps(document.metadata) if document.metadata else None,
-            "tags": json.dumps(document.tags) if document.tags else "[]",
+            "tags": json.dumps(sorted(document.tags)) if document.tags else "[]",
+            "checksum": document.checksum,
+            "source_path": document.source_path,
         }
 
     def _row_to_document(self, row: sqlite3.Row) -> Document:
@@ -156,6 +375,32 @@ class DocumentRepository:
             word_count=row["word_count"],
             metadata=metadata,
             tags=tags,
+            checksum=row["checksum"],
+            source_path=row["source_path"],
+        )
+
+    def _row_to_summary(self, row: sqlite3.Row) -> DocumentSummary:
+        """Convert a row of SUMMARY_COLUMNS to a DocumentSummary.
+
+        Args:
+            row: SQLite row
+
+        Returns:
+            Document summary
+        """
+        # Rows come from our own schema, so skip pydantic validation
+        return DocumentSummary.model_construct(
+            id=row["id"],
+            name=row["name"],
+            file_type=DocumentType(row["file_type"]),
+            size_bytes=row["size_bytes"],
+            creation_date=datetime.fromisoformat(row["creation_date"]),
+            last_modified_date=datetime.fromisoformat(row["last_modified_date"]),
+            tags=set(json.loads(row["tags"])) if row["tags"] else set(),
+            category=row["category"],
+            author=row["author"],
+            page_count=row["page_count"],
+            word_count=row["word_count"],
         )
 
     def save(self, document: Document) -> bool:
@@ -198,6 +443,8 @@ class DocumentRepository:
                     list(row.values()),
                 )
 
+            self._save_html_bodies(conn, [document])
+
             conn.commit()
             return True
         except Exception as e:
@@ -207,6 +454,255 @@ class DocumentRepository:
         finally:
             conn.close()
 
+    def save_many(self, documents: List[Document]) -> bool:
+        """Save several documents in a single transaction.
+
+        Existing documents are updated, new ones inserted.
+
+        Args:
+            documents: Documents to save
+
+        Returns:
+            True if all documents were saved, False if none were
+        """
+        if not documents:
+            return True
+
+        rows = [self._document_to_row(document) for document in documents]
+        columns = list(rows[0].keys())
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != "id")
+        sql = (
+            f"INSERT INTO documents ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+
+        conn = self._get_connection()
+        try:
+            with conn:
+                conn.executemany(sql, [[row[c] for c in columns] for row in rows])
+                self._save_html_bodies(conn, documents)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving documents: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def _save_html_bodies(
+        self, conn: sqlite3.Connection, documents: List[Document]
+    ) -> None:
+        """Store the HTML bodies of rich text documents, compressed if large.
+
+        Documents without an html_content attribute, or whose HTML was not
+        loaded (None), keep their stored body.
+
+        Args:
+            conn: Connection of the transaction saving the documents
+            documents: Documents being saved
+        """
+        rows = []
+        for document in documents:
+            html = getattr(document, "html_content", None)
+            if html is not None:
+                codec, body = compress_text(html)
+                rows.append((document.id, codec, body))
+
+        if rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO document_html (document_id, codec, body) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def get_html_content(self, document_id: str) -> Optional[str]:
+        """Get the HTML body of a rich text document, decompressed.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            The HTML, or None if the document has no stored HTML
+        """
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                "SELECT codec, body FROM document_html WHERE document_id = ?",
+                (document_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+
+        return decompress_text(row["codec"], row["body"]) if row else None
+
+    def update_integrity(
+        self,
+        document_id: str,
+        checksum: Optional[str],
+        fingerprint: List[int],
+        integrity_status: str,
+    ) -> bool:
+        """Record the result of verifying a document's file.
+
+        Only the checksum and the integrity entries of the metadata are
+        written, so a verification never overwrites concurrent edits.
+
+        Args:
+            document_id: ID of the verified document
+            checksum: Checksum to record for a document without one, replacing
+                its legacy MD5 checksum; None keeps the stored checksums
+            fingerprint: Stat fingerprint of the file when it was hashed
+            integrity_status: Verification result, e.g. "OK"
+
+        Returns:
+            True if successful, False otherwise
+        """
+        conn = self._get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE documents SET
+                        checksum = COALESCE(checksum, :checksum),
+                        metadata = json_set(
+                            CASE WHEN :checksum IS NULL
+                                THEN COALESCE(metadata, '{}')
+                                ELSE json_remove(COALESCE(metadata, '{}'), '$.checksum')
+                            END,
+                            '$.file_fingerprint', json(:fingerprint),
+                            '$.verified_status', :status
+                        )
+                    WHERE id = :id
+                    """,
+                    {
+                        "checksum": checksum,
+                        "fingerprint": json.dumps(fingerprint),
+                        "status": integrity_status,
+                        "id": document_id,
+                    },
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error updating document integrity: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def get_source_fingerprints(
+        self, directory: Optional[Union[str, Path]] = None
+    ) -> Dict[str, Optional[List[int]]]:
+        """Get the stat fingerprints recorded for imported source files.
+
+        Args:
+            directory: Only include files below this absolute directory
+
+        Returns:
+            Dictionary mapping source paths to the fingerprint the file had
+            when it was last imported, or None if none was recorded
+        """
+        condition, params = "", ()
+        if directory is not None:
+            # Range over the source path index instead of an unindexable LIKE
+            prefix = os.path.join(str(directory), "")
+            condition = "AND source_path >= ? AND source_path < ?"
+            params = (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT source_path,
+                    json_extract(metadata, '$.source_fingerprint') AS fingerprint
+                FROM documents
+                WHERE is_deleted = 0 AND source_path IS NOT NULL {condition}
+                """,
+                params,
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return {
+            row["source_path"]: (
+                json.loads(row["fingerprint"]) if row["fingerprint"] else None
+            )
+            for row in rows
+        }
+
+    def update_source_fingerprint(
+        self, document_id: str, fingerprint: List[int]
+    ) -> bool:
+        """Record the stat fingerprint of a document's source file.
+
+        Args:
+            document_id: ID of the document
+            fingerprint: Stat fingerprint of the source file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        conn = self._get_connection()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE documents SET metadata = json_set(
+                        COALESCE(metadata, '{}'), '$.source_fingerprint', json(?)
+                    )
+                    WHERE id = ?
+                    """,
+                    (json.dumps(fingerprint), document_id),
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error updating source fingerprint: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def find_by_checksum(self, checksum: str) -> Optional[Document]:
+        """Find a document whose file has the given content checksum.
+
+        Args:
+            checksum: Content checksum of the file
+
+        Returns:
+            The earliest imported matching document, or None
+        """
+        return self._find_one(
+            "checksum = ? ORDER BY creation_date LIMIT 1", (checksum,)
+        )
+
+    def find_by_source_path(self, source_path: str) -> Optional[Document]:
+        """Find the document imported from a file location.
+
+        Args:
+            source_path: Absolute path the document was imported from
+
+        Returns:
+            The matching document, or None
+        """
+        return self._find_one("source_path = ? LIMIT 1", (source_path,))
+
+    def _find_one(self, condition: str, params: Tuple) -> Optional[Document]:
+        """Get the first non-deleted document matching a condition.
+
+        Args:
+            condition: SQL condition, optionally followed by ORDER BY/LIMIT
+            params: Parameters of the condition
+
+        Returns:
+            The matching document, or None
+        """
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                f"SELECT * FROM documents WHERE is_deleted = 0 AND {condition}", params
+            ).fetchone()
+        finally:
+            conn.close()
+
+        return self._row_to_document(row) if row else None
+
     def get_by_id(self, document_id: str) -> Optional[Document]:
         """Get a document by ID.
 
@@ -247,6 +743,22 @@ class DocumentRepository:
 
         return documents
 
+    def get_all_summaries(self) -> List[DocumentSummary]:
+        """Get summaries of all documents, without loading their text.
+
+        Returns:
+            List of document summaries
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"SELECT {SUMMARY_COLUMNS} FROM documents WHERE is_deleted = 0"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [self._row_to_summary(row) for row in rows]
+
     def delete(self, document_id: str, permanent: bool = False) -> bool:
         """Delete a document.
 
@@ -287,9 +799,15 @@ class DocumentRepository:
         date_to: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0,
+        any_tags: Optional[List[str]] = None,
+        exclude_tags: Optional[List[str]] = None,
     ) -> Tuple[List[Document], int]:
         """Search for documents with filters.
 
+        A search text is matched against the full-text index of document
+        names, text and notes, and results are ranked by relevance (BM25);
+        otherwise results are ordered newest first.
+
         Args:
             query: Search text (searches in name, extracted_text, and notes)
             doc_type: Filter by document type
@@ -299,71 +817,281 @@ class DocumentRepository:
             date_to: Filter by creation date (to)
             limit: Maximum number of results
             offset: Number of results to skip
+            any_tags: Filter by tags (documents must have ANY specified tag)
+            exclude_tags: Filter by tags (documents must have NONE of them)
 
         Returns:
             Tuple of (list of matching documents, total count)
         """
+        search = self._filter_sql(
+            query, doc_type, category, tags, any_tags, exclude_tags, date_from, date_to
+        )
+        rows, total_count = self._search_rows("*", search, limit, offset)
+        return [self._row_to_document(row) for row in rows], total_count
+
+    def search_summaries(
+        self,
+        query: Optional[str] = None,
+        doc_type: Optional[DocumentType] = None,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        any_tags: Optional[List[str]] = None,
+        exclude_tags: Optional[List[str]] = None,
+    ) -> Tuple[List[DocumentSummary], int]:
+        """Search for documents with filters, without loading their text.
+
+        Takes the same filters as search. When searching for text, the best
+        MAX_SNIPPETS summaries carry a snippet of the matching text.
+
+        Returns:
+            Tuple of (list of matching document summaries, total count)
+        """
+        search = self._filter_sql(
+            query, doc_type, category, tags, any_tags, exclude_tags, date_from, date_to
+        )
+        rows, total_count = self._search_rows(SUMMARY_COLUMNS, search, limit, offset)
+        summaries = [self._row_to_summary(row) for row in rows]
+
+        if rows and "fts_rowid" in rows[0].keys():
+            snippets = self._snippets(
+                self._match_expression(query),
+                [row["fts_rowid"] for row in rows[:MAX_SNIPPETS]],
+            )
+            for summary, row in zip(summaries, rows):
+                summary.snippet = snippets.get(row["fts_rowid"])
+
+        return summaries, total_count
+
+    def _snippets(self, match: str, fts_rowids: List[int]) -> Dict[int, str]:
+        """Get highlighted snippets of the text matching a search.
+
+        Snippets are made only for the requested rows, since building one
+        means scanning the document's text for the matched terms.
+
+        Args:
+            match: FTS5 match expression of the search
+            fts_rowids: Index rows of the documents on the current page
+
+        Returns:
+            Dictionary mapping index rows to snippets
+        """
+        placeholders = ", ".join("?" * len(fts_rowids))
         conn = self._get_connection()
-        cursor = conn.cursor()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT rowid, snippet(documents_fts, -1, '<b>', '</b>', '...',
+                    {SNIPPET_TOKENS})
+                FROM documents_fts
+                WHERE documents_fts MATCH ? AND rowid IN ({placeholders})
+                """,
+                [match, *fts_rowids],
+            ).fetchall()
+        finally:
+            conn.close()
 
-        # Build the query
-        where_clauses = ["is_deleted = 0"]
-        params = []
+        return {row[0]: row[1] for row in rows}
+
+    def tag_counts(
+        self,
+        query: Optional[str] = None,
+        doc_type: Optional[DocumentType] = None,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        any_tags: Optional[List[str]] = None,
+        exclude_tags: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """Count the documents per tag among those matching the filters.
+
+        Takes the same filters as search; with none, counts the whole library.
+        Used to show how many documents each tag facet would leave.
+
+        Returns:
+            Dictionary mapping tags to document counts, most used first
+        """
+        search = self._filter_sql(
+            query, doc_type, category, tags, any_tags, exclude_tags, date_from, date_to
+        )
+
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT t.tag, COUNT(*) AS count
+                FROM document_tags t
+                WHERE t.document_id IN (
+                    SELECT d.id FROM {search.tables} WHERE {search.where}
+                )
+                GROUP BY t.tag
+                ORDER BY count DESC, t.tag
+                """,
+                search.params,
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return {row["tag"]: row["count"] for row in rows}
+
+    def _filter_sql(
+        self,
+        query: Optional[str],
+        doc_type: Optional[DocumentType],
+        category: Optional[str],
+        tags: Optional[List[str]],
+        any_tags: Optional[List[str]],
+        exclude_tags: Optional[List[str]],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ) -> SearchSql:
+        """Build the SQL parts of a document search.
+
+        A full-text search joins the index and also selects its row as
+        fts_rowid.
+
+        Returns:
+            The search's FROM, WHERE and ORDER BY parts
+        """
+        match = self._match_expression(query) if self.full_text_search else None
+        tables = "documents d"
+        order = "d.creation_date DESC"
+        columns = ""
 
-        if query:
+        # Build the query
+        where_clauses = ["d.is_deleted = 0"]
+        params: List = []
+
+        if match:
+            # CROSS JOIN keeps SQLite from probing the index once per document
+            tables = (
+                "documents_fts"
+                " CROSS JOIN documents_fts_rows r ON r.id = documents_fts.rowid"
+                " CROSS JOIN documents d ON d.id = r.document_id"
+            )
+            where_clauses.append("documents_fts MATCH ?")
+            params.append(match)
+            order = f"bm25(documents_fts, {FTS_WEIGHTS})"
+            columns = ", r.id AS fts_rowid"
+        elif query:
             where_clauses.append(
-                "(name LIKE ? OR extracted_text LIKE ? OR notes LIKE ?)"
+                "(d.name LIKE ? OR d.extracted_text LIKE ? OR d.notes LIKE ?)"
             )
             params.extend([f"%{query}%"] * 3)
 
         if doc_type:
-            where_clauses.append("file_type = ?")
+            where_clauses.append("d.file_type = ?")
             params.append(doc_type.value)
 
         if category:
-            where_clauses.append("category = ?")
+            where_clauses.append("d.category = ?")
             params.append(category)
 
+        # Tag filters are set operations on the tag table
+        if tags:
+            tags = sorted(set(tags))
+            where_clauses.append(
+                "d.id IN (SELECT document_id FROM document_tags "
+                f"WHERE tag IN ({', '.join('?' * len(tags))}) "
+                "GROUP BY document_id HAVING COUNT(*) = ?)"
+            )
+            params.extend([*tags, len(tags)])
+
+        if any_tags:
+            where_clauses.append(
+                "d.id IN (SELECT document_id FROM document_tags "
+                f"WHERE tag IN ({', '.join('?' * len(any_tags))}))"
+            )
+            params.extend(any_tags)
+
+        if exclude_tags:
+            where_clauses.append(
+                "d.id NOT IN (SELECT document_id FROM document_tags "
+                f"WHERE tag IN ({', '.join('?' * len(exclude_tags))}))"
+            )
+            params.extend(exclude_tags)
+
         if date_from:
-            where_clauses.append("creation_date >= ?")
+            where_clauses.append("d.creation_date >= ?")
             params.append(date_from.isoformat())
 
         if date_to:
-            where_clauses.append("creation_date <= ?")
+            where_clauses.append("d.creation_date <= ?")
             params.append(date_to.isoformat())
 
         # Combine all conditions
-        where_clause = " AND ".join(where_clauses)
+        return SearchSql(tables, " AND ".join(where_clauses), params, order, columns)
+
+    def _search_rows(
+        self, columns: str, search: SearchSql, limit: int, offset: int
+    ) -> Tuple[List[sqlite3.Row], int]:
+        """Select the given columns of documents matching the search filters.
 
-        # Get total count
-        count_query = f"SELECT COUNT(*) as count FROM documents WHERE {where_clause}"
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()["count"]
+        All filters, including tags, are applied in SQL, so pages are full
+        and the total count is exact. Full-text matches also select their
+        index row as fts_rowid.
 
-        # Execute the main query with pagination
-        query_sql = f"""
-        SELECT * FROM documents
-        WHERE {where_clause}
-        ORDER BY creation_date DESC
-        LIMIT ? OFFSET ?
+        Args:
+            columns: Comma-separated columns of the documents table, or "*"
+            search: Search parts built by _filter_sql
+            limit: Maximum number of rows, negative for all
+            offset: Number of rows to skip
+
+        Returns:
+            Tuple of (matching rows, best match or newest first, total count)
         """
+        select = ", ".join(f"d.{column.strip()}" for column in columns.split(","))
+        select += search.columns
 
-        cursor.execute(query_sql, params + [limit, offset])
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT {select} FROM {search.tables}
+                WHERE {search.where}
+                ORDER BY {search.order}
+                LIMIT ? OFFSET ?
+                """,
+                search.params + [limit, offset],
+            ).fetchall()
+
+            # A partial first page already tells the total
+            if offset == 0 and (limit < 0 or len(rows) < limit):
+                total_count = len(rows)
+            else:
+                total_count = conn.execute(
+                    f"SELECT COUNT(*) FROM {search.tables} WHERE {search.where}",
+                    search.params,
+                ).fetchone()[0]
+        finally:
+            conn.close()
 
-        documents = []
-        for row in cursor.fetchall():
-            document = self._row_to_document(row)
+        return rows, total_count
 
-            # Filter by tags if needed
-            if tags:
-                if not all(tag in document.tags for tag in tags):
-                    continue
+    @staticmethod
+    def _match_expression(query: Optional[str]) -> Optional[str]:
+        """Turn search text into an FTS5 match expression.
 
-            documents.append(document)
+        Every word must occur in the document. Words are quoted so that
+        FTS5 operators in the text are searched for literally, and the last
+        word also matches as a prefix, so results follow the user's typing.
 
-        conn.close()
+        Args:
+            query: Search text as entered
 
-        return documents, total_count
+        Returns:
+            Match expression, or None if the text has no words
+        """
+        words = (query or "").split()
+        if not words:
+            return None
+        terms = ['"{}"'.format(word.replace('"', '""')) for word in words]
+        terms[-1] += "*"
+        return " ".join(terms)
 
     def get_by_category(self, category: str) -> List[Document]:
         """Get documents by category.
@@ -386,6 +1114,95 @@ class DocumentRepository:
 
         return documents
 
+    def find_ids_with_content(self, text: str) -> Set[str]:
+        """Get the IDs of documents whose content contains a text.
+
+        Args:
+            text: Text to look for (case-insensitive for ASCII letters)
+
+        Returns:
+            Set of matching document IDs
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT id FROM documents WHERE is_deleted = 0 AND content LIKE ?",
+                (f"%{text}%",),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return {row["id"] for row in rows}
+
+    def filter_ids_with_content(self, document_ids: List[str]) -> List[str]:
+        """Keep the IDs of documents that exist and have text content.
+
+        Args:
+            document_ids: Document IDs to check
+
+        Returns:
+            The IDs of existing documents with content, in the given order
+        """
+        found: Set[str] = set()
+        conn = self._get_connection()
+        try:
+            # Stay below SQLite's limit on bound parameters
+            for start in range(0, len(document_ids), 500):
+                chunk = document_ids[start : start + 500]
+                rows = conn.execute(
+                    "SELECT id FROM documents WHERE is_deleted = 0 "
+                    "AND content IS NOT NULL AND content != '' "
+                    f"AND id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(row["id"] for row in rows)
+        finally:
+            conn.close()
+
+        return [document_id for document_id in document_ids if document_id in found]
+
+    def get_summaries_by_category(self, category: str) -> List[DocumentSummary]:
+        """Get summaries of the documents in a category.
+
+        Args:
+            category: Category name
+
+        Returns:
+            List of document summaries in the category
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"SELECT {SUMMARY_COLUMNS} FROM documents "
+                "WHERE category = ? AND is_deleted = 0",
+                (category,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [self._row_to_summary(row) for row in rows]
+
+    def get_summaries_by_type(self, doc_type: DocumentType) -> List[DocumentSummary]:
+        """Get summaries of the documents of a type.
+
+        Args:
+            doc_type: Document type
+
+        Returns:
+            List of document summaries of the type
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"SELECT {SUMMARY_COLUMNS} FROM documents "
+                "WHERE file_type = ? AND is_deleted = 0",
+                (doc_type.value,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [self._row_to_summary(row) for row in rows]
+
     def get_by_type(self, doc_type: DocumentType) -> List[Document]:
         """Get documents by type.
 
@@ -417,9 +1234,20 @@ class DocumentRepository:
         Returns:
             List of documents with the tag
         """
-        # We need to search in the JSON tag array
-        documents = self.get_all()
-        return [doc for doc in documents if tag in doc.tags]
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                """
+                SELECT d.* FROM document_tags t
+                JOIN documents d ON d.id = t.document_id
+                WHERE t.tag = ? AND d.is_deleted = 0
+                """,
+                (tag,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [self._row_to_document(row) for row in rows]
 
     def get_document_count(self) -> int:
         """Get the total number of documents.
@@ -0,0 +1,358 @@
+"""
+Purpose: Stores a positional index of the word tokens in every document
+
+This file is part of the document_manager pillar and serves as a repository component.
+For each document it records where every token occurs (character offset,
+token ordinal, line and paragraph), so concordance, phrase and proximity
+queries become index lookups instead of scans of the document text. The
+index lives in the document database next to the documents it covers and
+remembers the content revision it was built from, so out-of-date documents
+can be found with one query and re-indexed on their own.
+
+Key components:
+- TokenIndexRepository: Writes and queries the positional index
+- TokenOccurrence: One indexed occurrence of a token or phrase
+
+Dependencies:
+- sqlite3: For database operations
+
+Related files:
+- document_manager/repositories/document_repository.py: Maintains content_revision
+- document_manager/services/concordance_service.py: Tokenizes documents and builds KWIC views
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from loguru import logger
+
+from shared.repositories.database import track_connection
+
+# Documents are referenced by a small integer key so the UUID of a document
+# is not repeated in every one of its token rows. Deleting a document drops
+# its tokens.
+TOKEN_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_index_documents (
+    doc_key INTEGER PRIMARY KEY,
+    document_id TEXT NOT NULL UNIQUE,
+    revision INTEGER NOT NULL,
+    token_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS token_positions (
+    token TEXT NOT NULL,
+    doc_key INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    line_number INTEGER NOT NULL,
+    paragraph_number INTEGER NOT NULL,
+    PRIMARY KEY (token, doc_key, ordinal)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_token_positions_document
+ON token_positions(doc_key);
+
+CREATE TRIGGER IF NOT EXISTS token_index_document_delete AFTER DELETE ON documents
+BEGIN
+    DELETE FROM token_positions WHERE doc_key =
+        (SELECT doc_key FROM token_index_documents WHERE document_id = old.id);
+    DELETE FROM token_index_documents WHERE document_id = old.id;
+END;
+"""
+
+# Page cache used while indexing, in KiB
+INDEX_CACHE_KB = 65536
+
+# Token row as passed to replace_documents:
+# (token, ordinal, position, length, line number, paragraph number)
+TokenRow = Tuple[str, int, int, int, int, int]
+
+
+class TokenOccurrence(NamedTuple):
+    """An indexed occurrence of a token or phrase in a document."""
+
+    document_id: str
+    start: int  # Character offset of the first token
+    end: int  # Character offset just past the last token
+    ordinal: int  # Position of the first token among the document's tokens
+    line_number: int
+    paragraph_number: int
+
+
+class TokenIndexRepository:
+    """Repository for the positional token index of documents."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """Initialize the token index repository.
+
+        Args:
+            db_path: Path to the document database
+        """
+        self.db_path = Path(db_path)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the index tables if they don't exist."""
+        conn = self._get_connection()
+        try:
+            conn.executescript(TOKEN_INDEX_SCHEMA)
+        finally:
+            conn.close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection.
+
+        Returns:
+            SQLite connection object
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return track_connection(conn)
+
+    def stale_documents(
+        self, document_ids: Optional[List[str]] = None
+    ) -> List[Tuple[str, int]]:
+        """Find documents whose index is missing or out of date.
+
+        Args:
+            document_ids: Documents to check, or None for all documents
+
+        Returns:
+            List of (document ID, current content revision)
+        """
+        scope = ""
+        params: List = []
+        if document_ids is not None:
+            scope = "AND d.id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(document_ids))
+
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT d.id, d.content_revision
+                FROM documents d INDEXED BY idx_documents_revision
+                LEFT JOIN token_index_documents t ON t.document_id = d.id
+                WHERE d.is_deleted = 0 {scope}
+                    AND (t.revision IS NULL OR t.revision != d.content_revision)
+                """,
+                params,
+            ).fetchall()
+            return [(row["id"], row["content_revision"]) for row in rows]
+        except Exception as e:
+            logger.error(f"Error finding documents to index: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def replace_documents(
+        self, documents: Iterable[Tuple[str, int, List[TokenRow]]]
+    ) -> int:
+        """Replace the indexed tokens of several documents in one transaction.
+
+        Indexing documents in batches writes each touched page of the index
+        once per batch instead of once per document.
+
+        Args:
+            documents: Tuples of (document ID, content revision the tokens
+                were read from, token rows of the whole document)
+
+        Returns:
+            Number of documents indexed, 0 if the batch failed
+        """
+        conn = self._get_connection()
+        conn.execute(f"PRAGMA cache_size = -{INDEX_CACHE_KB}")
+        count = 0
+        try:
+            with conn:
+                for document_id, revision, tokens in documents:
+                    self._replace_document(conn, document_id, revision, tokens)
+                    count += 1
+            return count
+        except Exception as e:
+            logger.error(f"Error indexing documents: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def _replace_document(
+        self,
+        conn: sqlite3.Connection,
+        document_id: str,
+        revision: int,
+        tokens: List[TokenRow],
+    ) -> None:
+        """Replace the indexed tokens of one document within a transaction."""
+        row = conn.execute(
+            "SELECT doc_key FROM token_index_documents WHERE document_id = ?",
+            (document_id,),
+        ).fetchone()
+        if row:
+            doc_key = row["doc_key"]
+            conn.execute("DELETE FROM token_positions WHERE doc_key = ?", (doc_key,))
+            conn.execute(
+                "UPDATE token_index_documents SET revision = ?, token_count = ? "
+                "WHERE doc_key = ?",
+                (revision, len(tokens), doc_key),
+            )
+        else:
+            doc_key = conn.execute(
+                "INSERT INTO token_index_documents "
+                "(document_id, revision, token_count) VALUES (?, ?, ?)",
+                (document_id, revision, len(tokens)),
+            ).lastrowid
+
+        # Inserting in key order keeps the writes to the index local
+        conn.executemany(
+            "INSERT INTO token_positions (token, doc_key, ordinal, position, "
+            "length, line_number, paragraph_number) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((token[0], doc_key, *token[1:]) for token in sorted(tokens)),
+        )
+
+    def remove_inactive_documents(self) -> int:
+        """Drop the index of documents that were deleted or moved to the trash.
+
+        Returns:
+            Number of documents removed from the index
+        """
+        conn = self._get_connection()
+        try:
+            with conn:
+                keys = [
+                    row["doc_key"]
+                    for row in conn.execute(
+                        """
+                        SELECT t.doc_key FROM token_index_documents t
+                        LEFT JOIN documents d ON d.id = t.document_id
+                        WHERE d.id IS NULL OR d.is_deleted = 1
+                        """
+                    )
+                ]
+                for key in keys:
+                    conn.execute(
+                        "DELETE FROM token_positions WHERE doc_key = ?", (key,)
+                    )
+                    conn.execute(
+                        "DELETE FROM token_index_documents WHERE doc_key = ?", (key,)
+                    )
+            return len(keys)
+        except Exception as e:
+            logger.error(f"Error pruning token index: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def find_phrase(
+        self, tokens: List[str], document_ids: Optional[List[str]] = None
+    ) -> List[TokenOccurrence]:
+        """Find where a sequence of tokens occurs in consecutive positions.
+
+        Args:
+            tokens: Normalized tokens of the phrase (a single token is allowed)
+            document_ids: Documents to search, or None for all indexed documents
+
+        Returns:
+            Occurrences ordered by document and position
+        """
+        if not tokens:
+            return []
+
+        last = len(tokens) - 1
+        joins = "".join(
+            f" JOIN token_positions p{i} ON p{i}.token = ?"
+            f" AND p{i}.doc_key = p0.doc_key AND p{i}.ordinal = p0.ordinal + {i}"
+            for i in range(1, len(tokens))
+        )
+        params: List = list(tokens[1:]) + [tokens[0]]
+        scope = ""
+        if document_ids is not None:
+            scope = "AND t.document_id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(document_ids))
+
+        return self._query_occurrences(
+            f"""
+            SELECT t.document_id, p0.position AS start,
+                p{last}.position + p{last}.length AS end,
+                p0.ordinal, p0.line_number, p0.paragraph_number
+            FROM token_positions p0{joins}
+            JOIN token_index_documents t ON t.doc_key = p0.doc_key
+            WHERE p0.token = ? {scope}
+            ORDER BY t.document_id, p0.ordinal
+            """,
+            params,
+        )
+
+    def find_near(
+        self,
+        first: str,
+        second: str,
+        max_distance: int,
+        in_order: bool = False,
+        document_ids: Optional[List[str]] = None,
+    ) -> List[Tuple[TokenOccurrence, TokenOccurrence]]:
+        """Find pairs of tokens occurring within a number of tokens of each other.
+
+        Args:
+            first: Normalized first token
+            second: Normalized second token
+            max_distance: Largest allowed difference between their ordinals
+            in_order: Whether the second token must follow the first
+            document_ids: Documents to search, or None for all indexed documents
+
+        Returns:
+            Pairs of (first occurrence, second occurrence) ordered by document
+            and position of the first token
+        """
+        low = "a.ordinal + 1" if in_order else "a.ordinal - ?"
+        params: List = [second] if in_order else [second, max_distance]
+        params += [max_distance, first]
+        scope = ""
+        if document_ids is not None:
+            scope = "AND t.document_id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(document_ids))
+
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT t.document_id,
+                    a.position, a.position + a.length, a.ordinal,
+                    a.line_number, a.paragraph_number,
+                    b.position, b.position + b.length, b.ordinal,
+                    b.line_number, b.paragraph_number
+                FROM token_positions a
+                JOIN token_positions b ON b.token = ? AND b.doc_key = a.doc_key
+                    AND b.ordinal BETWEEN {low} AND a.ordinal + ?
+                    AND b.ordinal != a.ordinal
+                JOIN token_index_documents t ON t.doc_key = a.doc_key
+                WHERE a.token = ? {scope}
+                ORDER BY t.document_id, a.ordinal, b.ordinal
+                """,
+                params,
+            ).fetchall()
+            return [
+                (
+                    TokenOccurrence(row[0], *row[1:6]),
+                    TokenOccurrence(row[0], *row[6:11]),
+                )
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error(f"Error searching token index: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def _query_occurrences(self, sql: str, params: List) -> List[TokenOccurrence]:
+        """Run a query selecting TokenOccurrence columns."""
+        conn = self._get_connection()
+        try:
+            return [TokenOccurrence(*row) for row in conn.execute(sql, params)]
+        except Exception as e:
+            logger.error(f"Error searching token index: {e}")
+            return []
+        finally:
+            conn.close()
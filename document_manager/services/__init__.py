@@ -7,5 +7,11 @@ This module provides service classes for document management operations.
 from document_manager.services.document_service import DocumentService
 from document_manager.services.qgem_document_service import QGemDocumentService
 from document_manager.services.concordance_service import ConcordanceService
+from document_manager.services.watch_folder_service import WatchFolderService
 
-__all__ = ["DocumentService", "QGemDocumentService", "ConcordanceService"]
+__all__ = [
+    "DocumentService",
+    "QGemDocumentService",
+    "ConcordanceService",
+    "WatchFolderService",
+]
@@ -5,13 +5,15 @@ This file is part of the document_manager pillar and serves as a service compone
 It is responsible for handling document category operations and hierarchies.
 
 Key components:
-- CategoryService: Service class for document category management operations
+- CategoryService: Service class for document category management operations,
+  with a cached category tree that is rebuilt after category edits
 
 Dependencies:
 - document_manager.models.document_category: For DocumentCategory model
 - document_manager.repositories.category_repository: For category persistence
 """
 
+from collections import defaultdict
 from typing import Dict, List, Optional
 
 from loguru import logger
@@ -31,6 +33,10 @@ class CategoryService:
         """
         self.category_repository = category_repository or CategoryRepository()
 
+        # Category tree and the repository revision it was built at
+        self._tree: Optional[List[Dict]] = None
+        self._tree_revision = -1
+
     def get_category(self, category_id: str) -> Optional[DocumentCategory]:
         """Get a category by ID.
 
@@ -224,74 +230,45 @@ class CategoryService:
         if category_id == new_parent_id:
             return True
 
-        # Get the potential parent
-        parent = self.category_repository.get_by_id(new_parent_id)
-
-        if not parent:
-            return False
-
-        # Check if this category is an ancestor of the new parent
-        current_id = parent.parent_id
-        visited = set()
+        # Check if this category is the new parent or one of its ancestors
+        ancestors = self.category_repository.get_ancestors(new_parent_id)
+        return any(ancestor.id == category_id for ancestor in ancestors)
 
-        while current_id:
-            if current_id in visited:
-                # Cycle in existing hierarchy
-                return True
-
-            if current_id == category_id:
-                return True
+    def get_category_tree(self) -> List[Dict]:
+        """Get the category tree as a hierarchical structure.
 
-            visited.add(current_id)
-            current_parent = self.category_repository.get_by_id(current_id)
+        The tree is built from a single query and cached until a category is
+        saved or deleted. The cached tree is shared between callers and must
+        not be modified.
 
-            if not current_parent:
-                break
+        Returns:
+            List of root categories with nested children, sorted by name
+        """
+        revision = self.category_repository.revision
+        if self._tree is None or self._tree_revision != revision:
+            self._tree = self._build_category_tree()
+            self._tree_revision = revision
 
-            current_id = current_parent.parent_id
+        return self._tree
 
-        return False
+    def _build_category_tree(self) -> List[Dict]:
+        """Build the category tree from all categories.
 
-    def get_category_tree(self) -> List[Dict]:
-        """Get the category tree as a hierarchical structure.
+        Categories come sorted by name, so every child list is sorted as it
+        is filled. Categories whose parent does not exist are not reachable
+        from the roots and so are left out.
 
         Returns:
             List of root categories with nested children
         """
-        all_categories = {cat.id: cat for cat in self.category_repository.get_all()}
+        children: Dict[Optional[str], List[Dict]] = defaultdict(list)
 
-        # Build tree structure
-        def build_tree(category_id):
-            if category_id not in all_categories:
-                return None
+        for node in self.category_repository.get_tree_rows():
+            parent_id = node.pop("parent_id") or None
+            node["children"] = children[node["id"]]
+            children[parent_id].append(node)
 
-            category = all_categories[category_id]
-            children = []
-
-            for cat_id, cat in all_categories.items():
-                if cat.parent_id == category_id:
-                    child_tree = build_tree(cat_id)
-                    if child_tree:
-                        children.append(child_tree)
-
-            return {
-                "id": category.id,
-                "name": category.name,
-                "color": category.color,
-                "description": category.description,
-                "icon": category.icon,
-                "children": sorted(children, key=lambda x: x["name"]),
-            }
-
-        # Start with root categories
-        tree = []
-        for cat_id, cat in all_categories.items():
-            if not cat.parent_id:  # Root category
-                tree_node = build_tree(cat_id)
-                if tree_node:
-                    tree.append(tree_node)
-
-        return sorted(tree, key=lambda x: x["name"])
+        return children[None]
 
     def get_category_path(self, category_id: str) -> List[DocumentCategory]:
         """Get the path from root to a specific category.
@@ -302,17 +279,26 @@ class CategoryService:
         Returns:
             List of categories from root to the given category (inclusive)
         """
-        path: List[DocumentCategory] = []
-        current_category = self.category_repository.get_by_id(category_id)
+        return self.category_repository.get_ancestors(category_id)
 
-        while current_category:
-            path.insert(0, current_category)
+    def get_descendant_categories(self, category_id: str) -> List[DocumentCategory]:
+        """Get all categories below a category, at any depth.
 
-            if not current_category.parent_id:
-                break
+        Args:
+            category_id: Category ID
+
+        Returns:
+            List of descendant categories, sorted by name
+        """
+        return self.category_repository.get_descendants(category_id)
 
-            current_category = self.category_repository.get_by_id(
-                current_category.parent_id
-            )
+    def count_subtree_documents(self, category_id: str) -> int:
+        """Count the documents filed under a category or any of its descendants.
 
-        return path
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Number of documents in the category's subtree
+        """
+        return self.category_repository.count_subtree_documents(category_id)
@@ -0,0 +1,142 @@
+"""
+Purpose: Generates concordance entries in a pool of worker processes
+
+This file is part of the document_manager pillar and serves as a service component.
+Concordance generation scans every document for every keyword and builds an
+entry per occurrence, which is pure-Python work bound by the GIL. This module
+hands document IDs to worker processes; each worker loads its documents from
+the database itself and returns the entries as plain rows, so neither the
+documents nor whole-library entry lists pass through or pile up in the caller,
+which inserts the rows in batches as they arrive.
+
+Key components:
+- generate_entries: Yields entry rows per document as worker processes finish them
+- estimate_row_bytes: Approximate memory held by one entry row
+
+Dependencies:
+- document_manager.services.process_pool: Runs the worker processes
+- document_manager.services.concordance_service: Builds the entries in each worker
+
+Related files:
+- document_manager/services/concordance_service.py: Streams the rows into the database
+- document_manager/services/document_extraction_pool.py: Same pool use for imports
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+from document_manager.models.kwic_concordance import ConcordanceSettings
+from document_manager.repositories.concordance_repository import EntryRow, entry_row
+from document_manager.services.process_pool import run_in_processes
+
+# Result for one document: (document ID, entry rows, error message)
+DocumentEntries = Tuple[str, List[EntryRow], Optional[str]]
+
+# Rough size of an entry row beyond its context strings (tuple, IDs, numbers)
+ROW_OVERHEAD_BYTES = 400
+
+# State of the current worker process
+_repository = None
+_service = None
+_keywords: List[str] = []
+_settings: Optional[ConcordanceSettings] = None
+_matcher = None
+
+
+def _init_worker(
+    db_path: str, keywords: List[str], settings: ConcordanceSettings
+) -> None:
+    """Prepare the repository and keyword matcher used by this worker process.
+
+    Args:
+        db_path: Path of the document database (only read, never written)
+        keywords: Cleaned keywords to search for
+        settings: Concordance settings
+    """
+    global _repository, _service, _keywords, _settings, _matcher
+
+    # Imported here because concordance_service imports this module
+    from document_manager.repositories.document_repository import DocumentRepository
+    from document_manager.services.concordance_service import ConcordanceService
+
+    _repository = DocumentRepository(db_path)
+    # Workers only use the service's text processing, never its repositories
+    _service = ConcordanceService(None, None)
+    _keywords = keywords
+    _settings = settings
+    _matcher = _service._build_matcher(keywords, settings)
+
+
+def _document_entries(document_id: str) -> Tuple[List[EntryRow], Optional[str]]:
+    """Build the entry rows for one document in the current worker.
+
+    Args:
+        document_id: ID of the document to process
+
+    Returns:
+        Tuple of (entry rows, error message or None)
+    """
+    document = _repository.get_by_id(document_id)
+    if document is None:
+        return [], "document not found"
+    if not document.content:
+        return [], None
+
+    entries = _service._generate_document_concordance(
+        document, _keywords, _settings, _matcher
+    )
+    return [entry_row(entry) for entry in entries], None
+
+
+def estimate_row_bytes(row: EntryRow) -> int:
+    """Estimate the memory held by an entry row.
+
+    Args:
+        row: Entry row from generate_entries
+
+    Returns:
+        Approximate size in bytes
+    """
+    # Context strings are the only fields that grow with the settings
+    return ROW_OVERHEAD_BYTES + len(row[2]) + len(row[3])
+
+
+def generate_entries(
+    document_ids: List[str],
+    db_path: str,
+    keywords: List[str],
+    settings: ConcordanceSettings,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[DocumentEntries]:
+    """Generate concordance entries in worker processes, per document.
+
+    At most max_pending documents are handed to the pool at a time, so
+    finished entries cannot pile up faster than the caller stores them.
+    Closing the generator early cancels documents not yet started. With a
+    single worker the documents are processed in the calling process. A
+    worker that crashes fails the documents it was working on, and the rest
+    go to a new pool.
+
+    Args:
+        document_ids: Documents to process
+        db_path: Path of the document database
+        keywords: Cleaned keywords to search for
+        settings: Concordance settings
+        max_workers: Number of worker processes (defaults to the CPU count)
+        max_pending: Documents in flight at once (defaults to twice the workers)
+
+    Yields:
+        Tuples of (document ID, entry rows, error message)
+    """
+    for document_id, result, error in run_in_processes(
+        _document_entries,
+        document_ids,
+        initializer=_init_worker,
+        initargs=(str(db_path), keywords, settings),
+        max_workers=max_workers,
+        max_pending=max_pending,
+    ):
+        if error is not None:
+            yield document_id, [], error
+        else:
+            yield (document_id, *result)
@@ -6,13 +6,21 @@ KWIC (Key Word In Context) concordances from document text content.
 """
 
 import csv
+import gzip
 import json
+import os
 import re
+import textwrap
 import time
+from bisect import bisect_right
 from collections import defaultdict
 from datetime import datetime
 from io import StringIO
-from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from threading import Event
+from typing import Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple, Union
+
+from loguru import logger
 
 from document_manager.models.document import Document
 from document_manager.models.kwic_concordance import (
@@ -24,7 +32,34 @@ from document_manager.models.kwic_concordance import (
     ConcordanceTable,
 )
 from document_manager.repositories.concordance_repository import ConcordanceRepository
+from document_manager.repositories.token_index_repository import (
+    TokenIndexRepository,
+    TokenOccurrence,
+    TokenRow,
+)
+from document_manager.services.concordance_pool import estimate_row_bytes, generate_entries
 from document_manager.services.document_service import DocumentService
+from document_manager.utils.keyword_matcher import KeywordMatcher
+
+# Characters removed from contexts when punctuation is excluded
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+NEWLINE_PATTERN = re.compile('\n')
+
+# Tokens recorded in the positional index (the words \b delimits)
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Documents tokenized and written to the positional index per transaction
+INDEX_BATCH_SIZE = 10
+
+# Entries inserted per transaction when streaming a concordance
+DEFAULT_BATCH_SIZE = 5000
+
+# Memory buffered entries may take before they are written regardless
+DEFAULT_MEMORY_LIMIT_MB = 64
+
+# gzip level of compressed exports (9 is far slower for little gain on text)
+EXPORT_COMPRESS_LEVEL = 6
 
 
 class ConcordanceService:
@@ -49,6 +84,16 @@ class ConcordanceService:
         """
         self.concordance_repository = concordance_repository
         self.document_service = document_service
+        self._token_index: Optional[TokenIndexRepository] = None
+    
+    @property
+    def token_index(self) -> TokenIndexRepository:
+        """Positional token index stored with the documents (created on first use)."""
+        if self._token_index is None:
+            self._token_index = TokenIndexRepository(
+                self.document_service.document_repository.db_path
+            )
+        return self._token_index
     
     def generate_concordance(
         self,
@@ -58,7 +103,8 @@ class ConcordanceService:
         settings: Optional[ConcordanceSettings] = None,
         description: Optional[str] = None,
         tags: Optional[List[str]] = None,
-        created_by: Optional[str] = None
+        created_by: Optional[str] = None,
+        use_index: bool = False
     ) -> ConcordanceTable:
         """Generate a KWIC concordance for specified keywords and documents.
         
@@ -70,6 +116,9 @@ class ConcordanceService:
             description: Optional description
             tags: Optional tags for organization
             created_by: Optional user identifier
+            use_index: Answer from the positional token index (see
+                keyword_in_context) when matching whole words and every
+                keyword is a single word; other keywords scan the text
             
         Returns:
             Generated concordance table
@@ -90,23 +139,33 @@ class ConcordanceService:
         # Clean and validate keywords
         cleaned_keywords = self._clean_keywords(keywords, settings)
         
-        # Get documents
-        documents = []
-        for doc_id in document_ids:
-            doc = self.document_service.get_document(doc_id)
-            if doc and doc.content:
-                documents.append(doc)
-        
-        if not documents:
-            raise ValueError("No valid documents with content found")
-        
-        # Generate concordance entries
-        entries = []
-        for document in documents:
-            doc_entries = self._generate_document_concordance(
-                document, cleaned_keywords, settings
-            )
-            entries.extend(doc_entries)
+        # The index holds \w+ tokens, so it only answers single-word keywords
+        # exactly as the text scan would
+        if (
+            use_index
+            and settings.whole_words_only
+            and all(TOKEN_PATTERN.fullmatch(keyword) for keyword in cleaned_keywords)
+        ):
+            entries = self.keyword_in_context(cleaned_keywords, document_ids, settings)
+        else:
+            # Get documents
+            documents = []
+            for doc_id in document_ids:
+                doc = self.document_service.get_document(doc_id)
+                if doc and doc.content:
+                    documents.append(doc)
+            
+            if not documents:
+                raise ValueError("No valid documents with content found")
+            
+            # Generate concordance entries, finding all keywords in one pass
+            matcher = self._build_matcher(cleaned_keywords, settings)
+            entries = []
+            for document in documents:
+                doc_entries = self._generate_document_concordance(
+                    document, cleaned_keywords, settings, matcher
+                )
+                entries.extend(doc_entries)
         
         # Sort entries according to settings
         entries = self._sort_entries(entries, settings)
@@ -125,6 +184,302 @@ class ConcordanceService:
         
         return concordance_table
     
+    def generate_concordance_streaming(
+        self,
+        name: str,
+        keywords: List[str],
+        document_ids: List[str],
+        settings: Optional[ConcordanceSettings] = None,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        created_by: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[Event] = None
+    ) -> Optional[ConcordanceTable]:
+        """Generate and save a concordance, streaming entries to the database.
+        
+        Documents are processed in worker processes and their entries are
+        inserted in batches as they arrive, so memory use stays bounded
+        however many entries the concordance has. A batch is written once it
+        holds batch_size entries or its estimated size reaches memory_limit_mb.
+        
+        Args:
+            name: Name for the concordance table
+            keywords: List of keywords to search for
+            document_ids: List of document IDs to search in
+            settings: Concordance generation settings
+            description: Optional description
+            tags: Optional tags for organization
+            created_by: Optional user identifier
+            max_workers: Number of worker processes (defaults to the CPU count)
+            batch_size: Maximum entries per insert transaction
+            memory_limit_mb: Maximum estimated size of buffered entries
+            progress_callback: Called with (documents done, documents total)
+            cancel_event: When set, generation stops and the table is discarded
+            
+        Returns:
+            The saved concordance table without its entries (load it with
+            get_concordance), or None if generation was cancelled
+            
+        Raises:
+            ValueError: If no keywords or documents provided, or none of the
+                documents has content
+        """
+        if not keywords:
+            raise ValueError("At least one keyword must be provided")
+        
+        if not document_ids:
+            raise ValueError("At least one document must be provided")
+        
+        if settings is None:
+            settings = ConcordanceSettings()
+        
+        cleaned_keywords = self._clean_keywords(keywords, settings)
+        
+        # Check before creating the table, so nothing is left behind
+        document_ids = self.document_service.document_repository.filter_ids_with_content(
+            document_ids
+        )
+        if not document_ids:
+            raise ValueError("No valid documents with content found")
+        
+        concordance_table = ConcordanceTable(
+            name=name,
+            description=description,
+            keywords=cleaned_keywords,
+            document_ids=document_ids,
+            settings=settings,
+            created_by=created_by,
+            tags=tags or []
+        )
+        table_id = self.concordance_repository.create_concordance_table(concordance_table)
+        
+        memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        batch = []
+        batch_bytes = 0
+        documents_done = 0
+        cancelled = False
+        
+        try:
+            results = generate_entries(
+                document_ids,
+                self.document_service.document_repository.db_path,
+                cleaned_keywords,
+                settings,
+                max_workers=max_workers
+            )
+            for document_id, rows, error in results:
+                if error:
+                    logger.warning(f"Skipped document {document_id} in concordance: {error}")
+                
+                for row in rows:
+                    batch.append(row)
+                    batch_bytes += estimate_row_bytes(row)
+                    if len(batch) >= batch_size or batch_bytes >= memory_limit_bytes:
+                        self.concordance_repository.add_concordance_entries(table_id, batch)
+                        batch = []
+                        batch_bytes = 0
+                
+                documents_done += 1
+                if progress_callback:
+                    progress_callback(documents_done, len(document_ids))
+                
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    results.close()
+                    break
+            
+            if batch and not cancelled:
+                self.concordance_repository.add_concordance_entries(table_id, batch)
+        except Exception:
+            self.concordance_repository.delete_concordance_table(table_id)
+            raise
+        
+        if cancelled:
+            logger.info(f"Concordance generation cancelled: {name}")
+            self.concordance_repository.delete_concordance_table(table_id)
+            return None
+        
+        return concordance_table
+    
+    def update_token_index(self, document_ids: Optional[List[str]] = None) -> int:
+        """Bring the positional token index up to date.
+        
+        Only documents that are new or whose content changed since they were
+        indexed are tokenized again; deleted documents are dropped.
+        
+        Args:
+            document_ids: Documents to update, or None for the whole library
+            
+        Returns:
+            Number of documents (re-)indexed
+        """
+        if document_ids is None:
+            self.token_index.remove_inactive_documents()
+        
+        stale = self.token_index.stale_documents(document_ids)
+        indexed = 0
+        for batch_start in range(0, len(stale), INDEX_BATCH_SIZE):
+            batch = []
+            for document_id, revision in stale[batch_start:batch_start + INDEX_BATCH_SIZE]:
+                document = self.document_service.document_repository.get_by_id(document_id)
+                if document is not None:
+                    batch.append(
+                        (document_id, revision, self._tokenize(document.content or ''))
+                    )
+            indexed += self.token_index.replace_documents(batch)
+        
+        if indexed:
+            logger.debug(f"Indexed tokens of {indexed} documents")
+        return indexed
+    
+    def find_phrase(
+        self,
+        phrase: str,
+        document_ids: Optional[List[str]] = None
+    ) -> List[TokenOccurrence]:
+        """Find a word or phrase through the positional token index.
+        
+        Matching is case-insensitive and by whole tokens: the words of the
+        phrase must be consecutive, whatever punctuation or whitespace
+        separates them.
+        
+        Args:
+            phrase: Word or phrase to find
+            document_ids: Documents to search, or None for the whole library
+            
+        Returns:
+            Occurrences ordered by document and position
+        """
+        self.update_token_index(document_ids)
+        tokens = [token.casefold() for token in TOKEN_PATTERN.findall(phrase)]
+        return self.token_index.find_phrase(tokens, document_ids)
+    
+    def find_near(
+        self,
+        first: str,
+        second: str,
+        max_distance: int,
+        in_order: bool = False,
+        document_ids: Optional[List[str]] = None
+    ) -> List[Tuple[TokenOccurrence, TokenOccurrence]]:
+        """Find two words occurring within a number of words of each other.
+        
+        Args:
+            first: First word
+            second: Second word
+            max_distance: Maximum distance in words (1 means adjacent)
+            in_order: Whether the second word must follow the first
+            document_ids: Documents to search, or None for the whole library
+            
+        Returns:
+            Pairs of (first occurrence, second occurrence)
+            
+        Raises:
+            ValueError: If either argument is not a single word
+        """
+        words = [TOKEN_PATTERN.findall(first), TOKEN_PATTERN.findall(second)]
+        if any(len(tokens) != 1 for tokens in words):
+            raise ValueError("Proximity queries take single words")
+        
+        self.update_token_index(document_ids)
+        return self.token_index.find_near(
+            words[0][0].casefold(), words[1][0].casefold(), max_distance,
+            in_order, document_ids
+        )
+    
+    def keyword_in_context(
+        self,
+        keywords: List[str],
+        document_ids: Optional[List[str]] = None,
+        settings: Optional[ConcordanceSettings] = None
+    ) -> List[ConcordanceEntry]:
+        """Build concordance entries from the positional token index.
+        
+        Occurrences come from the index, so only the documents containing a
+        keyword are read, to cut out the contexts. Keywords match as whole
+        tokens, phrases as consecutive tokens; whole_words_only is implied.
+        Each occurrence is checked against the text, so a phrase only
+        matches where it is written exactly as given (ignoring case), not
+        across other punctuation or line breaks, and keywords with
+        characters outside words (e.g. "c++") do not match their words alone.
+        
+        Args:
+            keywords: Keywords or phrases to look up
+            document_ids: Documents to search, or None for the whole library
+            settings: Concordance settings
+            
+        Returns:
+            Entries grouped by document, then by keyword
+        """
+        if settings is None:
+            settings = ConcordanceSettings()
+        
+        self.update_token_index(document_ids)
+        
+        occurrences: Dict[str, Dict[str, List[TokenOccurrence]]] = defaultdict(
+            lambda: {keyword: [] for keyword in keywords}
+        )
+        for keyword in keywords:
+            tokens = [token.casefold() for token in TOKEN_PATTERN.findall(keyword)]
+            for occurrence in self.token_index.find_phrase(tokens, document_ids):
+                occurrences[occurrence.document_id][keyword].append(occurrence)
+        
+        entries = []
+        for document_id, by_keyword in occurrences.items():
+            document = self.document_service.get_document(document_id)
+            if document is None or not document.content:
+                continue
+            text = document.content
+            for keyword, keyword_occurrences in by_keyword.items():
+                keyword_tokens = TOKEN_PATTERN.findall(keyword)
+                key = keyword if settings.case_sensitive else keyword.casefold()
+                next_ordinal = 0
+                for occurrence in keyword_occurrences:
+                    # Occurrences of one phrase do not overlap, as in a text scan
+                    if occurrence.ordinal < next_ordinal:
+                        continue
+                    # The index ignores what lies between and around tokens
+                    matched = text[occurrence.start:occurrence.end]
+                    if not settings.case_sensitive:
+                        matched = matched.casefold()
+                    if matched != key:
+                        continue
+                    next_ordinal = occurrence.ordinal + len(keyword_tokens)
+                    entries.append(self._create_entry(
+                        text, occurrence.start, occurrence.end, document, settings,
+                        occurrence.line_number, occurrence.paragraph_number
+                    ))
+        
+        return entries
+    
+    def _tokenize(self, text: str) -> List[TokenRow]:
+        """Split a text into positional index rows.
+        
+        Args:
+            text: Text to tokenize
+            
+        Returns:
+            Token rows with normalized tokens, in text order
+        """
+        line_positions = self._calculate_line_positions(text)
+        paragraph_positions = self._calculate_paragraph_positions(text)
+        
+        return [
+            (
+                match.group().casefold(),
+                ordinal,
+                match.start(),
+                match.end() - match.start(),
+                self._find_line_number(match.start(), line_positions),
+                self._find_paragraph_number(match.start(), paragraph_positions)
+            )
+            for ordinal, match in enumerate(TOKEN_PATTERN.finditer(text))
+        ]
+    
     def save_concordance(self, concordance_table: ConcordanceTable) -> str:
         """Save a concordance table to the database.
         
@@ -136,16 +491,22 @@ class ConcordanceService:
         """
         return self.concordance_repository.save_concordance_table(concordance_table)
     
-    def get_concordance(self, table_id: str) -> Optional[ConcordanceTable]:
+    def get_concordance(
+        self, table_id: str, include_entries: bool = True
+    ) -> Optional[ConcordanceTable]:
         """Retrieve a concordance table by ID.
         
         Args:
             table_id: The ID of the table to retrieve
+            include_entries: Whether to load the entries; large tables are
+                better browsed page by page with get_entries_after
             
         Returns:
             The concordance table if found, None otherwise
         """
-        return self.concordance_repository.get_concordance_table(table_id)
+        return self.concordance_repository.get_concordance_table(
+            table_id, include_entries=include_entries
+        )
     
     def get_concordance_by_name(self, name: str) -> Optional[ConcordanceTable]:
         """Retrieve a concordance table by name.
@@ -213,6 +574,59 @@ class ConcordanceService:
             documents_found=documents_found
         )
     
+    def get_entries_after(
+        self,
+        table_id: str,
+        filter_criteria: Optional[ConcordanceFilter] = None,
+        sort_by: str = 'keyword',
+        descending: bool = False,
+        after: Optional[Tuple] = None,
+        limit: int = 200
+    ) -> Tuple[List[ConcordanceEntry], Optional[Tuple]]:
+        """Get one page of a table's matching entries.
+        
+        See ConcordanceRepository.get_entries_after.
+        
+        Args:
+            table_id: ID of the concordance table
+            filter_criteria: Optional filter criteria
+            sort_by: 'keyword', 'document' or 'position'
+            descending: Whether to sort in descending order
+            after: Key of the last entry of the previous page, or None
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Tuple of (entries, key of the last returned entry)
+        """
+        return self.concordance_repository.get_entries_after(
+            table_id, filter_criteria, sort_by, descending, after, limit
+        )
+    
+    def count_entries(
+        self, table_id: str, filter_criteria: Optional[ConcordanceFilter] = None
+    ) -> int:
+        """Count the entries of a table matching filter criteria.
+        
+        Args:
+            table_id: ID of the concordance table
+            filter_criteria: Optional filter criteria
+            
+        Returns:
+            Number of matching entries
+        """
+        return self.concordance_repository.count_matching_entries(table_id, filter_criteria)
+    
+    def get_entry_documents(self, table_id: str) -> List[Tuple[str, str]]:
+        """Get the documents that have entries in a table.
+        
+        Args:
+            table_id: ID of the concordance table
+            
+        Returns:
+            List of (document_id, document_name) tuples ordered by name
+        """
+        return self.concordance_repository.get_entry_documents(table_id)
+    
     def export_concordance(
         self,
         table_id: str,
@@ -220,6 +634,9 @@ class ConcordanceService:
     ) -> str:
         """Export a concordance table to various formats.
         
+        Large tables are better written with export_concordance_to_file,
+        which does not hold the exported text in memory.
+        
         Args:
             table_id: ID of the concordance table to export
             export_format: Export format configuration
@@ -230,22 +647,54 @@ class ConcordanceService:
         Raises:
             ValueError: If table not found or invalid format
         """
-        table = self.get_concordance(table_id)
-        if not table:
-            raise ValueError(f"Concordance table {table_id} not found")
+        output = StringIO()
+        self._write_export(table_id, export_format, output)
+        return output.getvalue()
+    
+    def export_concordance_to_file(
+        self,
+        table_id: str,
+        export_format: ConcordanceExportFormat,
+        file_path: Union[str, Path]
+    ) -> int:
+        """Export a concordance table to a file, streaming its entries.
         
-        if export_format.format_type == 'csv':
-            return self._export_to_csv(table, export_format)
-        elif export_format.format_type == 'tsv':
-            return self._export_to_tsv(table, export_format)
-        elif export_format.format_type == 'json':
-            return self._export_to_json(table, export_format)
-        elif export_format.format_type == 'html':
-            return self._export_to_html(table, export_format)
-        elif export_format.format_type == 'txt':
-            return self._export_to_txt(table, export_format)
+        The file is gzip-compressed when export_format.compress is set or
+        the path ends in .gz. It is written under a temporary name and only
+        replaces file_path once complete.
+        
+        Args:
+            table_id: ID of the concordance table to export
+            export_format: Export format configuration
+            file_path: File to write
+            
+        Returns:
+            Number of entries exported
+            
+        Raises:
+            ValueError: If table not found or invalid format
+        """
+        path = Path(file_path)
+        partial_path = path.with_name(path.name + '.part')
+        
+        if export_format.compress or path.suffix == '.gz':
+            output = gzip.open(
+                partial_path, 'wt', compresslevel=EXPORT_COMPRESS_LEVEL,
+                encoding='utf-8', newline=''
+            )
         else:
-            raise ValueError(f"Unsupported export format: {export_format.format_type}")
+            output = open(partial_path, 'w', encoding='utf-8', newline='')
+        
+        try:
+            with output:
+                count = self._write_export(table_id, export_format, output)
+            os.replace(partial_path, path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        
+        logger.info(f"Exported {count} concordance entries to {path}")
+        return count
     
     def get_statistics(self) -> Dict[str, int]:
         """Get overall concordance statistics.
@@ -338,103 +787,114 @@ class ConcordanceService:
         self,
         document: Document,
         keywords: List[str],
-        settings: ConcordanceSettings
+        settings: ConcordanceSettings,
+        matcher: Optional[KeywordMatcher] = None
     ) -> List[ConcordanceEntry]:
         """Generate concordance entries for a single document.
         
+        All keywords are found in one scan of the text. Entries are returned
+        grouped by keyword, in the order of the keywords list.
+        
         Args:
             document: Document to process
             keywords: Keywords to search for
             settings: Concordance settings
+            matcher: Matcher compiled for the keywords, built if not given
             
         Returns:
             List of concordance entries
         """
-        entries = []
+        if matcher is None:
+            matcher = self._build_matcher(keywords, settings)
+        
         text = document.content
         
-        # Calculate line and paragraph positions if needed
-        lines = text.split('\n')
+        # Calculate line and paragraph positions
         line_positions = self._calculate_line_positions(text)
         paragraph_positions = self._calculate_paragraph_positions(text)
         
-        for keyword in keywords:
-            keyword_entries = self._find_keyword_occurrences(
-                text, keyword, document, settings, 
-                line_positions, paragraph_positions
+        entries_by_keyword: Dict[str, List[ConcordanceEntry]] = {
+            keyword: [] for keyword in keywords
+        }
+        for start_pos, end_pos, keyword in matcher.finditer(text):
+            entries_by_keyword[keyword].append(
+                self._create_entry(
+                    text, start_pos, end_pos, document, settings,
+                    self._find_line_number(start_pos, line_positions),
+                    self._find_paragraph_number(start_pos, paragraph_positions)
+                )
             )
-            entries.extend(keyword_entries)
         
-        return entries
+        return [
+            entry
+            for keyword_entries in entries_by_keyword.values()
+            for entry in keyword_entries
+        ]
     
-    def _find_keyword_occurrences(
+    def _build_matcher(
+        self, keywords: List[str], settings: ConcordanceSettings
+    ) -> KeywordMatcher:
+        """Compile a matcher finding all keywords at once.
+        
+        Args:
+            keywords: Cleaned keywords
+            settings: Concordance settings
+            
+        Returns:
+            Keyword matcher
+        """
+        return KeywordMatcher(
+            keywords,
+            case_sensitive=settings.case_sensitive,
+            whole_words_only=settings.whole_words_only
+        )
+    
+    def _create_entry(
         self,
         text: str,
-        keyword: str,
+        start_pos: int,
+        end_pos: int,
         document: Document,
         settings: ConcordanceSettings,
-        line_positions: List[int],
-        paragraph_positions: List[int]
-    ) -> List[ConcordanceEntry]:
-        """Find all occurrences of a keyword in text.
+        line_number: int,
+        paragraph_number: int
+    ) -> ConcordanceEntry:
+        """Create the concordance entry for one keyword occurrence.
         
         Args:
-            text: Text to search in
-            keyword: Keyword to search for
+            text: Text the keyword was found in
+            start_pos: Start of the occurrence
+            end_pos: End of the occurrence
             document: Source document
             settings: Concordance settings
-            line_positions: Line start positions
-            paragraph_positions: Paragraph start positions
+            line_number: Line of the occurrence (1-based)
+            paragraph_number: Paragraph of the occurrence (1-based)
             
         Returns:
-            List of concordance entries for this keyword
+            Concordance entry
         """
-        entries = []
-        
-        # Build regex pattern
-        if settings.whole_words_only:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-        else:
-            pattern = re.escape(keyword)
-        
-        flags = 0 if settings.case_sensitive else re.IGNORECASE
-        
-        # Find all matches
-        for match in re.finditer(pattern, text, flags):
-            start_pos = match.start()
-            end_pos = match.end()
-            
-            # Extract context
-            left_start = max(0, start_pos - settings.context_window)
-            right_end = min(len(text), end_pos + settings.context_window)
-            
-            left_context = text[left_start:start_pos]
-            right_context = text[end_pos:right_end]
-            
-            # Clean context if needed
-            if not settings.include_punctuation:
-                left_context = re.sub(r'[^\w\s]', '', left_context)
-                right_context = re.sub(r'[^\w\s]', '', right_context)
-            
-            # Calculate line and paragraph numbers
-            line_number = self._find_line_number(start_pos, line_positions)
-            paragraph_number = self._find_paragraph_number(start_pos, paragraph_positions)
-            
-            # Create entry
-            entry = ConcordanceEntry(
-                keyword=text[start_pos:end_pos],  # Preserve original case
-                left_context=left_context.strip(),
-                right_context=right_context.strip(),
-                position=start_pos,
-                line_number=line_number,
-                paragraph_number=paragraph_number,
-                document_id=document.id,
-                document_name=document.name
-            )
-            
-            entries.append(entry)
-        
-        return entries
+        # Extract context
+        left_start = max(0, start_pos - settings.context_window)
+        right_end = min(len(text), end_pos + settings.context_window)
+        
+        left_context = text[left_start:start_pos]
+        right_context = text[end_pos:right_end]
+        
+        # Clean context if needed
+        if not settings.include_punctuation:
+            left_context = PUNCTUATION_PATTERN.sub('', left_context)
+            right_context = PUNCTUATION_PATTERN.sub('', right_context)
+        
+        return ConcordanceEntry(
+            keyword=text[start_pos:end_pos],  # Preserve original case
+            left_context=left_context.strip(),
+            right_context=right_context.strip(),
+            position=start_pos,
+            line_number=line_number,
+            paragraph_number=paragraph_number,
+            document_id=document.id,
+            document_name=document.name
+        )
     
     def _calculate_line_positions(self, text: str) -> List[int]:
         """Calculate the starting positions of each line.
@@ -445,11 +905,7 @@ class ConcordanceService:
         Returns:
             List of line start positions
         """
-        positions = [0]
-        for i, char in enumerate(text):
-            if char == '\n':
-                positions.append(i + 1)
-        return positions
+        return [0] + [match.end() for match in NEWLINE_PATTERN.finditer(text)]
     
     def _calculate_paragraph_positions(self, text: str) -> List[int]:
         """Calculate the starting positions of each paragraph.
@@ -479,30 +935,24 @@ class ConcordanceService:
         
         Args:
             position: Character position
-            line_positions: List of line start positions
+            line_positions: Sorted list of line start positions
             
         Returns:
             Line number (1-based)
         """
-        for i, line_start in enumerate(line_positions):
-            if i == len(line_positions) - 1 or position < line_positions[i + 1]:
-                return i + 1
-        return len(line_positions)
+        return max(1, bisect_right(line_positions, position))
     
     def _find_paragraph_number(self, position: int, paragraph_positions: List[int]) -> int:
         """Find the paragraph number for a given position.
         
         Args:
             position: Character position
-            paragraph_positions: List of paragraph start positions
+            paragraph_positions: Sorted list of paragraph start positions
             
         Returns:
             Paragraph number (1-based)
         """
-        for i, para_start in enumerate(paragraph_positions):
-            if i == len(paragraph_positions) - 1 or position < paragraph_positions[i + 1]:
-                return i + 1
-        return len(paragraph_positions)
+        return max(1, bisect_right(paragraph_positions, position))
     
     def _sort_entries(self, entries: List[ConcordanceEntry], settings: ConcordanceSettings) -> List[ConcordanceEntry]:
         """Sort concordance entries according to settings.
@@ -527,79 +977,100 @@ class ConcordanceService:
         
         return entries
     
-    def _export_to_csv(self, table: ConcordanceTable, export_format: ConcordanceExportFormat) -> str:
-        """Export concordance table to CSV format.
+    def _write_export(
+        self,
+        table_id: str,
+        export_format: ConcordanceExportFormat,
+        output: TextIO
+    ) -> int:
+        """Write a concordance table to a text stream in the requested format.
+        
+        Entries are read from the repository in chunks and written as they
+        are read, so memory use does not depend on the size of the table.
         
         Args:
-            table: Concordance table to export
-            export_format: Export configuration
+            table_id: ID of the concordance table to export
+            export_format: Export format configuration
+            output: Text stream to write to
             
         Returns:
-            CSV data as string
+            Number of entries written
+            
+        Raises:
+            ValueError: If table not found or invalid format
         """
-        output = StringIO()
-        writer = csv.writer(output)
+        table = self.concordance_repository.get_concordance_table(table_id, include_entries=False)
+        if not table:
+            raise ValueError(f"Concordance table {table_id} not found")
         
-        # Write header
-        headers = ['Keyword', 'Left Context', 'Right Context', 'Position', 'Document']
-        if export_format.include_metadata:
-            headers.extend(['Line Number', 'Paragraph Number', 'Created At'])
-        writer.writerow(headers)
+        writers = {
+            'csv': self._write_csv,
+            'tsv': self._write_tsv,
+            'json': self._write_json,
+            'html': self._write_html,
+            'txt': self._write_txt
+        }
+        writer = writers.get(export_format.format_type)
+        if writer is None:
+            raise ValueError(f"Unsupported export format: {export_format.format_type}")
         
-        # Sort entries if needed
-        entries = table.entries
+        group_by = None
         if export_format.group_by_keyword:
-            entries = sorted(entries, key=lambda e: e.keyword.lower())
+            group_by = 'keyword'
         elif export_format.group_by_document:
-            entries = sorted(entries, key=lambda e: e.document_name)
-        
-        # Write entries
-        for entry in entries:
-            row = [
-                entry.keyword,
-                entry.left_context,
-                entry.right_context,
-                entry.position,
-                entry.document_name
-            ]
-            
-            if export_format.include_metadata:
-                row.extend([
-                    entry.line_number or '',
-                    entry.paragraph_number or '',
-                    entry.created_at.isoformat()
-                ])
-            
-            writer.writerow(row)
+            group_by = 'document'
+        entries = self.concordance_repository.iter_concordance_entries(table_id, group_by)
         
-        # Add statistics if requested
-        if export_format.include_statistics:
-            writer.writerow([])
-            writer.writerow(['Statistics'])
-            stats = table.get_statistics()
-            for key, value in stats.items():
-                writer.writerow([key.replace('_', ' ').title(), value])
+        return writer(output, table, export_format, entries)
+    
+    def _export_statistics(self, table: ConcordanceTable) -> Dict[str, int]:
+        """Get the statistics of a stored table without loading its entries.
         
-        return output.getvalue()
+        Args:
+            table: Concordance table (its entries are not used)
+            
+        Returns:
+            The same statistics as ConcordanceTable.get_statistics
+        """
+        entry_stats = self.concordance_repository.get_entry_statistics(table.id)
+        return {
+            'total_entries': entry_stats['total_entries'],
+            'unique_documents': entry_stats['unique_documents'],
+            'unique_keywords': entry_stats['unique_keywords'],
+            'keywords_searched': len(table.keywords),
+            'documents_searched': len(table.document_ids)
+        }
     
-    def _export_to_tsv(self, table: ConcordanceTable, export_format: ConcordanceExportFormat) -> str:
-        """Export concordance table to TSV format."""
-        # Use CSV export with tab delimiter
-        output = StringIO()
-        writer = csv.writer(output, delimiter='\t')
+    def _write_csv(
+        self,
+        output: TextIO,
+        table: ConcordanceTable,
+        export_format: ConcordanceExportFormat,
+        entries: Iterable[ConcordanceEntry],
+        delimiter: str = ','
+    ) -> int:
+        """Write concordance entries in CSV format.
         
-        # Similar to CSV but with tab delimiter
+        Args:
+            output: Text stream to write to
+            table: Concordance table being exported
+            export_format: Export configuration
+            entries: Entries in export order
+            delimiter: Field delimiter
+            
+        Returns:
+            Number of entries written
+        """
+        writer = csv.writer(output, delimiter=delimiter)
+        
+        # Write header
         headers = ['Keyword', 'Left Context', 'Right Context', 'Position', 'Document']
         if export_format.include_metadata:
             headers.extend(['Line Number', 'Paragraph Number', 'Created At'])
         writer.writerow(headers)
         
-        entries = table.entries
-        if export_format.group_by_keyword:
-            entries = sorted(entries, key=lambda e: e.keyword.lower())
-        elif export_format.group_by_document:
-            entries = sorted(entries, key=lambda e: e.document_name)
-        
+        # Write entries
+        count = 0
         for entry in entries:
             row = [
                 entry.keyword,
@@ -617,19 +1088,41 @@ class ConcordanceService:
                 ])
             
             writer.writerow(row)
+            count += 1
         
+        # Add statistics if requested
         if export_format.include_statistics:
             writer.writerow([])
             writer.writerow(['Statistics'])
-            stats = table.get_statistics()
+            stats = self._export_statistics(table)
             for key, value in stats.items():
                 writer.writerow([key.replace('_', ' ').title(), value])
         
-        return output.getvalue()
+        return count
     
-    def _export_to_json(self, table: ConcordanceTable, export_format: ConcordanceExportFormat) -> str:
-        """Export concordance table to JSON format."""
-        data = {
+    def _write_tsv(
+        self,
+        output: TextIO,
+        table: ConcordanceTable,
+        export_format: ConcordanceExportFormat,
+        entries: Iterable[ConcordanceEntry]
+    ) -> int:
+        """Write concordance entries in TSV format."""
+        return self._write_csv(output, table, export_format, entries, delimiter='\t')
+    
+    def _write_json(
+        self,
+        output: TextIO,
+        table: ConcordanceTable,
+        export_format: ConcordanceExportFormat,
+        entries: Iterable[ConcordanceEntry]
+    ) -> int:
+        """Write concordance entries in JSON format.
+        
+        The document is written piece by piece, laid out as json.dumps with
+        indent=2 would lay out the whole table.
+        """
+        header = json.dumps({
             'concordance_table': {
                 'id': table.id,
                 'name': table.name,
@@ -638,16 +1131,12 @@ class ConcordanceService:
                 'updated_at': table.updated_at.isoformat(),
                 'keywords': table.keywords,
                 'tags': table.tags
-            },
-            'entries': []
-        }
-        
-        entries = table.entries
-        if export_format.group_by_keyword:
-            entries = sorted(entries, key=lambda e: e.keyword.lower())
-        elif export_format.group_by_document:
-            entries = sorted(entries, key=lambda e: e.document_name)
+            }
+        }, indent=2)
+        # Leave the outer object open for the entries
+        output.write(header[:-2] + ',\n  "entries": [')
         
+        count = 0
         for entry in entries:
             entry_data = {
                 'keyword': entry.keyword,
@@ -665,16 +1154,28 @@ class ConcordanceService:
                     'created_at': entry.created_at.isoformat()
                 })
             
-            data['entries'].append(entry_data)
+            output.write(',\n' if count else '\n')
+            output.write(textwrap.indent(json.dumps(entry_data, indent=2), '    '))
+            count += 1
+        
+        output.write('\n  ]' if count else ']')
         
         if export_format.include_statistics:
-            data['statistics'] = table.get_statistics()
+            stats = json.dumps(self._export_statistics(table), indent=2)
+            output.write(',\n  "statistics": ' + stats.replace('\n', '\n  '))
         
-        return json.dumps(data, indent=2)
+        output.write('\n}')
+        return count
     
-    def _export_to_html(self, table: ConcordanceTable, export_format: ConcordanceExportFormat) -> str:
-        """Export concordance table to HTML format."""
-        html = f"""
+    def _write_html(
+        self,
+        output: TextIO,
+        table: ConcordanceTable,
+        export_format: ConcordanceExportFormat,
+        entries: Iterable[ConcordanceEntry]
+    ) -> int:
+        """Write concordance entries in HTML format."""
+        output.write(f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -692,12 +1193,12 @@ class ConcordanceService:
         </head>
         <body>
             <h1>KWIC Concordance: {table.name}</h1>
-        """
+        """)
         
         if table.description:
-            html += f"<p><strong>Description:</strong> {table.description}</p>"
+            output.write(f"<p><strong>Description:</strong> {table.description}</p>")
         
-        html += f"""
+        output.write(f"""
             <p><strong>Keywords:</strong> {', '.join(table.keywords)}</p>
             <p><strong>Created:</strong> {table.created_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
             
@@ -708,59 +1209,61 @@ class ConcordanceService:
                         <th>Keyword</th>
                         <th>Right Context</th>
                         <th>Document</th>
-        """
+        """)
         
         if export_format.include_metadata:
-            html += "<th>Position</th><th>Line</th><th>Paragraph</th>"
+            output.write("<th>Position</th><th>Line</th><th>Paragraph</th>")
         
-        html += """
+        output.write("""
                     </tr>
                 </thead>
                 <tbody>
-        """
-        
-        entries = table.entries
-        if export_format.group_by_keyword:
-            entries = sorted(entries, key=lambda e: e.keyword.lower())
-        elif export_format.group_by_document:
-            entries = sorted(entries, key=lambda e: e.document_name)
+        """)
         
+        count = 0
         for entry in entries:
-            html += f"""
+            output.write(f"""
                 <tr>
                     <td class="context">{entry.left_context}</td>
                     <td class="keyword">{entry.keyword}</td>
                     <td class="context">{entry.right_context}</td>
                     <td>{entry.document_name}</td>
-            """
+            """)
             
             if export_format.include_metadata:
-                html += f"""
+                output.write(f"""
                     <td>{entry.position}</td>
                     <td>{entry.line_number or ''}</td>
                     <td>{entry.paragraph_number or ''}</td>
-                """
+                """)
             
-            html += "</tr>"
+            output.write("</tr>")
+            count += 1
         
-        html += "</tbody></table>"
+        output.write("</tbody></table>")
         
         if export_format.include_statistics:
-            stats = table.get_statistics()
-            html += """
+            stats = self._export_statistics(table)
+            output.write("""
                 <div class="stats">
                     <h3>Statistics</h3>
                     <ul>
-            """
+            """)
             for key, value in stats.items():
-                html += f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>"
-            html += "</ul></div>"
+                output.write(f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>")
+            output.write("</ul></div>")
         
-        html += "</body></html>"
-        return html
+        output.write("</body></html>")
+        return count
     
-    def _export_to_txt(self, table: ConcordanceTable, export_format: ConcordanceExportFormat) -> str:
-        """Export concordance table to plain text format."""
+    def _write_txt(
+        self,
+        output: TextIO,
+        table: ConcordanceTable,
+        export_format: ConcordanceExportFormat,
+        entries: Iterable[ConcordanceEntry]
+    ) -> int:
+        """Write concordance entries in plain text format."""
         lines = []
         lines.append(f"KWIC Concordance: {table.name}")
         lines.append("=" * (len(table.name) + 17))
@@ -774,17 +1277,15 @@ class ConcordanceService:
         lines.append(f"Created: {table.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append("")
         
-        entries = table.entries
-        if export_format.group_by_keyword:
-            entries = sorted(entries, key=lambda e: e.keyword.lower())
-        elif export_format.group_by_document:
-            entries = sorted(entries, key=lambda e: e.document_name)
-        
-        # Calculate column widths
-        max_left = max(len(entry.left_context) for entry in entries) if entries else 20
-        max_keyword = max(len(entry.keyword) for entry in entries) if entries else 10
-        max_right = max(len(entry.right_context) for entry in entries) if entries else 20
-        max_doc = max(len(entry.document_name) for entry in entries) if entries else 15
+        # Calculate column widths in the database rather than over the entries
+        widths = self.concordance_repository.get_entry_statistics(table.id)
+        if widths['total_entries']:
+            max_left = widths['max_left_context_length']
+            max_keyword = widths['max_keyword_length']
+            max_right = widths['max_right_context_length']
+            max_doc = widths['max_document_name_length']
+        else:
+            max_left, max_keyword, max_right, max_doc = 20, 10, 20, 15
         
         # Limit column widths for readability
         max_left = min(max_left, 40)
@@ -795,23 +1296,24 @@ class ConcordanceService:
         header = f"{'Left Context':<{max_left}} | {'Keyword':<{max_keyword}} | {'Right Context':<{max_right}} | {'Document':<{max_doc}}"
         lines.append(header)
         lines.append("-" * len(header))
+        output.write("\n".join(lines))
         
         # Entries
+        count = 0
         for entry in entries:
             left = entry.left_context[:max_left].ljust(max_left)
             keyword = entry.keyword[:max_keyword].ljust(max_keyword)
             right = entry.right_context[:max_right].ljust(max_right)
             doc = entry.document_name[:max_doc].ljust(max_doc)
             
-            line = f"{left} | {keyword} | {right} | {doc}"
-            lines.append(line)
+            output.write(f"\n{left} | {keyword} | {right} | {doc}")
+            count += 1
         
         if export_format.include_statistics:
-            lines.append("")
-            lines.append("Statistics:")
-            lines.append("-" * 10)
-            stats = table.get_statistics()
+            lines = ["", "Statistics:", "-" * 10]
+            stats = self._export_statistics(table)
             for key, value in stats.items():
                 lines.append(f"{key.replace('_', ' ').title()}: {value}")
+            output.write("\n" + "\n".join(lines))
         
-        return "\n".join(lines) 
\ No newline at end of file
+        return count
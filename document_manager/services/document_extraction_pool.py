@@ -0,0 +1,167 @@
+"""
+Purpose: Extracts document text in a pool of worker processes
+
+This file is part of the document_manager pillar and serves as a service component.
+Text extraction (PDF text, DOCX/ODF parsing, Symbol font conversion) is
+pure-Python work bound by the GIL, so threads cannot spread it over cores.
+This module sends file paths to worker processes, which copy each file into
+storage and extract its text and metadata without writing to the database;
+files already in the library are recognized by checksum and skipped. The
+caller receives the prepared documents and saves them itself.
+
+Key components:
+- extract_documents: Yields prepared documents as worker processes finish them
+- ExtractionTimeout: Raised inside a worker when a file exceeds its soft time limit
+
+Dependencies:
+- document_manager.services.process_pool: Runs the worker processes
+- document_manager.services.document_service: Performs the extraction in each worker
+
+Related files:
+- document_manager/services/document_service.py: Saves results in batched transactions
+- scripts/benchmark_document_import.py: Measures import throughput per worker count
+"""
+
+import signal
+import threading
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from document_manager.models.document import Document
+from document_manager.services.process_pool import run_in_processes
+
+# Result for one file: (source path, prepared document or None,
+# whether the document must be saved, error message)
+ExtractionResult = Tuple[Path, Optional[Document], bool, Optional[str]]
+
+# Document service of the current worker process
+_service = None
+
+
+class ExtractionTimeout(BaseException):
+    """Raised in a worker when extracting a file exceeds its time limit.
+
+    Derived from BaseException so the broad exception handlers of the
+    extractors do not swallow it.
+    """
+
+
+def _init_worker(db_path: str) -> None:
+    """Create the document service used by this worker process.
+
+    Args:
+        db_path: Path of the document database (only read, never written)
+    """
+    global _service
+
+    # Imported here because document_service imports this module
+    from document_manager.repositories.document_repository import DocumentRepository
+    from document_manager.services.document_service import DocumentService
+
+    _service = DocumentService(DocumentRepository(db_path))
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise ExtractionTimeout if the body runs longer than the limit.
+
+    Uses SIGALRM, so the limit only applies on POSIX systems and in the
+    main thread of a process, which is where pool workers run their tasks.
+    Python only handles the signal between bytecodes: a call into native
+    code (such as fitz) is not interrupted and the timeout is raised once
+    it returns, so this is a soft limit, not a guarantee.
+
+    Args:
+        seconds: Time limit, or None for no limit
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise ExtractionTimeout(f"timed out after {seconds:g} s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _prepare_file(
+    file_path: str, timeout: Optional[float]
+) -> Tuple[Optional[Document], bool, Optional[str]]:
+    """Prepare one file in the current worker.
+
+    Args:
+        file_path: Path of the file to import
+        timeout: Seconds the file may take, or None for no limit
+
+    Returns:
+        Tuple of (prepared document or None, whether it must be saved,
+        error message or None)
+    """
+    try:
+        with _time_limit(timeout):
+            document, needs_save = _service.prepare_document(file_path)
+    except ExtractionTimeout as e:
+        return None, False, str(e)
+
+    if document is None:
+        return None, False, "file could not be read"
+    return document, needs_save, None
+
+
+def extract_documents(
+    file_paths: List[Union[str, Path]],
+    db_path: Union[str, Path],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = 300.0,
+    max_pending: Optional[int] = None,
+) -> Iterator[ExtractionResult]:
+    """Prepare documents in worker processes, yielding them as they finish.
+
+    At most max_pending files are handed to the pool at a time, so a large
+    import neither queues every path up front nor piles up finished
+    documents faster than the caller can save them. With a single worker
+    the files are prepared in the calling process. A worker that crashes
+    fails the files it was working on, and the rest go to a new pool.
+
+    The timeout is best effort: it interrupts Python code, but not a call
+    stuck in native code (e.g. PyMuPDF parsing a PDF), which only stops
+    when the call returns.
+
+    Args:
+        file_paths: Files to import
+        db_path: Path of the document database
+        max_workers: Number of worker processes (defaults to the CPU count)
+        timeout: Seconds a single file may take before it is skipped (soft
+            limit, see _time_limit)
+        max_pending: Files in flight at once (defaults to twice the workers)
+
+    Yields:
+        Tuples of (source path, prepared document or None, whether it must
+        be saved, error message)
+    """
+    paths = [str(Path(path)) for path in file_paths]
+
+    for path, result, error in run_in_processes(
+        partial(_prepare_file, timeout=timeout),
+        paths,
+        initializer=_init_worker,
+        initargs=(str(db_path),),
+        max_workers=max_workers,
+        max_pending=max_pending,
+    ):
+        if error is not None:
+            yield Path(path), None, False, error
+        else:
+            yield (Path(path), *result)
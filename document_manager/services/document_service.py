@@ -10,27 +10,85 @@ Key components:
 Dependencies:
 - document_manager.models.document: For Document model
 - document_manager.repositories.document_repository: For document persistence
+- document_manager.utils.text_normalizer: For cleaning up extracted text
+- document_manager.utils.text_encoding: For detecting and converting text encodings
 - PyMuPDF: For PDF processing (imported as fitz)
 - python-docx: For DOCX processing
 """
 
-import concurrent.futures
+import io
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from glob import glob
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import fitz  # PyMuPDF
 from docx import Document as DocxDocument
 from loguru import logger
 
-from document_manager.models.document import Document, DocumentType
+from document_manager.models.document import Document, DocumentSummary, DocumentType
 from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_extraction_pool import extract_documents
+from document_manager.services.integrity_verifier import IntegrityVerifier
+from document_manager.utils.file_checksum import file_checksum, file_fingerprint
+from document_manager.utils.text_encoding import detect_encoding, transcode_to_utf8
+from document_manager.utils.text_normalizer import TextNormalizer
 from shared.ui.utils.font_manager import get_font_manager
 
+# Explicit declarations of Symbol font use, searched near the start of a text
+_SYMBOL_DECLARATION = re.compile(
+    r"Symbol font|Symbol typeface|Greek using Symbol|Symbol encoding", re.IGNORECASE
+)
+
+# Sequences that make sense in Symbol font Greek but are gibberish in English
+_SYMBOL_GREEK_SEQUENCE = re.compile(
+    r"\balfa\s+kai\s+wmega\b"  # alpha and omega in Symbol encoding
+    r"|\bqeorem\s+[0-9]+\b"  # theorem with theta
+    r"|\bgamma\s+delta\b"
+    r"|\bfsi\s+fonction\b"  # psi function
+    r"|\bprwton\b"  # proton with omega
+    r"|\bqeta\b"  # theta spelled with Symbol
+    r"|\bs\^2\s*\+\s*p\^2\b",  # Mathematical formula with Symbol chars
+    re.IGNORECASE,
+)
+
+# Common English words; several of them in a sample rule out Symbol font Greek
+_COMMON_ENGLISH_WORD = re.compile(r"\b(the|and|for|that|this|with|from)\b", re.IGNORECASE)
+
+# A line holding only a page number: a number, "Page X" or "Page X of Y", or
+# a Roman numeral
+_SPACE = r"[^\S\n]*"
+_PAGE_NUMBER_LINE = (
+    rf"{_SPACE}(?:\d+|page[^\S\n]+\d+(?:[^\S\n]+of[^\S\n]+\d+)?|[ivxlcdm]+){_SPACE}"
+)
+
+# A run of blank and page number lines holding at least one page number,
+# with the line break before it
+_PAGE_NUMBER_RUN = (
+    rf"(?:\A|\n)(?:{_SPACE}\n)*{_PAGE_NUMBER_LINE}"
+    rf"(?:\n(?:{_PAGE_NUMBER_LINE}|{_SPACE})(?=\n|\Z))*(?:\n|\Z)"
+)
+
+
+def _replace_page_number_run(match: "re.Match[str]") -> str:
+    """Get the text left in place of a run of page number lines.
+
+    Runs between paragraphs leave a paragraph break and runs at either end
+    of the text a single line break. A text holding nothing but page numbers
+    is emptied.
+    """
+    at_start = match.start() == 0
+    at_end = match.end() == len(match.string)
+    if at_start and at_end:
+        return ""
+    if at_start or at_end:
+        return "\n"
+    return "\n\n"
+
 
 class DocumentService:
     """Service for document management operations."""
@@ -107,6 +165,14 @@ class DocumentService:
         "∝": "∝",  # Proportional to
     }
 
+    # Unicode form extracted text is brought to when asked; off by default,
+    # since it changes the stored content and the offsets into it
+    UNICODE_FORM = "NFC"
+
+    # Compiled normalizers by (convert Symbol font Greek, remove page numbers,
+    # normalize Unicode)
+    _normalizers: Dict[Tuple[bool, bool, bool], TextNormalizer] = {}
+
     def __init__(self, document_repository: Optional[DocumentRepository] = None):
         """Initialize the document service.
 
@@ -115,10 +181,81 @@ class DocumentService:
         """
         self.document_repository = document_repository or DocumentRepository()
         self.storage_dir = Path("data/documents")
+        self.integrity_verifier = IntegrityVerifier(self.document_repository)
 
         # Ensure storage directory exists
         os.makedirs(self.storage_dir, exist_ok=True)
 
+    @classmethod
+    def _get_normalizer(
+        cls,
+        convert_symbols: bool,
+        remove_page_numbers: bool = False,
+        normalize_unicode: bool = False,
+    ) -> TextNormalizer:
+        """Get the compiled normalizer for a combination of cleanup steps.
+
+        Args:
+            convert_symbols: Whether to map Symbol font characters to Greek
+            remove_page_numbers: Whether to remove page number lines
+            normalize_unicode: Whether to bring the text to UNICODE_FORM
+
+        Returns:
+            Normalizer applying the steps in a single call
+        """
+        key = (convert_symbols, remove_page_numbers, normalize_unicode)
+        normalizer = cls._normalizers.get(key)
+        if normalizer is None:
+            substitutions = []
+            if remove_page_numbers:
+                substitutions = [
+                    (_PAGE_NUMBER_RUN, _replace_page_number_run),
+                    # Collapse the blank lines left between paragraphs
+                    (r"\n\n\n+", "\n\n"),
+                ]
+            normalizer = TextNormalizer(
+                char_map=(
+                    {**cls.SYMBOL_TO_GREEK, **cls.SYMBOL_SPECIAL}
+                    if convert_symbols
+                    else None
+                ),
+                substitutions=substitutions,
+                flags=re.IGNORECASE,
+                unicode_form=cls.UNICODE_FORM if normalize_unicode else None,
+            )
+            cls._normalizers[key] = normalizer
+        return normalizer
+
+    def _normalize_extracted_text(
+        self,
+        text: str,
+        detect_symbols: bool = True,
+        remove_page_numbers: bool = False,
+        normalize_unicode: bool = False,
+    ) -> Tuple[str, bool]:
+        """Clean up extracted text in one compiled pipeline.
+
+        Every extractor passes its text through here. Symbol font Greek is
+        converted when detected, page numbers are removed when asked, and
+        the result is brought to UNICODE_FORM when asked. Unicode
+        normalization is off by default so the stored text keeps the
+        extracted code points and the offsets into it stay valid.
+
+        Args:
+            text: Extracted text
+            detect_symbols: Whether to look for Symbol font Greek to convert
+            remove_page_numbers: Whether to remove page number lines
+            normalize_unicode: Whether to bring the text to UNICODE_FORM
+
+        Returns:
+            Tuple of (normalized_text, symbol_font_converted)
+        """
+        convert_symbols = detect_symbols and self._detect_symbol_font(text)
+        normalizer = self._get_normalizer(
+            convert_symbols, remove_page_numbers, normalize_unicode
+        )
+        return normalizer.normalize(text), convert_symbols
+
     def _convert_symbol_to_greek(self, text: str) -> Tuple[str, bool]:
         """Convert Symbol font characters to proper Unicode Greek letters.
 
@@ -131,160 +268,125 @@ class DocumentService:
         Returns:
             Tuple of (converted_text, was_converted)
         """
-        # MUCH MORE strict markers of Symbol font use
-        # We need multiple strong indicators and explicit evidence before converting
+        if not self._detect_symbol_font(text):
+            return text, False
 
-        # Check first for explicit Symbol font declarations
-        explicit_symbol_markers = [
-            "Symbol font",
-            "Symbol typeface",
-            "Greek using Symbol",
-            "Symbol encoding",
-        ]
+        # The character map alone, without Unicode normalization
+        normalizer = self._get_normalizer(True)
+        return normalizer.normalize(text), True
 
-        has_explicit_marker = False
-        for marker in explicit_symbol_markers:
-            if marker.lower() in text.lower()[:1000]:
-                logger.info(f"Found explicit Symbol font declaration: '{marker}'")
-                has_explicit_marker = True
-                break
+    def _detect_symbol_font(self, text: str) -> bool:
+        """Decide whether a text is Greek written in Symbol font.
 
-        # Without explicit markers, look for very specific Greek letter sequences that would be nonsensical in English
-        if not has_explicit_marker:
-            # These are sequences that would make sense in Greek but are gibberish in English
-            very_specific_greek_markers = [
-                r"\balfa\s+kai\s+wmega\b",  # alpha and omega in Symbol encoding
-                r"\bqeorem\s+[0-9]+\b",  # theorem with theta
-                r"\bgamma\s+delta\b",
-                r"\bfsi\s+fonction\b",  # psi function
-                r"\bprwton\b",  # proton with omega
-                r"\bqeta\b",  # theta spelled with Symbol
-                r"\bs\^2\s*\+\s*p\^2\b",  # Mathematical formula with Symbol chars
-            ]
+        Args:
+            text: Text that may contain Symbol font encoded Greek letters
 
-            has_specific_sequences = False
-            for marker in very_specific_greek_markers:
-                if re.search(marker, text, re.IGNORECASE):
-                    logger.info(
-                        f"Found definite Greek sequence in Symbol font: '{marker}'"
-                    )
-                    has_specific_sequences = True
-                    break
+        Returns:
+            True if the text should be converted to Unicode Greek
+        """
+        # MUCH MORE strict markers of Symbol font use
+        # We need multiple strong indicators and explicit evidence before converting
 
-            if not has_specific_sequences:
-                # No explicit markers or specific Greek sequences found
-                # Only consider statistical measures as a last resort, with much higher thresholds
+        # Check first for explicit Symbol font declarations
+        declaration = _SYMBOL_DECLARATION.search(text, 0, 1000)
+        if declaration:
+            logger.info(
+                f"Found explicit Symbol font declaration: '{declaration.group(0)}'"
+            )
 
-                # Sample text for analysis
-                sample_text = text[:3000]
+        # Without explicit markers, look for very specific Greek letter sequences that would be nonsensical in English
+        elif _SYMBOL_GREEK_SEQUENCE.search(text):
+            logger.info("Found definite Greek sequence in Symbol font")
 
-                # Define characters that are common in Symbol font for Greek encoding
-                greek_specific_chars = set("abgdezhqiklmnxoprVsctufcyw")
+        else:
+            # No explicit markers or specific Greek sequences found
+            # Only consider statistical measures as a last resort, with much higher thresholds
 
-                # Count sequences of 4+ consecutive Symbol-mappable characters
-                # (Raising from 3 to 4 characters to be more strict)
-                sequence_count = 0
-                current_sequence = 0
+            # Sample text for analysis
+            sample_text = text[:3000]
+            lowered = sample_text.lower()
 
-                for char in sample_text:
-                    if char.lower() in greek_specific_chars:
-                        current_sequence += 1
-                    else:
-                        if (
-                            current_sequence >= 4
-                        ):  # More strict: require 4+ char sequences
-                            sequence_count += 1
-                        current_sequence = 0
-
-                # Much more strict statistical criteria
-                # 1. Need at least 10 Greek-like sequences (up from 5)
-                # 2. At least 25% of text must be Symbol-mappable (up from 15%)
-                # 3. English vowel ratio must be unusual (indicating non-English text)
-
-                symbol_chars_count = sum(
-                    1 for c in sample_text if c.lower() in greek_specific_chars
-                )
-                percentage_symbol = (
-                    symbol_chars_count / len(sample_text) if sample_text else 0
-                )
+            # Define characters that are common in Symbol font for Greek encoding
+            greek_specific_chars = set("abgdezhqiklmnxoprVsctufcyw")
 
-                # Check English vowel ratio (English is typically 35-45% vowels)
-                english_vowels = set("aeiouy")
-                vowel_count = sum(1 for c in sample_text.lower() if c in english_vowels)
-                vowel_percentage = vowel_count / len(sample_text) if sample_text else 0
+            # Count sequences of 4+ consecutive Symbol-mappable characters
+            # (Raising from 3 to 4 characters to be more strict)
+            sequence_count = 0
+            current_sequence = 0
 
-                # Vowel ratio is either very low or very high (non-English-like)
-                unusual_vowel_ratio = vowel_percentage < 0.2 or vowel_percentage > 0.5
+            for char in lowered:
+                if char in greek_specific_chars:
+                    current_sequence += 1
+                else:
+                    if current_sequence >= 4:  # More strict: require 4+ char sequences
+                        sequence_count += 1
+                    current_sequence = 0
+
+            # Much more strict statistical criteria
+            # 1. Need at least 10 Greek-like sequences (up from 5)
+            # 2. At least 25% of text must be Symbol-mappable (up from 15%)
+            # 3. English vowel ratio must be unusual (indicating non-English text)
+
+            symbol_chars_count = sum(1 for c in lowered if c in greek_specific_chars)
+            percentage_symbol = (
+                symbol_chars_count / len(sample_text) if sample_text else 0
+            )
 
-                if (
-                    sequence_count >= 10
-                    and percentage_symbol > 0.25
-                    and unusual_vowel_ratio
-                ):
-                    logger.info(
-                        f"Statistical analysis suggests Symbol font: {sequence_count} sequences, "
-                        f"{percentage_symbol:.2%} Symbol chars, {vowel_percentage:.2%} vowels"
-                    )
-                    # Additional verification: check for common English words that would become nonsense in Greek
-                    common_english_words = [
-                        "the",
-                        "and",
-                        "for",
-                        "that",
-                        "this",
-                        "with",
-                        "from",
-                    ]
-                    english_word_count = 0
-                    for word in common_english_words:
-                        if re.search(r"\b" + word + r"\b", sample_text, re.IGNORECASE):
-                            english_word_count += 1
+            # Check English vowel ratio (English is typically 35-45% vowels)
+            english_vowels = set("aeiouy")
+            vowel_count = sum(1 for c in lowered if c in english_vowels)
+            vowel_percentage = vowel_count / len(sample_text) if sample_text else 0
 
-                    # If we find multiple common English words, it's probably not Greek
-                    if english_word_count >= 3:
-                        logger.info(
-                            f"Found {english_word_count} common English words, likely not Symbol font Greek"
-                        )
-                        return text, False
-                else:
-                    # Does not meet the stricter statistical criteria
-                    return text, False
+            # Vowel ratio is either very low or very high (non-English-like)
+            unusual_vowel_ratio = vowel_percentage < 0.2 or vowel_percentage > 0.5
 
-        # If we get here, we've decided this is Symbol font Greek
-        # Make a copy of the text to modify
-        converted_text = text
+            if not (
+                sequence_count >= 10 and percentage_symbol > 0.25 and unusual_vowel_ratio
+            ):
+                # Does not meet the stricter statistical criteria
+                return False
 
-        # Replace common Symbol font encoded Greek with proper Unicode
-        for latin, greek in self.SYMBOL_TO_GREEK.items():
-            converted_text = converted_text.replace(latin, greek)
+            logger.info(
+                f"Statistical analysis suggests Symbol font: {sequence_count} sequences, "
+                f"{percentage_symbol:.2%} Symbol chars, {vowel_percentage:.2%} vowels"
+            )
+            # Additional verification: check for common English words that would become nonsense in Greek
+            english_word_count = len(
+                {word.lower() for word in _COMMON_ENGLISH_WORD.findall(sample_text)}
+            )
 
-        # Handle special Symbol font characters
-        for symbol, replacement in self.SYMBOL_SPECIAL.items():
-            converted_text = converted_text.replace(symbol, replacement)
+            # If we find multiple common English words, it's probably not Greek
+            if english_word_count >= 3:
+                logger.info(
+                    f"Found {english_word_count} common English words, likely not Symbol font Greek"
+                )
+                return False
 
-        # Analyze the impact of the conversion
-        self._analyze_conversion_impact(text, converted_text)
+        # If we get here, the text looks like Symbol font Greek
+        changed_chars = self._get_normalizer(True).count_mapped(text)
+        self._analyze_conversion_impact(changed_chars, len(text))
 
         # Check for maximum conversion threshold (50%)
         # If more than 50% of text would convert, it's likely a mistake
-        changed_chars = sum(1 for a, b in zip(text, converted_text) if a != b)
-        if len(text) > 0:
-            percentage = (changed_chars / len(text)) * 100
-            if percentage > 50:
-                logger.warning(
-                    f"Preventing conversion with extremely high impact ({percentage:.2f}%)"
-                )
-                return text, False
-
-        # Log that we did a conversion
-        logger.info("Converted Symbol font Greek characters to Unicode")
+        if text and changed_chars / len(text) > 0.5:
+            logger.warning(
+                f"Preventing conversion with extremely high impact "
+                f"({changed_chars / len(text):.2%})"
+            )
+            return False
 
-        return converted_text, True
+        # Log that we will do a conversion
+        logger.info("Converting Symbol font Greek characters to Unicode")
+        return True
 
     def import_document(self, file_path: Union[str, Path]) -> Optional[Document]:
         """Import a document from a file.
 
-        This copies the file to the storage directory and extracts metadata.
+        This copies the file to the storage directory, extracts its text and
+        saves the document in a single write. Files already in the library
+        are not extracted again: an unchanged file or a file with the same
+        content as an existing document returns that document, and a file
+        that changed since it was imported updates its existing document.
 
         Args:
             file_path: Path to the document file
@@ -292,77 +394,172 @@ class DocumentService:
         Returns:
             Imported document if successful, None otherwise
         """
+        document, needs_save = self.prepare_document(file_path)
+        if document is None:
+            return None
+
+        # Save document to repository
+        if needs_save and not self.document_repository.save(document):
+            return None
+
+        return document
+
+    def prepare_document(
+        self, file_path: Union[str, Path]
+    ) -> Tuple[Optional[Document], bool]:
+        """Copy a file into storage and extract its text without saving it.
+
+        This is the part of an import that does not write to the database, so
+        it can run in worker processes while the caller saves the results.
+
+        Args:
+            file_path: Path to the document file
+
+        Returns:
+            Tuple of (document, whether it must be saved); the document is
+            None if the file could not be read
+        """
         file_path = Path(file_path)
 
         if not file_path.exists():
             logger.error(f"File not found: {file_path}")
-            return None
+            return None, False
 
         try:
+            source_path = str(file_path.resolve())
+            source_fingerprint = file_fingerprint(file_path)
+
+            # Skip files whose content is already in the library; a file whose
+            # stat fingerprint is unchanged need not even be hashed
+            previous = self.document_repository.find_by_source_path(source_path)
+            if (
+                previous
+                and previous.metadata.get("source_fingerprint") == source_fingerprint
+            ):
+                logger.debug(f"Unchanged since last import: {file_path}")
+                return previous, False
+
+            checksum = file_checksum(file_path)
+            if previous and previous.checksum == checksum:
+                logger.debug(f"Unchanged since last import: {file_path}")
+                return previous, False
+
+            duplicate = self.document_repository.find_by_checksum(checksum)
+            if duplicate:
+                logger.info(f"{file_path} has the same content as {duplicate.name}")
+                return duplicate, False
+
             # Create document object with metadata
             document = Document.from_file(file_path)
+            document.checksum = checksum
+            document.source_path = source_path
+            document.metadata["source_fingerprint"] = source_fingerprint
+
+            if previous:
+                # The file changed: re-extract into the existing document
+                document.id = previous.id
+                document.tags = previous.tags
+                document.category = previous.category
+                document.notes = previous.notes
 
             # Copy file to storage directory
             storage_path = self.storage_dir / f"{document.id}{file_path.suffix}"
             shutil.copy2(file_path, storage_path)
 
-            # Update file path to storage location
-            document.file_path = Path(str(storage_path))
-
-            # Extract text content if possible
-            self.extract_text(document)
-
-            # Save document to repository
-            self.document_repository.save(document)
-
-            return document
+            try:
+                # Update file path to storage location
+                document.file_path = Path(str(storage_path))
+                document.metadata["file_fingerprint"] = file_fingerprint(storage_path)
+
+                # Extract text content if possible
+                self.extract_text(document, save=False)
+            except BaseException:
+                # Also on a timeout: a new document that is never saved must
+                # not leave its copy behind in storage
+                if not previous:
+                    storage_path.unlink(missing_ok=True)
+                raise
+
+            return document, True
         except Exception as e:
             logger.error(f"Error importing document: {e}")
-            return None
+            return None, False
 
     def batch_import_documents(
         self,
         file_paths: List[Union[str, Path]],
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         category_id: Optional[str] = None,
+        batch_size: int = 50,
+        timeout: Optional[float] = 300.0,
     ) -> List[Document]:
         """Import multiple documents at once.
 
+        Text extraction is CPU-bound Python code, so it runs in a pool of
+        worker processes. Extracted documents are saved by this process in
+        batched transactions; files already in the library are returned
+        without being extracted again (see import_document).
+
         Args:
             file_paths: List of paths to document files
-            max_workers: Maximum number of worker threads for parallel processing
+            max_workers: Number of worker processes (defaults to the CPU count)
             category_id: Optional category ID to assign to all imported documents
+            batch_size: Number of documents saved per transaction
+            timeout: Seconds a single file may take before it is skipped; a
+                soft limit that cannot interrupt native extraction code
 
         Returns:
             List of successfully imported documents
         """
         logger.info(f"Batch importing {len(file_paths)} documents")
-        imported_documents = []
+        imported_documents: List[Document] = []
+        pending: List[Document] = []
 
-        # Use ThreadPoolExecutor for parallel processing
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all import tasks
-            future_to_path = {
-                executor.submit(self.import_document, path): path for path in file_paths
-            }
+        def flush() -> None:
+            if pending and self.document_repository.save_many(pending):
+                imported_documents.extend(pending)
+            elif pending:
+                logger.error(f"Failed to save a batch of {len(pending)} documents")
+            pending.clear()
 
-            # Process results as they complete
-            for future in concurrent.futures.as_completed(future_to_path):
-                path = future_to_path[future]
-                try:
-                    document = future.result()
-                    if document:
-                        # Assign category if provided
-                        if category_id is not None:
-                            document.category = category_id
-                            self.document_repository.save(document)
-
-                        imported_documents.append(document)
-                        logger.info(f"Successfully imported: {path}")
-                    else:
-                        logger.warning(f"Failed to import: {path}")
-                except Exception as e:
-                    logger.error(f"Exception importing {path}: {e}")
+        # Identical new files in the same batch are only imported once
+        batch_checksums: Dict[str, Document] = {}
+
+        try:
+            for path, document, needs_save, error in extract_documents(
+                file_paths,
+                db_path=self.document_repository.db_path,
+                max_workers=max_workers,
+                timeout=timeout,
+            ):
+                if document is None:
+                    logger.warning(f"Failed to import {path}: {error}")
+                    continue
+
+                if needs_save and document.checksum in batch_checksums:
+                    Path(document.file_path).unlink(missing_ok=True)
+                    imported_documents.append(batch_checksums[document.checksum])
+                    continue
+
+                # Assign category if provided
+                if category_id is not None and document.category != category_id:
+                    document.category = category_id
+                    needs_save = True
+
+                if not needs_save:
+                    imported_documents.append(document)
+                    logger.info(f"Already imported: {path}")
+                    continue
+
+                if document.checksum:
+                    batch_checksums[document.checksum] = document
+                pending.append(document)
+                logger.info(f"Successfully imported: {path}")
+                if len(pending) >= batch_size:
+                    flush()
+        finally:
+            # Documents already extracted are saved even if the import stops
+            flush()
 
         logger.info(
             f"Batch import completed. {len(imported_documents)} of {len(file_paths)} documents imported successfully"
@@ -374,7 +571,7 @@ class DocumentService:
         directory_path: Union[str, Path],
         file_patterns: Optional[List[str]] = None,
         recursive: bool = False,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         category_id: Optional[str] = None,
     ) -> List[Document]:
         """Import all documents from a directory.
@@ -383,7 +580,7 @@ class DocumentService:
             directory_path: Path to directory containing documents
             file_patterns: List of glob patterns to match files (e.g., ["*.pdf", "*.docx"])
             recursive: Whether to search subdirectories recursively
-            max_workers: Maximum number of worker threads for parallel processing
+            max_workers: Number of worker processes (defaults to the CPU count)
             category_id: Optional category ID to assign to all imported documents
 
         Returns:
@@ -427,11 +624,14 @@ class DocumentService:
             all_files_paths, max_workers=max_workers, category_id=category_id
         )
 
-    def extract_text(self, document: Document) -> Optional[Document]:
+    def extract_text(
+        self, document: Document, save: bool = True
+    ) -> Optional[Document]:
         """Extract text content from a document.
 
         Args:
             document: Document to process
+            save: Whether to save the document after a successful extraction
 
         Returns:
             Updated document if successful, None otherwise
@@ -462,7 +662,12 @@ class DocumentService:
                 )
                 return None
 
-            return document if success else None
+            if not success:
+                return None
+
+            if save:
+                self.document_repository.save(document)
+            return document
 
         except Exception as e:
             logger.error(f"Error extracting text: {e}")
@@ -471,10 +676,13 @@ class DocumentService:
     def _remove_page_numbers(self, text: str) -> str:
         """Remove page numbers from extracted text.
 
-        This function identifies and removes common page number patterns:
-        - Standalone numbers at the beginning or end of a line
-        - Numbers with "Page" prefix (e.g., "Page 1", "Page 2")
-        - Roman numerals (i, ii, iii, iv, etc.) at line boundaries
+        This function identifies and removes lines holding only a page number:
+        - Standalone numbers
+        - Numbers with "Page" prefix (e.g., "Page 1", "Page 2 of 10")
+        - Roman numerals (i, ii, iii, iv, etc.)
+
+        Each run of such lines and the blank lines around it is removed in
+        the same pass that collapses longer runs of blank lines.
 
         Args:
             text: The text to process
@@ -482,41 +690,47 @@ class DocumentService:
         Returns:
             Text with page numbers removed
         """
-        # Pattern 1: Standalone numbers at beginning or end of a line
-        text = re.sub(r"^\s*\d+\s*$", "", text, flags=re.MULTILINE)
-        text = re.sub(r"^\s*\d+\s*\n", "\n", text, flags=re.MULTILINE)
-        text = re.sub(r"\n\s*\d+\s*$", "\n", text, flags=re.MULTILINE)
-
-        # Pattern 2: "Page X" or "Page X of Y" patterns
-        text = re.sub(
-            r"^\s*Page\s+\d+(\s+of\s+\d+)?\s*$",
-            "",
-            text,
-            flags=re.MULTILINE | re.IGNORECASE,
-        )
-        text = re.sub(
-            r"\n\s*Page\s+\d+(\s+of\s+\d+)?\s*\n",
-            "\n",
-            text,
-            flags=re.MULTILINE | re.IGNORECASE,
-        )
+        normalizer = self._get_normalizer(False, True, normalize_unicode=False)
+        return normalizer.normalize(text)
 
-        # Pattern 3: Roman numerals at line boundaries
-        # Match i, ii, iii, iv, v, vi, vii, viii, ix, x, etc.
-        roman_pattern = r"^\s*[ivxlcdm]+\s*$"
-        text = re.sub(roman_pattern, "", text, flags=re.MULTILINE | re.IGNORECASE)
+    def iter_pdf_pages(
+        self, file_path: Union[str, Path], remove_page_numbers: bool = True
+    ) -> Iterator[str]:
+        """Yield the text of a PDF one page at a time.
 
-        # Replace single line breaks with double line breaks where page numbers were removed
-        # This preserves the spacing in the original document
-        text = re.sub(r"\n\n\n+", "\n\n", text)
+        Only the current page is held in memory, so callers can stream the
+        text of very large books into a writer.
 
-        return text
+        Args:
+            file_path: Path to the PDF file
+            remove_page_numbers: Whether to remove page numbers from each page
+
+        Yields:
+            Text of each page, normalized with Symbol font Greek converted to
+            Unicode
+        """
+        with fitz.open(file_path) as pdf:
+            for page in pdf:
+                # Use the "text" option which gives plain text without page numbers in headers/footers
+                # The default PyMuPDF text extraction preserves whitespace and ligatures
+                page_text = page.get_text()
+
+                # Convert any Symbol font Greek characters to Unicode
+                page_text, _ = self._normalize_extracted_text(
+                    page_text, remove_page_numbers=remove_page_numbers
+                )
+
+                yield page_text
 
     def _extract_text_from_pdf(
         self, document: Document, remove_page_numbers: bool = True
     ) -> bool:
         """Extract text from a PDF document.
 
+        Pages are streamed into a single buffer, and the character offset at
+        which each page starts is recorded in metadata["page_offsets"] so the
+        text can later be mapped back to pages.
+
         Args:
             document: PDF document
             remove_page_numbers: Whether to remove page numbers from the extracted text (default: True)
@@ -525,39 +739,30 @@ class DocumentService:
             True if successful, False otherwise
         """
         try:
-            pdf = fitz.open(document.file_path)
-            text = ""
-            page_count = 0
+            text = io.StringIO()
+            page_offsets: List[int] = []
+            offset = 0
             word_count = 0
 
-            # Extract text from each page
-            for page in pdf:
-                # Use the "text" option which gives plain text without page numbers in headers/footers
-                # The default PyMuPDF text extraction preserves whitespace and ligatures
-                page_text = page.get_text()
-
-                # Convert any Symbol font Greek characters to Unicode
-                page_text, was_converted = self._convert_symbol_to_greek(page_text)
-
-                text += page_text
-                page_count += 1
+            for page_text in self.iter_pdf_pages(
+                document.file_path, remove_page_numbers
+            ):
+                page_offsets.append(offset)
+                offset += text.write(page_text)
                 # Approximate word count
                 word_count += len(page_text.split())
 
-            # Remove page numbers if requested
+            page_count = len(page_offsets)
             if remove_page_numbers:
-                text = self._remove_page_numbers(text)
                 document.metadata["page_numbers_removed"] = True
 
             # Update document with extracted text and metadata
-            document.content = text
+            document.content = text.getvalue()
             document.page_count = page_count
             document.word_count = word_count
             document.metadata["page_count"] = page_count
             document.metadata["word_count"] = word_count
-
-            # Save updated document
-            self.document_repository.save(document)
+            document.metadata["page_offsets"] = page_offsets
 
             return True
         except Exception as e:
@@ -687,7 +892,9 @@ class DocumentService:
                 text_parts.append("[/TABLE]\n")
 
             # Join all parts with proper paragraph breaks
-            full_text = "\n\n".join(text_parts)
+            full_text, _ = self._normalize_extracted_text(
+                "\n\n".join(text_parts), detect_symbols=False
+            )
 
             # Update document with extracted text
             document.content = full_text
@@ -698,9 +905,6 @@ class DocumentService:
                 "formatted_text"
             ] = True  # Indicate that this text preserves formatting
 
-            # Save the document
-            self.document_repository.save(document)
-
             return True
 
         except Exception as e:
@@ -718,16 +922,8 @@ class DocumentService:
         Returns:
             Detected encoding name
         """
-        import chardet
-
-        # Read a sample of the file for detection
-        with open(file_path, "rb") as file:
-            raw_data = file.read(10000)  # Read first 10KB for detection
-
-        # Use chardet for automatic detection
-        detection_result = chardet.detect(raw_data)
-        detected_encoding = detection_result.get("encoding", "utf-8")
-        confidence = detection_result.get("confidence", 0.0)
+        # Feed a sample of the file to chardet until it is confident
+        detected_encoding, confidence = detect_encoding(file_path)
 
         logger.info(
             f"Detected encoding: {detected_encoding} (confidence: {confidence:.2f})"
@@ -759,6 +955,9 @@ class DocumentService:
     def _convert_file_to_utf8(self, file_path: Path, source_encoding: str) -> bool:
         """Convert a text file from source encoding to UTF-8.
 
+        The file is converted a buffer at a time and atomically replaced, with
+        the original kept next to it as a .backup file.
+
         Args:
             file_path: Path to the text file
             source_encoding: Source encoding of the file
@@ -770,20 +969,7 @@ class DocumentService:
             # Create backup file path
             backup_path = file_path.with_suffix(file_path.suffix + ".backup")
 
-            # Read file with source encoding
-            with open(
-                file_path, "r", encoding=source_encoding, errors="replace"
-            ) as source_file:
-                content = source_file.read()
-
-            # Create backup of original file
-            import shutil
-
-            shutil.copy2(file_path, backup_path)
-
-            # Write file with UTF-8 encoding
-            with open(file_path, "w", encoding="utf-8") as target_file:
-                target_file.write(content)
+            transcode_to_utf8(file_path, source_encoding, backup_path=backup_path)
 
             logger.info(
                 f"Successfully converted {file_path} from {source_encoding} to UTF-8"
@@ -894,7 +1080,7 @@ class DocumentService:
                 raise Exception("Could not read file with any encoding")
 
             # Convert potential Symbol font Greek text
-            text, was_symbol_converted = self._convert_symbol_to_greek(text)
+            text, was_symbol_converted = self._normalize_extracted_text(text)
 
             # Update document with text content
             document.content = text
@@ -906,9 +1092,6 @@ class DocumentService:
             document.metadata["converted_to_utf8"] = was_converted_to_utf8
             document.metadata["symbol_conversion"] = was_symbol_converted
 
-            # Save updated document
-            self.document_repository.save(document)
-
             return True
 
         except Exception as e:
@@ -953,8 +1136,9 @@ class DocumentService:
                 para_text = teletype.extractText(para)
 
                 # Check for Greek letters if Symbol font is used
-                if has_symbol_font:
-                    para_text, was_converted = self._convert_symbol_to_greek(para_text)
+                para_text, _ = self._normalize_extracted_text(
+                    para_text, detect_symbols=has_symbol_font
+                )
 
                 extracted_text += para_text + "\n"
                 word_count += len(para_text.split())
@@ -970,10 +1154,7 @@ class DocumentService:
             document.metadata["page_count"] = page_count
             document.metadata["has_greek_text"] = has_symbol_font
 
-            # Save updated document
-            self.document_repository.save(document)
-
-            return was_converted
+            return True
         except ImportError:
             logger.error(
                 "odfpy library not installed. Please install odfpy to process ODT files."
@@ -1030,16 +1211,15 @@ class DocumentService:
                 extracted_text += "\n\n"
 
             # Update document with text content
-            document.content = extracted_text
+            document.content, _ = self._normalize_extracted_text(
+                extracted_text, detect_symbols=False
+            )
             document.word_count = word_count
             document.page_count = sheet_count
             document.metadata["word_count"] = word_count
             document.metadata["sheet_count"] = sheet_count
             document.metadata["page_count"] = sheet_count
 
-            # Save updated document
-            self.document_repository.save(document)
-
             return True
         except ImportError:
             logger.error(
@@ -1094,16 +1274,15 @@ class DocumentService:
                 extracted_text += "\n\n"
 
             # Update document with text content
-            document.content = extracted_text
+            document.content, _ = self._normalize_extracted_text(
+                extracted_text, detect_symbols=False
+            )
             document.word_count = word_count
             document.page_count = slide_count
             document.metadata["word_count"] = word_count
             document.metadata["slide_count"] = slide_count
             document.metadata["page_count"] = slide_count
 
-            # Save updated document
-            self.document_repository.save(document)
-
             return True
         except ImportError:
             logger.error(
@@ -1160,44 +1339,64 @@ class DocumentService:
                         )
                         document.metadata["integrity_status"] = "SIZE_MISMATCH"
 
-            # Additional check: verify checksum if available
-            if document.metadata.get("checksum"):
-                actual_checksum = self._calculate_file_checksum(file_path)
-                if actual_checksum != document.metadata["checksum"]:
-                    logger.warning(
-                        f"Document checksum mismatch for {document_id}: "
-                        f"recorded={document.metadata['checksum']}, actual={actual_checksum}"
+            # Hash the file again only if its stat fingerprint changed. The
+            # full hash runs in the background; until it finishes the
+            # document is reported as unverified. A failure found above
+            # (e.g. SIZE_MISMATCH) is kept either way.
+            if document.metadata["integrity_status"] == "OK":
+                fingerprint = file_fingerprint(file_path)
+                if fingerprint == document.metadata.get("file_fingerprint"):
+                    document.metadata["integrity_status"] = document.metadata.get(
+                        "verified_status", "OK"
+                    )
+                else:
+                    document.metadata["integrity_status"] = "UNVERIFIED"
+                    # Documents from older versions only have an MD5 checksum,
+                    # which the verifier checks before replacing it
+                    self.integrity_verifier.schedule(
+                        document.id,
+                        file_path,
+                        document.checksum,
+                        None if document.checksum else document.metadata.get("checksum"),
                     )
-                    document.metadata["integrity_status"] = "CHECKSUM_MISMATCH"
-                    return document
 
         return document
 
-    def _calculate_file_checksum(self, file_path: Path) -> str:
-        """Calculate MD5 checksum of a file.
+    def get_all_documents(self) -> List[Document]:
+        """Get all documents from the repository.
+
+        Returns:
+            List of all documents
+        """
+        return self.document_repository.get_all()
+
+    def get_document_summaries(
+        self, category_id: Optional[str] = None
+    ) -> List[DocumentSummary]:
+        """Get summaries of documents for listing, without their text.
+
+        Use get_document to load a document's content when it is opened.
 
         Args:
-            file_path: Path to the file
+            category_id: Only list documents in this category, if given
 
         Returns:
-            MD5 checksum as a hexadecimal string
+            List of document summaries
         """
-        import hashlib
+        if category_id is None:
+            return self.document_repository.get_all_summaries()
+        return self.document_repository.get_summaries_by_category(category_id)
 
-        md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            # Read in chunks to avoid loading large files entirely into memory
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
+    def find_document_ids_with_content(self, text: str) -> Set[str]:
+        """Get the IDs of documents whose content contains a text.
 
-    def get_all_documents(self) -> List[Document]:
-        """Get all documents from the repository.
+        Args:
+            text: Text to look for
 
         Returns:
-            List of all documents
+            Set of matching document IDs
         """
-        return self.document_repository.get_all()
+        return self.document_repository.find_ids_with_content(text)
 
     def list_documents(self) -> List[Document]:
         """List all documents from the repository.
@@ -1267,12 +1466,19 @@ class DocumentService:
             logger.error(f"Document validation failed: {error_message}")
             return None
 
-        # Calculate and store checksum for future integrity checks
+        # Store checksum for future integrity checks, hashing the file only
+        # if it changed since the checksum was computed
         if document.file_path:
             document.metadata = document.metadata or {}
-            document.metadata["checksum"] = self._calculate_file_checksum(
-                Path(document.file_path)
-            )
+            document.metadata.pop("checksum", None)  # legacy MD5 checksum
+            fingerprint = file_fingerprint(document.file_path)
+            if (
+                not document.checksum
+                or fingerprint != document.metadata.get("file_fingerprint")
+            ):
+                document.checksum = file_checksum(document.file_path)
+                document.metadata["file_fingerprint"] = fingerprint
+                document.metadata["verified_status"] = "OK"
 
         # Proceed with saving
         success = self.document_repository.save(document)
@@ -1326,6 +1532,9 @@ class DocumentService:
         tag_ids: Optional[List[str]] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
+        limit: Optional[int] = 100,
+        any_tag_ids: Optional[List[str]] = None,
+        exclude_tag_ids: Optional[List[str]] = None,
     ) -> List[Document]:
         """Search for documents with various filters.
 
@@ -1333,14 +1542,17 @@ class DocumentService:
             query: Text search query
             category: Filter by category
             doc_type: Filter by document type
-            tag_ids: Filter by tag IDs
+            tag_ids: Filter by tag IDs (documents must have all of them)
             date_from: Filter by creation date (from)
             date_to: Filter by creation date (to)
+            limit: Maximum number of documents, or None for all
+            any_tag_ids: Filter by tag IDs (documents must have any of them)
+            exclude_tag_ids: Filter by tag IDs (documents must have none of them)
 
         Returns:
             List of matching documents
         """
-        # Get documents and total count
+        # Get documents and total count (SQLite treats a negative limit as none)
         documents, _ = self.document_repository.search(
             query=query,
             category=category,
@@ -1348,10 +1560,86 @@ class DocumentService:
             tags=tag_ids,
             date_from=date_from,
             date_to=date_to,
+            limit=-1 if limit is None else limit,
+            any_tags=any_tag_ids,
+            exclude_tags=exclude_tag_ids,
         )
 
         return documents
 
+    def search_document_summaries(
+        self,
+        query: str = "",
+        category: Optional[str] = None,
+        doc_type: Optional[DocumentType] = None,
+        tag_ids: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = 100,
+        any_tag_ids: Optional[List[str]] = None,
+        exclude_tag_ids: Optional[List[str]] = None,
+    ) -> List[DocumentSummary]:
+        """Search for documents like search_documents, without loading their text.
+
+        Args:
+            query: Text search query
+            category: Filter by category
+            doc_type: Filter by document type
+            tag_ids: Filter by tag IDs (documents must have all of them)
+            date_from: Filter by creation date (from)
+            date_to: Filter by creation date (to)
+            limit: Maximum number of documents, or None for all
+            any_tag_ids: Filter by tag IDs (documents must have any of them)
+            exclude_tag_ids: Filter by tag IDs (documents must have none of them)
+
+        Returns:
+            List of matching document summaries
+        """
+        summaries, _ = self.document_repository.search_summaries(
+            query=query,
+            category=category,
+            doc_type=doc_type,
+            tags=tag_ids,
+            date_from=date_from,
+            date_to=date_to,
+            limit=-1 if limit is None else limit,
+            any_tags=any_tag_ids,
+            exclude_tags=exclude_tag_ids,
+        )
+
+        return summaries
+
+    def get_tag_counts(
+        self,
+        query: str = "",
+        category: Optional[str] = None,
+        doc_type: Optional[DocumentType] = None,
+        tag_ids: Optional[List[str]] = None,
+        any_tag_ids: Optional[List[str]] = None,
+        exclude_tag_ids: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """Count documents per tag, for showing tag facets of a search.
+
+        Args:
+            query: Text search query
+            category: Filter by category
+            doc_type: Filter by document type
+            tag_ids: Filter by tag IDs (documents must have all of them)
+            any_tag_ids: Filter by tag IDs (documents must have any of them)
+            exclude_tag_ids: Filter by tag IDs (documents must have none of them)
+
+        Returns:
+            Dictionary mapping tag IDs to the number of matching documents
+        """
+        return self.document_repository.tag_counts(
+            query=query,
+            category=category,
+            doc_type=doc_type,
+            tags=tag_ids,
+            any_tags=any_tag_ids,
+            exclude_tags=exclude_tag_ids,
+        )
+
     def add_tag_to_document(self, document_id: str, tag_id: str) -> bool:
         """Add a tag to a document.
 
@@ -1501,13 +1789,8 @@ class DocumentService:
                 }
             )
 
-            # Create a new text with the conversion reversed
-            original_text = document.content
-            reverted_text = original_text
-
-            # Apply the reverse mapping
-            for greek, latin in reverse_mapping.items():
-                reverted_text = reverted_text.replace(greek, latin)
+            # Apply the reverse mapping in a single pass
+            reverted_text = document.content.translate(str.maketrans(reverse_mapping))
 
             # Update the document
             document.content = reverted_text
@@ -1528,23 +1811,58 @@ class DocumentService:
             logger.error(f"Error reverting Greek conversion: {e}")
             return False
 
-    def _analyze_conversion_impact(
-        self, original_text: str, converted_text: str
-    ) -> None:
+    def _convert_text_file_to_utf8(
+        self, file_path: Path
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Detect the encoding of one file and convert it to UTF-8 if needed.
+
+        Runs in the worker threads of bulk_convert_text_files_to_utf8.
+
+        Args:
+            file_path: Path to the text file
+
+        Returns:
+            Tuple of (conversion details or None, error message or None)
+        """
+        try:
+            # Detect current encoding
+            detected_encoding = self._detect_file_encoding(file_path)
+
+            file_result = {
+                "file_path": str(file_path),
+                "original_encoding": detected_encoding,
+                "status": "unknown",
+            }
+
+            # Check if already UTF-8
+            if detected_encoding.lower() in ["utf-8", "ascii"]:
+                file_result["status"] = "already_utf8"
+                logger.info(f"File {file_path} is already UTF-8 compatible")
+            elif self._convert_file_to_utf8(file_path, detected_encoding):
+                file_result["status"] = "converted"
+                file_result["converted_to"] = "utf-8"
+            else:
+                file_result["status"] = "failed"
+                logger.error(f"Failed to convert {file_path}")
+
+            return file_result, None
+
+        except Exception as e:
+            error_msg = f"Error processing {file_path}: {e}"
+            logger.error(error_msg)
+            return None, error_msg
+
+    def _analyze_conversion_impact(self, changed_chars: int, total_chars: int) -> None:
         """Analyze and log the impact of Greek text conversion.
 
         Args:
-            original_text: Text before conversion
-            converted_text: Text after conversion
+            changed_chars: Number of characters the conversion changes
+            total_chars: Length of the text
         """
-        if not original_text or not converted_text or original_text == converted_text:
+        if not changed_chars:
             return
 
-        # Count characters that were changed
-        changed_chars = sum(1 for a, b in zip(original_text, converted_text) if a != b)
-
         # Calculate percentage of text affected
-        total_chars = len(original_text)
         if total_chars > 0:
             percentage = (changed_chars / total_chars) * 100
 
@@ -1599,13 +1917,20 @@ class DocumentService:
         directory_path: Union[str, Path],
         file_patterns: Optional[List[str]] = None,
         recursive: bool = True,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Convert multiple text files in a directory to UTF-8 encoding.
 
+        Files are detected and converted in parallel threads. Detection only
+        samples each file and conversion streams it, so memory use does not
+        depend on file sizes.
+
         Args:
             directory_path: Directory containing text files to convert
             file_patterns: List of file patterns to match (e.g., ['*.txt', '*.text'])
             recursive: Whether to search subdirectories
+            max_workers: Number of files converted at once (defaults to the
+                CPU count, at most 8)
 
         Returns:
             Dictionary with conversion results and statistics
@@ -1625,55 +1950,35 @@ class DocumentService:
         }
 
         try:
-            # Find all matching text files
-            text_files = []
+            # Find all matching text files, once each even if several patterns match
+            text_files: Dict[Path, None] = {}
             for pattern in file_patterns:
                 if recursive:
-                    text_files.extend(directory_path.rglob(pattern))
+                    text_files.update(dict.fromkeys(directory_path.rglob(pattern)))
                 else:
-                    text_files.extend(directory_path.glob(pattern))
+                    text_files.update(dict.fromkeys(directory_path.glob(pattern)))
 
             results["total_files"] = len(text_files)
             logger.info(f"Found {len(text_files)} text files to process")
 
-            for file_path in text_files:
-                try:
-                    # Detect current encoding
-                    detected_encoding = self._detect_file_encoding(file_path)
-
-                    file_result = {
-                        "file_path": str(file_path),
-                        "original_encoding": detected_encoding,
-                        "status": "unknown",
-                    }
-
-                    # Check if already UTF-8
-                    if detected_encoding.lower() in ["utf-8", "ascii"]:
-                        file_result["status"] = "already_utf8"
+            workers = max(1, max_workers or min(8, os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for file_result, error_msg in pool.map(
+                    self._convert_text_file_to_utf8, text_files
+                ):
+                    if error_msg is not None:
+                        results["errors"].append(error_msg)
+                        results["failed_conversions"] += 1
+                        continue
+
+                    if file_result["status"] == "already_utf8":
                         results["already_utf8"] += 1
-                        logger.info(f"File {file_path} is already UTF-8 compatible")
+                    elif file_result["status"] == "converted":
+                        results["converted_files"] += 1
                     else:
-                        # Convert to UTF-8
-                        if self._convert_file_to_utf8(file_path, detected_encoding):
-                            file_result["status"] = "converted"
-                            file_result["converted_to"] = "utf-8"
-                            results["converted_files"] += 1
-                            logger.info(
-                                f"Successfully converted {file_path} from {detected_encoding} to UTF-8"
-                            )
-                        else:
-                            file_result["status"] = "failed"
-                            results["failed_conversions"] += 1
-                            logger.error(f"Failed to convert {file_path}")
-
+                        results["failed_conversions"] += 1
                     results["conversion_details"].append(file_result)
 
-                except Exception as e:
-                    error_msg = f"Error processing {file_path}: {e}"
-                    results["errors"].append(error_msg)
-                    results["failed_conversions"] += 1
-                    logger.error(error_msg)
-
             # Log summary
             logger.info("Bulk conversion complete:")
             logger.info(f"  Total files: {results['total_files']}")
@@ -0,0 +1,180 @@
+"""
+Purpose: Verifies document file checksums in a low-priority background thread
+
+This file is part of the document_manager pillar and serves as a service component.
+Fetching a document only compares the stat fingerprint of its file with the
+stored one. When the fingerprint changed, the file is queued here and hashed
+in full off the calling thread, and the result is written back so the next
+fetch can use the fast path again.
+
+Key components:
+- IntegrityVerifier: Queues documents and re-hashes their files in the background
+
+Dependencies:
+- threading: For the background worker
+- document_manager.utils.file_checksum: For checksums and fingerprints
+
+Related files:
+- document_manager/services/document_service.py: Schedules verifications in get_document
+- document_manager/repositories/document_repository.py: Stores verification results
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.utils.file_checksum import (
+    CHECKSUM_BUFFER_SIZE,
+    file_checksum,
+    file_checksum_and_md5,
+    file_fingerprint,
+)
+
+# Niceness of the worker thread (Linux applies it per thread)
+VERIFIER_NICENESS = 19
+
+
+class IntegrityVerifier:
+    """Re-hashes document files in a background thread.
+
+    The worker thread starts when a document is scheduled and exits once
+    the queue is empty. A document scheduled again before it was verified
+    is only hashed once.
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        buffer_size: int = CHECKSUM_BUFFER_SIZE,
+    ):
+        """Initialize the verifier.
+
+        Args:
+            document_repository: Repository the results are written to
+            buffer_size: Number of bytes read at a time while hashing
+        """
+        self.document_repository = document_repository
+        self.buffer_size = buffer_size
+        # Document ID -> (file path, expected checksum, legacy MD5 checksum)
+        self._pending: Dict[str, Tuple[Path, Optional[str], Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(
+        self,
+        document_id: str,
+        file_path: Path,
+        expected_checksum: Optional[str],
+        legacy_checksum: Optional[str] = None,
+    ) -> None:
+        """Queue a document's file for verification.
+
+        Args:
+            document_id: ID of the document
+            file_path: Path of the document file
+            expected_checksum: Stored checksum, or None to record the current one
+            legacy_checksum: MD5 checksum stored by older versions, checked
+                when there is no expected checksum
+        """
+        with self._lock:
+            self._pending[document_id] = (
+                Path(file_path),
+                expected_checksum,
+                legacy_checksum,
+            )
+            self._idle.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="IntegrityVerifier", daemon=True
+                )
+                self._thread.start()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every scheduled document has been verified.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the queue is empty, False if the timeout expired
+        """
+        return self._idle.wait(timeout)
+
+    def verify(
+        self,
+        document_id: str,
+        file_path: Path,
+        expected_checksum: Optional[str],
+        legacy_checksum: Optional[str] = None,
+    ) -> str:
+        """Hash a document's file and record the result.
+
+        A document that only has a legacy MD5 checksum gets the new checksum
+        recorded if its file still matches the MD5. If it does not, the MD5
+        is kept, so the mismatch stays on record.
+
+        Args:
+            document_id: ID of the document
+            file_path: Path of the document file
+            expected_checksum: Stored checksum, or None to record the current one
+            legacy_checksum: MD5 checksum stored by older versions, checked
+                when there is no expected checksum
+
+        Returns:
+            The integrity status: "OK", "CHECKSUM_MISMATCH" or "FILE_MISSING"
+        """
+        recorded = expected_checksum or legacy_checksum
+        try:
+            fingerprint = file_fingerprint(file_path)
+            if expected_checksum or not legacy_checksum:
+                checksum = file_checksum(file_path, self.buffer_size)
+                actual = checksum
+            else:
+                checksum, actual = file_checksum_and_md5(file_path, self.buffer_size)
+        except OSError:
+            logger.warning(f"Document file missing: {file_path}")
+            return "FILE_MISSING"
+
+        status = "OK"
+        if recorded and actual != recorded:
+            logger.warning(
+                f"Document checksum mismatch for {document_id}: "
+                f"recorded={recorded}, actual={actual}"
+            )
+            status = "CHECKSUM_MISMATCH"
+
+        self.document_repository.update_integrity(
+            document_id, checksum if status == "OK" else None, fingerprint, status
+        )
+        return status
+
+    def _run(self) -> None:
+        """Verify queued documents until the queue is empty."""
+        try:
+            os.setpriority(
+                os.PRIO_PROCESS, threading.get_native_id(), VERIFIER_NICENESS
+            )
+        except (AttributeError, OSError):
+            pass
+
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    self._idle.set()
+                    return
+                document_id = next(iter(self._pending))
+                file_path, expected_checksum, legacy_checksum = self._pending.pop(
+                    document_id
+                )
+
+            try:
+                self.verify(document_id, file_path, expected_checksum, legacy_checksum)
+            except Exception as e:
+                logger.error(f"Error verifying document {document_id}: {e}")
@@ -0,0 +1,161 @@
+"""
+Purpose: Runs a function over many items in worker processes, surviving crashes
+
+This file is part of the document_manager pillar and serves as a service component.
+Imports and concordance generation both hand items to a pool of spawned
+worker processes, keep a bounded number in flight and consume the results
+as they finish. This module holds that loop once. A worker that dies (a
+segfault in native code, os._exit, the OOM killer) breaks the whole pool:
+the items that were in flight are reported as failed, a fresh pool is
+started and the remaining items carry on, so one bad file cannot abort a
+long run.
+
+Key components:
+- run_in_processes: Yields (item, result, error) as worker processes finish items
+
+Dependencies:
+- concurrent.futures: For the process pool
+
+Related files:
+- document_manager/services/document_extraction_pool.py: Extracts imported documents
+- document_manager/services/concordance_pool.py: Builds concordance entries
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+Item = TypeVar("Item")
+
+# Result for one item: (item, function result or None, error message or None)
+ItemResult = Tuple[Item, Any, Optional[str]]
+
+# Error reported for items lost with a crashed worker process
+WORKER_CRASHED = "worker process crashed"
+
+
+def run_in_processes(
+    function: Callable[[Item], Any],
+    items: Sequence[Item],
+    initializer: Callable[..., None],
+    initargs: Tuple = (),
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[ItemResult]:
+    """Call a function on each item in worker processes, yielding as they finish.
+
+    At most max_pending items are handed to the pool at a time, so results
+    cannot pile up faster than the caller consumes them. Closing the
+    generator early cancels items not yet started. With a single worker
+    the items are processed in the calling process.
+
+    An exception raised by the function is reported as the item's error.
+    If a worker process dies, every item in flight at the time is reported
+    with a "worker process crashed" error, since the pool cannot tell which
+    one killed it, and the remaining items go to a new pool.
+
+    Args:
+        function: Picklable function called with each item in a worker
+        items: Items to process
+        initializer: Picklable function preparing each worker process
+        initargs: Arguments of the initializer
+        max_workers: Number of worker processes (defaults to the CPU count)
+        max_pending: Items in flight at once (defaults to twice the workers)
+
+    Yields:
+        Tuples of (item, result or None, error message or None)
+    """
+    if not items:
+        return
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(items)))
+    if workers == 1:
+        initializer(*initargs)
+        for item in items:
+            try:
+                result = function(item)
+            except Exception as e:
+                outcome = (item, None, str(e) or type(e).__name__)
+            else:
+                outcome = (item, result, None)
+            yield outcome
+        return
+
+    max_pending = max(workers, max_pending or workers * 2)
+
+    # Spawned workers do not inherit the Qt state of the application process
+    context = multiprocessing.get_context("spawn")
+
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+
+    remaining = deque(items)
+    # Future -> (item, pool it was submitted to)
+    in_flight: Dict[Future, Tuple[Item, ProcessPoolExecutor]] = {}
+    pool: Optional[ProcessPoolExecutor] = None
+    retired: List[ProcessPoolExecutor] = []
+
+    def retire(broken: ProcessPoolExecutor) -> None:
+        nonlocal pool
+        if broken is pool:
+            retired.append(broken)
+            pool = None
+
+    try:
+        while remaining or in_flight:
+            while remaining and len(in_flight) < max_pending:
+                if pool is None:
+                    pool = new_pool()
+                try:
+                    future = pool.submit(function, remaining[0])
+                except BrokenProcessPool:
+                    # The item stays queued for the next pool
+                    retire(pool)
+                    break
+                in_flight[future] = (remaining.popleft(), pool)
+
+            if not in_flight:
+                continue
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            outcomes = []
+            for future in done:
+                item, owner = in_flight.pop(future)
+                try:
+                    outcomes.append((item, future.result(), None))
+                except BrokenProcessPool:
+                    # Every future of a broken pool fails; later items need
+                    # a new pool
+                    outcomes.append((item, None, WORKER_CRASHED))
+                    retire(owner)
+                except Exception as e:
+                    outcomes.append((item, None, str(e) or type(e).__name__))
+
+            for outcome in outcomes:
+                yield outcome
+    finally:
+        # Stopped early (e.g. cancelled): drop items not yet started
+        for future in in_flight:
+            future.cancel()
+        for executor in retired:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -3,7 +3,9 @@ Purpose: Provides services for managing QGem documents.
 
 This file is part of the document_manager pillar and serves as a service component.
 It handles operations related to QGem rich text documents, including conversion
-between DocumentFormat and QGemDocument models.
+between DocumentFormat and QGemDocument models. Listings query the documents
+by type and leave the HTML bodies out; a document's HTML is loaded, and
+decompressed, only when it is opened.
 
 Key components:
 - QGemDocumentService: Service for managing QGem documents
@@ -15,10 +17,11 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
-from document_manager.models.document import DocumentType
+from document_manager.models.document import DocumentSummary, DocumentType
 from document_manager.models.qgem_document import QGemDocument
 from document_manager.services.document_service import DocumentService
 from shared.ui.widgets.rtf_editor.models.document_format import DocumentFormat
+from shared.ui.widgets.rtf_editor.utils.image_storage import cleanup_unused_images
 
 logger = logging.getLogger(__name__)
 
@@ -150,38 +153,51 @@ class QGemDocumentService:
         # Convert to QGemDocument if it's a QTDOC
         if doc.file_type == DocumentType.QTDOC:
             if isinstance(doc, QGemDocument):
-                return doc
+                qgem_doc = doc
             elif hasattr(doc, "dict") and callable(doc.dict):
-                return QGemDocument(**doc.dict())
+                qgem_doc = QGemDocument(**doc.dict())
             else:
                 logger.error(f"Unexpected document type from service: {type(doc)}")
                 return None
+
+            # The HTML body is stored apart and only read when opening
+            if qgem_doc.html_content is None:
+                qgem_doc.html_content = self.document_repository.get_html_content(
+                    document_id
+                )
+            return qgem_doc
         return None
 
     def get_all_qgem_documents(self) -> List[QGemDocument]:
         """Get all QGem documents.
 
+        Only QGem documents are read from the database. Their HTML bodies are
+        not loaded; use get_document_by_id to open a document with its HTML.
+
         Returns:
             List of QGemDocument instances
         """
-        # Get all documents
-        all_docs = self.document_service.get_all_documents()
-
-        # Filter QGem documents and convert to QGemDocument
         qgem_docs = []
-        for doc in all_docs:
-            if doc.file_type == DocumentType.QTDOC:
-                if isinstance(doc, QGemDocument):
-                    qgem_docs.append(doc)
-                elif hasattr(doc, "dict") and callable(doc.dict):
-                    qgem_docs.append(QGemDocument(**doc.dict()))
-                else:
-                    logger.warning(
-                        f"Skipping document with ID {doc.id} due to unexpected type: {type(doc)}"
-                    )
+        for doc in self.document_repository.get_by_type(DocumentType.QTDOC):
+            if isinstance(doc, QGemDocument):
+                qgem_docs.append(doc)
+            elif hasattr(doc, "dict") and callable(doc.dict):
+                qgem_docs.append(QGemDocument(**doc.dict()))
+            else:
+                logger.warning(
+                    f"Skipping document with ID {doc.id} due to unexpected type: {type(doc)}"
+                )
 
         return qgem_docs
 
+    def get_qgem_summaries(self) -> List[DocumentSummary]:
+        """Get summaries of all QGem documents for listing, without their text.
+
+        Returns:
+            List of document summaries
+        """
+        return self.document_repository.get_summaries_by_type(DocumentType.QTDOC)
+
     def delete_document(self, document_id: str) -> bool:
         """Delete a QGem document by ID.
 
@@ -213,6 +229,8 @@ class QGemDocumentService:
             result = self.document_service.delete_document(document_id)
             if result:
                 logger.info(f"Successfully deleted QGem document with ID {document_id}")
+                # Images no other document uses are deleted with it
+                cleanup_unused_images(document_id, [])
                 return True
             else:
                 logger.error(f"Failed to delete QGem document with ID {document_id}")
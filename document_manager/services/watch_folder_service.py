@@ -0,0 +1,404 @@
+"""
+Purpose: Ingests new and changed documents from watched folders incrementally
+
+This file is part of the document_manager pillar and serves as a service component.
+Instead of re-importing a whole corpus to pick up a few changes, this service
+watches configured directories and only imports the files that appeared or
+changed. Changes are noticed through QFileSystemWatcher, with a periodic scan
+as a fallback for file systems and edits the watcher misses. Both compare stat
+fingerprints only, so an unchanged corpus costs one stat per file and no reads.
+A file is imported once its fingerprint has stayed the same for a debounce
+interval, so files still being written are not imported half finished.
+Imports run in the background through DocumentService.batch_import_documents.
+
+Key components:
+- WatchFolderService: Watches directories and imports their changed files
+
+Dependencies:
+- PyQt6: For the file system watcher, timers and signals
+- document_manager.services.document_service: Imports the files
+
+Related files:
+- document_manager/repositories/document_repository.py: Stores source fingerprints
+- document_manager/utils/file_checksum.py: Computes the stat fingerprints
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Union
+
+from loguru import logger
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from document_manager.models.document import Document, DocumentType
+from document_manager.services.document_service import DocumentService
+from document_manager.utils.file_checksum import file_fingerprint
+
+# Files being ingested: source path -> fingerprint when it was queued
+_Batch = Dict[str, List[int]]
+
+
+class WatchFolderService(QObject):
+    """Watches directories and imports new or changed documents in the background."""
+
+    # Emitted with the documents imported or found unchanged by each batch
+    documents_ingested = pyqtSignal(list)
+    # Emitted with an error message when a batch fails
+    ingestion_failed = pyqtSignal(str)
+    # Emitted with True when ingestion starts and False when the queue is empty
+    busy_changed = pyqtSignal(bool)
+
+    # Delivers a finished batch from the worker thread to the GUI thread
+    _batch_finished = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        document_service: Optional[DocumentService] = None,
+        file_patterns: Optional[List[str]] = None,
+        recursive: bool = True,
+        category_id: Optional[str] = None,
+        debounce_ms: int = 2000,
+        scan_interval_ms: int = 60000,
+        max_workers: Optional[int] = None,
+        parent=None,
+    ):
+        """Initialize the service; nothing is watched until a directory is added.
+
+        Args:
+            document_service: Service importing the files, created if not provided
+            file_patterns: Glob patterns of files to import (defaults to all
+                supported document types)
+            recursive: Whether to watch subdirectories
+            category_id: Optional category ID assigned to imported documents
+            debounce_ms: Time a file must stay unchanged before it is imported
+            scan_interval_ms: Interval of the fallback scan, 0 to disable it
+            max_workers: Number of extraction processes per batch
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.document_service = document_service or DocumentService()
+        self.file_patterns = file_patterns or [f"*.{t.value}" for t in DocumentType]
+        self.recursive = recursive
+        self.category_id = category_id
+        self.max_workers = max_workers
+
+        self._directories: Set[str] = set()
+        # Directories added to the file system watcher, including subdirectories
+        self._watched: Set[str] = set()
+
+        # Fingerprints of files already ingested or in the library
+        self._known: Dict[str, Optional[List[int]]] = {}
+        # Files that changed, with the fingerprint they were last seen with
+        self._settling: Dict[str, List[int]] = {}
+        # Files whose fingerprint has settled, waiting for the running batch
+        self._queue: _Batch = {}
+        self._batch: Optional[_Batch] = None
+        # Set by stop(); batches finishing afterwards are not reported
+        self._stopped = False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        # Directories reported by the watcher, scanned together after a pause
+        self._dirty: Set[str] = set()
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._on_debounce_timeout)
+
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setInterval(scan_interval_ms)
+        self._scan_timer.timeout.connect(self.scan)
+        if scan_interval_ms > 0:
+            self._scan_timer.start()
+
+        # One batch at a time; extraction itself runs in a process pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="watch-folder"
+        )
+        self._batch_finished.connect(self._on_batch_finished)
+
+    def add_directory(self, directory: Union[str, Path]) -> bool:
+        """Start watching a directory and ingest what changed since the last run.
+
+        Args:
+            directory: Directory to watch
+
+        Returns:
+            True if the directory is watched, False if it does not exist
+        """
+        path = Path(directory).resolve()
+        if not path.is_dir():
+            logger.error(f"Watch folder not found: {directory}")
+            return False
+
+        key = str(path)
+        if key in self._directories:
+            return True
+
+        self._directories.add(key)
+        self._known.update(
+            self.document_service.document_repository.get_source_fingerprints(key)
+        )
+        logger.info(f"Watching {key} for new documents")
+        self._scan_directory(key, self.recursive)
+        return True
+
+    def remove_directory(self, directory: Union[str, Path]) -> None:
+        """Stop watching a directory.
+
+        Files already queued from it are still ingested.
+
+        Args:
+            directory: Directory to stop watching
+        """
+        key = str(Path(directory).resolve())
+        self._directories.discard(key)
+
+        prefix = os.path.join(key, "")
+        watched = [d for d in self._watched if d == key or d.startswith(prefix)]
+        if watched:
+            self._watcher.removePaths(watched)
+            self._watched.difference_update(watched)
+        for path in [p for p in self._settling if p.startswith(prefix)]:
+            del self._settling[path]
+
+    def directories(self) -> List[str]:
+        """Get the watched directories.
+
+        Returns:
+            Sorted list of watched directory paths
+        """
+        return sorted(self._directories)
+
+    def scan(self) -> None:
+        """Look for new and changed files in every watched directory."""
+        for directory in list(self._directories):
+            self._scan_directory(directory, self.recursive)
+
+    def pending_count(self) -> int:
+        """Get the number of files waiting to be or being ingested.
+
+        Returns:
+            Number of changed files not ingested yet
+        """
+        return (
+            len(self._settling)
+            + len(self._queue)
+            + (len(self._batch) if self._batch else 0)
+        )
+
+    def is_busy(self) -> bool:
+        """Check whether a batch is being ingested.
+
+        Returns:
+            True while a batch is running
+        """
+        return self._batch is not None
+
+    def stop(self) -> None:
+        """Stop watching without waiting for the running batch.
+
+        A batch already running finishes its imports in the background,
+        but its results are not reported. The service cannot be restarted.
+        """
+        self._stopped = True
+        self._scan_timer.stop()
+        self._debounce_timer.stop()
+        if self._watched:
+            self._watcher.removePaths(list(self._watched))
+        self._watched.clear()
+        self._directories.clear()
+        self._settling.clear()
+        self._queue.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+        if self._batch is not None:
+            self._batch = None
+            self.busy_changed.emit(False)
+
+    def _on_directory_changed(self, directory: str) -> None:
+        """Schedule a scan of a directory the watcher reported."""
+        if not os.path.isdir(directory):
+            # The watcher drops removed directories by itself
+            self._watched.discard(directory)
+        self._dirty.add(directory)
+        self._debounce_timer.start()
+
+    def _on_debounce_timeout(self) -> None:
+        """Scan reported directories and re-check files that were settling."""
+        dirty, self._dirty = self._dirty, set()
+        for directory in dirty:
+            if self._is_watched(directory):
+                # Subdirectories have watches of their own
+                self._scan_directory(directory, recursive=False)
+
+        for path, fingerprint in list(self._settling.items()):
+            self._observe(path, fingerprint)
+
+        if self._settling:
+            self._debounce_timer.start()
+
+    def _is_watched(self, directory: str) -> bool:
+        """Check whether a directory is, or is inside, a watched directory."""
+        return any(
+            directory == d or (self.recursive and directory.startswith(os.path.join(d, "")))
+            for d in self._directories
+        )
+
+    def _scan_directory(self, directory: str, recursive: bool) -> None:
+        """Stat the matching files of a directory and note the changed ones.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan subdirectories too
+        """
+        for path in self._iter_files(directory, recursive):
+            try:
+                fingerprint = file_fingerprint(path)
+            except OSError:
+                continue
+            self._observe(path, fingerprint)
+
+        if self._settling and not self._debounce_timer.isActive():
+            self._debounce_timer.start()
+
+    def _iter_files(self, directory: str, recursive: bool) -> Iterator[str]:
+        """Yield the files of a directory that match the file patterns.
+
+        Directories found along the way are added to the watcher. Hidden
+        files and office lock files are skipped.
+
+        Args:
+            directory: Directory to list
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            Absolute paths of matching files
+        """
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            if current not in self._watched:
+                self._watcher.addPath(current)
+                self._watched.add(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name.startswith((".", "~$")):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                        elif entry.is_file() and any(
+                            fnmatch(entry.name.lower(), pattern.lower())
+                            for pattern in self.file_patterns
+                        ):
+                            yield entry.path
+            except OSError as e:
+                logger.warning(f"Cannot scan watch folder {current}: {e}")
+
+    def _observe(self, path: str, fingerprint: Optional[List[int]]) -> None:
+        """Compare a file's fingerprint with what was seen before.
+
+        A changed file first settles: it is queued once a later look finds
+        the same fingerprint again.
+
+        Args:
+            path: Absolute path of the file
+            fingerprint: Current fingerprint, or the last seen one to re-stat
+        """
+        if path in self._settling:
+            try:
+                fingerprint = file_fingerprint(path)
+            except OSError:
+                # Deleted or renamed while it was being written
+                del self._settling[path]
+                return
+
+        if self._known.get(path) == fingerprint:
+            self._settling.pop(path, None)
+            return
+        if self._queue.get(path) == fingerprint or (
+            self._batch is not None and self._batch.get(path) == fingerprint
+        ):
+            return
+
+        if self._settling.get(path) == fingerprint:
+            del self._settling[path]
+            self._queue[path] = fingerprint
+            self._start_batch()
+        else:
+            self._settling[path] = fingerprint
+
+    def _start_batch(self) -> None:
+        """Hand the queued files to the worker thread unless a batch is running."""
+        if self._stopped or self._batch is not None or not self._queue:
+            return
+
+        self._batch, self._queue = self._queue, {}
+        logger.info(f"Ingesting {len(self._batch)} changed files from watch folders")
+        self.busy_changed.emit(True)
+
+        future = self._executor.submit(self._ingest, dict(self._batch))
+        future.add_done_callback(self._deliver)
+
+    def _deliver(self, future: Future) -> None:
+        """Pass a finished batch to the GUI thread (runs in the worker)."""
+        if self._stopped:
+            return
+        try:
+            self._batch_finished.emit(future.result(), None)
+        except Exception as e:
+            self._batch_finished.emit([], str(e) or type(e).__name__)
+
+    def _ingest(self, batch: _Batch) -> List[Document]:
+        """Import a batch of files and record their source fingerprints.
+
+        Runs on the worker thread, so it must not touch the service state.
+
+        Args:
+            batch: Files to import with the fingerprint they were queued with
+
+        Returns:
+            Documents imported or found unchanged
+        """
+        documents = self.document_service.batch_import_documents(
+            list(batch),
+            max_workers=self.max_workers,
+            category_id=self.category_id,
+        )
+
+        # Documents imported before fingerprints were recorded get theirs now,
+        # so the next run skips them without hashing
+        repository = self.document_service.document_repository
+        for document in documents:
+            fingerprint = batch.get(document.source_path or "")
+            if (
+                fingerprint is not None
+                and document.metadata.get("source_fingerprint") != fingerprint
+            ):
+                repository.update_source_fingerprint(document.id, fingerprint)
+
+        return documents
+
+    def _on_batch_finished(self, documents: List[Document], error: Optional[str]) -> None:
+        """Record a finished batch and start the next one."""
+        if self._stopped:
+            # Delivered after stop(), before the worker saw the flag
+            return
+        batch, self._batch = self._batch or {}, None
+
+        if error is None:
+            # Files that failed to import are not retried until they change
+            self._known.update(batch)
+            self.documents_ingested.emit(documents)
+        else:
+            logger.error(f"Watch folder ingestion failed: {error}")
+            self.ingestion_failed.emit(error)
+
+        self._start_batch()
+        if self._batch is None:
+            self.busy_changed.emit(False)
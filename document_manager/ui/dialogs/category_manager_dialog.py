@@ -123,16 +123,21 @@ class CategoryManagerDialog(QDialog):
 
     def _load_categories(self):
         """Load categories into the tree."""
-        self.category_tree.clear()
+        # Repaint once when the whole tree is built, not per item
+        self.category_tree.setUpdatesEnabled(False)
+        try:
+            self.category_tree.clear()
 
-        # Get category tree
-        category_tree = self.category_service.get_category_tree()
+            # Get category tree (cached by the service until categories change)
+            category_tree = self.category_service.get_category_tree()
 
-        # Build tree items
-        self._build_tree_items(category_tree, None)
+            # Build tree items
+            self._build_tree_items(category_tree, None)
 
-        # Expand all items
-        self.category_tree.expandAll()
+            # Expand all items
+            self.category_tree.expandAll()
+        finally:
+            self.category_tree.setUpdatesEnabled(True)
 
     def _build_tree_items(
         self, categories: List[Dict], parent_item: Optional[QTreeWidgetItem] = None
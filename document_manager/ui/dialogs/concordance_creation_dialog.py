@@ -5,9 +5,10 @@ This dialog allows users to create new KWIC concordances by selecting
 keywords, documents, and configuring generation settings.
 """
 
+import threading
 from typing import List, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -20,6 +21,7 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QListWidget,
     QListWidgetItem,
+    QProgressDialog,
     QPushButton,
     QSpinBox,
     QTabWidget,
@@ -33,6 +35,46 @@ from document_manager.services.concordance_service import ConcordanceService
 from document_manager.services.document_service import DocumentService
 
 
+class ConcordanceGenerationWorker(QThread):
+    """Worker thread that generates and saves a concordance."""
+    
+    progress_updated = pyqtSignal(int, int)  # documents done, documents total
+    generation_completed = pyqtSignal(str)  # concordance table ID
+    generation_cancelled = pyqtSignal()
+    error_occurred = pyqtSignal(str)  # error message
+    
+    def __init__(self, concordance_service: ConcordanceService, **generation_args):
+        """Initialize the worker.
+        
+        Args:
+            concordance_service: Service generating the concordance
+            **generation_args: Arguments for generate_concordance_streaming
+        """
+        super().__init__()
+        self.concordance_service = concordance_service
+        self.generation_args = generation_args
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Ask the generation to stop after the current document."""
+        self.cancel_event.set()
+    
+    def run(self):
+        """Generate the concordance."""
+        try:
+            table = self.concordance_service.generate_concordance_streaming(
+                progress_callback=self.progress_updated.emit,
+                cancel_event=self.cancel_event,
+                **self.generation_args
+            )
+            if table is None:
+                self.generation_cancelled.emit()
+            else:
+                self.generation_completed.emit(table.id)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
 class ConcordanceCreationDialog(QDialog):
     """Dialog for creating new KWIC concordances."""
     
@@ -54,6 +96,8 @@ class ConcordanceCreationDialog(QDialog):
         super().__init__(parent)
         self.concordance_service = concordance_service
         self.document_service = document_service
+        self.generation_worker = None
+        self.progress_dialog = None
         
         self.setWindowTitle("Create KWIC Concordance")
         self.setModal(True)
@@ -511,35 +555,65 @@ class ConcordanceCreationDialog(QDialog):
         )
     
     def _create_concordance(self):
-        """Create the concordance and close the dialog."""
-        try:
-            # Get form data
-            name = self.name_edit.text().strip()
-            description = self.description_edit.toPlainText().strip() or None
-            tags = [tag.strip() for tag in self.tags_edit.text().split(',') if tag.strip()]
-            created_by = self.created_by_edit.text().strip() or None
-            keywords = self._get_keywords()
-            document_ids = self._get_selected_document_ids()
-            settings = self._get_settings()
-            
-            # Generate concordance
-            concordance_table = self.concordance_service.generate_concordance(
-                name=name,
-                keywords=keywords,
-                document_ids=document_ids,
-                settings=settings,
-                description=description,
-                tags=tags,
-                created_by=created_by
+        """Generate the concordance in a worker thread, showing progress."""
+        document_ids = self._get_selected_document_ids()
+        
+        self.generation_worker = ConcordanceGenerationWorker(
+            self.concordance_service,
+            name=self.name_edit.text().strip(),
+            keywords=self._get_keywords(),
+            document_ids=document_ids,
+            settings=self._get_settings(),
+            description=self.description_edit.toPlainText().strip() or None,
+            tags=[tag.strip() for tag in self.tags_edit.text().split(',') if tag.strip()],
+            created_by=self.created_by_edit.text().strip() or None
+        )
+        
+        self.progress_dialog = QProgressDialog(
+            "Generating concordance...", "Cancel", 0, len(document_ids), self
+        )
+        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress_dialog.setMinimumDuration(500)
+        self.progress_dialog.canceled.connect(self.generation_worker.cancel)
+        
+        self.generation_worker.progress_updated.connect(self._on_generation_progress)
+        self.generation_worker.generation_completed.connect(self._on_generation_completed)
+        self.generation_worker.generation_cancelled.connect(self._on_generation_finished)
+        self.generation_worker.error_occurred.connect(self._on_generation_error)
+        
+        self.button_box.setEnabled(False)
+        self.generation_worker.start()
+    
+    def _on_generation_progress(self, done: int, total: int):
+        """Show how many documents have been processed."""
+        if self.progress_dialog:
+            self.progress_dialog.setLabelText(
+                f"Generating concordance... ({done} of {total} documents)"
             )
-            
-            # Save concordance
-            table_id = self.concordance_service.save_concordance(concordance_table)
-            
-            # Emit signal and close
-            self.concordanceCreated.emit(table_id)
-            self.accept()
-            
-        except Exception as e:
-            print(f"Error creating concordance: {e}")
-            # Could show an error dialog here 
\ No newline at end of file
+            self.progress_dialog.setValue(done)
+    
+    def _on_generation_completed(self, table_id: str):
+        """Emit the new concordance and close the dialog."""
+        self._on_generation_finished()
+        self.concordanceCreated.emit(table_id)
+        self.accept()
+    
+    def _on_generation_error(self, message: str):
+        """Report a failed generation."""
+        self._on_generation_finished()
+        print(f"Error creating concordance: {message}")
+        # Could show an error dialog here
+    
+    def _on_generation_finished(self):
+        """Close the progress dialog and re-enable the dialog buttons."""
+        if self.progress_dialog:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+        self.button_box.setEnabled(True)
+    
+    def reject(self):
+        """Cancel a running generation before closing."""
+        if self.generation_worker and self.generation_worker.isRunning():
+            self.generation_worker.cancel()
+            self.generation_worker.wait()
+        super().reject()
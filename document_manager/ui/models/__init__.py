@@ -0,0 +1,11 @@
+"""
+Item models for the document manager pillar.
+
+This module provides Qt item models backing the document manager views.
+"""
+
+from document_manager.ui.models.concordance_entry_model import ConcordanceEntryModel
+
+__all__ = [
+    "ConcordanceEntryModel",
+]
@@ -0,0 +1,141 @@
+"""
+Concordance Entry Model for Document Manager.
+
+This module provides a lazily loaded table model over the entries of a
+concordance table. Paging, the page cache and background loading come from
+KeysetTableModel; filtering and sorting are done by SQLite through the entry
+indexes.
+"""
+
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+
+from document_manager.models.kwic_concordance import ConcordanceEntry, ConcordanceFilter
+from document_manager.services.concordance_service import ConcordanceService
+from shared.services.query_executor import QueryExecutor
+from shared.ui.models.keyset_table_model import KeysetTableModel
+
+# Query of the model: (table ID, filter criteria)
+_EntryQuery = Tuple[str, Optional[ConcordanceFilter]]
+
+
+class ConcordanceEntryModel(KeysetTableModel):
+    """Table model that pages concordance entries in from the database."""
+
+    COLUMN_KEYWORD = 0
+    COLUMN_LEFT_CONTEXT = 1
+    COLUMN_RIGHT_CONTEXT = 2
+    COLUMN_DOCUMENT = 3
+    COLUMN_POSITION = 4
+    COLUMN_LINE = 5
+
+    _HEADERS = ["Keyword", "Left Context", "Right Context", "Document", "Position", "Line"]
+
+    # Repository sort order for each sortable view column
+    _SORT_KEYS = {
+        COLUMN_KEYWORD: "keyword",
+        COLUMN_DOCUMENT: "document",
+        COLUMN_POSITION: "position",
+    }
+
+    _ROWS_NAME = "concordance entries"
+
+    def __init__(
+        self,
+        concordance_service: ConcordanceService,
+        page_size: int = 200,
+        max_cached_pages: int = 10,
+        executor: Optional[QueryExecutor] = None,
+        parent=None,
+    ):
+        """Initialize the model.
+
+        Args:
+            concordance_service: Service used to query entries
+            page_size: Number of entries fetched per query
+            max_cached_pages: Number of pages kept in memory at once
+            executor: Executor dedicated to this model; when given, new
+                filters and sorts are loaded on its worker thread
+            parent: Parent object
+        """
+        super().__init__("keyword", False, page_size, max_cached_pages, executor, parent)
+        self.concordance_service = concordance_service
+
+    def set_table(
+        self, table_id: Optional[str], filter_criteria: Optional[ConcordanceFilter] = None
+    ) -> None:
+        """Show the entries of a table matching filter criteria.
+
+        Args:
+            table_id: ID of the concordance table, or None to show nothing
+            filter_criteria: Optional filter criteria
+        """
+        self._set_query(None if table_id is None else (table_id, filter_criteria))
+
+    def entry_at(self, row: int) -> Optional[ConcordanceEntry]:
+        """Get the entry shown in a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            The entry, or None if the row does not exist
+        """
+        return self.row_item(row)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get the data shown in a cell."""
+        if not index.isValid():
+            return None
+
+        entry = self.entry_at(index.row())
+        if entry is None:
+            return None
+
+        column = index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            if column == self.COLUMN_KEYWORD:
+                return entry.keyword
+            if column == self.COLUMN_LEFT_CONTEXT:
+                return entry.left_context
+            if column == self.COLUMN_RIGHT_CONTEXT:
+                return entry.right_context
+            if column == self.COLUMN_DOCUMENT:
+                return entry.document_name
+            if column == self.COLUMN_POSITION:
+                return str(entry.position)
+            if column == self.COLUMN_LINE:
+                return str(entry.line_number) if entry.line_number else ""
+
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == self.COLUMN_LEFT_CONTEXT:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+        elif role == Qt.ItemDataRole.UserRole:
+            return entry
+
+        return None
+
+    def _fetch_page(
+        self,
+        query: _EntryQuery,
+        sort_by: str,
+        descending: bool,
+        after: Optional[Tuple],
+    ) -> Tuple[List[ConcordanceEntry], Optional[Tuple]]:
+        """Run the keyset query for a page of entries."""
+        table_id, filter_criteria = query
+        return self.concordance_service.get_entries_after(
+            table_id,
+            filter_criteria,
+            sort_by=sort_by,
+            descending=descending,
+            after=after,
+            limit=self.page_size,
+        )
+
+    def _count(self, query: _EntryQuery) -> int:
+        """Count the entries of a table matching filter criteria."""
+        return self.concordance_service.count_entries(*query)
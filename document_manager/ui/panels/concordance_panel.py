@@ -3,6 +3,8 @@ Concordance Panel for Document Manager.
 
 This panel provides a comprehensive interface for managing KWIC concordances,
 including viewing, searching, filtering, and exporting concordance data.
+Entries are paged in from the database as the view scrolls; filtering and
+sorting run in the database on a background query executor.
 """
 
 from typing import Dict, List, Optional
@@ -20,6 +22,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSplitter,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QTextEdit,
@@ -29,6 +32,7 @@ from PyQt6.QtWidgets import (
 
 from document_manager.models.kwic_concordance import (
     ConcordanceExportFormat,
+    ConcordanceFilter,
     ConcordanceTable,
 )
 from document_manager.services.concordance_service import ConcordanceService
@@ -36,6 +40,8 @@ from document_manager.services.document_service import DocumentService
 from document_manager.ui.dialogs.concordance_creation_dialog import (
     ConcordanceCreationDialog,
 )
+from document_manager.ui.models.concordance_entry_model import ConcordanceEntryModel
+from shared.services.query_executor import QueryExecutor
 from shared.services.service_locator import ServiceLocator
 
 
@@ -56,6 +62,7 @@ class ConcordancePanel(QWidget):
 
         # Current data
         self.current_concordance: Optional[ConcordanceTable] = None
+        self.current_entry_count = 0
         self.concordance_tables: List[Dict] = []
 
         # Search timer for debouncing
@@ -63,6 +70,17 @@ class ConcordancePanel(QWidget):
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self._perform_search)
 
+        # Entry filters are searched in the database in the background
+        self.filter_timer = QTimer()
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.timeout.connect(self._display_concordance_entries)
+        self.entry_executor = QueryExecutor(self)
+        self.entry_executor.query_failed.connect(self._on_entry_search_failed)
+        self.entry_model = ConcordanceEntryModel(
+            self.concordance_service, executor=self.entry_executor, parent=self
+        )
+        self.entry_model.results_loaded.connect(self._on_entries_loaded)
+
         self._setup_ui()
         self._connect_signals()
         self._load_concordance_tables()
@@ -199,7 +217,7 @@ class ConcordancePanel(QWidget):
         search_controls_layout.addWidget(self.keyword_filter)
 
         self.document_filter = QComboBox()
-        self.document_filter.addItem("All Documents")
+        self.document_filter.addItem("All Documents", None)
         search_controls_layout.addWidget(QLabel("Document:"))
         search_controls_layout.addWidget(self.document_filter)
 
@@ -232,12 +250,9 @@ class ConcordancePanel(QWidget):
         self.results_label = QLabel("No concordance selected")
         entries_layout.addWidget(self.results_label)
 
-        # Entries table
-        self.entries_table = QTableWidget()
-        self.entries_table.setColumnCount(6)
-        self.entries_table.setHorizontalHeaderLabels(
-            ["Keyword", "Left Context", "Right Context", "Document", "Position", "Line"]
-        )
+        # Entries table; rows are loaded as the view scrolls
+        self.entries_table = QTableView()
+        self.entries_table.setModel(self.entry_model)
 
         # Configure entries table
         entries_header = self.entries_table.horizontalHeader()
@@ -249,9 +264,12 @@ class ConcordancePanel(QWidget):
         entries_header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
 
         self.entries_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
         )
         self.entries_table.setAlternatingRowColors(True)
+        entries_header.setSortIndicator(
+            ConcordanceEntryModel.COLUMN_KEYWORD, Qt.SortOrder.AscendingOrder
+        )
         self.entries_table.setSortingEnabled(True)
 
         entries_layout.addWidget(self.entries_table)
@@ -288,7 +306,7 @@ class ConcordancePanel(QWidget):
         self.clear_filters_button.clicked.connect(self._clear_filters)
 
         # Entries table
-        self.entries_table.itemSelectionChanged.connect(
+        self.entries_table.selectionModel().currentRowChanged.connect(
             self._on_entry_selection_changed
         )
 
@@ -386,10 +404,19 @@ class ConcordancePanel(QWidget):
     def _load_concordance_table(self, table_id: str):
         """Load a specific concordance table."""
         try:
+            # Entries are paged in by the entry model instead
             self.current_concordance = self.concordance_service.get_concordance(
-                table_id
+                table_id, include_entries=False
             )
             if self.current_concordance:
+                self.current_entry_count = next(
+                    (
+                        table["entry_count"]
+                        for table in self.concordance_tables
+                        if table["id"] == table_id
+                    ),
+                    0,
+                )
                 self._display_concordance_info()
                 self._populate_document_filter()
                 self._display_concordance_entries()
@@ -408,7 +435,7 @@ class ConcordancePanel(QWidget):
         <b>Description:</b> {self.current_concordance.description or 'None'}<br>
         <b>Keywords:</b> {', '.join(self.current_concordance.keywords)}<br>
         <b>Documents:</b> {len(self.current_concordance.document_ids)}<br>
-        <b>Entries:</b> {len(self.current_concordance.entries)}<br>
+        <b>Entries:</b> {self.current_entry_count}<br>
         <b>Created:</b> {self.current_concordance.created_at.strftime('%Y-%m-%d %H:%M:%S')}<br>
         <b>Tags:</b> {', '.join(self.current_concordance.tags) if self.current_concordance.tags else 'None'}
         """
@@ -416,98 +443,68 @@ class ConcordancePanel(QWidget):
 
     def _populate_document_filter(self):
         """Populate the document filter dropdown."""
+        self.document_filter.blockSignals(True)
         self.document_filter.clear()
-        self.document_filter.addItem("All Documents")
+        self.document_filter.addItem("All Documents", None)
 
         if self.current_concordance:
-            # Get unique document names
-            doc_names = set(
-                entry.document_name for entry in self.current_concordance.entries
-            )
-            for doc_name in sorted(doc_names):
-                self.document_filter.addItem(doc_name)
+            # Documents with entries, listed by name
+            for doc_id, doc_name in self.concordance_service.get_entry_documents(
+                self.current_concordance.id
+            ):
+                self.document_filter.addItem(doc_name, doc_id)
+        self.document_filter.blockSignals(False)
 
     def _display_concordance_entries(self):
-        """Display the concordance entries."""
+        """Display the concordance entries matching the current filters."""
+        self.filter_timer.stop()
         if not self.current_concordance:
-            self.entries_table.setRowCount(0)
+            self.entry_model.set_table(None)
             self.results_label.setText("No concordance selected")
             return
 
-        # Apply filters
-        filtered_entries = self._apply_filters()
-
-        # Update results label
-        total_entries = len(self.current_concordance.entries)
-        filtered_count = len(filtered_entries)
-        self.results_label.setText(
-            f"Showing {filtered_count} of {total_entries} entries"
-        )
-
-        # Populate table
-        self.entries_table.setRowCount(len(filtered_entries))
+        # Filter in the database; a search still running for older filter
+        # values is interrupted
+        self.entry_model.set_table(self.current_concordance.id, self._build_filter())
+        if self.entry_model.is_loading():
+            self.results_label.setText("Searching...")
 
-        for row, entry in enumerate(filtered_entries):
-            # Keyword
-            keyword_item = QTableWidgetItem(entry.keyword)
-            keyword_item.setData(Qt.ItemDataRole.UserRole, entry)
-            self.entries_table.setItem(row, 0, keyword_item)
+    def _build_filter(self) -> Optional[ConcordanceFilter]:
+        """Build search criteria from the filter controls.
 
-            # Left context
-            left_item = QTableWidgetItem(entry.left_context)
-            self.entries_table.setItem(row, 1, left_item)
-
-            # Right context
-            right_item = QTableWidgetItem(entry.right_context)
-            self.entries_table.setItem(row, 2, right_item)
-
-            # Document
-            doc_item = QTableWidgetItem(entry.document_name)
-            self.entries_table.setItem(row, 3, doc_item)
-
-            # Position
-            pos_item = QTableWidgetItem(str(entry.position))
-            self.entries_table.setItem(row, 4, pos_item)
+        Returns:
+            Filter criteria, or None if no filter is set
+        """
+        keyword_text = self.keyword_filter.text().strip()
+        doc_id = self.document_filter.currentData()
+        left_text = self.left_context_filter.text().strip()
+        right_text = self.right_context_filter.text().strip()
+
+        if not (keyword_text or doc_id or left_text or right_text):
+            return None
+
+        return ConcordanceFilter(
+            keywords=[keyword_text] if keyword_text else None,
+            document_ids=[doc_id] if doc_id else None,
+            left_context_contains=left_text or None,
+            right_context_contains=right_text or None,
+        )
 
-            # Line
-            line_item = QTableWidgetItem(
-                str(entry.line_number) if entry.line_number else ""
+    def _on_entries_loaded(self, total: int):
+        """Show how many entries match the current filters."""
+        if self.current_concordance:
+            self.results_label.setText(
+                f"Showing {total} of {self.current_entry_count} entries"
             )
-            self.entries_table.setItem(row, 5, line_item)
-
-    def _apply_filters(self) -> List:
-        """Apply current filters to concordance entries."""
-        if not self.current_concordance:
-            return []
-
-        entries = self.current_concordance.entries
-
-        # Keyword filter
-        keyword_text = self.keyword_filter.text().strip().lower()
-        if keyword_text:
-            entries = [e for e in entries if keyword_text in e.keyword.lower()]
-
-        # Document filter
-        doc_filter = self.document_filter.currentText()
-        if doc_filter != "All Documents":
-            entries = [e for e in entries if e.document_name == doc_filter]
-
-        # Left context filter
-        left_text = self.left_context_filter.text().strip().lower()
-        if left_text:
-            entries = [e for e in entries if left_text in e.left_context.lower()]
 
-        # Right context filter
-        right_text = self.right_context_filter.text().strip().lower()
-        if right_text:
-            entries = [e for e in entries if right_text in e.right_context.lower()]
-
-        return entries
+    def _on_entry_search_failed(self, message: str):
+        """Report a failed filter search."""
+        self.results_label.setText(f"Search failed: {message}")
 
     def _on_filter_changed(self):
-        """Handle filter changes."""
+        """Handle filter changes; typing restarts the debounce timer."""
         if self.current_concordance:
-            self._display_concordance_entries()
+            self.filter_timer.start(300)
 
     def _clear_filters(self):
         """Clear all filters."""
@@ -516,32 +513,26 @@ class ConcordancePanel(QWidget):
         self.left_context_filter.clear()
         self.right_context_filter.clear()
 
-    def _on_entry_selection_changed(self):
+    def _on_entry_selection_changed(self, current, previous=None):
         """Handle entry selection changes."""
-        selected_items = self.entries_table.selectedItems()
-        if selected_items:
-            # Get the entry from the first column
-            row = selected_items[0].row()
-            keyword_item = self.entries_table.item(row, 0)
-            entry = keyword_item.data(Qt.ItemDataRole.UserRole)
-
-            if entry:
-                # Display full context
-                full_context = (
-                    f"{entry.left_context} **{entry.keyword}** {entry.right_context}"
-                )
-                self.entry_details.setText(full_context)
+        entry = self.entry_model.entry_at(current.row()) if current.isValid() else None
+        if entry:
+            # Display full context
+            full_context = (
+                f"{entry.left_context} **{entry.keyword}** {entry.right_context}"
+            )
+            self.entry_details.setText(full_context)
         else:
             self.entry_details.clear()
 
     def _clear_concordance_display(self):
         """Clear the concordance display."""
         self.info_label.setText("Select a concordance table to view details")
-        self.entries_table.setRowCount(0)
+        self.entry_model.set_table(None)
         self.results_label.setText("No concordance selected")
         self.entry_details.clear()
         self.document_filter.clear()
-        self.document_filter.addItem("All Documents")
+        self.document_filter.addItem("All Documents", None)
 
     def _create_concordance(self):
         """Open the concordance creation dialog."""
@@ -631,24 +622,24 @@ class ConcordancePanel(QWidget):
         )
 
         # Get save location
-        filename, _ = QFileDialog.getSaveFileName(
+        gzip_filter = f"Compressed {format_choice} Files (*.{file_ext}.gz)"
+        filename, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export Concordance",
             f"{self.current_concordance.name}.{file_ext}",
-            f"{file_filter};;All Files (*.*)",
+            f"{file_filter};;{gzip_filter};;All Files (*.*)",
         )
 
         if filename:
+            if selected_filter == gzip_filter and not filename.endswith(".gz"):
+                filename += ".gz"
+
             try:
-                # Export data
-                exported_data = self.concordance_service.export_concordance(
-                    self.current_concordance.id, export_format
+                # Stream the entries to the file (gzip-compressed for .gz)
+                self.concordance_service.export_concordance_to_file(
+                    self.current_concordance.id, export_format, filename
                 )
 
-                # Save to file
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(exported_data)
-
                 QMessageBox.information(
                     self, "Success", f"Concordance exported to {filename}"
                 )
@@ -4,7 +4,8 @@ Purpose: Provides a UI panel for gematric analysis of documents.
 This file is part of the document_manager pillar and serves as a UI component.
 It displays document content and provides tools for gematric analysis of the text,
 including searching for words/phrases with specific gematria values and calculating
-gematria values of selected text.
+gematria values of selected text. Searches run on a background executor and
+their matches are highlighted in one batch with extra selections.
 
 Key components:
 - DocumentAnalysisPanel: Panel for analyzing documents from a gematric perspective
@@ -13,12 +14,15 @@ Dependencies:
 - PyQt6: For UI components
 - document_manager.models.document: For Document model
 - document_manager.services.document_service: For document operations
+- document_manager.utils.text_match_finder: For finding text and value matches
+- document_manager.ui.widgets.match_highlighter: For highlighting matches
+- shared.services.query_executor: For searching off the GUI thread
 - gematria.services.gematria_service: For gematria calculations
 """
 
-import re
 from datetime import datetime
-from typing import List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -43,8 +47,16 @@ from PyQt6.QtWidgets import (
 from document_manager.models.document import Document
 from document_manager.services.category_service import CategoryService
 from document_manager.services.document_service import DocumentService
+from document_manager.ui.widgets.match_highlighter import MatchHighlighter
+from document_manager.utils.text_match_finder import (
+    TextMatch,
+    find_phrase_value_matches,
+    find_text_matches,
+    find_value_matches,
+)
 from gematria.models.calculation_type import CalculationType
 from gematria.services.gematria_service import GematriaService
+from shared.services.query_executor import QueryExecutor
 from shared.ui.components.message_box import MessageBox
 from shared.ui.widgets.panel import Panel
 from shared.ui.widgets.unicode_text_widget import UnicodeTextEdit
@@ -92,6 +104,13 @@ class DocumentAnalysisPanel(Panel):
         # Initialize UI
         self._init_ui()
 
+        # Searches run off the GUI thread; their matches are highlighted with
+        # extra selections rather than by reformatting the document
+        self.search_executor = QueryExecutor(self)
+        self.search_executor.result_ready.connect(self._on_search_finished)
+        self.search_executor.query_failed.connect(self._on_search_failed)
+        self.highlighter = MatchHighlighter(self.doc_content_display, parent=self)
+
         # Load categories and document list
         self._refresh_categories()
 
@@ -462,12 +481,7 @@ class DocumentAnalysisPanel(Panel):
         category_id = self.category_combo.currentData()
 
         # Get all documents or documents by category
-        if category_id is None:
-            # "All Documents" selected
-            documents = self.document_service.get_all_documents()
-        else:
-            # Specific category selected
-            documents = self.document_service.get_documents_by_category(category_id)
+        documents = self.document_service.get_document_summaries(category_id)
 
         # Sort by name
         documents.sort(key=lambda doc: doc.name)
@@ -534,6 +548,8 @@ class DocumentAnalysisPanel(Panel):
             self.result_label.setText("--")
             self.search_value_btn.setEnabled(False)
             self.search_text_btn.setEnabled(False)
+            self.search_executor.cancel()
+            self._clear_highlights()
             self.results_list.clear()
             self.results_label.setText("No search results")
             return False
@@ -600,6 +616,7 @@ class DocumentAnalysisPanel(Panel):
         )  # Assuming text search input is always available
         self.calc_btn.setEnabled(False)  # Disable calc until selection
         self.result_label.setText("--")
+        self.search_executor.cancel()
         self._clear_highlights()
         self.results_list.clear()
         self.results_label.setText("No search results")
@@ -760,393 +777,177 @@ class DocumentAnalysisPanel(Panel):
             self._search_by_phrase_value()
             return
 
-        # Get parameters
         target_value = self.value_search_input.value()
         method = self.method_combo.currentData()
 
-        # Clear previous highlights and results
-        self._clear_highlights()
-        self.results_list.clear()
-        self.value_search_results = []
-
-        # Simple algorithm: tokenize text and calculate gematria for each token
-        content = self.current_document.content
-
-        # Find word positions first for later reference
-        word_positions = []
-        for match in re.finditer(r"\b\w+\b", content):
-            word_positions.append((match.group(0), match.start()))
-
-        # Now search for matching words
-        matches = []
-
-        for word, position in word_positions:
-            try:
-                # Check if the word is a number
-                if word.isdigit():
-                    # If it's a number, use its face value
-                    value = int(word)
-                    if value == target_value:
-                        matches.append((word, position))
-                    continue
-
-                # Extract numbers from word (like "AI10" -> "AI" + 10)
-                number_sum = 0
-                text_without_numbers = ""
-
-                i = 0
-                while i < len(word):
-                    if word[i].isdigit():
-                        # Found a digit, extract the full number
-                        num_start = i
-                        while i < len(word) and word[i].isdigit():
-                            i += 1
-                        # Add the number to our sum
-                        number = int(word[num_start:i])
-                        number_sum += number
-                    else:
-                        # Add non-digit characters to the clean text
-                        text_without_numbers += word[i]
-                        i += 1
-
-                # Calculate gematria value for the text without numbers
-                if text_without_numbers.strip():
-                    text_value = self.gematria_service.calculate(
-                        text_without_numbers, method
-                    )
-                else:
-                    text_value = 0
-
-                # Add the number sum to get total value
-                value = text_value + number_sum
-
-                if value == target_value:
-                    matches.append((word, position))
-            except Exception:
-                continue
-
-        # Store search results for later reference
-        self.value_search_results = matches
-
-        # Highlight matches
-        if matches:
-            cursor = self.doc_content_display.textCursor()
-            cursor.setPosition(0)
-            self.doc_content_display.setTextCursor(cursor)
-
-            # Create format for highlighting
-            highlight_format = QTextCharFormat()
-            highlight_format.setBackground(QColor(255, 255, 0, 100))  # Light yellow
-
-            # Find and highlight all occurrences
-            for word, position in matches:
-                # Create a cursor at the specific position
-                cursor = self.doc_content_display.textCursor()
-                cursor.setPosition(position)
-                cursor.movePosition(
-                    QTextCursor.MoveOperation.Right,
-                    QTextCursor.MoveMode.KeepAnchor,
-                    len(word),
-                )
-
-                # Apply highlight
-                cursor.mergeCharFormat(highlight_format)
-
-                # Get some context (10 chars before and after)
-                start_context = max(0, position - 10)
-                end_context = min(len(content), position + len(word) + 10)
-                context = content[start_context:end_context].replace("\n", " ")
-
-                # Add the match to the results list
-                item = QListWidgetItem(f"{word}: ...{context}...")
-                item.setData(Qt.ItemDataRole.UserRole, position)
-                self.results_list.addItem(item)
-
-            # Update results label
-            self.results_label.setText(
-                f"Found {len(matches)} matches for value {target_value}"
-            )
-        else:
-            self.results_label.setText(f"No matches found for value {target_value}")
+        self._start_search(
+            "value",
+            target_value,
+            partial(
+                find_value_matches,
+                self.current_document.content,
+                target_value,
+                partial(self.gematria_service.calculate, calculation_type=method),
+            ),
+        )
 
     def _search_by_phrase_value(self) -> None:
         """Search for consecutive words with a specific combined gematria value."""
-        # Validate document is loaded
         if not self.current_document or not self.current_document.content:
             return
 
-        # Get the search value and method
         target_value = self.value_search_input.value()
         method = self.method_combo.currentData()
 
-        # Clear previous highlights and results
-        self._clear_highlights()
-        self.results_list.clear()
-        self.value_search_results = []
-
-        # Extract content
-        content = self.current_document.content
-
-        # Compile the regex pattern once (more efficient)
-        word_pattern = re.compile(r"\b\w+\b")
-
-        # Find all words with their positions
-        words_with_positions = [
-            (match.group(0), match.start(), match.end())
-            for match in word_pattern.finditer(content)
-        ]
-
-        # Create highlight format for matches
-        highlight_format = QTextCharFormat()
-        highlight_format.setBackground(QColor(255, 255, 0, 100))  # Light yellow
-
-        # Track matches to avoid duplicates
-        matches = []
-
-        # Maximum allowed gap between consecutive words (in characters)
-        max_gap = 20
-
-        # Cache for word gematria values to avoid recalculating
-        word_values_cache = {}
-
-        # Process all possible consecutive word sequences
-        for i in range(len(words_with_positions)):
-            # Start with the first word and its value
-            word = words_with_positions[i][0]
-            phrase_start = words_with_positions[i][1]
-
-            # Use cache for word value calculation
-            if word not in word_values_cache:
-                try:
-                    # Check if the word is a number
-                    if word.isdigit():
-                        word_values_cache[word] = int(word)
-                    else:
-                        # Extract numbers from word (like "AI10" -> "AI" + 10)
-                        number_sum = 0
-                        text_without_numbers = ""
-                        j = 0
-                        while j < len(word):
-                            if word[j].isdigit():
-                                # Found a digit, extract the full number
-                                num_start = j
-                                while j < len(word) and word[j].isdigit():
-                                    j += 1
-                                # Add the number to our sum
-                                number = int(word[num_start:j])
-                                number_sum += number
-                            else:
-                                # Add non-digit characters to the clean text
-                                text_without_numbers += word[j]
-                                j += 1
-
-                        # Calculate gematria value for the text without numbers
-                        if text_without_numbers.strip():
-                            text_value = self.gematria_service.calculate(
-                                text_without_numbers, method
-                            )
-                        else:
-                            text_value = 0
-
-                        # Add the number sum to get total value
-                        word_values_cache[word] = text_value + number_sum
-                except Exception as e:
-                    logger.error(f"Error calculating value for word '{word}': {e}")
-                    word_values_cache[word] = 0
-
-            # Check if single word matches target value
-            phrase_value = word_values_cache[word]
-            if phrase_value == target_value:
-                phrase_text = word
-                phrase_end = words_with_positions[i][2]
-
-                # Only add if not a duplicate
-                if (phrase_text, phrase_start, phrase_end, phrase_value) not in matches:
-                    matches.append(
-                        (phrase_text, phrase_start, phrase_end, phrase_value)
-                    )
-
-            # If single word exceeds target by too much, skip multi-word phrases
-            if phrase_value > target_value * 2:
-                continue
-
-            # Try adding more words to the phrase
-            current_phrase = [word]
-            current_value = phrase_value
-
-            for j in range(i + 1, len(words_with_positions)):
-                # Check if words are too far apart
-                prev_end = words_with_positions[j - 1][2]
-                curr_start = words_with_positions[j][1]
-
-                if curr_start - prev_end > max_gap:
-                    break  # Words too far apart
-
-                # Add the next word to phrase
-                next_word = words_with_positions[j][0]
-                current_phrase.append(next_word)
-
-                # Get and cache word value if needed
-                if next_word not in word_values_cache:
-                    try:
-                        if next_word.isdigit():
-                            word_values_cache[next_word] = int(next_word)
-                        else:
-                            # Calculate word value using the same logic as above
-                            number_sum = 0
-                            text_without_numbers = ""
-                            k = 0
-                            while k < len(next_word):
-                                if next_word[k].isdigit():
-                                    num_start = k
-                                    while k < len(next_word) and next_word[k].isdigit():
-                                        k += 1
-                                    number = int(next_word[num_start:k])
-                                    number_sum += number
-                                else:
-                                    text_without_numbers += next_word[k]
-                                    k += 1
-
-                            if text_without_numbers.strip():
-                                text_value = self.gematria_service.calculate(
-                                    text_without_numbers, method
-                                )
-                            else:
-                                text_value = 0
-
-                            word_values_cache[next_word] = text_value + number_sum
-                    except Exception as e:
-                        logger.error(
-                            f"Error calculating value for word '{next_word}': {e}"
-                        )
-                        word_values_cache[next_word] = 0
-
-                # Add to phrase value
-                current_value += word_values_cache[next_word]
-
-                # If we've exceeded the target, no point continuing this phrase
-                if current_value > target_value * 1.5 and target_value > 0:
-                    break
-
-                # Check if we hit the target value exactly
-                if current_value == target_value:
-                    phrase_text = " ".join(current_phrase)
-                    phrase_end = words_with_positions[j][2]
-
-                    # Only add if not a duplicate
-                    if (
-                        phrase_text,
-                        phrase_start,
-                        phrase_end,
-                        current_value,
-                    ) not in matches:
-                        matches.append(
-                            (phrase_text, phrase_start, phrase_end, current_value)
-                        )
-
-        # Store search results for later reference - maintain format expected by other methods
-        self.value_search_results = [(text, pos) for text, pos, _, _ in matches]
-
-        # Highlight matches and populate results list
-        if matches:
-            for phrase_text, start_pos, end_pos, phrase_value in matches:
-                # Create a cursor at the specific position
-                cursor = self.doc_content_display.textCursor()
-                cursor.setPosition(start_pos)
-                cursor.movePosition(
-                    QTextCursor.MoveOperation.Right,
-                    QTextCursor.MoveMode.KeepAnchor,
-                    end_pos - start_pos,
-                )
-
-                # Apply highlight
-                cursor.mergeCharFormat(highlight_format)
-
-                # Get some context
-                start_context = max(0, start_pos - 10)
-                end_context = min(len(content), end_pos + 10)
-                context = content[start_context:end_context].replace("\n", " ")
-
-                # Add to results list
-                item = QListWidgetItem(
-                    f"{phrase_text} ({phrase_value}): ...{context}..."
-                )
-                item.setData(Qt.ItemDataRole.UserRole, start_pos)
-                self.results_list.addItem(item)
-
-            # Update results label
-            self.results_label.setText(
-                f"Found {len(matches)} phrase matches for value {target_value}"
-            )
-        else:
-            self.results_label.setText(
-                f"No phrase matches found for value {target_value}"
-            )
+        self._start_search(
+            "phrase",
+            target_value,
+            partial(
+                find_phrase_value_matches,
+                self.current_document.content,
+                target_value,
+                partial(self.gematria_service.calculate, calculation_type=method),
+            ),
+        )
 
     def _search_by_text(self):
         """Search for text in the document."""
         if not self.current_document or not self.current_document.content:
             return
 
-        # Get search text
         search_text = self.text_search_input.text().strip()
         if not search_text:
             return
 
-        # Clear previous highlights and results
+        self._start_search(
+            "text",
+            search_text,
+            partial(find_text_matches, self.current_document.content, search_text),
+        )
+
+    def _start_search(
+        self, kind: str, subject: Any, search: Callable[[], List[TextMatch]]
+    ) -> None:
+        """Clear the previous results and run a search on the search executor.
+
+        Args:
+            kind: "value", "phrase" or "text"
+            subject: Target value or search text, shown with the results
+            search: Callable finding the matches in the document content
+        """
         self._clear_highlights()
         self.results_list.clear()
-        self.text_search_results = []
+        if kind == "text":
+            self.text_search_results = []
+        else:
+            self.value_search_results = []
+        self.results_label.setText("Searching...")
 
-        # Create format for highlighting
-        highlight_format = QTextCharFormat()
-        highlight_format.setBackground(QColor(173, 216, 230, 100))  # Light blue
+        self.search_executor.submit(
+            partial(
+                self._run_search, kind, subject, self.current_document.content, search
+            )
+        )
 
-        # Find all occurrences with positions
-        content = self.current_document.content
-        matches = []
+    @staticmethod
+    def _run_search(
+        kind: str, subject: Any, content: str, search: Callable[[], List[TextMatch]]
+    ) -> Dict[str, Any]:
+        """Find matches and label them for the results list.
 
-        for match in re.finditer(re.escape(search_text), content, re.IGNORECASE):
-            matches.append((match.group(0), match.start()))
+        Runs on the search executor's worker thread, so it must not touch widgets.
 
-            # Create a cursor at the specific position
-            cursor = self.doc_content_display.textCursor()
-            cursor.setPosition(match.start())
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Right,
-                QTextCursor.MoveMode.KeepAnchor,
-                len(match.group(0)),
-            )
+        Args:
+            kind: "value", "phrase" or "text"
+            subject: Target value or search text
+            content: Document content being searched
+            search: Callable finding the matches in the content
+
+        Returns:
+            Dictionary with kind, subject, matches and labels
+        """
+        matches = search()
+
+        # Text matches get a little more context than value matches
+        context_size = 15 if kind == "text" else 10
+        labels = []
+        for match in matches:
+            context = content[
+                max(0, match.start - context_size) : match.end + context_size
+            ].replace("\n", " ")
+            if kind == "phrase":
+                labels.append(f"{match.text} ({match.value}): ...{context}...")
+            else:
+                labels.append(f"{match.text}: ...{context}...")
 
-            # Apply highlight
-            cursor.mergeCharFormat(highlight_format)
+        return {"kind": kind, "subject": subject, "matches": matches, "labels": labels}
 
-            # Get some context (15 chars before and after)
-            start_context = max(0, match.start() - 15)
-            end_context = min(len(content), match.end() + 15)
-            context = content[start_context:end_context].replace("\n", " ")
+    def _on_search_finished(self, results: Dict[str, Any]) -> None:
+        """Show the matches of a finished search in one batch.
 
-            # Add the match to the results list
-            item = QListWidgetItem(f"{match.group(0)}: ...{context}...")
-            item.setData(Qt.ItemDataRole.UserRole, match.start())
+        Args:
+            results: Results returned by _run_search
+        """
+        kind, subject = results["kind"], results["subject"]
+        matches: List[TextMatch] = results["matches"]
+
+        found = [(match.text, match.start) for match in matches]
+        if kind == "text":
+            self.text_search_results = found
+        else:
+            self.value_search_results = found
+
+        self.results_list.setUpdatesEnabled(False)
+        for label, match in zip(results["labels"], matches):
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, match.start)
             self.results_list.addItem(item)
+        self.results_list.setUpdatesEnabled(True)
 
-        # Store search results for later reference
-        self.text_search_results = matches
+        if kind == "text":
+            color = QColor(173, 216, 230, 100)  # Light blue
+        else:
+            color = QColor(255, 255, 0, 100)  # Light yellow
+        highlight_format = QTextCharFormat()
+        highlight_format.setBackground(color)
+        self.highlighter.set_matches(
+            ((match.start, match.end) for match in matches), highlight_format
+        )
 
-        # Update results label
-        if matches:
-            self.results_label.setText(
-                f"Found {len(matches)} occurrences of '{search_text}'"
+        if kind == "text":
+            message = (
+                f"Found {len(matches)} occurrences of '{subject}'"
+                if matches
+                else f"No occurrences found for '{subject}'"
+            )
+        elif kind == "phrase":
+            message = (
+                f"Found {len(matches)} phrase matches for value {subject}"
+                if matches
+                else f"No phrase matches found for value {subject}"
             )
         else:
-            self.results_label.setText(f"No occurrences found for '{search_text}'")
+            message = (
+                f"Found {len(matches)} matches for value {subject}"
+                if matches
+                else f"No matches found for value {subject}"
+            )
+        self.results_label.setText(message)
 
         # Reset cursor to start
         cursor = self.doc_content_display.textCursor()
         cursor.setPosition(0)
         self.doc_content_display.setTextCursor(cursor)
 
+    def _on_search_failed(self, message: str) -> None:
+        """Report a search that raised an error.
+
+        Args:
+            message: Error message
+        """
+        logger.error(f"Error searching document: {message}")
+        self.results_label.setText("Search failed")
+
     def _highlight_text(self, text: str, format: QTextCharFormat) -> int:
         """Highlight all occurrences of text in the document.
 
@@ -1157,40 +958,15 @@ class DocumentAnalysisPanel(Panel):
         Returns:
             Number of occurrences highlighted
         """
-        # Reset cursor to start
-        cursor = self.doc_content_display.textCursor()
-        cursor.setPosition(0)
-        self.doc_content_display.setTextCursor(cursor)
-
-        # Count occurrences
-        count = 0
-
-        # Find and highlight all occurrences
-        while self.doc_content_display.find(text):
-            cursor = self.doc_content_display.textCursor()
-            cursor.mergeCharFormat(format)
-            count += 1
-
-        # Reset cursor to start
-        cursor = self.doc_content_display.textCursor()
-        cursor.setPosition(0)
-        self.doc_content_display.setTextCursor(cursor)
-
-        return count
+        matches = find_text_matches(self.doc_content_display.toPlainText(), text)
+        self.highlighter.set_matches(
+            ((match.start, match.end) for match in matches), format
+        )
+        return len(matches)
 
     def _clear_highlights(self):
         """Clear all highlights in the document."""
-        # Create default format
-        default_format = QTextCharFormat()
-
-        # Apply to entire document
-        cursor = self.doc_content_display.textCursor()
-        cursor.select(QTextCursor.SelectionType.Document)
-        cursor.setCharFormat(default_format)
-
-        # Reset cursor
-        cursor.clearSelection()
-        self.doc_content_display.setTextCursor(cursor)
+        self.highlighter.clear()
 
     def _show_context_menu(self, position):
         """Show context menu for text operations.
@@ -12,8 +12,10 @@ Dependencies:
 - document_manager.models.document: For Document model
 - document_manager.services.document_service: For document operations
 - document_manager.services.category_service: For category operations
+- shared.services.query_executor: For running document searches in the background
 """
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -41,6 +43,7 @@ from PyQt6.QtWidgets import (
 from document_manager.models.document import DocumentType
 from document_manager.services.category_service import CategoryService
 from document_manager.services.document_service import DocumentService
+from shared.services.query_executor import QueryExecutor
 from shared.ui.components.message_box import MessageBox
 from shared.ui.widgets.panel import Panel
 
@@ -100,13 +103,14 @@ class BatchImportDialog(QDialog):
         category_layout.addWidget(self.category_combo)
         layout.addLayout(category_layout)
 
-        # Thread count
+        # Worker process count (text extraction runs in separate processes)
+        cpu_count = os.cpu_count() or 4
         thread_layout = QHBoxLayout()
         thread_layout.addWidget(QLabel("Max parallel imports:"))
         self.thread_count = QSpinBox()
         self.thread_count.setMinimum(1)
-        self.thread_count.setMaximum(16)
-        self.thread_count.setValue(4)
+        self.thread_count.setMaximum(max(16, cpu_count))
+        self.thread_count.setValue(cpu_count)
         thread_layout.addWidget(self.thread_count)
         layout.addLayout(thread_layout)
 
@@ -155,6 +159,17 @@ class DocumentBrowserPanel(Panel):
         self.document_service = DocumentService()
         self.category_service = CategoryService()
 
+        # Documents matching the current filters and the category names shown
+        self.documents = []
+        self.categories = {}
+
+        # Searches run in the background; typing restarts the debounce timer
+        self.search_executor = QueryExecutor(self)
+        self.search_executor.result_ready.connect(self._on_documents_loaded)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self._search_documents)
+
         # Initialize UI
         self._init_ui()
 
@@ -192,7 +207,7 @@ class DocumentBrowserPanel(Panel):
         toolbar_layout.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search documents...")
-        self.search_input.textChanged.connect(self._apply_filters)
+        self.search_input.textChanged.connect(self._on_search_changed)
         toolbar_layout.addWidget(self.search_input)
 
         self.content_layout.addLayout(toolbar_layout)
@@ -229,12 +244,15 @@ class DocumentBrowserPanel(Panel):
         self.content_layout.addWidget(self.document_tree)
 
     def _load_documents(self):
-        """Load documents from the service."""
-        self.documents = self.document_service.get_all_documents()
-        self._update_document_tree()
+        """Load documents matching the current filters from the service."""
+        self.search_timer.stop()
+        self._search_documents()
 
     def _load_categories(self):
         """Load categories for the filter dropdown."""
+        categories = self.category_service.get_all_categories()
+        self.categories = {category.id: category for category in categories}
+
         # Clear existing categories
         self.category_filter.clear()
 
@@ -242,25 +260,21 @@ class DocumentBrowserPanel(Panel):
         self.category_filter.addItem("All Categories", None)
 
         # Add categories from service
-        categories = self.category_service.get_all_categories()
         for category in categories:
             self.category_filter.addItem(category.name, category.id)
 
-    def _update_document_tree(self):
-        """Update the document tree with current documents."""
-        # Clear current items
-        self.document_tree.clear()
-
-        # Apply filters (this will repopulate the tree)
-        self._apply_filters()
+    def _on_search_changed(self):
+        """Restart the debounce timer while the user is typing."""
+        self.search_timer.start(300)
 
     def _apply_filters(self):
-        """Apply filters to the document list."""
-        # Clear current items
-        self.document_tree.clear()
+        """Search again with the current filter values."""
+        self.search_timer.stop()
+        self._search_documents()
 
-        # Get filter values
-        search_text = self.search_input.text().lower()
+    def _search_documents(self):
+        """Run the document search for the current filters in the background."""
+        search_text = self.search_input.text().strip()
         category_idx = self.category_filter.currentIndex()
         category_id = (
             self.category_filter.itemData(category_idx) if category_idx > 0 else None
@@ -268,24 +282,29 @@ class DocumentBrowserPanel(Panel):
         type_idx = self.type_filter.currentIndex()
         doc_type = self.type_filter.itemData(type_idx) if type_idx > 0 else None
 
-        # Get categories map for display
-        categories = {cat.id: cat for cat in self.category_service.get_all_categories()}
+        # Any search still running is interrupted by the new one
+        document_service = self.document_service
+        self.search_executor.submit(
+            lambda: document_service.search_document_summaries(
+                query=search_text, category=category_id, doc_type=doc_type, limit=None
+            )
+        )
 
-        # Add filtered documents to tree
-        for document in self.documents:
-            # Check search filter
-            if search_text and search_text not in document.name.lower():
-                if not document.content or search_text not in document.content.lower():
-                    continue
+    def _on_documents_loaded(self, documents):
+        """Show the documents found by the latest search.
 
-            # Check category filter
-            if category_id and document.category != category_id:
-                continue
+        Args:
+            documents: Summaries of the matching documents, best match or newest first
+        """
+        self.documents = documents
+        self._update_document_tree()
 
-            # Check type filter
-            if doc_type and document.file_type != doc_type:
-                continue
+    def _update_document_tree(self):
+        """Update the document tree with current documents."""
+        # Clear current items
+        self.document_tree.clear()
 
+        for document in self.documents:
             # Create tree item
             item = QTreeWidgetItem(
                 [
@@ -299,9 +318,13 @@ class DocumentBrowserPanel(Panel):
             # Store document ID in the item
             item.setData(0, Qt.ItemDataRole.UserRole, document.id)
 
+            # Show where the search text matched
+            if document.snippet:
+                item.setToolTip(0, document.snippet)
+
             # Get category name
-            if document.category and document.category in categories:
-                category_name = categories[document.category].name
+            if document.category and document.category in self.categories:
+                category_name = self.categories[document.category].name
             else:
                 category_name = ""
             item.setText(4, category_name)
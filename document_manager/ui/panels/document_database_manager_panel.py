@@ -9,7 +9,7 @@ Key components:
 
 Dependencies:
 - PyQt6: For UI components
-- document_manager.models.document: For Document model
+- document_manager.models.document: For DocumentSummary and DocumentType
 - document_manager.services.document_service: For document operations
 - document_manager.services.category_service: For category operations
 """
@@ -37,7 +37,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from document_manager.models.document import Document, DocumentType
+from document_manager.models.document import DocumentSummary, DocumentType
 from document_manager.services.category_service import CategoryService
 from document_manager.services.document_service import DocumentService
 from shared.ui.components.message_box import MessageBox
@@ -65,9 +65,9 @@ class DocumentDatabaseManagerPanel(QWidget):
 
         # Track current selection
         self.current_document_id = None
-        self.documents: List[Document] = []
+        self.documents: List[DocumentSummary] = []
         self.categories = {}
-        self.filtered_documents: List[Document] = []
+        self.filtered_documents: List[DocumentSummary] = []
 
         # Initialize UI
         self._init_ui()
@@ -266,7 +266,7 @@ class DocumentDatabaseManagerPanel(QWidget):
 
     def _load_documents(self):
         """Load documents from the service."""
-        self.documents = self.document_service.get_all_documents()
+        self.documents = self.document_service.get_document_summaries()
         self.filtered_documents = self.documents.copy()
         self._update_document_table()
 
@@ -344,12 +344,20 @@ class DocumentDatabaseManagerPanel(QWidget):
         date_idx = self.date_combo.currentIndex()
         date_filter = self.date_combo.itemData(date_idx)
 
+        # Documents whose content matches are looked up in the database,
+        # since the listed summaries do not hold the content
+        content_matches = (
+            self.document_service.find_document_ids_with_content(search_text)
+            if search_text
+            else set()
+        )
+
         # Filter documents
         self.filtered_documents = []
         for document in self.documents:
             # Check search filter
             if search_text and search_text not in document.name.lower():
-                if not document.content or search_text not in document.content.lower():
+                if document.id not in content_matches:
                     continue
 
             # Check type filter
@@ -36,6 +36,7 @@ from PyQt6.QtWidgets import (
 )
 
 from document_manager.models.document import Document
+from document_manager.repositories.category_repository import CategoryRepository
 from document_manager.repositories.document_repository import DocumentRepository
 from document_manager.services.document_service import DocumentService
 from shared.ui.components.message_box import MessageBox
@@ -56,6 +57,9 @@ class DocumentDatabaseUtilityPanel(QWidget):
         # Create services and repositories
         self.document_service = DocumentService()
         self.document_repository = DocumentRepository()
+        self.category_repository = CategoryRepository(
+            str(self.document_repository.db_path)
+        )
 
         # Initialize UI
         self._init_ui()
@@ -175,7 +179,7 @@ class DocumentDatabaseUtilityPanel(QWidget):
         """Load and display database statistics."""
         try:
             # Get document count
-            documents = self.document_service.get_all_documents()
+            documents = self.document_service.get_document_summaries()
             document_count = len(documents)
 
             # Calculate total size of documents
@@ -341,12 +345,14 @@ class DocumentDatabaseUtilityPanel(QWidget):
 
             # Delete all data from tables
             cursor.execute("DELETE FROM documents")
-            cursor.execute("DELETE FROM document_categories")
 
             # Commit changes
             conn.commit()
             conn.close()
 
+            # Through the repository, so cached category trees are refreshed
+            self.category_repository.delete_all()
+
             # Optimize database after purge
             self._optimize_database()
 
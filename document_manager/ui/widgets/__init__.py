@@ -0,0 +1,12 @@
+"""
+Widgets for the document manager pillar.
+
+This module provides reusable widgets and widget helpers for the document
+manager views.
+"""
+
+from document_manager.ui.widgets.match_highlighter import MatchHighlighter
+
+__all__ = [
+    "MatchHighlighter",
+]
@@ -0,0 +1,167 @@
+"""
+Match Highlighter for Document Manager.
+
+This module highlights search matches in a text edit with extra selections
+instead of changing the document's character formats. All matches are applied
+in one setExtraSelections call, and the document itself is never modified, so
+highlighting neither creates undo steps nor re-lays out the text. When there
+are more matches than can be drawn cheaply, only those around the visible part
+of the document are selected, and the selection follows scrolling.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Tuple
+
+from PyQt6.QtCore import QEvent, QObject, QPoint, QTimer
+from PyQt6.QtGui import QTextCharFormat, QTextCursor
+from PyQt6.QtWidgets import QTextEdit
+
+
+class MatchHighlighter(QObject):
+    """Highlights character intervals of a text edit with extra selections."""
+
+    def __init__(self, editor: QTextEdit, max_selections: int = 2000, parent=None):
+        """Initialize the highlighter.
+
+        Args:
+            editor: Text edit to highlight
+            max_selections: Number of matches above which only the matches
+                around the visible text are selected
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.editor = editor
+        self.max_selections = max(1, max_selections)
+        self._format = QTextCharFormat()
+
+        # Disjoint intervals sorted by position, with their bounds split out
+        # for bisecting
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._match_count = 0
+        self._windowed = False
+
+        # Scrolling and resizing refresh the windowed selections once per event
+        # loop pass, however many scroll steps arrive
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._select_visible)
+
+        editor.verticalScrollBar().valueChanged.connect(self._schedule_refresh)
+        editor.viewport().installEventFilter(self)
+        editor.document().contentsChange.connect(self._on_contents_change)
+
+    def set_matches(
+        self, intervals: Iterable[Tuple[int, int]], char_format: QTextCharFormat
+    ) -> None:
+        """Highlight a set of matches, replacing the current highlights.
+
+        Args:
+            intervals: (start, end) character offsets of the matches, in any order
+            char_format: Format drawn over the matches
+        """
+        self._format = char_format
+        self._starts, self._ends = [], []
+        self._match_count = 0
+
+        for start, end in sorted(intervals):
+            if end <= start:
+                continue
+            self._match_count += 1
+            if self._ends and start <= self._ends[-1]:
+                # Overlapping or touching matches are drawn as one
+                self._ends[-1] = max(self._ends[-1], end)
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+        self._windowed = len(self._starts) > self.max_selections
+        if self._windowed:
+            self._select_visible()
+        else:
+            self._apply(0, len(self._starts))
+
+    def clear(self) -> None:
+        """Remove all highlights."""
+        self._refresh_timer.stop()
+        self._starts, self._ends = [], []
+        self._match_count = 0
+        self._windowed = False
+        self.editor.setExtraSelections([])
+
+    def match_count(self) -> int:
+        """Get the number of highlighted matches.
+
+        Returns:
+            Number of matches passed to set_matches, including those not
+            currently selected because they are out of view
+        """
+        return self._match_count
+
+    def eventFilter(self, watched, event):
+        """Refresh the windowed selections when the viewport is shown or resized."""
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Resize) and self._windowed:
+            self._schedule_refresh()
+        return False
+
+    def _schedule_refresh(self, *args) -> None:
+        """Refresh the windowed selections on the next event loop pass."""
+        if self._windowed:
+            self._refresh_timer.start()
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Drop windowed highlights whose offsets an edit has invalidated.
+
+        Selections of a small match set are cursors that move with the text,
+        but the offsets kept for windowing would point at the wrong text.
+        """
+        if self._windowed and (removed or added):
+            self.clear()
+
+    def _select_visible(self) -> None:
+        """Select the matches in and around the visible part of the document."""
+        if not self._windowed:
+            return
+
+        viewport = self.editor.viewport()
+        first = self.editor.cursorForPosition(QPoint(0, 0)).position()
+        last = self.editor.cursorForPosition(
+            QPoint(viewport.width(), viewport.height())
+        ).position()
+
+        # A screen's worth of margin on each side keeps small scrolls covered
+        margin = max(last - first, 1)
+        low, high = first - margin, last + margin
+
+        begin = bisect_right(self._ends, low)
+        end = begin + self.max_selections
+        if self.editor.isVisible():
+            end = min(bisect_left(self._starts, high), end)
+        # A hidden editor has no layout to measure, so it gets the matches
+        # after the top of the view until it is shown
+        self._apply(begin, end)
+
+    def _apply(self, begin: int, end: int) -> None:
+        """Replace the extra selections with a range of the intervals.
+
+        Args:
+            begin: Index of the first interval to select
+            end: Index after the last interval to select
+        """
+        document = self.editor.document()
+        limit = document.characterCount() - 1
+        selections = []
+
+        for start, stop in zip(self._starts[begin:end], self._ends[begin:end]):
+            if start >= limit:
+                break
+            selection = QTextEdit.ExtraSelection()
+            cursor = QTextCursor(document)
+            cursor.setPosition(start)
+            cursor.setPosition(min(stop, limit), QTextCursor.MoveMode.KeepAnchor)
+            selection.cursor = cursor
+            selection.format = self._format
+            selections.append(selection)
+
+        self.editor.setExtraSelections(selections)
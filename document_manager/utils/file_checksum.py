@@ -0,0 +1,87 @@
+"""
+Purpose: Computes content checksums of document files
+
+This file is part of the document_manager pillar and serves as a utility component.
+It is responsible for hashing document files so that imports can recognize
+files whose content is already in the library, and for the cheap stat-based
+fingerprints that tell when a stored checksum needs to be recomputed.
+
+Key components:
+- file_checksum: Streams a file through BLAKE2b and returns the hex digest
+- file_checksum_and_md5: Also computes the MD5 recorded by older versions
+- file_fingerprint: Returns the (mtime, size, inode) of a file
+
+Dependencies:
+- hashlib: For BLAKE2b (and legacy MD5) hashing
+
+Related files:
+- document_manager/services/document_service.py: Uses checksums to skip unchanged imports
+- document_manager/repositories/document_repository.py: Stores and looks up checksums
+- document_manager/services/integrity_verifier.py: Re-hashes files in the background
+"""
+
+import hashlib
+from pathlib import Path
+from typing import List, Tuple, Union
+
+# Read size for hashing; large reads keep the per-call overhead negligible
+CHECKSUM_BUFFER_SIZE = 1024 * 1024
+
+
+def file_checksum(
+    file_path: Union[str, Path], buffer_size: int = CHECKSUM_BUFFER_SIZE
+) -> str:
+    """Compute the BLAKE2b checksum of a file's content.
+
+    Args:
+        file_path: Path to the file
+        buffer_size: Number of bytes read at a time
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(buffer_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_checksum_and_md5(
+    file_path: Union[str, Path], buffer_size: int = CHECKSUM_BUFFER_SIZE
+) -> Tuple[str, str]:
+    """Compute the BLAKE2b checksum and the legacy MD5 of a file in one read.
+
+    Documents saved by older versions only have an MD5 checksum in their
+    metadata; it must be checked before the BLAKE2b checksum replaces it.
+
+    Args:
+        file_path: Path to the file
+        buffer_size: Number of bytes read at a time
+
+    Returns:
+        Tuple of (BLAKE2b hex digest, MD5 hex digest)
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    legacy_digest = hashlib.md5()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(buffer_size):
+            digest.update(chunk)
+            legacy_digest.update(chunk)
+    return digest.hexdigest(), legacy_digest.hexdigest()
+
+
+def file_fingerprint(file_path: Union[str, Path]) -> List[int]:
+    """Get the stat fingerprint of a file.
+
+    A file whose modification time, size and inode are unchanged is assumed
+    to have unchanged content, so its checksum need not be recomputed.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        List of [modification time in ns, size in bytes, inode number]
+    """
+    stat = Path(file_path).stat()
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
@@ -0,0 +1,175 @@
+"""
+Purpose: Finds many keywords in a text in a single pass
+
+This file is part of the document_manager pillar and serves as a utility component.
+It compiles a keyword list into one regular expression shaped like a trie, so
+a text is scanned once however many keywords there are, instead of once per
+keyword. Matches are reported as a separate search per keyword would report
+them, including keywords that overlap each other. Case-insensitive matching
+compares Unicode case-folded text (str.casefold), so "ß" matches "ss"; the
+text is folded once and match offsets are mapped back to the original text.
+
+Key components:
+- KeywordMatcher: Compiled matcher yielding (start, end, keyword) for a text
+
+Dependencies:
+- re: For the compiled trie pattern
+
+Related files:
+- document_manager/services/concordance_service.py: Builds concordances with it
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character is matched by regex \\w."""
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Matches a fixed set of keywords against texts in one scan per text.
+
+    The pattern is a lookahead, so every position where a keyword starts is
+    visited and the longest keyword there is captured. Shorter keywords that
+    start at the same position are prefixes of it and are checked directly.
+    """
+
+    def __init__(
+        self,
+        keywords: List[str],
+        case_sensitive: bool = False,
+        whole_words_only: bool = True,
+    ):
+        """Compile the matcher.
+
+        Args:
+            keywords: Keywords to find (duplicates are ignored)
+            case_sensitive: Whether matching is case-sensitive
+            whole_words_only: Whether keywords must start and end at word boundaries
+        """
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))
+        self.case_sensitive = case_sensitive
+        self.whole_words_only = whole_words_only
+
+        # Keywords that match the same text (e.g. "σ" and "ς" ignoring case)
+        self._keys: Dict[str, str] = {k: self._key(k) for k in self.keywords}
+
+        # Keywords that can match where a keyword key matches: those whose key
+        # is a prefix of it, shortest first. The trie is built over the keys
+        # and the regex runs on the folded text, so at every position it
+        # finds the longest matching key whatever the case of the keywords.
+        self._candidates: Dict[str, List[str]] = {
+            key: sorted(
+                (k for k in self.keywords if key.startswith(self._keys[k])),
+                key=lambda k: len(self._keys[k]),
+            )
+            for key in set(self._keys.values())
+        }
+
+        # Only the start boundary is part of the pattern: shorter keywords
+        # ending inside the longest match are checked one by one
+        boundary = r"\b" if whole_words_only else ""
+        trie = self._trie_pattern(self._build_trie(list(self._candidates)))
+        self._pattern = re.compile(f"{boundary}(?=({trie}))")
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Find all keyword occurrences in a text.
+
+        Occurrences of one keyword never overlap each other, as with
+        re.finditer; occurrences of different keywords may.
+
+        Args:
+            text: Text to search
+
+        Yields:
+            Tuples of (start, end, keyword) in order of start position
+        """
+        if not self.keywords:
+            return
+
+        folded, positions = self._fold(text)
+        next_start: Dict[str, int] = {}
+        for match in self._pattern.finditer(folded):
+            folded_start = match.start()
+            start = folded_start if positions is None else positions[folded_start]
+            # Inside the folded form of a character (e.g. the second "s" of "ß")
+            if start < 0:
+                continue
+            if self.whole_words_only and not self._is_boundary(text, start):
+                continue
+
+            for keyword in self._candidates[match.group(1)]:
+                folded_end = folded_start + len(self._keys[keyword])
+                end = folded_end if positions is None else positions[folded_end]
+                if end < 0 or start < next_start.get(keyword, 0):
+                    continue
+                if self.whole_words_only and not self._is_boundary(text, end):
+                    continue
+                next_start[keyword] = end
+                yield start, end, keyword
+
+    def _key(self, text: str) -> str:
+        """Get the form of a text used to compare it with keywords."""
+        return text if self.case_sensitive else text.casefold()
+
+    def _fold(self, text: str) -> Tuple[str, Optional[List[int]]]:
+        """Fold a text for matching and map folded offsets back to it.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Tuple of (folded text, original offset of each folded offset or
+            -1 inside a character that folds to several, None if the offsets
+            are the same)
+        """
+        folded = self._key(text)
+        # Folding never shortens a character, so equal lengths mean 1:1
+        if len(folded) == len(text):
+            return folded, None
+
+        positions = [-1] * (len(folded) + 1)
+        offset = 0
+        for index, char in enumerate(text):
+            positions[offset] = index
+            offset += len(char.casefold())
+        positions[offset] = len(text)
+        return folded, positions
+
+    @staticmethod
+    def _is_boundary(text: str, position: int) -> bool:
+        """Check whether a position is a word boundary, like regex \\b."""
+        before = position > 0 and _is_word_char(text[position - 1])
+        after = position < len(text) and _is_word_char(text[position])
+        return before != after
+
+    @staticmethod
+    def _build_trie(keywords: List[str]) -> Dict:
+        """Build a character trie of the keywords; "" marks a keyword end."""
+        root: Dict = {}
+        for keyword in keywords:
+            node = root
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return root
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict) -> str:
+        """Turn a trie into a regex that prefers the longest keyword.
+
+        Sibling branches start with different characters and the pattern is
+        matched case-sensitively, so at most one branch can match.
+        """
+        branches = [
+            re.escape(char) + cls._trie_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A keyword may end here, but a longer one is tried first
+        return f"(?:{pattern})?" if "" in node else pattern
@@ -0,0 +1,109 @@
+"""
+Purpose: Compresses large text bodies for storage in the database
+
+This file is part of the document_manager pillar and serves as a utility component.
+Rich text documents are stored as HTML, which is verbose and compresses
+well. Bodies above a size threshold are compressed with zstd when the
+zstandard package is installed and with zlib otherwise; smaller bodies are
+stored as they are, since compressing them saves little and costs time on
+every open. The codec is stored next to each body, so bodies written with
+either codec can always be read back as long as the codec is available.
+
+Key components:
+- compress_text: Encodes and, above a threshold, compresses a text
+- decompress_text: Restores a text stored by compress_text
+
+Dependencies:
+- zlib: Always available compression
+- zstandard: Optional, faster and tighter compression
+
+Related files:
+- document_manager/repositories/document_repository.py: Stores QGem HTML bodies
+"""
+
+import zlib
+from typing import Optional, Tuple
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Bodies smaller than this many bytes are stored uncompressed
+COMPRESSION_THRESHOLD = 4096
+
+# Codec names stored with each body
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+# zlib level 6 and zstd level 3 are each library's default trade-off
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compress_text(
+    text: str, threshold: int = COMPRESSION_THRESHOLD, codec: Optional[str] = None
+) -> Tuple[str, bytes]:
+    """Encode a text as UTF-8, compressing it if it is large enough.
+
+    The compressed form is only kept if it is actually smaller.
+
+    Args:
+        text: Text to store
+        threshold: Smallest encoded size in bytes that is compressed
+        codec: Codec to use, defaults to zstd if available and zlib otherwise
+
+    Returns:
+        Tuple of (codec name, stored bytes)
+
+    Raises:
+        ValueError: If the requested codec is unknown or unavailable
+    """
+    data = text.encode("utf-8")
+    if len(data) < threshold:
+        return CODEC_NONE, data
+
+    codec = codec or (CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_ZLIB)
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    elif codec == CODEC_ZLIB:
+        compressed = zlib.compress(data, ZLIB_LEVEL)
+    elif codec == CODEC_NONE:
+        return CODEC_NONE, data
+    else:
+        raise ValueError(f"Unknown compression codec: {codec}")
+
+    if len(compressed) >= len(data):
+        return CODEC_NONE, data
+    return codec, compressed
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    """Restore a text stored by compress_text.
+
+    Args:
+        codec: Codec name returned by compress_text
+        data: Stored bytes
+
+    Returns:
+        The original text
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    if codec == CODEC_NONE:
+        raw = data
+    elif codec == CODEC_ZLIB:
+        raw = zlib.decompress(data)
+    elif codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Reading zstd compressed text requires the zstandard package")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    return bytes(raw).decode("utf-8")
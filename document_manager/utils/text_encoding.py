@@ -0,0 +1,184 @@
+"""
+Purpose: Detects text file encodings and converts files to UTF-8 in bounded memory
+
+This file is part of the document_manager pillar and serves as a utility component.
+Detection feeds chardet's incremental detector a sample of the file, a chunk
+at a time, and stops as soon as it is confident, so the cost does not grow
+with the file size. Conversion streams the file through incremental codecs
+into a temporary file next to it and swaps it in with an atomic rename, so a
+file is never left half converted and only one buffer is held in memory.
+
+Key components:
+- detect_encoding: Sampled incremental encoding detection
+- transcode_to_utf8: Streaming, atomic conversion of a file to UTF-8
+
+Dependencies:
+- chardet: For the incremental UniversalDetector
+- codecs: For BOM detection and incremental decoders/encoders
+
+Related files:
+- document_manager/services/document_service.py: Detects and converts text files
+- document_manager/ui/dialogs/encoding_conversion_dialog.py: Bulk conversion UI
+"""
+
+import codecs
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from chardet.universaldetector import UniversalDetector
+
+# Bytes fed to the detector at a time
+DETECTION_CHUNK_SIZE = 64 * 1024
+
+# Most bytes of a file the detector looks at
+DETECTION_SAMPLE_SIZE = 1024 * 1024
+
+# Read size for conversion; large reads keep the per-call overhead negligible
+TRANSCODE_BUFFER_SIZE = 1024 * 1024
+
+# Byte order marks and the codecs that strip them, longest first because the
+# UTF-32 LE mark starts with the UTF-16 LE one
+_BYTE_ORDER_MARKS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def detect_encoding(
+    file_path: Union[str, Path],
+    chunk_size: int = DETECTION_CHUNK_SIZE,
+    sample_size: int = DETECTION_SAMPLE_SIZE,
+) -> Tuple[Optional[str], float]:
+    """Detect the encoding of a text file from a sample of its bytes.
+
+    A byte order mark settles the encoding at once. Otherwise the detector
+    reads the start of the file, then chunks spread evenly over the rest up
+    to its end, so text that only leaves ASCII late in a large file is still
+    noticed. Each later chunk starts after a line break, so it does not
+    begin in the middle of a multi-byte character.
+
+    Args:
+        file_path: Path to the text file
+        chunk_size: Number of bytes fed to the detector at a time
+        sample_size: Largest number of bytes to look at
+
+    Returns:
+        Tuple of (encoding name or None if undetermined, confidence)
+    """
+    size = os.path.getsize(file_path)
+    chunk_size = max(1, min(chunk_size, sample_size))
+
+    with open(file_path, "rb") as file:
+        head = file.read(chunk_size)
+        for bom, encoding in _BYTE_ORDER_MARKS:
+            if head.startswith(bom):
+                return encoding, 1.0
+
+        detector = UniversalDetector()
+        detector.feed(head)
+
+        # The head takes the first chunk of the sample, the rest is spread out
+        chunks = sample_size // chunk_size - 1
+        remaining = size - len(head)
+        if chunks > 0 and remaining > 0 and not detector.done:
+            if remaining <= chunks * chunk_size:
+                offsets = range(len(head), size, chunk_size)
+                aligned = False
+            else:
+                # Evenly spaced, with the last chunk ending the file
+                last = size - chunk_size
+                offsets = [
+                    len(head) + (last - len(head)) * i // max(chunks - 1, 1)
+                    for i in range(chunks)
+                ]
+                aligned = True
+
+            for offset in offsets:
+                file.seek(offset)
+                chunk = file.read(chunk_size)
+                if aligned:
+                    line_break = chunk.find(b"\n")
+                    chunk = chunk[line_break + 1 :] if line_break >= 0 else b""
+                detector.feed(chunk)
+                if detector.done:
+                    break
+
+    result = detector.close()
+    return result.get("encoding"), result.get("confidence") or 0.0
+
+
+def transcode_to_utf8(
+    file_path: Union[str, Path],
+    source_encoding: str,
+    backup_path: Optional[Union[str, Path]] = None,
+    buffer_size: int = TRANSCODE_BUFFER_SIZE,
+) -> None:
+    """Convert a file to UTF-8 in place, a buffer at a time.
+
+    The converted text is written to a temporary file in the same directory
+    and renamed over the original only once it is complete and flushed to
+    disk. Undecodable bytes become U+FFFD. Line endings are kept as they are.
+
+    Args:
+        file_path: Path to the text file
+        source_encoding: Current encoding of the file
+        backup_path: Where to keep the original file, or None for no backup
+        buffer_size: Number of bytes read at a time
+
+    Raises:
+        LookupError: If the source encoding is unknown
+        OSError: If the file cannot be read or replaced
+    """
+    path = Path(file_path)
+    decoder = codecs.getincrementaldecoder(source_encoding)(errors="replace")
+    encoder = codecs.getincrementalencoder("utf-8")()
+
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with open(path, "rb") as source, os.fdopen(fd, "wb") as target:
+            while chunk := source.read(buffer_size):
+                target.write(encoder.encode(decoder.decode(chunk)))
+            target.write(encoder.encode(decoder.decode(b"", final=True), final=True))
+            target.flush()
+            os.fsync(target.fileno())
+
+        shutil.copymode(path, temp_name)
+
+        if backup_path is not None:
+            _keep_backup(path, Path(backup_path))
+
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _keep_backup(path: Path, backup_path: Path) -> None:
+    """Keep the current content of a file under a backup path.
+
+    A hard link keeps the original content without copying it, because the
+    converted file replaces the original under a new inode. File systems
+    without hard links get a copy.
+
+    Args:
+        path: File about to be replaced
+        backup_path: Path of the backup, replaced if it exists
+    """
+    if backup_path.exists():
+        backup_path.unlink()
+
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
@@ -0,0 +1,178 @@
+"""
+Purpose: Finds text and gematria value matches in a document's content
+
+This file is part of the document_manager pillar and serves as a utility component.
+It holds the match searches of the document analysis panel as plain functions
+over a string, so they can run on a worker thread and be tested without
+widgets. Every match carries its character interval in the text, ready to be
+highlighted.
+
+Key components:
+- TextMatch: A match with its start/end offsets, matched text and value
+- word_value: Gematria value of a word, counting embedded numbers at face value
+- find_text_matches: Case-insensitive occurrences of a search string
+- find_value_matches: Words with a given gematria value
+- find_phrase_value_matches: Runs of consecutive words with a given total value
+
+Dependencies:
+- re: For word tokenization
+
+Related files:
+- document_manager/ui/panels/document_analysis_panel.py: Runs these searches
+- document_manager/ui/widgets/match_highlighter.py: Highlights the matches
+"""
+
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Calculates the gematria value of a text without digits
+ValueFunction = Callable[[str], int]
+
+_WORD_PATTERN = re.compile(r"\b\w+\b")
+_NUMBER_PATTERN = re.compile(r"\d+")
+
+
+class TextMatch(NamedTuple):
+    """A match in a text."""
+
+    start: int
+    end: int
+    text: str
+    value: Optional[int] = None
+
+
+def word_value(word: str, value_of: ValueFunction) -> int:
+    """Get the gematria value of a word.
+
+    Numbers inside the word count at face value and the remaining letters are
+    calculated, so "AI10" is the value of "AI" plus 10.
+
+    Args:
+        word: Word to evaluate
+        value_of: Gematria calculation for text without digits
+
+    Returns:
+        Value of the word
+    """
+    if word.isdigit():
+        return int(word)
+
+    number_sum = sum(int(number) for number in _NUMBER_PATTERN.findall(word))
+    letters = _NUMBER_PATTERN.sub("", word)
+    text_value = value_of(letters) if letters.strip() else 0
+    return text_value + number_sum
+
+
+def find_text_matches(content: str, search_text: str) -> List[TextMatch]:
+    """Find every occurrence of a text, ignoring case.
+
+    Args:
+        content: Text to search
+        search_text: Text to find
+
+    Returns:
+        Matches in order of position
+    """
+    if not search_text:
+        return []
+
+    return [
+        TextMatch(match.start(), match.end(), match.group(0))
+        for match in re.finditer(re.escape(search_text), content, re.IGNORECASE)
+    ]
+
+
+def find_value_matches(
+    content: str, target_value: int, value_of: ValueFunction
+) -> List[TextMatch]:
+    """Find the words whose gematria value equals a target.
+
+    Words whose value cannot be calculated are skipped.
+
+    Args:
+        content: Text to search
+        target_value: Value to find
+        value_of: Gematria calculation for text without digits
+
+    Returns:
+        Matches in order of position
+    """
+    values: Dict[str, Optional[int]] = {}
+    matches = []
+
+    for match in _WORD_PATTERN.finditer(content):
+        word = match.group(0)
+        if word not in values:
+            try:
+                values[word] = word_value(word, value_of)
+            except Exception:
+                values[word] = None
+
+        if values[word] == target_value:
+            matches.append(TextMatch(match.start(), match.end(), word, target_value))
+
+    return matches
+
+
+def find_phrase_value_matches(
+    content: str, target_value: int, value_of: ValueFunction, max_gap: int = 20
+) -> List[TextMatch]:
+    """Find runs of consecutive words whose combined value equals a target.
+
+    A run may not span more than max_gap characters between two words, and
+    runs stop growing once their value is well past the target. Words whose
+    value cannot be calculated count as 0.
+
+    Args:
+        content: Text to search
+        target_value: Value to find
+        value_of: Gematria calculation for text without digits
+        max_gap: Largest number of characters allowed between two words
+
+    Returns:
+        Matches ordered by start position, then by length
+    """
+    words = [
+        (match.group(0), match.start(), match.end())
+        for match in _WORD_PATTERN.finditer(content)
+    ]
+
+    values: Dict[str, int] = {}
+
+    def value(word: str) -> int:
+        if word not in values:
+            try:
+                values[word] = word_value(word, value_of)
+            except Exception:
+                values[word] = 0
+        return values[word]
+
+    matches = []
+
+    for i, (word, phrase_start, phrase_end) in enumerate(words):
+        phrase_value = value(word)
+        if phrase_value == target_value:
+            matches.append(TextMatch(phrase_start, phrase_end, word, phrase_value))
+
+        # A word far above the target cannot start a matching phrase
+        if phrase_value > target_value * 2:
+            continue
+
+        phrase = [word]
+        for j in range(i + 1, len(words)):
+            next_word, next_start, next_end = words[j]
+            if next_start - words[j - 1][2] > max_gap:
+                break
+
+            phrase.append(next_word)
+            phrase_value += value(next_word)
+
+            if phrase_value > target_value * 1.5 and target_value > 0:
+                break
+
+            if phrase_value == target_value:
+                matches.append(
+                    TextMatch(phrase_start, next_end, " ".join(phrase), phrase_value)
+                )
+
+    return matches
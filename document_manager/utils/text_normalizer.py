@@ -0,0 +1,117 @@
+"""
+Purpose: Normalizes extracted text in a fixed number of passes
+
+This file is part of the document_manager pillar and serves as a utility component.
+It compiles a text cleanup pipeline once so that applying it costs at most
+three passes over the text, however many rules it has: every character
+mapping is fused into one str.translate table, every regex substitution into
+one alternation, and Unicode normalization runs once at the end, skipped when
+the text is already normalized.
+
+Key components:
+- TextNormalizer: Compiled character map, substitutions and Unicode form
+
+Dependencies:
+- re: For the fused substitution pattern
+- unicodedata: For Unicode normalization
+
+Related files:
+- document_manager/services/document_service.py: Normalizes all extracted text
+"""
+
+import re
+import unicodedata
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+# A substitution replaces its matches with a fixed string or with the result
+# of calling a function on the match
+Replacement = Union[str, Callable[["re.Match[str]"], str]]
+
+
+class TextNormalizer:
+    """A compiled text cleanup pipeline.
+
+    Substitutions are tried at each position in the order given, and the
+    first one that matches wins, as in a single regex alternation. Unlike
+    separate re.sub calls, a substitution never sees the output of another,
+    so patterns should not rely on earlier ones having run. Replacement
+    strings are inserted literally; use a function to build a replacement
+    from the match, referring to groups by name since fusing the patterns
+    renumbers them.
+    """
+
+    def __init__(
+        self,
+        char_map: Optional[Mapping[str, str]] = None,
+        substitutions: Sequence[Tuple[str, Replacement]] = (),
+        flags: int = 0,
+        unicode_form: Optional[str] = None,
+    ):
+        """Compile the pipeline.
+
+        Args:
+            char_map: Single characters and the text replacing them
+            substitutions: (pattern, replacement) pairs, in priority order
+            flags: Regex flags applied to every substitution pattern
+            unicode_form: Unicode normalization form ("NFC", "NFKC", ...), or
+                None to leave the text unnormalized
+        """
+        self._table: Optional[Dict[int, str]] = (
+            str.maketrans(dict(char_map)) if char_map else None
+        )
+
+        # Table deleting the characters the map actually changes, for counting
+        self._changed_table: Dict[int, None] = {
+            ordinal: None
+            for ordinal, replacement in (self._table or {}).items()
+            if replacement != chr(ordinal)
+        }
+
+        self._replacements: List[Replacement] = []
+        self._pattern: Optional[re.Pattern] = None
+        if substitutions:
+            alternatives = []
+            for index, (pattern, replacement) in enumerate(substitutions):
+                alternatives.append(f"(?P<_{index}>{pattern})")
+                self._replacements.append(replacement)
+            self._pattern = re.compile("|".join(alternatives), flags)
+
+        self.unicode_form = unicode_form
+
+    def normalize(self, text: str) -> str:
+        """Apply the pipeline to a text.
+
+        Args:
+            text: Text to normalize
+
+        Returns:
+            Normalized text
+        """
+        if self._table:
+            text = text.translate(self._table)
+        if self._pattern is not None:
+            text = self._pattern.sub(self._replace, text)
+        if self.unicode_form and not unicodedata.is_normalized(self.unicode_form, text):
+            text = unicodedata.normalize(self.unicode_form, text)
+        return text
+
+    def count_mapped(self, text: str) -> int:
+        """Count the characters of a text that the character map changes.
+
+        Args:
+            text: Text to inspect
+
+        Returns:
+            Number of characters the map would replace with something else
+        """
+        if not self._changed_table:
+            return 0
+        return len(text) - len(text.translate(self._changed_table))
+
+    def _replace(self, match: "re.Match[str]") -> str:
+        """Get the replacement for a match of the fused pattern."""
+        # The wrapping group closes last, so it is the match's last group
+        replacement = self._replacements[int(match.lastgroup[1:])]
+        if isinstance(replacement, str):
+            return replacement
+        return replacement(match)
@@ -23,7 +23,7 @@ Related files:
 - gematria/ui/dialogs/save_calculation_dialog.py: UI for saving calculations
 """
 
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from loguru import logger
 
@@ -36,6 +36,8 @@ from shared.repositories.sqlite_calculation_repository import (
     SQLiteCalculationRepository,
 )
 from shared.repositories.sqlite_tag_repository import SQLiteTagRepository
+from shared.utils.calculation_hash import DuplicateMergePolicy
+from shared.utils.config import get_config
 
 
 class CalculationDatabaseService:
@@ -48,7 +50,14 @@ class CalculationDatabaseService:
             data_dir: Optional base directory path for storing data
         """
         # Initialize repositories
-        self.calculation_repo = SQLiteCalculationRepository(data_dir)
+        gematria_config = get_config().pillars.gematria
+        self.calculation_repo = SQLiteCalculationRepository(
+            data_dir,
+            tag_merge_policy=DuplicateMergePolicy(gematria_config.duplicate_tag_policy),
+            notes_merge_policy=DuplicateMergePolicy(
+                gematria_config.duplicate_notes_policy
+            ),
+        )
         self.tag_repo = SQLiteTagRepository(data_dir)
 
         # Ensure we have some default tags
@@ -180,17 +189,35 @@ class CalculationDatabaseService:
         """
         return self.calculation_repo.get_calculation(calculation_id)
 
-    def save_calculation(self, calculation: CalculationResult) -> bool:
+    def save_calculation(
+        self, calculation: CalculationResult
+    ) -> Optional[CalculationResult]:
         """Save a calculation result.
 
         Args:
             calculation: CalculationResult instance to save
 
         Returns:
-            True if successful, False otherwise
+            The calculation as stored, which is a merged copy with another ID
+            if an equal calculation was already stored, or None if saving
+            failed
         """
         return self.calculation_repo.save_calculation(calculation)
 
+    def save_calculations(self, calculations: List[CalculationResult]) -> int:
+        """Save several calculation results in one transaction.
+
+        Duplicates are merged into the stored calculations according to the
+        configured merge policies.
+
+        Args:
+            calculations: CalculationResult instances to save
+
+        Returns:
+            Number of calculations saved
+        """
+        return self.calculation_repo.save_calculations(calculations)
+
     def delete_calculation(self, calculation_id: str) -> bool:
         """Delete a calculation result.
 
@@ -224,7 +251,7 @@ class CalculationDatabaseService:
 
         if tag_id not in calculation.tags:
             calculation.tags.append(tag_id)
-            return self.save_calculation(calculation)
+            return self.save_calculation(calculation) is not None
 
         return True  # Tag already exists on the calculation
 
@@ -245,7 +272,7 @@ class CalculationDatabaseService:
 
         if tag_id in calculation.tags:
             calculation.tags.remove(tag_id)
-            return self.save_calculation(calculation)
+            return self.save_calculation(calculation) is not None
 
         return True  # Tag was not on the calculation
 
@@ -264,7 +291,7 @@ class CalculationDatabaseService:
             return False
 
         calculation.favorite = not calculation.favorite
-        return self.save_calculation(calculation)
+        return self.save_calculation(calculation) is not None
 
     def update_calculation_notes(self, calculation_id: str, notes: str) -> bool:
         """Update the notes for a calculation.
@@ -282,7 +309,7 @@ class CalculationDatabaseService:
             return False
 
         calculation.notes = notes
-        return self.save_calculation(calculation)
+        return self.save_calculation(calculation) is not None
 
     # ===== Search Methods =====
 
@@ -447,34 +474,64 @@ class CalculationDatabaseService:
 
         return results
 
-    def get_filtered_calculations(
+    def count_matching_calculations(self, criteria: Dict[str, Any]) -> int:
+        """Count the calculations matching the search criteria.
+
+        Args:
+            criteria: Search criteria as accepted by search_calculations
+
+        Returns:
+            Number of matching calculations
+        """
+        return self.calculation_repo.count_matching_calculations(criteria)
+
+    def get_calculations_after(
+        self,
+        criteria: Dict[str, Any],
+        sort_by: str = "created_at",
+        descending: bool = True,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: int = 200,
+    ) -> Tuple[List[CalculationResult], Optional[Tuple[Any, str]]]:
+        """Get one page of matching calculations using keyset pagination.
+
+        Args:
+            criteria: Search criteria as accepted by search_calculations
+            sort_by: Column to sort by
+            descending: Whether to sort in descending order
+            after: Key returned with the previous page, or None for the first page
+            limit: Maximum number of calculations to return
+
+        Returns:
+            Tuple of (calculations, key to pass as ``after`` for the next page)
+        """
+        return self.calculation_repo.get_calculations_after(
+            criteria, sort_by, descending, after, limit
+        )
+
+    def build_filter_criteria(
         self,
         search_term: Optional[str] = None,
         tag_id: Optional[str] = None,
         calculation_type: Optional[Union[CalculationType, str]] = None,
         favorites_only: bool = False,
-        limit: int = 50,
-        offset: int = 0,
-    ) -> tuple[List[CalculationResult], int]:
-        """Get calculations filtered by various criteria with pagination.
+    ) -> Dict[str, Any]:
+        """Build search criteria from the calculation history filters.
 
         Args:
-            search_term: Optional text to search for in input text, notes, or result
+            search_term: Optional input text to match
             tag_id: Optional tag ID to filter by
             calculation_type: Optional calculation method to filter by
             favorites_only: Whether to only include favorites
-            limit: Maximum number of results to return
-            offset: Number of results to skip
 
         Returns:
-            Tuple of (list of filtered calculations, total count of matching calculations)
+            Criteria dictionary as accepted by search_calculations
         """
-        # Build criteria dictionary
-        criteria = {}
+        criteria: Dict[str, Any] = {}
         if search_term:
             criteria["input_text"] = search_term
         if tag_id:
-            criteria["tags"] = [tag_id]
+            criteria["tag_id"] = tag_id
         if calculation_type:
             # Handle different types of calculation methods
             if isinstance(calculation_type, CalculationType):
@@ -488,19 +545,40 @@ class CalculationDatabaseService:
                 else:
                     criteria["calculation_type"] = calculation_type
         if favorites_only:
-            criteria["favorites_only"] = True
+            criteria["favorite"] = True
+        return criteria
+
+    def get_filtered_calculations(
+        self,
+        search_term: Optional[str] = None,
+        tag_id: Optional[str] = None,
+        calculation_type: Optional[Union[CalculationType, str]] = None,
+        favorites_only: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[List[CalculationResult], int]:
+        """Get calculations filtered by various criteria with pagination.
 
-        # First get all matching calculations to count them
-        all_matching = self.search_calculations(criteria)
-        total_count = len(all_matching)
+        Args:
+            search_term: Optional text to search for in input text, notes, or result
+            tag_id: Optional tag ID to filter by
+            calculation_type: Optional calculation method to filter by
+            favorites_only: Whether to only include favorites
+            limit: Maximum number of results to return
+            offset: Number of results to skip
 
-        # Then get the paginated subset
-        end_idx = min(offset + limit, total_count)
+        Returns:
+            Tuple of (list of filtered calculations, total count of matching calculations)
+        """
+        criteria = self.build_filter_criteria(
+            search_term, tag_id, calculation_type, favorites_only
+        )
+        total_count = self.count_matching_calculations(criteria)
         if offset >= total_count:
             return [], total_count
 
-        paginated_results = all_matching[offset:end_idx]
-        return paginated_results, total_count
+        criteria["limit"] = offset + limit
+        return self.search_calculations(criteria)[offset:], total_count
 
     def get_distinct_calculation_types(self) -> List[Union[CalculationType, str]]:
         """Get a list of all distinct calculation types used in saved calculations.
@@ -508,13 +586,4 @@ class CalculationDatabaseService:
         Returns:
             List of unique calculation types
         """
-        # Get all calculations and extract unique calculation types
-        calculations = self.get_all_calculations()
-
-        # Use a set to track unique types
-        unique_types = set()
-
-        for calc in calculations:
-            unique_types.add(calc.calculation_type)
-
-        return list(unique_types)
+        return self.calculation_repo.get_distinct_calculation_types()
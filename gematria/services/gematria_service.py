@@ -2189,7 +2189,49 @@ class GematriaService:
             value: Optional explicit value to override the calculated result (for custom calculations)
 
         Returns:
-            The saved calculation result
+            The calculation as stored; if an equal calculation was already
+            stored, the merged calculation with its ID. The unsaved result is
+            returned if saving failed.
+        """
+        result = self.build_calculation_result(
+            text,
+            calculation_type,
+            notes=notes,
+            tags=tags,
+            favorite=favorite,
+            value=value,
+            custom_method_name=custom_method_name,
+        )
+
+        # Save to database
+        stored = self.db_service.save_calculation(result)
+
+        return stored if stored is not None else result
+
+    def build_calculation_result(
+        self,
+        text: str,
+        calculation_type: Union[
+            CalculationType, str, CustomCipherConfig
+        ] = CalculationType.HEBREW_STANDARD_VALUE,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        favorite: bool = False,
+        value: Optional[int] = None,
+        custom_method_name: Optional[str] = None,
+    ) -> CalculationResult:
+        """Calculate the gematria value and build an unsaved calculation result.
+
+        Args:
+            text: The text to calculate
+            calculation_type: The calculation type to use (enum, name, or custom config)
+            notes: Optional notes to attach to the calculation
+            tags: Optional list of tag IDs to associate with the calculation
+            favorite: Whether to mark the calculation as a favorite
+            value: Optional explicit value to override the calculated result (for custom calculations)
+
+        Returns:
+            The calculation result, ready to be saved
         """
         # Calculate the value if not explicitly provided
         result_value = (
@@ -2227,11 +2269,19 @@ class GematriaService:
             custom_method_name=method_name,
         )
 
-        # Save to database
-        self.db_service.save_calculation(result)
-
         return result
 
+    def save_calculations(self, results: List[CalculationResult]) -> int:
+        """Save a batch of calculation results in one transaction.
+
+        Args:
+            results: Calculation results to save
+
+        Returns:
+            Number of results saved
+        """
+        return self.db_service.save_calculations(results)
+
     def get_calculation_history(self, limit: int = 50) -> List[CalculationResult]:
         """Get the calculation history.
 
@@ -0,0 +1,10 @@
+"""Gematria item models.
+
+This package provides Qt item models backing the Gematria views.
+"""
+
+from typing import List
+
+from gematria.ui.models.calculation_table_model import CalculationTableModel
+
+__all__: List[str] = ["CalculationTableModel"]
@@ -0,0 +1,208 @@
+"""
+Purpose: Provides a lazily loaded table model over saved calculations
+
+This file is part of the gematria pillar and serves as a UI model component.
+It is responsible for presenting search results from the calculation database
+to Qt item views without materializing them. Paging, the page cache and
+background loading come from KeysetTableModel; this model defines the
+columns and runs the calculation queries.
+
+Key components:
+- CalculationTableModel: Keyset-paged model of calculation search results
+
+Dependencies:
+- PyQt6: For the item model roles
+- gematria.services.calculation_database_service: For keyset queries
+- shared.ui.models.keyset_table_model: For incremental fetching and sorting
+
+Related files:
+- gematria/ui/panels/calculation_history_panel.py: Calculation history view
+- gematria/ui/panels/search_panel.py: Search results view
+- shared/repositories/sqlite_calculation_repository.py: Implements the keyset queries
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+
+from gematria.models.calculation_result import CalculationResult
+from gematria.models.tag import Tag
+from gematria.services.calculation_database_service import CalculationDatabaseService
+from shared.services.query_executor import QueryExecutor
+from shared.ui.models.keyset_table_model import KeysetTableModel
+
+
+class CalculationTableModel(KeysetTableModel):
+    """Table model that pages calculations in from the database on demand."""
+
+    COLUMN_TEXT = 0
+    COLUMN_VALUE = 1
+    COLUMN_METHOD = 2
+    COLUMN_TAGS = 3
+    COLUMN_FAVORITE = 4
+    COLUMN_CREATED = 5
+
+    _HEADERS = ["Text", "Value", "Method", "Tags", "★", "Created"]
+
+    # Repository sort column for each sortable view column
+    _SORT_KEYS = {
+        COLUMN_TEXT: "input_text",
+        COLUMN_VALUE: "result_value",
+        COLUMN_METHOD: "calculation_type",
+        COLUMN_FAVORITE: "favorite",
+        COLUMN_CREATED: "created_at",
+    }
+
+    _ROWS_NAME = "calculations"
+
+    def __init__(
+        self,
+        calculation_service: CalculationDatabaseService,
+        method_formatter: Callable[[CalculationResult], str],
+        page_size: int = 200,
+        max_cached_pages: int = 10,
+        executor: Optional[QueryExecutor] = None,
+        parent=None,
+    ):
+        """Initialize the model.
+
+        Args:
+            calculation_service: Service used to query calculations
+            method_formatter: Returns the display name of a calculation's method
+            page_size: Number of rows fetched per query
+            max_cached_pages: Number of pages kept in memory at once
+            executor: Executor dedicated to this model; when given, new
+                searches and sorts are loaded on its worker thread
+            parent: Parent object
+        """
+        super().__init__(
+            "created_at", True, page_size, max_cached_pages, executor, parent
+        )
+        self.calculation_service = calculation_service
+        self.method_formatter = method_formatter
+        self._tags: Dict[str, Optional[Tag]] = {}
+        self._method_names: Dict[Tuple[Any, Optional[str]], str] = {}
+
+    def set_criteria(self, criteria: Optional[Dict[str, Any]]) -> None:
+        """Show the calculations matching new search criteria.
+
+        Args:
+            criteria: Search criteria as accepted by search_calculations,
+                or None to show nothing
+        """
+        self._set_query(criteria)
+
+    def calculation_at(self, row: int) -> Optional[CalculationResult]:
+        """Get the calculation shown in a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            The calculation, or None if the row does not exist
+        """
+        return self.row_item(row)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get the data shown in a cell."""
+        if not index.isValid():
+            return None
+
+        calculation = self.calculation_at(index.row())
+        if calculation is None:
+            return None
+
+        column = index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            if column == self.COLUMN_TEXT:
+                return calculation.input_text
+            if column == self.COLUMN_VALUE:
+                return str(calculation.result_value)
+            if column == self.COLUMN_METHOD:
+                return self._method_name(calculation)
+            if column == self.COLUMN_TAGS:
+                return ", ".join(tag["name"] for tag in self._tag_data(calculation))
+            if column == self.COLUMN_FAVORITE:
+                return "★" if calculation.favorite else ""
+            if column == self.COLUMN_CREATED:
+                timestamp = calculation.timestamp
+                if hasattr(timestamp, "strftime"):
+                    return timestamp.strftime("%Y-%m-%d %H:%M")
+                return str(timestamp or "")
+
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == self.COLUMN_VALUE:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            if column == self.COLUMN_FAVORITE:
+                return Qt.AlignmentFlag.AlignCenter
+
+        elif role == Qt.ItemDataRole.UserRole:
+            # The tags column carries tag name/color data for TagItemDelegate
+            if column == self.COLUMN_TAGS:
+                return self._tag_data(calculation)
+            return calculation
+
+        return None
+
+    def _fetch_page(
+        self,
+        criteria: Dict[str, Any],
+        sort_by: str,
+        descending: bool,
+        after: Optional[Tuple],
+    ) -> Tuple[List[CalculationResult], Optional[Tuple]]:
+        """Run the keyset query for a page of calculations."""
+        return self.calculation_service.get_calculations_after(
+            criteria,
+            sort_by=sort_by,
+            descending=descending,
+            after=after,
+            limit=self.page_size,
+        )
+
+    def _count(self, criteria: Dict[str, Any]) -> int:
+        """Count the calculations matching search criteria."""
+        return self.calculation_service.count_matching_calculations(criteria)
+
+    def _load_extras(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """Load the tags shown in the tags column."""
+        return {"tags": {tag.id: tag for tag in self.calculation_service.get_all_tags()}}
+
+    def _reset_extras(self, results: Optional[Dict[str, Any]]) -> None:
+        """Take over the tags loaded with new results."""
+        self._tags = dict(results["tags"]) if results is not None else {}
+
+    def _method_name(self, calculation: CalculationResult) -> str:
+        """Get the cached display name of a calculation's method.
+
+        Args:
+            calculation: The calculation
+
+        Returns:
+            Method display name
+        """
+        key = (calculation.calculation_type, calculation.custom_method_name)
+        name = self._method_names.get(key)
+        if name is None:
+            name = self.method_formatter(calculation)
+            self._method_names[key] = name
+        return name
+
+    def _tag_data(self, calculation: CalculationResult) -> List[Dict[str, str]]:
+        """Get name and color of a calculation's tags.
+
+        Args:
+            calculation: The calculation
+
+        Returns:
+            List of dictionaries with name, color and id of each tag
+        """
+        tag_data = []
+        for tag_id in calculation.tags or []:
+            if tag_id not in self._tags:
+                self._tags[tag_id] = self.calculation_service.get_tag(tag_id)
+            tag = self._tags[tag_id]
+            if tag:
+                tag_data.append({"name": tag.name, "color": tag.color, "id": tag.id})
+        return tag_data
@@ -27,7 +27,7 @@ Related files:
 from typing import List, Optional
 
 from loguru import logger
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QModelIndex, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -35,16 +35,16 @@ from PyQt6.QtWidgets import (
     QFrame,
     QGridLayout,
     QHBoxLayout,
+    QHeaderView,
     QInputDialog,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
     QMenu,
     QMessageBox,
     QPushButton,
     QSplitter,
     QStackedWidget,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -53,6 +53,8 @@ from PyQt6.QtWidgets import (
 from gematria.models.calculation_result import CalculationResult
 from gematria.models.tag import Tag
 from gematria.services.calculation_database_service import CalculationDatabaseService
+from gematria.ui.models.calculation_table_model import CalculationTableModel
+from shared.services.query_executor import QueryExecutor
 from shared.services.service_locator import ServiceLocator
 from shared.services.tag_service import TagService
 from shared.ui.widgets.common_widgets import CollapsibleBox, ColorSquare
@@ -608,7 +610,7 @@ class CalculationDetailWidget(QWidget):
 
 
 class CalculationHistoryPanel(Panel):
-    """Panel for viewing calculation history with pagination and filtering."""
+    """Panel for viewing calculation history with incremental loading and filtering."""
 
     def __init__(self):
         """Initialize the panel."""
@@ -618,9 +620,6 @@ class CalculationHistoryPanel(Panel):
         self.calculation_service = ServiceLocator.get(CalculationDatabaseService)
         self.tag_service = ServiceLocator.get(TagService)
 
-        # Pagination state
-        self.current_page = 0
-        self.page_size = 50
         self.total_calculations = 0
 
         # Filter state
@@ -702,54 +701,57 @@ class CalculationHistoryPanel(Panel):
 
         main_layout.addWidget(search_panel)
 
-        # Pagination controls
-        pagination_widget = QWidget()
-        pagination_layout = QHBoxLayout(pagination_widget)
-        pagination_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.prev_button = QPushButton("Previous")
-        self.prev_button.clicked.connect(self._load_prev_page)
-
-        self.page_label = QLabel("Page 1")
-        self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.next_button = QPushButton("Next")
-        self.next_button.clicked.connect(self._load_next_page)
-
-        # Page size control
-        page_size_widget = QWidget()
-        page_size_layout = QHBoxLayout(page_size_widget)
-        page_size_layout.setContentsMargins(0, 0, 0, 0)
-
-        page_size_layout.addWidget(QLabel("Per page:"))
-        self.page_size_combo = QComboBox()
-        for size in [10, 25, 50, 100]:
-            self.page_size_combo.addItem(str(size), size)
-        self.page_size_combo.setCurrentIndex(2)  # Default to 50
-        self.page_size_combo.currentIndexChanged.connect(self._on_page_size_changed)
-        page_size_layout.addWidget(self.page_size_combo)
-
-        pagination_layout.addWidget(self.prev_button)
-        pagination_layout.addWidget(self.page_label, 1)
-        pagination_layout.addWidget(self.next_button)
-        pagination_layout.addWidget(page_size_widget)
-
-        main_layout.addWidget(pagination_widget)
-
         # Splitter for list and details
         splitter = QSplitter(Qt.Orientation.Vertical)
 
-        # Calculation list
-        self.calculation_list = QListWidget()
-        self.calculation_list.setAlternatingRowColors(True)
-        self.calculation_list.currentItemChanged.connect(self._on_calculation_selected)
-        self.calculation_list.itemDoubleClicked.connect(self._on_calculation_details)
+        # Calculation table; rows are loaded from the database as they are
+        # scrolled into view and sorting is done by the database
+        self.calculation_model = CalculationTableModel(
+            self.calculation_service,
+            lambda calc: self.format_calculation_type(calc.calculation_type),
+            executor=QueryExecutor(self),
+            parent=self,
+        )
+        self.calculation_model.results_loaded.connect(self._on_calculations_loaded)
+        self.calculation_table = QTableView()
+        self.calculation_table.setModel(self.calculation_model)
+        self.calculation_table.setColumnHidden(CalculationTableModel.COLUMN_TAGS, True)
+        self.calculation_table.setAlternatingRowColors(True)
+        self.calculation_table.setSelectionBehavior(
+            QTableView.SelectionBehavior.SelectRows
+        )
+        self.calculation_table.setSelectionMode(
+            QTableView.SelectionMode.SingleSelection
+        )
+        self.calculation_table.verticalHeader().hide()
+
+        header = self.calculation_table.horizontalHeader()
+        header.setResizeContentsPrecision(0)
+        header.setSectionResizeMode(
+            CalculationTableModel.COLUMN_TEXT, QHeaderView.ResizeMode.Stretch
+        )
+        for column in (
+            CalculationTableModel.COLUMN_VALUE,
+            CalculationTableModel.COLUMN_METHOD,
+            CalculationTableModel.COLUMN_FAVORITE,
+            CalculationTableModel.COLUMN_CREATED,
+        ):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSortIndicator(
+            CalculationTableModel.COLUMN_CREATED, Qt.SortOrder.DescendingOrder
+        )
+        self.calculation_table.setSortingEnabled(True)
+
+        self.calculation_table.selectionModel().currentRowChanged.connect(
+            self._on_calculation_selected
+        )
+        self.calculation_table.doubleClicked.connect(self._on_calculation_details)
 
-        # Add context menu to calculation list
-        self.calculation_list.setContextMenuPolicy(
+        # Add context menu to calculation table
+        self.calculation_table.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu
         )
-        self.calculation_list.customContextMenuRequested.connect(
+        self.calculation_table.customContextMenuRequested.connect(
             self._show_context_menu
         )
 
@@ -798,7 +800,7 @@ class CalculationHistoryPanel(Panel):
 
         details_layout.addLayout(button_layout)
 
-        splitter.addWidget(self.calculation_list)
+        splitter.addWidget(self.calculation_table)
         splitter.addWidget(self.details_panel)
         splitter.setSizes([300, 200])
 
@@ -812,7 +814,6 @@ class CalculationHistoryPanel(Panel):
 
     def _on_search_debounced(self):
         """Perform the actual search after debounce delay."""
-        self.current_page = 0
         self._load_calculations()
 
     def _on_refresh(self):
@@ -821,7 +822,6 @@ class CalculationHistoryPanel(Panel):
         self.tag_combo.setCurrentIndex(0)
         self.method_combo.setCurrentIndex(0)
         self.favorites_check.setChecked(False)
-        self.current_page = 0
         self._load_tags_and_methods()
         self._load_calculations()
 
@@ -830,31 +830,16 @@ class CalculationHistoryPanel(Panel):
         self.filter_tag = self.tag_combo.currentData()
         self.filter_method = self.method_combo.currentData()
         self.favorites_only = self.favorites_check.isChecked()
-        self.current_page = 0  # Reset to first page when filters change
-        self._load_calculations()
-
-    def _load_prev_page(self):
-        """Load the previous page of results."""
-        if self.current_page > 0:
-            self.current_page -= 1
-            self._load_calculations()
-
-    def _load_next_page(self):
-        """Load the next page of results."""
-        max_page = (self.total_calculations - 1) // self.page_size
-        if self.current_page < max_page:
-            self.current_page += 1
-            self._load_calculations()
-
-    def _on_page_size_changed(self):
-        """Handle page size changes."""
-        self.page_size = self.page_size_combo.currentData()
-        self.current_page = 0  # Reset to first page when page size changes
         self._load_calculations()
 
     def _on_calculation_selected(self, current, previous):
         """Handle calculation selection change."""
-        if not current:
+        row_calculation = (
+            self.calculation_model.calculation_at(current.row())
+            if current.isValid()
+            else None
+        )
+        if not row_calculation:
             self.selected_calculation = None
             self.view_details_button.setEnabled(False)
             self.delete_button.setEnabled(False)
@@ -866,8 +851,7 @@ class CalculationHistoryPanel(Panel):
             self.details_notes.setText("")
             return
 
-        calc_id = current.data(Qt.ItemDataRole.UserRole)
-        calculation = self.calculation_service.get_calculation(calc_id)
+        calculation = self.calculation_service.get_calculation(row_calculation.id)
 
         if calculation:
             self.selected_calculation = calculation
@@ -937,13 +921,24 @@ class CalculationHistoryPanel(Panel):
         # Fallback case - just convert to string
         return str(calculation_type)
 
-    def _on_calculation_details(self, item):
-        """Open the details dialog for the selected calculation."""
-        if not item:
+    def _on_calculation_details(self, index=None):
+        """Open the details dialog for the selected calculation.
+
+        Args:
+            index: Model index of the calculation (defaults to the current row)
+        """
+        if not isinstance(index, QModelIndex):
+            index = self.calculation_table.currentIndex()
+
+        row_calculation = (
+            self.calculation_model.calculation_at(index.row())
+            if index.isValid()
+            else None
+        )
+        if not row_calculation:
             return
 
-        calc_id = item.data(Qt.ItemDataRole.UserRole)
-        calculation = self.calculation_service.get_calculation(calc_id)
+        calculation = self.calculation_service.get_calculation(row_calculation.id)
 
         if calculation:
             try:
@@ -1018,8 +1013,7 @@ class CalculationHistoryPanel(Panel):
             logger.error(f"Error loading calculation methods: {e}")
 
     def _load_calculations(self):
-        """Load calculations based on current filters and pagination."""
-        self.calculation_list.clear()
+        """Load calculations based on current filters."""
         self.selected_calculation = None
         self.view_details_button.setEnabled(False)
         self.delete_button.setEnabled(False)
@@ -1030,79 +1024,60 @@ class CalculationHistoryPanel(Panel):
                 self.search_box.text().strip() if self.search_box.text() else None
             )
 
-            # Calculate offset for pagination
-            offset = self.current_page * self.page_size
-
-            # Get calculations with filters
-            (
-                calculations,
-                self.total_calculations,
-            ) = self.calculation_service.get_filtered_calculations(
+            criteria = self.calculation_service.build_filter_criteria(
                 search_term=search_term,
                 tag_id=self.filter_tag,
                 calculation_type=self.filter_method,
                 favorites_only=self.favorites_only,
-                limit=self.page_size,
-                offset=offset,
             )
 
-            # Update the pagination information
-            total_pages = (
-                self.total_calculations + self.page_size - 1
-            ) // self.page_size
-            if total_pages == 0:
-                total_pages = 1
-
-            self.page_label.setText(f"Page {self.current_page + 1} of {total_pages}")
-            self.prev_button.setEnabled(self.current_page > 0)
-            self.next_button.setEnabled(self.current_page < total_pages - 1)
-
-            # Display the results count
-            if self.total_calculations == 0:
-                self.details_title.setText("No calculations found")
-            elif self.total_calculations == 1:
-                self.details_title.setText("1 calculation found")
-            else:
-                self.details_title.setText(
-                    f"{self.total_calculations} calculations found"
-                )
-
-            # Populate the list
-            for calc in calculations:
-                # Format the display text to include the proper method name
-                formatted_method = self.format_calculation_type(calc.calculation_type)
-                item = QListWidgetItem(
-                    f"{calc.input_text} = {calc.result_value} ({formatted_method})"
-                )
-                item.setData(Qt.ItemDataRole.UserRole, calc.id)
-                self.calculation_list.addItem(item)
+            # The first page is loaded in the background; further rows are
+            # fetched lazily as the table is scrolled
+            self.details_title.setText("Searching...")
+            self.calculation_model.set_criteria(criteria)
 
         except Exception as e:
             logger.error(f"Error loading calculations: {e}")
 
+    def _on_calculations_loaded(self, total: int):
+        """Display the results count once a search has been loaded."""
+        self.total_calculations = total
+
+        if self.total_calculations == 0:
+            self.details_title.setText("No calculations found")
+        elif self.total_calculations == 1:
+            self.details_title.setText("1 calculation found")
+        else:
+            self.details_title.setText(f"{self.total_calculations} calculations found")
+
     def _show_context_menu(self, position):
-        """Show context menu for calculation list item.
+        """Show context menu for calculation table row.
 
         Args:
             position: Position where menu should be shown
         """
-        # Get the item at the position
-        item = self.calculation_list.itemAt(position)
-        if not item:
+        # Get the row at the position
+        index = self.calculation_table.indexAt(position)
+        row_calculation = (
+            self.calculation_model.calculation_at(index.row())
+            if index.isValid()
+            else None
+        )
+        if not row_calculation:
             return
 
         # Create context menu
         menu = QMenu(self)
 
         # Get calculation data
-        calc_id = item.data(Qt.ItemDataRole.UserRole)
+        calc_id = row_calculation.id
         calculation = self.calculation_service.get_calculation(calc_id)
         if not calculation:
             return
 
         # Add menu items
         view_action = menu.addAction("View Details")
-        view_action.triggered.connect(lambda: self._on_calculation_details(item))
+        view_action.triggered.connect(lambda: self._on_calculation_details(index))
 
         delete_action = menu.addAction("Delete")
         delete_action.triggered.connect(
@@ -1131,7 +1106,7 @@ class CalculationHistoryPanel(Panel):
                 )
 
         # Show menu at the requested position
-        menu.exec(self.calculation_list.viewport().mapToGlobal(position))
+        menu.exec(self.calculation_table.viewport().mapToGlobal(position))
 
     def _on_delete_specific_calculation(self, calc_id):
         """Delete a specific calculation by ID.
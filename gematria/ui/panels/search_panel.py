@@ -4,10 +4,10 @@ This module provides a panel implementation for searching the Gematria database
 for calculations based on various criteria.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Optional
 
 from loguru import logger
-from PyQt6.QtCore import QRect, QRegularExpression, QSize, Qt, pyqtSignal
+from PyQt6.QtCore import QModelIndex, QRect, QRegularExpression, QSize, Qt, pyqtSignal
 from PyQt6.QtGui import (
     QBrush,
     QColor,
@@ -31,8 +31,7 @@ from PyQt6.QtWidgets import (
     QStyle,
     QStyledItemDelegate,
     QStyleOptionViewItem,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -42,24 +41,12 @@ from gematria.models.calculation_type import CalculationType, Language
 from gematria.models.custom_cipher_config import CustomCipherConfig
 from gematria.services.calculation_database_service import CalculationDatabaseService
 from gematria.services.custom_cipher_service import CustomCipherService
+from gematria.ui.models.calculation_table_model import CalculationTableModel
 from gematria.ui.widgets.calculation_detail_widget import CalculationDetailWidget
+from shared.services.query_executor import QueryExecutor
 from shared.ui.window_management import WindowManager
 
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    """Custom QTableWidgetItem that sorts numerically."""
-    
-    def __init__(self, value: int):
-        super().__init__(str(value))
-        self.numeric_value = value
-    
-    def __lt__(self, other):
-        """Override less than operator for proper numeric sorting."""
-        if isinstance(other, NumericTableWidgetItem):
-            return self.numeric_value < other.numeric_value
-        return super().__lt__(other)
-
-
 class TagItemDelegate(QStyledItemDelegate):
     """Custom delegate for displaying tags with colors in the search results table."""
 
@@ -349,35 +336,49 @@ class SearchPanel(QWidget):
 
         layout.addLayout(button_layout)
 
-        # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(5)
-        self.results_table.setHorizontalHeaderLabels(["Text", "Value", "Method", "Tags", "★"])
-        
+        # Results table, backed by a model that loads rows as they are scrolled into view
+        self.results_model = CalculationTableModel(
+            self.calculation_db_service,
+            self._get_method_name,
+            executor=QueryExecutor(self),
+            parent=self,
+        )
+        self.results_model.results_loaded.connect(
+            lambda total: logger.debug(f"Search matched {total} results")
+        )
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setColumnHidden(CalculationTableModel.COLUMN_CREATED, True)
+
         # Set column widths for better display
         header = self.results_table.horizontalHeader()
+        # Only measure visible rows when sizing columns to their contents
+        header.setResizeContentsPrecision(0)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Text column stretches
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Value column
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Method column
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)  # Tags column - fixed width
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Favorite column
-        
+
         # Set specific width for Tags column to ensure tag names are visible
         self.results_table.setColumnWidth(3, 200)  # Tags column - 200px width
-        
-        # Enable sorting
+
+        # Enable sorting (performed by the database), newest first by default
+        header.setSortIndicator(
+            CalculationTableModel.COLUMN_CREATED, Qt.SortOrder.DescendingOrder
+        )
         self.results_table.setSortingEnabled(True)
-        
+
         # Set up the tag delegate for the Tags column (column 3)
         tag_delegate = TagItemDelegate(self.results_table)
         self.results_table.setItemDelegateForColumn(3, tag_delegate)
 
         # Configure table behavior
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.results_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.results_table.itemSelectionChanged.connect(self._on_result_selected)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.results_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.results_table.selectionModel().selectionChanged.connect(self._on_result_selected)
         # Connect double-click to view details in a separate window
-        self.results_table.itemDoubleClicked.connect(self._open_detail_window)
+        self.results_table.doubleClicked.connect(self._open_detail_window)
 
         # Make the rows a bit taller to accommodate the tags
         self.results_table.verticalHeader().setDefaultSectionSize(30)
@@ -513,9 +514,8 @@ class SearchPanel(QWidget):
 
         # Perform search
         logger.debug(f"Sending search criteria to calculation_db_service: {criteria}")
-        results = self.calculation_db_service.search_calculations(criteria)
-        logger.debug(f"Search returned {len(results)} results")
-        self._display_results(results)
+        self.selected_calculation = None
+        self.results_model.set_criteria(criteria)
 
     def _clear_search(self) -> None:
         """Clear all search fields."""
@@ -531,85 +531,9 @@ class SearchPanel(QWidget):
         self.has_notes.setChecked(False)
 
         # Clear results
-        self.results_table.setRowCount(0)
+        self.results_model.set_criteria(None)
         self.selected_calculation = None
 
-    def _display_results(self, results: List[CalculationResult]) -> None:
-        """Display search results in the table.
-
-        Args:
-            results: List of calculation results to display
-        """
-        # Temporarily disable sorting while populating the table to avoid performance issues
-        self.results_table.setSortingEnabled(False)
-        
-        self.results_table.setRowCount(0)
-        self.selected_calculation = None
-
-        if not results:
-            # Re-enable sorting even if no results
-            self.results_table.setSortingEnabled(True)
-            return
-
-        self.results_table.setRowCount(len(results))
-
-        for i, result in enumerate(results):
-            # Text column
-            text_item = QTableWidgetItem(result.input_text)
-            text_item.setData(Qt.ItemDataRole.UserRole, result)
-            self.results_table.setItem(i, 0, text_item)
-
-            # Value column - Set up for proper numerical sorting
-            value_item = NumericTableWidgetItem(result.result_value)
-            value_item.setData(Qt.ItemDataRole.UserRole, result.result_value)
-            value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.results_table.setItem(i, 1, value_item)
-
-            # Method column - Set up for proper text sorting
-            method_name = self._get_method_name(result)
-            method_item = QTableWidgetItem(method_name)
-            # Store the method name for sorting (already a string, so it will sort alphabetically)
-            method_item.setData(Qt.ItemDataRole.UserRole + 1, method_name)
-            self.results_table.setItem(i, 2, method_item)
-
-            # Tags column
-            tags_item = QTableWidgetItem()
-            tag_display_list = []  # List for the delegate to use for drawing
-
-            if hasattr(result, "tags") and result.tags:
-                try:
-                    # Get full tag objects so we can display tag names
-                    for tag_id in result.tags:
-                        tag = self.calculation_db_service.get_tag(tag_id)
-                        if tag:
-                            # Store tag data for the delegate
-                            tag_display_list.append(
-                                {"name": tag.name, "color": tag.color, "id": tag.id}
-                            )
-
-                    # Create a plain text representation for fallback and tooltip
-                    tag_names = [tag["name"] for tag in tag_display_list]
-                    plain_text = ", ".join(tag_names) if tag_names else ""
-                    tags_item.setText(plain_text)
-                    tags_item.setToolTip(plain_text)
-
-                except Exception as e:
-                    logger.error(f"Error getting tag data: {e}")
-
-            # Store the tag data for the delegate to use
-            tags_item.setData(Qt.ItemDataRole.UserRole, tag_display_list)
-            self.results_table.setItem(i, 3, tags_item)
-
-            # Favorite column
-            favorite_item = QTableWidgetItem("★" if result.favorite else "")
-            favorite_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Store a sortable value for favorites (1 for favorite, 0 for not favorite)
-            favorite_item.setData(Qt.ItemDataRole.UserRole + 1, 1 if result.favorite else 0)
-            self.results_table.setItem(i, 4, favorite_item)
-        
-        # Re-enable sorting after populating the table
-        self.results_table.setSortingEnabled(True)
-
     def _get_method_name(self, calculation: CalculationResult) -> str:
         """Get the display name for a calculation method.
 
@@ -705,26 +629,26 @@ class SearchPanel(QWidget):
 
     def _on_result_selected(self) -> None:
         """Handle selection change in the results table."""
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        calculation = (
+            self.results_model.calculation_at(selected_rows[0].row())
+            if selected_rows
+            else None
+        )
+        if calculation is None:
             self.selected_calculation = None
             return
 
-        # Get the calculation result from the first column
-        row = selected_items[0].row()
-        self.selected_calculation = cast(
-            CalculationResult,
-            self.results_table.item(row, 0).data(Qt.ItemDataRole.UserRole),
-        )
+        self.selected_calculation = calculation
 
         # Emit signal that result was selected
         self.result_selected.emit(self.selected_calculation)
 
-    def _open_detail_window(self, item: QTableWidgetItem) -> None:
+    def _open_detail_window(self, index: QModelIndex) -> None:
         """Open calculation details in a separate window.
 
         Args:
-            item: The table item that was double-clicked
+            index: The table index that was double-clicked
         """
         if not self.selected_calculation or not self.window_manager:
             return
@@ -48,6 +48,9 @@ from shared.ui.window_management import WindowManager
 # Import TQAnalysisService
 from tq.services.tq_analysis_service import TQAnalysisService
 
+# Number of imported calculations written per transaction
+IMPORT_SAVE_BATCH_SIZE = 500
+
 
 class WordAbacusPanel(QWidget):
     """Panel for Word Abacus calculations."""
@@ -357,6 +360,11 @@ class WordAbacusPanel(QWidget):
         progress_dialog.setMaximum(total_calculations)
         calculation_count = 0
 
+        # Results are written in batches; duplicates are merged on insert
+        pending_results: List[CalculationResult] = []
+        built_count = 0
+        saved_count = 0
+
         for i, item_data in enumerate(imported_items):
             word = item_data.get("word")
             notes = item_data.get("notes")
@@ -397,43 +405,84 @@ class WordAbacusPanel(QWidget):
             for calc_type in applicable_methods:
                 if progress_dialog.wasCanceled():
                     logger.info("Import and calculation process canceled by user.")
+                    # Keep what was already calculated
+                    built_count += len(pending_results)
+                    saved_count += self._gematria_service.save_calculations(
+                        pending_results
+                    )
                     QMessageBox.information(
                         self, "Canceled", "Import process was canceled."
                     )
+                    self._report_unsaved_calculations(built_count, saved_count)
                     return
 
                 try:
                     logger.debug(
                         f"Calculating {calc_type.name} for word: '{word}', notes: '{notes}', tags: {tag_ids}"
                     )
-                    self._gematria_service.calculate_and_save(
-                        text=word,
-                        calculation_type=calc_type,
-                        notes=notes,
-                        tags=tag_ids,
-                        favorite=False,  # Default, or make this configurable from import?
+                    pending_results.append(
+                        self._gematria_service.build_calculation_result(
+                            text=word,
+                            calculation_type=calc_type,
+                            notes=notes,
+                            tags=list(tag_ids),
+                            favorite=False,  # Default, or make this configurable from import?
+                        )
                     )
                     # We could emit calculation_performed here if needed for each saved item
                     # self.calculation_performed.emit(result_obj)
                 except Exception as e:
                     logger.error(
-                        f"Error calculating/saving '{calc_type.name}' for '{word}': {e}"
+                        f"Error calculating '{calc_type.name}' for '{word}': {e}"
                     )
                     # Optionally, inform user about specific errors but continue batch
 
                 calculation_count += 1
                 progress_dialog.setValue(calculation_count)
 
+            if len(pending_results) >= IMPORT_SAVE_BATCH_SIZE:
+                built_count += len(pending_results)
+                saved_count += self._gematria_service.save_calculations(
+                    pending_results
+                )
+                pending_results = []
+
             # Brief pause to allow UI to update, especially if many methods per word
             # QApplication.processEvents() # Can be risky, use with caution
 
+        if pending_results:
+            built_count += len(pending_results)
+            saved_count += self._gematria_service.save_calculations(pending_results)
+
         progress_dialog.setValue(total_calculations)
-        QMessageBox.information(
+        if saved_count < built_count:
+            self._report_unsaved_calculations(built_count, saved_count)
+        else:
+            QMessageBox.information(
+                self,
+                "Import Complete",
+                f"Successfully processed and saved calculations for {len(imported_items)} words/phrases.",
+            )
+        logger.info("Import and batch calculation complete.")
+
+    def _report_unsaved_calculations(self, built_count: int, saved_count: int) -> None:
+        """Warn the user about imported calculations that could not be saved.
+
+        Args:
+            built_count: Number of calculations handed to the database
+            saved_count: Number of them that were saved
+        """
+        if saved_count >= built_count:
+            return
+
+        failed_count = built_count - saved_count
+        logger.error(f"{failed_count} of {built_count} imported calculations were not saved")
+        QMessageBox.warning(
             self,
-            "Import Complete",
-            f"Successfully processed and saved calculations for {len(imported_items)} words/phrases.",
+            "Import Incomplete",
+            f"{failed_count} of {built_count} calculations could not be saved. "
+            "See the log for details.",
         )
-        logger.info("Import and batch calculation complete.")
 
     def _send_to_quadset_analysis(self) -> None:
         """Send the current calculation result to Quadset Analysis."""
@@ -22,6 +22,7 @@ from PyQt6.QtWidgets import (
 from gematria.models.calculation_result import CalculationResult
 from gematria.services.calculation_database_service import CalculationDatabaseService
 from gematria.ui.dialogs.calculation_details_dialog import CalculationDetailsDialog
+from shared.services.query_executor import QueryExecutor
 from shared.services.service_locator import ServiceLocator
 
 
@@ -45,6 +46,11 @@ class DatabaseEntriesTabWidget(QWidget):
         # Current entries
         self.entries: List[CalculationResult] = []
         
+        # Lookups run in the background; paging quickly cancels stale ones
+        self.lookup_executor = QueryExecutor(self)
+        self.lookup_executor.result_ready.connect(self._on_entries_loaded)
+        self.lookup_executor.query_failed.connect(self._on_lookup_failed)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -98,24 +104,41 @@ class DatabaseEntriesTabWidget(QWidget):
         self.current_number = number
         self.header_label.setText(f"Database Entries for {number}")
         
-        # Get all calculations with this result value
-        try:
-            self.entries = self.calculation_service.find_calculations_by_value(number)
-            self._populate_table()
-            
-            # Update info label
-            count = len(self.entries)
-            if count == 0:
-                self.info_label.setText(f"No database entries found for {number}")
-            elif count == 1:
-                self.info_label.setText(f"Found 1 database entry for {number}")
-            else:
-                self.info_label.setText(f"Found {count} database entries for {number}")
-                
-        except Exception as e:
-            self.info_label.setText(f"Error loading entries: {str(e)}")
-            self.entries = []
-            self._populate_table()
+        # Get all calculations with this result value on the worker thread
+        self.info_label.setText(f"Loading database entries for {number}...")
+        calculation_service = self.calculation_service
+        self.lookup_executor.submit(
+            lambda: calculation_service.find_calculations_by_value(number)
+        )
+    
+    def _on_entries_loaded(self, entries: List[CalculationResult]):
+        """Show the entries found for the current number.
+        
+        Args:
+            entries: Calculations with the current number as value
+        """
+        number = self.current_number
+        self.entries = entries
+        self._populate_table()
+        
+        # Update info label
+        count = len(self.entries)
+        if count == 0:
+            self.info_label.setText(f"No database entries found for {number}")
+        elif count == 1:
+            self.info_label.setText(f"Found 1 database entry for {number}")
+        else:
+            self.info_label.setText(f"Found {count} database entries for {number}")
+    
+    def _on_lookup_failed(self, message: str):
+        """Show an error when the lookup fails.
+        
+        Args:
+            message: Error message
+        """
+        self.info_label.setText(f"Error loading entries: {message}")
+        self.entries = []
+        self._populate_table()
     
     def _populate_table(self):
         """Populate the table with current entries."""
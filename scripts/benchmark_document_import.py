@@ -0,0 +1,99 @@
+"""Benchmark batch document import throughput for different worker counts.
+
+Generates a folder of synthetic multi-page PDFs and imports it into a fresh
+database once per worker count, printing files per second and the speedup
+over a single worker. Throughput should grow close to linearly with the
+number of worker processes, up to the number of physical cores.
+
+Usage:
+    python scripts/benchmark_document_import.py [--files 200] [--pages 20]
+        [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # noqa: E402  PyMuPDF
+from loguru import logger  # noqa: E402
+
+from document_manager.repositories.document_repository import (  # noqa: E402
+    DocumentRepository,
+)
+from document_manager.services.document_service import DocumentService  # noqa: E402
+
+SAMPLE_LINE = "In the beginning was the Word, and the Word was with God. abgdezhq "
+
+
+def create_pdfs(directory: Path, count: int, pages: int) -> list:
+    """Create synthetic PDFs with a few paragraphs of text per page."""
+    paths = []
+    for i in range(count):
+        pdf = fitz.open()
+        for page_number in range(pages):
+            page = pdf.new_page()
+            text = "\n".join(f"{SAMPLE_LINE}{page_number}.{j}" for j in range(45))
+            page.insert_text((36, 36), text, fontsize=8)
+        path = directory / f"doc_{i:04d}.pdf"
+        pdf.save(path)
+        pdf.close()
+        paths.append(path)
+    return paths
+
+
+def run(paths: list, workers: int, work_dir: Path) -> float:
+    """Import the files with a given worker count and return the elapsed time."""
+    run_dir = work_dir / f"run_{workers}"
+    run_dir.mkdir()
+    os.chdir(run_dir)
+
+    service = DocumentService(DocumentRepository(run_dir / "isopgem.db"))
+    start = time.perf_counter()
+    imported = service.batch_import_documents(paths, max_workers=workers)
+    elapsed = time.perf_counter() - start
+
+    if len(imported) != len(paths):
+        print(f"  warning: imported {len(imported)} of {len(paths)} files")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        source = work_dir / "source"
+        source.mkdir()
+        paths = create_pdfs(source, args.files, args.pages)
+        print(
+            f"{args.files} PDFs x {args.pages} pages, {os.cpu_count()} CPUs available"
+        )
+
+        baseline = None
+        for workers in sorted(set(args.workers)):
+            elapsed = run(paths, workers, work_dir)
+            baseline = baseline or elapsed
+            print(
+                f"  {workers:2d} workers: {elapsed:7.2f} s, "
+                f"{args.files / elapsed:7.1f} files/s, "
+                f"speedup {baseline / elapsed:4.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the search panel test scripts.
+"""
+
+import time
+
+
+def wait_for_results(app, model, timeout=10.0):
+    """Process events until the search results are shown.
+
+    Searches run on a background executor, so the model only holds the
+    new rows once the executor has delivered them.
+    """
+    deadline = time.monotonic() + timeout
+    while model.is_loading():
+        if time.monotonic() > deadline:
+            raise TimeoutError("Search results were not delivered in time")
+        app.processEvents()
+        time.sleep(0.01)
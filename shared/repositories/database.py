@@ -7,6 +7,8 @@ creating necessary tables, and providing transaction management.
 
 Key components:
 - Database: Core class for SQLite database operations and connection management
+- interruptible_queries: Collects the connections a thread queries with
+- track_connection: Registers a connection with the current collection scope
 
 Dependencies:
 - sqlite3: For SQLite database operations
@@ -19,13 +21,55 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from loguru import logger
 
+from shared.utils.calculation_hash import calculation_content_hash
+
 # Define a shorter type alias for the cursor type
 Cursor = sqlite3.Cursor
 
+# Connections used by the current thread inside interruptible_queries()
+_interruptible = threading.local()
+
+
+@contextmanager
+def interruptible_queries() -> Iterator[List[sqlite3.Connection]]:
+    """Collect the connections the current thread queries with.
+
+    Repositories report the connections they use through track_connection().
+    Inside this scope they are gathered in the yielded list, so another
+    thread can abort the running statements with Connection.interrupt().
+
+    Yields:
+        List filled with the connections used inside the scope
+    """
+    connections: List[sqlite3.Connection] = []
+    previous = getattr(_interruptible, "connections", None)
+    _interruptible.connections = connections
+    try:
+        yield connections
+    finally:
+        _interruptible.connections = previous
+
+
+def track_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Register a connection with the current interruptible_queries() scope.
+
+    Does nothing outside such a scope.
+
+    Args:
+        conn: Connection about to be used by the current thread
+
+    Returns:
+        The same connection
+    """
+    connections = getattr(_interruptible, "connections", None)
+    if connections is not None and not any(c is conn for c in connections):
+        connections.append(conn)
+    return conn
+
 
 class Database:
     """Core class for SQLite database management."""
@@ -101,13 +145,16 @@ class Database:
             )
             # Enable foreign keys
             self._local.connection.execute("PRAGMA foreign_keys = ON")
+            # New databases reclaim free pages incrementally instead of
+            # requiring a full VACUUM (no-op for existing databases)
+            self._local.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
             # Enable WAL mode for better concurrent access
             self._local.connection.execute("PRAGMA journal_mode = WAL")
             # Row factory for dictionary-like access
             self._local.connection.row_factory = sqlite3.Row
 
         try:
-            yield self._local.connection
+            yield track_connection(self._local.connection)
         except Exception as e:
             logger.error(f"Database error: {e}")
             raise
@@ -211,6 +258,7 @@ class Database:
         """Create database tables if they don't exist."""
         self._create_tags_table()
         self._create_calculations_table()
+        self._migrate_calculation_content_hash()
         self._create_indices()
 
     def _create_tags_table(self) -> None:
@@ -237,7 +285,8 @@ class Database:
             result_value TEXT NOT NULL,
             favorite BOOLEAN NOT NULL DEFAULT 0,
             notes TEXT,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            content_hash TEXT
         );
         """
         self.execute(query)
@@ -254,12 +303,63 @@ class Database:
         """
         self.execute(query)
 
+    def _migrate_calculation_content_hash(self) -> None:
+        """Add and backfill the content_hash column on older databases.
+
+        Rows are hashed newest first. When several existing rows share a hash,
+        only the newest one gets it; the older copies keep a NULL hash so the
+        unique index can be created, and can be removed later through the
+        duplicate finder in the maintenance window.
+        """
+        columns = {
+            row["name"] for row in self.query_all("PRAGMA table_info(calculations)")
+        }
+        if "content_hash" in columns:
+            return
+
+        logger.info("Adding content_hash column to calculations table")
+
+        with self.transaction() as conn:
+            conn.execute("ALTER TABLE calculations ADD COLUMN content_hash TEXT")
+
+            cursor = conn.execute(
+                """
+                SELECT id, input_text, calculation_type, custom_method_name, result_value
+                FROM calculations
+                ORDER BY created_at DESC
+                """
+            )
+
+            seen = set()
+            updates = []
+            for row in cursor.fetchall():
+                content_hash = calculation_content_hash(
+                    row["input_text"],
+                    row["calculation_type"],
+                    row["custom_method_name"],
+                    row["result_value"],
+                )
+                if content_hash in seen:
+                    continue
+                seen.add(content_hash)
+                updates.append((content_hash, row["id"]))
+
+            conn.executemany(
+                "UPDATE calculations SET content_hash = ? WHERE id = ?", updates
+            )
+
     def _create_indices(self) -> None:
         """Create database indices for better query performance."""
-        # Calculations indices
+        # Calculations indices. Sortable columns are indexed together with the
+        # id so keyset pagination can seek straight to the next page.
         self.execute(
             """
-        CREATE INDEX IF NOT EXISTS idx_calculations_input_text ON calculations(input_text);
+        CREATE INDEX IF NOT EXISTS idx_calculations_input_text_id ON calculations(input_text, id);
+        """
+        )
+        self.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_calculations_value_id ON calculations(CAST(result_value AS INTEGER), id);
         """
         )
         self.execute(
@@ -269,20 +369,34 @@ class Database:
         )
         self.execute(
             """
-        CREATE INDEX IF NOT EXISTS idx_calculations_calculation_type ON calculations(calculation_type);
+        CREATE INDEX IF NOT EXISTS idx_calculations_calculation_type_id ON calculations(calculation_type, id);
+        """
+        )
+        self.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_calculations_favorite_id ON calculations(favorite, id);
         """
         )
         self.execute(
             """
-        CREATE INDEX IF NOT EXISTS idx_calculations_favorite ON calculations(favorite);
+        CREATE INDEX IF NOT EXISTS idx_calculations_created_at_id ON calculations(created_at, id);
         """
         )
         self.execute(
             """
-        CREATE INDEX IF NOT EXISTS idx_calculations_created_at ON calculations(created_at);
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_calculations_content_hash ON calculations(content_hash);
         """
         )
 
+        # Superseded by the (column, id) indices above
+        for index_name in (
+            "idx_calculations_input_text",
+            "idx_calculations_calculation_type",
+            "idx_calculations_favorite",
+            "idx_calculations_created_at",
+        ):
+            self.execute(f"DROP INDEX IF EXISTS {index_name}")
+
         # Tags indices
         self.execute(
             """
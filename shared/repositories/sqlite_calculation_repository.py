@@ -17,6 +17,7 @@ Dependencies:
 - gematria.models.calculation_result: For the CalculationResult data model
 - gematria.models.calculation_type: For the CalculationType data model
 - shared.repositories.database: For database connection management
+- shared.utils.calculation_hash: For duplicate detection and merging
 
 Related files:
 - gematria/models/calculation_result.py: Data model for calculation results
@@ -24,8 +25,9 @@ Related files:
 - shared/repositories/sqlite_tag_repository.py: Companion repository for tag data
 """
 
+from dataclasses import replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 from loguru import logger
 
@@ -35,18 +37,53 @@ if TYPE_CHECKING:
     from gematria.models.calculation_type import CalculationType
 
 from shared.repositories.database import Database
+from shared.utils.calculation_hash import (
+    DuplicateMergePolicy,
+    calculation_content_hash,
+    merge_duplicate_fields,
+)
+
+# Comma-separated tag IDs of the calculation aliased as "c"
+_TAG_IDS_COLUMN = (
+    "(SELECT GROUP_CONCAT(ct.tag_id) FROM calculation_tags ct "
+    "WHERE ct.calculation_id = c.id) AS tag_ids"
+)
+
+# Keyset pagination sort columns: (ORDER BY expression, expression selected as
+# the page key). Each ORDER BY expression is covered by an (expression, id)
+# index. created_at is keyed by its stored text so the timestamp converter
+# does not alter the value compared against the next page.
+_KEYSET_SORT_COLUMNS = {
+    "created_at": ("c.created_at", "CAST(c.created_at AS TEXT)"),
+    "input_text": ("c.input_text", "c.input_text"),
+    "result_value": (
+        "CAST(c.result_value AS INTEGER)",
+        "CAST(c.result_value AS INTEGER)",
+    ),
+    "calculation_type": ("c.calculation_type", "c.calculation_type"),
+    "favorite": ("c.favorite", "c.favorite"),
+}
 
 
 class SQLiteCalculationRepository:
     """Repository for managing calculation results using SQLite."""
 
-    def __init__(self, data_dir: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        tag_merge_policy: DuplicateMergePolicy = DuplicateMergePolicy.COMBINE,
+        notes_merge_policy: DuplicateMergePolicy = DuplicateMergePolicy.COMBINE,
+    ) -> None:
         """Initialize the calculation repository.
 
         Args:
             data_dir: Directory where database will be stored
+            tag_merge_policy: How tags are merged when a duplicate is saved
+            notes_merge_policy: How notes are merged when a duplicate is saved
         """
         self.db = Database(data_dir)
+        self.tag_merge_policy = tag_merge_policy
+        self.notes_merge_policy = notes_merge_policy
         logger.debug("SQLiteCalculationRepository initialized")
 
     def get_all_calculations(self) -> List["CalculationResult"]:
@@ -227,16 +264,70 @@ class SQLiteCalculationRepository:
         logger.debug(f"Calculation with ID {calculation_id} not found")
         return None
 
-    def save_calculation(self, calculation: "CalculationResult") -> bool:
+    def save_calculation(
+        self, calculation: "CalculationResult"
+    ) -> Optional["CalculationResult"]:
         """Save a calculation to the database.
 
+        If another calculation with the same content (normalized text, method
+        and value) is already stored, the new one is merged into it according
+        to the merge policies. The calculation object passed in keeps its
+        own ID and fields; the returned calculation is the merged row, with
+        the duplicate's ID.
+
         Args:
             calculation: The calculation to save
 
         Returns:
-            True if successful, False otherwise
+            The calculation as stored, or None if saving failed
         """
+        try:
+            with self.db.transaction() as conn:
+                return self._save_calculation(conn, calculation)
+        except Exception as e:
+            logger.error(f"Failed to save calculation: {e}")
+            return None
+
+    def save_calculations(self, calculations: List["CalculationResult"]) -> int:
+        """Save several calculations in a single transaction.
+
+        Duplicates, both of stored calculations and within the batch itself,
+        are merged the same way as in save_calculation. If the transaction
+        fails, the calculations are saved again one per transaction, so one
+        bad row only loses itself.
+
+        Args:
+            calculations: The calculations to save
+
+        Returns:
+            Number of calculations saved
+        """
+        try:
+            with self.db.transaction() as conn:
+                for calculation in calculations:
+                    self._save_calculation(conn, calculation)
+            return len(calculations)
+        except Exception as e:
+            logger.warning(
+                f"Failed to save {len(calculations)} calculations at once, "
+                f"saving them one by one: {e}"
+            )
+
+        return sum(1 for c in calculations if self.save_calculation(c) is not None)
+
+    def _save_calculation(
+        self, conn, calculation: "CalculationResult"
+    ) -> "CalculationResult":
+        """Insert, update or merge a calculation inside an open transaction.
 
+        Args:
+            conn: Connection with an open transaction
+            calculation: The calculation to save
+
+        Returns:
+            The calculation as stored: the one given, or a merged copy of
+            the duplicate it was folded into
+        """
         # Set timestamp if not provided
         if not calculation.timestamp:
             calculation.timestamp = datetime.now()
@@ -246,79 +337,155 @@ class SQLiteCalculationRepository:
             calculation.calculation_type
         )
 
+        content_hash = calculation_content_hash(
+            calculation.input_text,
+            calculation_type_str,
+            calculation.custom_method_name,
+            calculation.result_value,
+        )
+
+        duplicate = conn.execute(
+            "SELECT id, notes, favorite FROM calculations WHERE content_hash = ? AND id != ?",
+            (content_hash, calculation.id),
+        ).fetchone()
+
+        if duplicate:
+            return self._merge_into_duplicate(conn, calculation, duplicate)
+
         # Check if calculation exists
-        existing = self.get_calculation(calculation.id)
+        existing = conn.execute(
+            "SELECT 1 FROM calculations WHERE id = ?", (calculation.id,)
+        ).fetchone()
 
-        try:
-            with self.db.transaction() as conn:
-                if existing:
-                    # Update existing calculation
-                    query = """
-                    UPDATE calculations
-                    SET input_text = ?, calculation_type = ?, custom_method_name = ?,
-                        result_value = ?, favorite = ?, notes = ?
-                    WHERE id = ?
-                    """
-
-                    conn.execute(
-                        query,
-                        (
-                            calculation.input_text,
-                            calculation_type_str,
-                            calculation.custom_method_name,
-                            calculation.result_value,
-                            1 if calculation.favorite else 0,
-                            calculation.notes,
-                            calculation.id,
-                        ),
-                    )
-
-                    # Delete existing tag associations and re-add them
-                    conn.execute(
-                        "DELETE FROM calculation_tags WHERE calculation_id = ?",
-                        (calculation.id,),
-                    )
-
-                    logger.debug(f"Updated calculation: {calculation.id}")
-                else:
-                    # Insert new calculation
-                    query = """
-                    INSERT INTO calculations (
-                        id, input_text, calculation_type, custom_method_name,
-                        result_value, favorite, notes, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-
-                    conn.execute(
-                        query,
-                        (
-                            calculation.id,
-                            calculation.input_text,
-                            calculation_type_str,
-                            calculation.custom_method_name,
-                            calculation.result_value,
-                            1 if calculation.favorite else 0,
-                            calculation.notes,
-                            calculation.timestamp,  # Use timestamp instead of created_at
-                        ),
-                    )
-
-                    logger.debug(f"Created calculation: {calculation.id}")
-
-                # Add tag associations
-                if calculation.tags:
-                    tag_params = [
-                        (calculation.id, tag_id) for tag_id in calculation.tags
-                    ]
-                    conn.executemany(
-                        "INSERT INTO calculation_tags (calculation_id, tag_id) VALUES (?, ?)",
-                        tag_params,
-                    )
-
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save calculation: {e}")
-            return False
+        if existing:
+            # Update existing calculation
+            query = """
+            UPDATE calculations
+            SET input_text = ?, calculation_type = ?, custom_method_name = ?,
+                result_value = ?, favorite = ?, notes = ?, content_hash = ?
+            WHERE id = ?
+            """
+
+            conn.execute(
+                query,
+                (
+                    calculation.input_text,
+                    calculation_type_str,
+                    calculation.custom_method_name,
+                    calculation.result_value,
+                    1 if calculation.favorite else 0,
+                    calculation.notes,
+                    content_hash,
+                    calculation.id,
+                ),
+            )
+
+            # Delete existing tag associations and re-add them
+            conn.execute(
+                "DELETE FROM calculation_tags WHERE calculation_id = ?",
+                (calculation.id,),
+            )
+
+            logger.debug(f"Updated calculation: {calculation.id}")
+        else:
+            # Insert new calculation
+            query = """
+            INSERT INTO calculations (
+                id, input_text, calculation_type, custom_method_name,
+                result_value, favorite, notes, created_at, content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+
+            conn.execute(
+                query,
+                (
+                    calculation.id,
+                    calculation.input_text,
+                    calculation_type_str,
+                    calculation.custom_method_name,
+                    calculation.result_value,
+                    1 if calculation.favorite else 0,
+                    calculation.notes,
+                    calculation.timestamp,  # Use timestamp instead of created_at
+                    content_hash,
+                ),
+            )
+
+            logger.debug(f"Created calculation: {calculation.id}")
+
+        # Add tag associations
+        self._insert_tags(conn, calculation.id, calculation.tags)
+        return calculation
+
+    def _merge_into_duplicate(
+        self, conn, calculation: "CalculationResult", duplicate
+    ) -> "CalculationResult":
+        """Merge a calculation into the stored calculation with the same content.
+
+        The calculation passed in is left unchanged, so a batch whose
+        transaction is rolled back can be saved again as it was.
+
+        Args:
+            conn: Connection with an open transaction
+            calculation: The calculation being saved
+            duplicate: Row (id, notes, favorite) of the stored duplicate
+
+        Returns:
+            A copy of the calculation carrying the merged row's ID and fields
+        """
+        duplicate_id = duplicate[0]
+        existing_tags = [
+            row[0]
+            for row in conn.execute(
+                "SELECT tag_id FROM calculation_tags WHERE calculation_id = ?",
+                (duplicate_id,),
+            ).fetchall()
+        ]
+
+        tags, notes = merge_duplicate_fields(
+            existing_tags,
+            duplicate[1],
+            calculation.tags or [],
+            calculation.notes,
+            self.tag_merge_policy,
+            self.notes_merge_policy,
+        )
+        favorite = bool(duplicate[2]) or calculation.favorite
+
+        conn.execute(
+            "UPDATE calculations SET notes = ?, favorite = ? WHERE id = ?",
+            (notes, 1 if favorite else 0, duplicate_id),
+        )
+        conn.execute(
+            "DELETE FROM calculation_tags WHERE calculation_id = ?", (duplicate_id,)
+        )
+        self._insert_tags(conn, duplicate_id, tags)
+
+        # An edited calculation that now matches another one is folded into it
+        conn.execute("DELETE FROM calculations WHERE id = ?", (calculation.id,))
+
+        logger.debug(
+            f"Merged calculation {calculation.id} into duplicate {duplicate_id}"
+        )
+
+        return replace(
+            calculation, id=duplicate_id, tags=tags, notes=notes, favorite=favorite
+        )
+
+    def _insert_tags(self, conn, calculation_id: str, tag_ids: List[str]) -> None:
+        """Associate tags with a calculation.
+
+        Args:
+            conn: Connection with an open transaction
+            calculation_id: ID of the calculation
+            tag_ids: IDs of the tags to associate
+        """
+        if tag_ids:
+            tag_params = [(calculation_id, tag_id) for tag_id in tag_ids]
+            conn.executemany(
+                "INSERT OR IGNORE INTO calculation_tags (calculation_id, tag_id) VALUES (?, ?)",
+                tag_params,
+            )
 
     def delete_calculation(self, calculation_id: str) -> bool:
         """Delete a calculation by ID.
@@ -520,22 +687,127 @@ class SQLiteCalculationRepository:
         Returns:
             List of calculation results matching the criteria
         """
-        # Build query parts
-        select = """
-        SELECT c.*, GROUP_CONCAT(ct.tag_id) as tag_ids
+        where, params = self._build_search_filters(criteria)
+
+        # Add limit if specified
+        limit_clause = ""
+        if "limit" in criteria and isinstance(criteria["limit"], int):
+            limit_clause = f"LIMIT {criteria['limit']}"
+
+        query = f"""
+        SELECT c.*, {_TAG_IDS_COLUMN}
         FROM calculations c
+        {where}
+        ORDER BY c.created_at DESC
+        {limit_clause}
         """
 
-        # Tags join clause depends on criteria
-        if criteria.get("tag_id") or criteria.get("has_tags"):
-            join = "JOIN calculation_tags ct ON c.id = ct.calculation_id"
-        else:
-            join = "LEFT JOIN calculation_tags ct ON c.id = ct.calculation_id"
+        rows = self.db.query_all(query, tuple(params))
+        return [self._row_to_calculation(row) for row in rows]
+
+    def count_matching_calculations(self, criteria: Dict[str, Any]) -> int:
+        """Count the calculations matching the search criteria.
+
+        Args:
+            criteria: Search criteria as accepted by search_calculations
+
+        Returns:
+            Number of matching calculations
+        """
+        where, params = self._build_search_filters(criteria)
+        row = self.db.query_one(
+            f"SELECT COUNT(*) AS total FROM calculations c {where}", tuple(params)
+        )
+        return row["total"] if row else 0
+
+    def get_calculations_after(
+        self,
+        criteria: Dict[str, Any],
+        sort_by: str = "created_at",
+        descending: bool = True,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: int = 200,
+    ) -> Tuple[List["CalculationResult"], Optional[Tuple[Any, str]]]:
+        """Get one page of matching calculations using keyset pagination.
+
+        Rows are ordered by the sort column and then by ID. Instead of an
+        OFFSET, the next page starts right after the key of the last row of
+        the previous page, so every page costs the same regardless of how
+        deep into the result set it is.
+
+        Args:
+            criteria: Search criteria as accepted by search_calculations
+            sort_by: Column to sort by (created_at, input_text, result_value,
+                calculation_type or favorite)
+            descending: Whether to sort in descending order
+            after: Key of the last row of the previous page, or None for the first page
+            limit: Maximum number of rows to return
 
+        Returns:
+            Tuple of (calculations, key of the last returned row)
+        """
+        sort_expression, key_expression = _KEYSET_SORT_COLUMNS.get(
+            sort_by, _KEYSET_SORT_COLUMNS["created_at"]
+        )
+        direction = "DESC" if descending else "ASC"
+
+        where, params = self._build_search_filters(criteria)
+        if after is not None:
+            # Written out instead of as a row value so that expression indices
+            # (such as the numeric value index) can still seek to the key
+            comparison = "<" if descending else ">"
+            keyset = (
+                f"{sort_expression} {comparison}= ? AND "
+                f"({sort_expression} {comparison} ? OR c.id {comparison} ?)"
+            )
+            where = f"{where} AND {keyset}" if where else f"WHERE {keyset}"
+            params.extend([after[0], after[0], after[1]])
+
+        query = f"""
+        SELECT c.*, {_TAG_IDS_COLUMN}, {key_expression} AS sort_key
+        FROM calculations c
+        {where}
+        ORDER BY {sort_expression} {direction}, c.id {direction}
+        LIMIT ?
+        """
+        params.append(limit)
+
+        rows = self.db.query_all(query, tuple(params))
+        if not rows:
+            return [], after
+
+        last_key = (rows[-1]["sort_key"], rows[-1]["id"])
+        return [self._row_to_calculation(row) for row in rows], last_key
+
+    def get_distinct_calculation_types(self) -> List[str]:
+        """Get the distinct calculation types used by saved calculations.
+
+        Returns:
+            List of calculation types as stored in the database
+        """
+        rows = self.db.query_all(
+            "SELECT DISTINCT calculation_type FROM calculations ORDER BY calculation_type"
+        )
+        return [row["calculation_type"] for row in rows]
+
+    def _build_search_filters(
+        self, criteria: Dict[str, Any]
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause for a set of search criteria.
+
+        Tag criteria are expressed as EXISTS subqueries on the calculation
+        alias ``c``, so the clause can be combined with any ordering or
+        pagination without grouping.
+
+        Args:
+            criteria: Search criteria as accepted by search_calculations
+
+        Returns:
+            Tuple of (WHERE clause or empty string, query parameters)
+        """
         where_clauses = []
-        params = []
+        params: List[Any] = []
 
-        # Add criteria to WHERE clause
         if "input_text" in criteria:
             where_clauses.append("c.input_text = ?")
             params.append(criteria["input_text"])
@@ -557,13 +829,10 @@ class SQLiteCalculationRepository:
             params.append(criteria["result_value_max"])
 
         if "calculation_type" in criteria:
-            calc_type = criteria["calculation_type"]
-            if isinstance(calc_type, "CalculationType"):
-                where_clauses.append("c.calculation_type = ?")
-                params.append(self._calculation_type_to_str(calc_type))
-            else:
-                where_clauses.append("c.calculation_type = ?")
-                params.append(str(calc_type))
+            where_clauses.append("c.calculation_type = ?")
+            params.append(
+                str(self._calculation_type_to_str(criteria["calculation_type"]))
+            )
 
         if "custom_method_name" in criteria:
             where_clauses.append("c.custom_method_name = ?")
@@ -571,8 +840,8 @@ class SQLiteCalculationRepository:
 
         # Language filtering - filter by calculation types that belong to the specified language
         if "language" in criteria:
-            from gematria.models.calculation_type import CalculationType, Language
-            
+            from gematria.models.calculation_type import Language
+
             target_language = criteria["language"]
             if isinstance(target_language, Language):
                 # Since calculation types are stored as tuple strings, we need to check if the language
@@ -582,13 +851,23 @@ class SQLiteCalculationRepository:
                 params.append(f"%{language_str}%")
 
         if criteria.get("favorite"):
-            where_clauses.append("c.favorite = 1")
+            # The unary plus keeps this low-selectivity filter from displacing
+            # the sort index, which lets paged queries stop early
+            where_clauses.append("+c.favorite = 1")
 
         if criteria.get("has_notes"):
             where_clauses.append("c.notes IS NOT NULL AND c.notes != ''")
 
+        if criteria.get("has_tags"):
+            where_clauses.append(
+                "EXISTS (SELECT 1 FROM calculation_tags ct WHERE ct.calculation_id = c.id)"
+            )
+
         if "tag_id" in criteria:
-            where_clauses.append("ct.tag_id = ?")
+            where_clauses.append(
+                "EXISTS (SELECT 1 FROM calculation_tags ct "
+                "WHERE ct.calculation_id = c.id AND ct.tag_id = ?)"
+            )
             params.append(criteria["tag_id"])
 
         if "created_after" in criteria:
@@ -599,24 +878,8 @@ class SQLiteCalculationRepository:
             where_clauses.append("c.created_at <= ?")
             params.append(criteria["created_before"])
 
-        # Construct WHERE clause
         where = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
-
-        # Group by and order by
-        group_by = "GROUP BY c.id"
-        order_by = "ORDER BY c.created_at DESC"
-
-        # Add limit if specified
-        limit_clause = ""
-        if "limit" in criteria and isinstance(criteria["limit"], int):
-            limit_clause = f"LIMIT {criteria['limit']}"
-
-        # Construct full query
-        query = f"{select}\n{join}\n{where}\n{group_by}\n{order_by}\n{limit_clause}"
-
-        # Execute query
-        rows = self.db.query_all(query, tuple(params))
-        return [self._row_to_calculation(row) for row in rows]
+        return where, params
 
     def _row_to_calculation(self, row: Dict[str, Any]) -> "CalculationResult":
         """Convert a database row to a CalculationResult object.
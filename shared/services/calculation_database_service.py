@@ -140,14 +140,18 @@ class CalculationDatabaseService:
         """
         return self.calculation_repo.get_calculation(calculation_id)
 
-    def save_calculation(self, calculation: CalculationResult) -> bool:
+    def save_calculation(
+        self, calculation: CalculationResult
+    ) -> Optional[CalculationResult]:
         """Save a calculation result.
 
         Args:
             calculation: CalculationResult instance to save
 
         Returns:
-            True if successful, False otherwise
+            The calculation as stored, which is a merged copy with another ID
+            if an equal calculation was already stored, or None if saving
+            failed
         """
         return self.calculation_repo.save_calculation(calculation)
 
@@ -184,7 +188,7 @@ class CalculationDatabaseService:
 
         if tag_id not in calculation.tags:
             calculation.tags.append(tag_id)
-            return self.save_calculation(calculation)
+            return self.save_calculation(calculation) is not None
 
         return True  # Tag already exists on the calculation
 
@@ -205,7 +209,7 @@ class CalculationDatabaseService:
 
         if tag_id in calculation.tags:
             calculation.tags.remove(tag_id)
-            return self.save_calculation(calculation)
+            return self.save_calculation(calculation) is not None
 
         return True  # Tag was not on the calculation
 
@@ -224,7 +228,7 @@ class CalculationDatabaseService:
             return False
 
         calculation.favorite = not calculation.favorite
-        return self.save_calculation(calculation)
+        return self.save_calculation(calculation) is not None
 
     def update_calculation_notes(self, calculation_id: str, notes: str) -> bool:
         """Update the notes for a calculation.
@@ -242,7 +246,7 @@ class CalculationDatabaseService:
             return False
 
         calculation.notes = notes
-        return self.save_calculation(calculation)
+        return self.save_calculation(calculation) is not None
 
     # ===== Search Methods =====
 
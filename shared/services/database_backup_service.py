@@ -0,0 +1,263 @@
+"""
+Purpose: Provides consistent online backups of the SQLite database
+
+This file is part of the shared services layer and is responsible for creating,
+rotating and restoring database backups. Backups are taken through the SQLite
+online backup API, which copies a transactionally consistent snapshot of the
+database (including any pages still sitting in the WAL file) while the
+application keeps using it.
+
+Key components:
+- DatabaseBackupService: Creates paged, throttled backups with optional
+  compression and keeps the number of stored backups bounded
+
+Dependencies:
+- sqlite3: For the online backup API
+- gzip: For optional backup compression
+- shared.repositories.database: For locating the live database file
+
+Related files:
+- shared/ui/dialogs/database_maintenance_window.py: Runs backups in a worker thread
+- shared/utils/config.py: Provides the default number of backups to keep
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from loguru import logger
+
+from shared.repositories.database import Database
+
+# Name of the database file inside a backup directory
+BACKUP_DB_NAME = "isopgem.db"
+
+# Prefix used for backup directories inside the data directory
+BACKUP_DIR_PREFIX = "backup_"
+
+# Progress callback signature: (pages_copied, total_pages)
+ProgressCallback = Callable[[int, int], None]
+
+
+class _BackupCancelled(Exception):
+    """Raised from the backup progress hook to abort a running backup."""
+
+
+class DatabaseBackupService:
+    """Service for online backup, rotation and restore of the SQLite database."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        backup_root: Optional[str] = None,
+        pages_per_step: int = 256,
+        step_delay: float = 0.005,
+    ):
+        """Initialize the backup service.
+
+        Args:
+            db_path: Path of the database to back up (defaults to the shared database)
+            backup_root: Directory holding backup folders (defaults to the data directory)
+            pages_per_step: Number of pages copied per backup step
+            step_delay: Seconds to sleep between steps so interactive queries
+                can acquire the database in the meantime
+        """
+        if db_path is None:
+            db_path = Database.get_instance().get_database_path()
+
+        self.db_path = Path(db_path)
+        self.backup_root = Path(backup_root) if backup_root else self.db_path.parent
+        self.pages_per_step = max(1, pages_per_step)
+        self.step_delay = max(0.0, step_delay)
+
+    def create_backup(
+        self,
+        compress: bool = False,
+        max_backups: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Path]:
+        """Create a consistent backup of the live database.
+
+        The backup is copied a few pages at a time from a dedicated read
+        connection, so it never blocks the connections used by the UI for more
+        than a single step.
+
+        Args:
+            compress: Whether to gzip the finished backup
+            max_backups: Number of backups to keep after this one is written
+                (None keeps everything)
+            progress_callback: Called with (pages_copied, total_pages) after each step
+            is_cancelled: Polled after each step; returning True aborts the backup
+
+        Returns:
+            Path of the backup directory, or None if the backup failed or was cancelled
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_dir = self.backup_root / f"{BACKUP_DIR_PREFIX}{timestamp}"
+        suffix = 1
+        while backup_dir.exists():
+            backup_dir = self.backup_root / f"{BACKUP_DIR_PREFIX}{timestamp}_{suffix}"
+            suffix += 1
+
+        partial_file = backup_dir / f"{BACKUP_DB_NAME}.partial"
+
+        def on_progress(status: int, remaining: int, total: int) -> None:
+            if progress_callback:
+                progress_callback(total - remaining, total)
+            if is_cancelled and is_cancelled():
+                raise _BackupCancelled()
+            if remaining and self.step_delay:
+                # Yield the database to interactive queries between steps
+                time.sleep(self.step_delay)
+
+        try:
+            os.makedirs(backup_dir, exist_ok=True)
+
+            source = sqlite3.connect(self.db_path)
+            target = sqlite3.connect(partial_file)
+            try:
+                source.backup(target, pages=self.pages_per_step, progress=on_progress)
+            finally:
+                target.close()
+                source.close()
+
+            if compress:
+                final_file = backup_dir / f"{BACKUP_DB_NAME}.gz"
+                with (
+                    open(partial_file, "rb") as src,
+                    gzip.open(final_file, "wb") as dst,
+                ):
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                partial_file.unlink()
+            else:
+                final_file = backup_dir / BACKUP_DB_NAME
+                os.replace(partial_file, final_file)
+
+            logger.info(f"Database backed up to {final_file}")
+
+        except _BackupCancelled:
+            logger.info("Database backup cancelled")
+            shutil.rmtree(backup_dir, ignore_errors=True)
+            return None
+        except Exception as e:
+            logger.error(f"Error backing up database: {e}")
+            shutil.rmtree(backup_dir, ignore_errors=True)
+            return None
+
+        if max_backups is not None:
+            self.rotate_backups(max_backups)
+
+        return backup_dir
+
+    def list_backups(self) -> List[Path]:
+        """List the available backup directories, newest first.
+
+        Returns:
+            List of backup directory paths
+        """
+        if not self.backup_root.exists():
+            return []
+
+        backups = [
+            d
+            for d in self.backup_root.iterdir()
+            if d.is_dir()
+            and d.name.startswith(BACKUP_DIR_PREFIX)
+            and self.get_backup_file(d) is not None
+        ]
+        backups.sort(key=lambda d: d.name, reverse=True)
+        return backups
+
+    def get_backup_file(self, backup_dir: Path) -> Optional[Path]:
+        """Get the database file stored in a backup directory.
+
+        Args:
+            backup_dir: Backup directory to inspect
+
+        Returns:
+            Path of the plain or compressed backup file, or None if missing
+        """
+        for name in (BACKUP_DB_NAME, f"{BACKUP_DB_NAME}.gz"):
+            candidate = backup_dir / name
+            if candidate.exists():
+                return candidate
+        return None
+
+    def rotate_backups(self, max_backups: int) -> List[Path]:
+        """Delete the oldest backups so that at most max_backups remain.
+
+        Args:
+            max_backups: Number of backups to keep
+
+        Returns:
+            List of backup directories that were removed
+        """
+        removed: List[Path] = []
+        for backup_dir in self.list_backups()[max(0, max_backups) :]:
+            try:
+                shutil.rmtree(backup_dir)
+                removed.append(backup_dir)
+                logger.debug(f"Removed old backup {backup_dir}")
+            except OSError as e:
+                logger.error(f"Error removing old backup {backup_dir}: {e}")
+        return removed
+
+    def restore_backup(
+        self,
+        backup_dir: Path,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> bool:
+        """Restore the live database from a backup.
+
+        The backup is copied into the live database through the backup API,
+        so the WAL file and any open connections stay consistent.
+
+        Args:
+            backup_dir: Backup directory to restore from
+            progress_callback: Called with (pages_copied, total_pages) after each step
+
+        Returns:
+            True if the restore succeeded, False otherwise
+        """
+        backup_file = self.get_backup_file(backup_dir)
+        if backup_file is None:
+            logger.error(f"No database file found in backup {backup_dir}")
+            return False
+
+        temp_file: Optional[Path] = None
+        try:
+            if backup_file.suffix == ".gz":
+                temp_file = backup_dir / f"{BACKUP_DB_NAME}.restore"
+                with gzip.open(backup_file, "rb") as src, open(temp_file, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                source_path = temp_file
+            else:
+                source_path = backup_file
+
+            def on_progress(status: int, remaining: int, total: int) -> None:
+                if progress_callback:
+                    progress_callback(total - remaining, total)
+
+            source = sqlite3.connect(source_path)
+            target = sqlite3.connect(self.db_path)
+            try:
+                source.backup(target, pages=self.pages_per_step, progress=on_progress)
+            finally:
+                target.close()
+                source.close()
+
+            logger.info(f"Database restored from {backup_file}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error restoring database from {backup_dir}: {e}")
+            return False
+        finally:
+            if temp_file is not None and temp_file.exists():
+                temp_file.unlink()
@@ -0,0 +1,363 @@
+"""
+Purpose: Provides interruptible maintenance jobs for the SQLite database
+
+This file is part of the shared services layer and is responsible for routine
+database upkeep: reclaiming free pages with incremental vacuum, refreshing
+query planner statistics, checking integrity and detecting duplicate
+calculations. Every job runs on its own connection, reports progress, and can
+be cancelled or bounded by a time budget, so it can be driven from a worker
+thread while the rest of the application keeps using the database.
+
+Key components:
+- DatabaseMaintenanceService: Service exposing the individual maintenance jobs
+
+Dependencies:
+- sqlite3: For database access and progress handlers
+- shared.utils.calculation_hash: For duplicate detection keys
+- shared.repositories.database: For locating the live database file
+
+Related files:
+- shared/ui/dialogs/database_maintenance_window.py: Runs these jobs in worker threads
+- shared/services/database_backup_service.py: Companion service for backups
+"""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from shared.repositories.database import Database
+from shared.utils.calculation_hash import calculation_content_hash
+
+# Progress callback signature: (done, total)
+ProgressCallback = Callable[[int, int], None]
+
+# Number of SQLite VM instructions between cancellation checks
+_PROGRESS_HANDLER_INTERVAL = 10000
+
+# Values reported by PRAGMA auto_vacuum
+AUTO_VACUUM_NONE = 0
+AUTO_VACUUM_FULL = 1
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class DatabaseMaintenanceService:
+    """Service for background-friendly database maintenance jobs."""
+
+    def __init__(self, db_path: Optional[str] = None, busy_timeout: float = 5.0):
+        """Initialize the maintenance service.
+
+        Args:
+            db_path: Path of the database to maintain (defaults to the shared database)
+            busy_timeout: Seconds to wait for locks held by other connections
+        """
+        if db_path is None:
+            db_path = Database.get_instance().get_database_path()
+
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+
+    @contextmanager
+    def _connect(
+        self,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        time_budget: Optional[float] = None,
+    ) -> Iterator[sqlite3.Connection]:
+        """Open a dedicated connection that aborts when cancelled or out of time.
+
+        Args:
+            is_cancelled: Polled while statements run; returning True interrupts them
+            time_budget: Seconds after which running statements are interrupted
+
+        Yields:
+            SQLite connection in autocommit mode
+        """
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.busy_timeout, isolation_level=None
+        )
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        deadline = time.monotonic() + time_budget if time_budget else None
+
+        def should_abort() -> int:
+            if is_cancelled and is_cancelled():
+                return 1
+            if deadline is not None and time.monotonic() > deadline:
+                return 1
+            return 0
+
+        if is_cancelled or deadline is not None:
+            conn.set_progress_handler(should_abort, _PROGRESS_HANDLER_INTERVAL)
+
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get_storage_info(self) -> Dict[str, int]:
+        """Get page-level storage information for the database.
+
+        Returns:
+            Dictionary with page_size, page_count, freelist_count and auto_vacuum
+        """
+        with self._connect() as conn:
+            return {
+                "page_size": conn.execute("PRAGMA page_size").fetchone()[0],
+                "page_count": conn.execute("PRAGMA page_count").fetchone()[0],
+                "freelist_count": conn.execute("PRAGMA freelist_count").fetchone()[0],
+                "auto_vacuum": conn.execute("PRAGMA auto_vacuum").fetchone()[0],
+            }
+
+    def enable_incremental_vacuum(
+        self, is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """Switch the database to incremental auto-vacuum.
+
+        Changing the auto-vacuum mode of an existing database requires one full
+        VACUUM. This only has to be done once; afterwards free pages can be
+        reclaimed with incremental_vacuum without rebuilding the file.
+
+        Args:
+            is_cancelled: Polled while the VACUUM runs; returning True aborts it
+
+        Returns:
+            True if the database now uses incremental auto-vacuum, False if
+            the VACUUM was cancelled or left the mode unchanged
+
+        Raises:
+            sqlite3.OperationalError: If the VACUUM failed for another reason,
+                such as a lock held by another connection
+        """
+        try:
+            with self._connect(is_cancelled) as conn:
+                mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+                if mode == AUTO_VACUUM_INCREMENTAL:
+                    return True
+
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+
+                mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+                logger.info("Database switched to incremental auto-vacuum")
+                return mode == AUTO_VACUUM_INCREMENTAL
+        except sqlite3.OperationalError as e:
+            if is_cancelled is not None and is_cancelled():
+                logger.info(f"Enabling incremental vacuum cancelled: {e}")
+                return False
+            logger.error(f"Enabling incremental vacuum failed: {e}")
+            raise
+
+    def incremental_vacuum(
+        self,
+        pages_per_step: int = 500,
+        progress_callback: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Reclaim free pages a few at a time.
+
+        Each step is a short write transaction, so other connections can
+        interleave their work between steps.
+
+        Args:
+            pages_per_step: Number of free pages released per step
+            progress_callback: Called with (pages_freed, pages_to_free) after each step
+            is_cancelled: Polled between steps; returning True stops the job
+            time_budget: Seconds after which the job stops
+
+        Returns:
+            Dictionary with pages_freed, remaining and completed
+        """
+        deadline = time.monotonic() + time_budget if time_budget else None
+
+        with self._connect() as conn:
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            initial = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+            if mode != AUTO_VACUUM_INCREMENTAL:
+                logger.warning(
+                    "Incremental vacuum requested but auto_vacuum is not INCREMENTAL"
+                )
+                return {"pages_freed": 0, "remaining": initial, "completed": False}
+
+            remaining = initial
+            while remaining > 0:
+                if is_cancelled and is_cancelled():
+                    break
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+
+                # incremental_vacuum only frees pages while its rows are stepped
+                conn.execute(
+                    f"PRAGMA incremental_vacuum({int(pages_per_step)})"
+                ).fetchall()
+                remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+                if progress_callback:
+                    progress_callback(initial - remaining, initial)
+
+        return {
+            "pages_freed": initial - remaining,
+            "remaining": remaining,
+            "completed": remaining == 0,
+        }
+
+    def optimize(
+        self,
+        full_analyze: bool = False,
+        analysis_limit: int = 1000,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        time_budget: Optional[float] = None,
+    ) -> bool:
+        """Refresh query planner statistics.
+
+        By default this runs PRAGMA optimize with a bounded analysis limit,
+        which only re-analyzes tables whose statistics are stale and samples
+        at most analysis_limit rows per index.
+
+        Args:
+            full_analyze: Run a complete ANALYZE instead of PRAGMA optimize
+            analysis_limit: Approximate number of rows sampled per index
+            is_cancelled: Polled while statements run; returning True aborts them
+            time_budget: Seconds after which the job is interrupted
+
+        Returns:
+            True if the statistics were refreshed, False if interrupted
+        """
+        try:
+            with self._connect(is_cancelled, time_budget) as conn:
+                if full_analyze:
+                    conn.execute("ANALYZE")
+                else:
+                    conn.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+                    conn.execute("PRAGMA optimize")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Database optimize stopped: {e}")
+            return False
+
+    def quick_check(
+        self,
+        max_errors: int = 100,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run PRAGMA quick_check.
+
+        Args:
+            max_errors: Maximum number of problems to report
+            is_cancelled: Polled while the check runs; returning True aborts it
+            time_budget: Seconds after which the check is interrupted
+
+        Returns:
+            Dictionary with ok, completed and a list of messages
+        """
+        try:
+            with self._connect(is_cancelled, time_budget) as conn:
+                rows = conn.execute(f"PRAGMA quick_check({int(max_errors)})").fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Database quick check stopped: {e}")
+            return {"ok": False, "completed": False, "messages": [str(e)]}
+
+        messages = [row[0] for row in rows]
+        return {"ok": messages == ["ok"], "completed": True, "messages": messages}
+
+    def iter_duplicate_calculations(
+        self,
+        batch_size: int = 2000,
+        progress_callback: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """Stream duplicate calculations as they are found.
+
+        Rows are read newest first in batches and compared by content hash
+        (normalized text, method and value); the first row seen for each hash
+        is kept and every later row with the same hash is reported. This also
+        catches legacy duplicates that predate the unique content_hash index.
+
+        Args:
+            batch_size: Number of rows fetched per batch
+            progress_callback: Called with (rows_scanned, total_rows) after each batch
+            is_cancelled: Polled between batches; returning True stops the scan
+
+        Yields:
+            Tuples of (duplicate_id, kept_id)
+        """
+        seen: Dict[str, str] = {}
+
+        with self._connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM calculations").fetchone()[0]
+            cursor = conn.execute(
+                """
+                SELECT id, input_text, calculation_type, custom_method_name,
+                       result_value
+                FROM calculations
+                ORDER BY created_at DESC
+                """
+            )
+
+            scanned = 0
+            while True:
+                if is_cancelled and is_cancelled():
+                    return
+
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                for calculation_id, text, calc_type, method, value in rows:
+                    key = calculation_content_hash(text, calc_type, method, value)
+                    kept_id = seen.setdefault(key, calculation_id)
+                    if kept_id != calculation_id:
+                        yield calculation_id, kept_id
+
+                scanned += len(rows)
+                if progress_callback:
+                    progress_callback(scanned, total)
+
+    def delete_calculations(
+        self,
+        calculation_ids: List[str],
+        batch_size: int = 500,
+        progress_callback: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """Delete calculations in short batched transactions.
+
+        Args:
+            calculation_ids: IDs of the calculations to delete
+            batch_size: Number of rows deleted per transaction
+            progress_callback: Called with (processed, total) after each batch
+            is_cancelled: Polled between batches; returning True stops the job
+
+        Returns:
+            Number of calculations deleted
+        """
+        deleted = 0
+        total = len(calculation_ids)
+
+        with self._connect() as conn:
+            for start in range(0, total, batch_size):
+                if is_cancelled and is_cancelled():
+                    break
+
+                batch = calculation_ids[start : start + batch_size]
+                placeholders = ",".join("?" * len(batch))
+                conn.execute("BEGIN")
+                try:
+                    cursor = conn.execute(
+                        f"DELETE FROM calculations WHERE id IN ({placeholders})", batch
+                    )
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                deleted += cursor.rowcount
+
+                if progress_callback:
+                    progress_callback(min(start + batch_size, total), total)
+
+        logger.info(f"Deleted {deleted} calculations during maintenance")
+        return deleted
@@ -0,0 +1,225 @@
+"""
+Purpose: Runs database queries off the GUI thread with cancellation
+
+This file is part of the shared services layer and is responsible for keeping
+searches responsive. Queries submitted by a panel run on a dedicated worker
+thread, which opens its own SQLite connections. Submitting a new query
+supersedes the previous one: a query that has not started yet is dropped, and
+one that is running is aborted with sqlite3.Connection.interrupt(). Results
+arrive through Qt signals, and results of superseded queries are discarded,
+so the GUI thread never waits on the database while the user types.
+
+Key components:
+- QueryWorker: Worker thread that runs the newest submitted query
+- QueryExecutor: Per-panel front end delivering the latest result via signals
+
+Dependencies:
+- PyQt6: For the worker thread and signals
+- shared.repositories.database: For tracking the connections a query uses
+
+Related files:
+- shared/repositories/database.py: Provides interruptible_queries/track_connection
+- gematria/ui/models/calculation_table_model.py: Loads result pages through it
+- document_manager/ui/panels/document_browser_panel.py: Document search
+- document_manager/ui/panels/concordance_panel.py: Concordance entry search
+"""
+
+import sqlite3
+import threading
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
+
+from loguru import logger
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, pyqtSignal
+
+from shared.repositories.database import interruptible_queries
+
+# A query is a callable running repository calls and returning their result
+Query = Callable[[], Any]
+
+
+class QueryWorker(QThread):
+    """Worker thread that runs only the newest submitted query.
+
+    The thread stays alive between queries. Submitting a query replaces any
+    query still waiting and interrupts the one currently running.
+    """
+
+    query_finished = pyqtSignal(int, object)  # request id, result
+    query_failed = pyqtSignal(int, str)  # request id, error message
+
+    def __init__(self, parent=None):
+        """Initialize the worker.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[int, Query]] = None
+        self._running_id: Optional[int] = None
+        self._connections: List[sqlite3.Connection] = []
+        self._stopping = False
+
+    def submit(self, request_id: int, query: Query) -> None:
+        """Queue a query, superseding the waiting and the running one.
+
+        Args:
+            request_id: Identifier reported back with the result
+            query: Callable performing the repository calls
+        """
+        with self._condition:
+            self._pending = (request_id, query)
+            self._interrupt_running()
+            self._condition.notify()
+
+    def cancel(self) -> None:
+        """Drop the waiting query and interrupt the running one."""
+        with self._condition:
+            self._pending = None
+            self._interrupt_running()
+
+    def stop(self) -> None:
+        """Cancel all work and let the thread finish."""
+        with self._condition:
+            self._stopping = True
+            self._pending = None
+            self._interrupt_running()
+            self._condition.notify()
+
+    def run(self):
+        """Run queries until stopped."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                request_id, query = self._pending
+                self._pending = None
+                self._running_id = request_id
+
+            try:
+                with interruptible_queries() as connections:
+                    with self._condition:
+                        self._connections = connections
+                    result = query()
+            except Exception as e:
+                # Interrupted queries fail with "interrupted"; they are stale anyway
+                self.query_failed.emit(request_id, str(e))
+            else:
+                self.query_finished.emit(request_id, result)
+            finally:
+                with self._condition:
+                    self._running_id = None
+                    self._connections = []
+
+    def _interrupt_running(self) -> None:
+        """Abort the statements of the running query (caller holds the lock)."""
+        if self._running_id is None:
+            return
+
+        for conn in list(self._connections):
+            try:
+                conn.interrupt()
+            except sqlite3.ProgrammingError:
+                # The repository already closed this connection
+                pass
+
+
+def _stop_worker(worker: QueryWorker) -> None:
+    """Stop a worker and wait for its thread to finish.
+
+    Args:
+        worker: The worker to stop
+    """
+    worker.stop()
+    worker.wait()
+
+
+class QueryExecutor(QObject):
+    """Runs a panel's queries in the background, keeping only the latest.
+
+    Each panel owns one executor. result_ready is only emitted for the most
+    recently submitted query; results of superseded queries are dropped.
+    """
+
+    result_ready = pyqtSignal(object)  # result of the latest query
+    query_failed = pyqtSignal(str)  # error message of the latest query
+    busy_changed = pyqtSignal(bool)  # True while a query is outstanding
+
+    def __init__(self, parent=None):
+        """Initialize the executor and start its worker thread.
+
+        Args:
+            parent: Parent object; the worker stops when it is destroyed
+        """
+        super().__init__(parent)
+        self._latest_id = 0
+        self._busy = False
+
+        self._worker = QueryWorker(self)
+        self._worker.query_finished.connect(self._on_query_finished)
+        self._worker.query_failed.connect(self._on_query_failed)
+        self._worker.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        self.destroyed.connect(partial(_stop_worker, self._worker))
+
+    def submit(self, query: Query) -> int:
+        """Run a query, cancelling the previously submitted one.
+
+        Args:
+            query: Callable performing the repository calls; it runs on the
+                worker thread and must not touch widgets
+
+        Returns:
+            Identifier of the submitted query
+        """
+        self._latest_id += 1
+        self._worker.submit(self._latest_id, query)
+        self._set_busy(True)
+        return self._latest_id
+
+    def cancel(self) -> None:
+        """Cancel the outstanding query without starting a new one."""
+        self._latest_id += 1
+        self._worker.cancel()
+        self._set_busy(False)
+
+    def is_busy(self) -> bool:
+        """Check whether a query is outstanding.
+
+        Returns:
+            True if the latest query has not delivered its result yet
+        """
+        return self._busy
+
+    def shutdown(self) -> None:
+        """Cancel outstanding work and stop the worker thread."""
+        self.cancel()
+        if self._worker.isRunning():
+            _stop_worker(self._worker)
+
+    def _on_query_finished(self, request_id: int, result: Any) -> None:
+        """Deliver the result of the latest query."""
+        if request_id != self._latest_id:
+            return
+        self._set_busy(False)
+        self.result_ready.emit(result)
+
+    def _on_query_failed(self, request_id: int, message: str) -> None:
+        """Report the failure of the latest query."""
+        if request_id != self._latest_id:
+            return
+        logger.error(f"Background query failed: {message}")
+        self._set_busy(False)
+        self.query_failed.emit(message)
+
+    def _set_busy(self, busy: bool) -> None:
+        """Update the busy state, emitting busy_changed on change."""
+        if busy != self._busy:
+            self._busy = busy
+            self.busy_changed.emit(busy)
@@ -12,26 +12,132 @@ Dependencies:
 - PyQt6: For building the graphical user interface
 - gematria.services.calculation_database_service: For accessing the database
 - shared.repositories: For direct repository operations
+- shared.services.database_backup_service: For online backup and restore
+- shared.services.database_maintenance_service: For vacuum, analyze and checks
 """
 
 import os
-import shutil
-from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 from loguru import logger
+from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QMessageBox,
     QProgressBar,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
 from gematria.services.calculation_database_service import CalculationDatabaseService
+from shared.services.database_backup_service import DatabaseBackupService
+from shared.services.database_maintenance_service import (
+    AUTO_VACUUM_INCREMENTAL,
+    DatabaseMaintenanceService,
+)
+from shared.utils.config import get_config
+
+# Seconds a single optimize run may spend before it is interrupted
+OPTIMIZE_TIME_BUDGET = 60.0
+
+
+class MaintenanceWorker(QThread):
+    """Worker thread running a single database maintenance job.
+
+    The job is a callable taking (progress_callback, is_cancelled) and
+    returning the job result.
+    """
+
+    progress_updated = pyqtSignal(int, int)  # done, total
+    job_completed = pyqtSignal(object)  # job result
+    error_occurred = pyqtSignal(str)  # error message
+
+    def __init__(
+        self, job: Callable[[Callable[[int, int], None], Callable[[], bool]], Any]
+    ):
+        super().__init__()
+        self.job = job
+        self._cancelled = False
+
+    def cancel(self):
+        """Request cancellation of the running job."""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation was requested."""
+        return self._cancelled
+
+    def run(self):
+        """Run the maintenance job."""
+        try:
+            result = self.job(self.progress_updated.emit, self.is_cancelled)
+            self.job_completed.emit(result)
+        except Exception as e:
+            logger.error(f"Maintenance job failed: {e}")
+            self.error_occurred.emit(str(e))
+
+
+class BackupWorker(QThread):
+    """Worker thread for online database backups."""
+
+    progress_updated = pyqtSignal(int, int)  # pages copied, total pages
+    backup_completed = pyqtSignal(str)  # backup directory ("" if none was made)
+
+    def __init__(
+        self,
+        backup_service: DatabaseBackupService,
+        compress: bool,
+        max_backups: Optional[int],
+    ):
+        super().__init__()
+        self.backup_service = backup_service
+        self.compress = compress
+        self.max_backups = max_backups
+        self._cancelled = False
+
+    def cancel(self):
+        """Request cancellation of the running backup."""
+        self._cancelled = True
+
+    def run(self):
+        """Run the backup."""
+        backup_dir = self.backup_service.create_backup(
+            compress=self.compress,
+            max_backups=self.max_backups,
+            progress_callback=self.progress_updated.emit,
+            is_cancelled=lambda: self._cancelled,
+        )
+        self.backup_completed.emit(str(backup_dir) if backup_dir else "")
+
+
+class RestoreWorker(QThread):
+    """Worker thread for restoring the database from a backup."""
+
+    progress_updated = pyqtSignal(int, int)  # pages copied, total pages
+    restore_completed = pyqtSignal(bool)  # success
+
+    def __init__(self, backup_service: DatabaseBackupService, backup_dir: Path):
+        super().__init__()
+        self.backup_service = backup_service
+        self.backup_dir = backup_dir
+
+    def run(self):
+        """Snapshot the current database, then restore the selected backup."""
+        if self.backup_service.create_backup() is None:
+            # Never overwrite the live data without a safety copy
+            self.restore_completed.emit(False)
+            return
+
+        success = self.backup_service.restore_backup(
+            self.backup_dir, progress_callback=self.progress_updated.emit
+        )
+        self.restore_completed.emit(success)
 
 
 class DatabaseMaintenanceWindow(QWidget):
@@ -47,6 +153,15 @@ class DatabaseMaintenanceWindow(QWidget):
 
         # Initialize the database service and repositories
         self.db_service = CalculationDatabaseService()
+        self.backup_service = DatabaseBackupService(
+            self.db_service.calculation_repo.db.get_database_path()
+        )
+        self.maintenance_service = DatabaseMaintenanceService(
+            self.db_service.calculation_repo.db.get_database_path()
+        )
+        self.backup_worker: Optional[BackupWorker] = None
+        self.restore_worker: Optional[RestoreWorker] = None
+        self.maintenance_worker: Optional[MaintenanceWorker] = None
 
         # Initialize UI
         self._init_ui()
@@ -113,32 +228,68 @@ class DatabaseMaintenanceWindow(QWidget):
         optimize_layout.addStretch()
         tasks_layout.addLayout(optimize_layout)
 
+        # Check Integrity
+        integrity_layout = QHBoxLayout()
+        integrity_btn = QPushButton("Check Integrity")
+        integrity_btn.setToolTip("Run a quick consistency check of the database")
+        integrity_btn.clicked.connect(self._check_integrity)
+        integrity_layout.addWidget(integrity_btn)
+        integrity_layout.addWidget(QLabel("Verify the database structure is intact"))
+        integrity_layout.addStretch()
+        tasks_layout.addLayout(integrity_layout)
+
         # Backup Database
         backup_layout = QHBoxLayout()
-        backup_btn = QPushButton("Backup Database")
-        backup_btn.setToolTip("Create a backup of the database files")
-        backup_btn.clicked.connect(self._backup_database)
-        backup_layout.addWidget(backup_btn)
+        self.backup_btn = QPushButton("Backup Database")
+        self.backup_btn.setToolTip("Create a backup of the database files")
+        self.backup_btn.clicked.connect(self._backup_database)
+        backup_layout.addWidget(self.backup_btn)
         backup_layout.addWidget(QLabel("Create a backup of all database files"))
         backup_layout.addStretch()
+
+        self.compress_backup_check = QCheckBox("Compress")
+        self.compress_backup_check.setToolTip("Store the backup gzip-compressed")
+        backup_layout.addWidget(self.compress_backup_check)
+
+        backup_layout.addWidget(QLabel("Keep last:"))
+        self.max_backups_spin = QSpinBox()
+        self.max_backups_spin.setRange(0, 100)
+        self.max_backups_spin.setSpecialValueText("All")
+        self.max_backups_spin.setValue(get_config().storage.max_backups)
+        self.max_backups_spin.setToolTip(
+            "Number of backups to keep; older backups are deleted"
+        )
+        backup_layout.addWidget(self.max_backups_spin)
+
+        self.cancel_backup_btn = QPushButton("Cancel")
+        self.cancel_backup_btn.setVisible(False)
+        self.cancel_backup_btn.clicked.connect(self._cancel_backup)
+        backup_layout.addWidget(self.cancel_backup_btn)
         tasks_layout.addLayout(backup_layout)
 
         # Restore Database
         restore_layout = QHBoxLayout()
-        restore_btn = QPushButton("Restore Database")
-        restore_btn.setToolTip("Restore database from a backup")
-        restore_btn.clicked.connect(self._restore_database)
-        restore_layout.addWidget(restore_btn)
+        self.restore_btn = QPushButton("Restore Database")
+        self.restore_btn.setToolTip("Restore database from a backup")
+        self.restore_btn.clicked.connect(self._restore_database)
+        restore_layout.addWidget(self.restore_btn)
         restore_layout.addWidget(QLabel("Restore database from a previous backup"))
         restore_layout.addStretch()
         tasks_layout.addLayout(restore_layout)
 
         layout.addWidget(tasks_group)
 
-        # Progress bar (initially hidden)
+        # Progress bar and cancel button (initially hidden)
+        progress_layout = QHBoxLayout()
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.progress_bar)
+
+        self.cancel_job_btn = QPushButton("Cancel")
+        self.cancel_job_btn.setVisible(False)
+        self.cancel_job_btn.clicked.connect(self._cancel_maintenance_job)
+        progress_layout.addWidget(self.cancel_job_btn)
+        layout.addLayout(progress_layout)
 
         # Status label
         self.status_label = QLabel()
@@ -289,151 +440,288 @@ class DatabaseMaintenanceWindow(QWidget):
                 logger.error(f"Error cleaning database: {e}")
                 self.status_label.setText(f"Error cleaning database: {str(e)}")
 
+    def _run_maintenance_job(
+        self,
+        job: Callable[[Callable[[int, int], None], Callable[[], bool]], Any],
+        status: str,
+        on_completed: Callable[[Any], None],
+    ) -> bool:
+        """Run a maintenance job in a background worker.
+
+        Args:
+            job: Callable taking (progress_callback, is_cancelled)
+            status: Status text shown while the job runs
+            on_completed: Called on the GUI thread with the job result
+
+        Returns:
+            True if the job was started, False if another job is still running
+        """
+        if self.maintenance_worker is not None and self.maintenance_worker.isRunning():
+            self.status_label.setText("Another maintenance task is still running.")
+            return False
+
+        self.maintenance_worker = MaintenanceWorker(job)
+        self.maintenance_worker.progress_updated.connect(self._on_copy_progress)
+        self.maintenance_worker.job_completed.connect(
+            lambda result: self._on_maintenance_job_finished(on_completed, result)
+        )
+        self.maintenance_worker.error_occurred.connect(self._on_maintenance_job_failed)
+
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.cancel_job_btn.setVisible(True)
+        self.status_label.setText(status)
+        self.maintenance_worker.start()
+        return True
+
+    def _cancel_maintenance_job(self):
+        """Cancel the running maintenance job."""
+        if self.maintenance_worker is not None:
+            self.maintenance_worker.cancel()
+            self.status_label.setText("Cancelling...")
+
+    def _on_maintenance_job_finished(
+        self, on_completed: Callable[[Any], None], result: Any
+    ):
+        """Hide the progress controls and hand the result to the caller.
+
+        Args:
+            on_completed: Completion handler of the job
+            result: Job result
+        """
+        self.progress_bar.setVisible(False)
+        self.cancel_job_btn.setVisible(False)
+        on_completed(result)
+
+    def _on_maintenance_job_failed(self, error: str):
+        """Report a failed maintenance job.
+
+        Args:
+            error: Error message
+        """
+        self.progress_bar.setVisible(False)
+        self.cancel_job_btn.setVisible(False)
+        self.status_label.setText(f"Maintenance task failed: {error}")
+
     def _find_duplicates(self):
         """Find duplicate calculations in the database."""
-        try:
-            # Use SQL to find duplicates based on input text and calculation type
-            query = """
-            SELECT input_text, calculation_type, COUNT(*) as count
-            FROM calculations
-            GROUP BY input_text, calculation_type
-            HAVING COUNT(*) > 1
-            """
-
-            # Execute the query and fetch results manually since fetch is not a parameter
-            cursor = self.db_service.calculation_repo.db.execute(query)
-            result = cursor.fetchall() if cursor else []
-
-            if not result:
-                self.status_label.setText("No duplicate calculations found.")
-                return
+        service = self.maintenance_service
 
-            # Count duplicates
-            total_dupes = sum(row[2] - 1 for row in result)
+        def job(progress, is_cancelled):
+            duplicate_ids = [
+                duplicate_id
+                for duplicate_id, _ in service.iter_duplicate_calculations(
+                    progress_callback=progress, is_cancelled=is_cancelled
+                )
+            ]
+            return {"ids": duplicate_ids, "cancelled": is_cancelled()}
 
-            # Ask if the user wants to remove duplicates
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle("Duplicate Calculations")
-            msg_box.setText(
-                f"Found {total_dupes} duplicate calculations for {len(result)} unique inputs."
-            )
-            msg_box.setInformativeText("Do you want to remove these duplicates?")
-            msg_box.setIcon(QMessageBox.Icon.Question)
-            msg_box.setStandardButtons(
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        self._run_maintenance_job(
+            job, "Scanning for duplicate calculations...", self._on_duplicates_found
+        )
+
+    def _on_duplicates_found(self, result: dict):
+        """Offer to remove the duplicates found by the scan.
+
+        Args:
+            result: Scan result with the duplicate IDs
+        """
+        duplicate_ids = result["ids"]
+
+        if result["cancelled"]:
+            self.status_label.setText(
+                f"Scan cancelled after finding {len(duplicate_ids)} duplicates."
             )
-            msg_box.setDefaultButton(QMessageBox.StandardButton.No)
+            return
 
-            result_btn = msg_box.exec()
+        if not duplicate_ids:
+            self.status_label.setText("No duplicate calculations found.")
+            return
 
-            if result_btn == QMessageBox.StandardButton.Yes:
-                # For each group of duplicates, keep the newest one and delete the rest
-                removed_count = 0
+        # Ask if the user wants to remove duplicates
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("Duplicate Calculations")
+        msg_box.setText(f"Found {len(duplicate_ids)} duplicate calculations.")
+        msg_box.setInformativeText(
+            "Do you want to remove these duplicates? The newest copy of each "
+            "calculation is kept."
+        )
+        msg_box.setIcon(QMessageBox.Icon.Question)
+        msg_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        msg_box.setDefaultButton(QMessageBox.StandardButton.No)
 
-                for row in result:
-                    input_text, calculation_type = row[0], row[1]
+        if msg_box.exec() != QMessageBox.StandardButton.Yes:
+            self.status_label.setText(
+                f"Found {len(duplicate_ids)} duplicate calculations. No changes made."
+            )
+            return
 
-                    # Get all calculations with this input and type, ordered by date
-                    duplicates_query = """
-                    SELECT id FROM calculations
-                    WHERE input_text = ? AND calculation_type = ?
-                    ORDER BY created_at DESC
-                    """
+        service = self.maintenance_service
 
-                    # Execute the query and fetch results manually
-                    cursor = self.db_service.calculation_repo.db.execute(
-                        duplicates_query, (input_text, calculation_type)
-                    )
-                    dupe_ids = cursor.fetchall() if cursor else []
+        def job(progress, is_cancelled):
+            return service.delete_calculations(
+                duplicate_ids, progress_callback=progress, is_cancelled=is_cancelled
+            )
 
-                    # Keep the first one (newest), delete the rest
-                    if len(dupe_ids) > 1:
-                        for i in range(1, len(dupe_ids)):
-                            if self.db_service.delete_calculation(dupe_ids[i][0]):
-                                removed_count += 1
+        def on_removed(removed_count):
+            self.status_label.setText(
+                f"Removed {removed_count} duplicate calculations."
+            )
+            self._update_stats()
+            logger.info(
+                f"Removed {removed_count} duplicate calculations during maintenance"
+            )
 
-                self.status_label.setText(
-                    f"Removed {removed_count} duplicate calculations."
+        self._run_maintenance_job(job, "Removing duplicate calculations...", on_removed)
+
+    def _optimize_database(self):
+        """Reclaim free space and refresh statistics in the background."""
+        service = self.maintenance_service
+
+        if service.get_storage_info()["auto_vacuum"] != AUTO_VACUUM_INCREMENTAL:
+            confirm = QMessageBox.question(
+                self,
+                "Enable Incremental Compaction",
+                "This database must be rebuilt once before free space can be "
+                "reclaimed incrementally. This may take a while on large "
+                "databases. Rebuild it now?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            convert = confirm == QMessageBox.StandardButton.Yes
+        else:
+            convert = False
+
+        def job(progress, is_cancelled):
+            # Errors propagate and are reported as a failed task
+            if convert and not service.enable_incremental_vacuum(is_cancelled):
+                if is_cancelled():
+                    return {"cancelled": True}
+                raise RuntimeError(
+                    "The database could not be switched to incremental compaction"
                 )
-                self._update_stats()
 
-                logger.info(
-                    f"Removed {removed_count} duplicate calculations during maintenance"
+            vacuum = service.incremental_vacuum(
+                progress_callback=progress,
+                is_cancelled=is_cancelled,
+                time_budget=OPTIMIZE_TIME_BUDGET,
+            )
+            analyzed = service.optimize(
+                is_cancelled=is_cancelled, time_budget=OPTIMIZE_TIME_BUDGET
+            )
+            return {"cancelled": is_cancelled(), "vacuum": vacuum, "analyzed": analyzed}
+
+        def on_optimized(result):
+            if result["cancelled"]:
+                self.status_label.setText("Database optimization cancelled.")
+                return
+
+            vacuum = result["vacuum"]
+            message = f"Database optimized: reclaimed {vacuum['pages_freed']} pages."
+            if vacuum["remaining"]:
+                message += (
+                    f" {vacuum['remaining']} free pages remain; run again to continue."
                 )
+            if not result["analyzed"]:
+                message += " Statistics refresh did not finish in time."
+            self.status_label.setText(message)
+            self._update_stats()
+
+            logger.info("Database optimized during maintenance")
+
+        self._run_maintenance_job(job, "Optimizing database...", on_optimized)
+
+    def _check_integrity(self):
+        """Run a quick integrity check in the background."""
+        service = self.maintenance_service
+
+        def job(progress, is_cancelled):
+            return service.quick_check(is_cancelled=is_cancelled)
+
+        def on_checked(result):
+            if not result["completed"]:
+                self.status_label.setText("Integrity check was interrupted.")
+            elif result["ok"]:
+                self.status_label.setText("Integrity check passed.")
             else:
+                problems = "<br>".join(result["messages"][:10])
                 self.status_label.setText(
-                    f"Found {total_dupes} duplicate calculations. No changes made."
+                    f"Integrity check found problems:<br>{problems}"
                 )
+                logger.warning(f"Integrity check problems: {result['messages']}")
 
-        except Exception as e:
-            logger.error(f"Error finding duplicates: {e}")
-            self.status_label.setText(f"Error finding duplicates: {str(e)}")
+        self._run_maintenance_job(job, "Checking database integrity...", on_checked)
 
-    def _optimize_database(self):
-        """Optimize the database files."""
-        try:
-            # Use VACUUM to rebuild the database, reclaiming unused space
-            self.db_service.calculation_repo.db.execute("VACUUM")
+    def _backup_database(self):
+        """Backup the database in a background worker."""
+        if self.backup_worker is not None and self.backup_worker.isRunning():
+            return
 
-            # Run ANALYZE to update statistics
-            self.db_service.calculation_repo.db.execute("ANALYZE")
+        max_backups = self.max_backups_spin.value() or None
+        self.backup_worker = BackupWorker(
+            self.backup_service, self.compress_backup_check.isChecked(), max_backups
+        )
+        self.backup_worker.progress_updated.connect(self._on_copy_progress)
+        self.backup_worker.backup_completed.connect(self._on_backup_completed)
 
-            self.status_label.setText("Database optimized successfully.")
-            self._update_stats()
+        self._set_backup_running(True, cancellable=True)
+        self.status_label.setText("Backing up database...")
+        self.backup_worker.start()
 
-            logger.info("Database optimized during maintenance")
+    def _cancel_backup(self):
+        """Cancel the running backup."""
+        if self.backup_worker is not None:
+            self.backup_worker.cancel()
+            self.status_label.setText("Cancelling backup...")
 
-        except Exception as e:
-            logger.error(f"Error optimizing database: {e}")
-            self.status_label.setText(f"Error optimizing database: {str(e)}")
+    def _set_backup_running(self, running: bool, cancellable: bool = False):
+        """Toggle the controls while a backup or restore is running.
 
-    def _backup_database(self):
-        """Backup the database files."""
-        try:
-            # Create a backup directory with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            data_dir = Path(self.db_service.calculation_repo.db._db_file).parent
-            backup_dir = data_dir / f"backup_{timestamp}"
-            os.makedirs(backup_dir, exist_ok=True)
+        Args:
+            running: Whether a backup or restore is in progress
+            cancellable: Whether the running operation can be cancelled
+        """
+        self.backup_btn.setEnabled(not running)
+        self.restore_btn.setEnabled(not running)
+        self.cancel_backup_btn.setVisible(running and cancellable)
+        self.progress_bar.setVisible(running)
+        self.progress_bar.setRange(0, 0)
+
+    def _on_copy_progress(self, copied: int, total: int):
+        """Update the progress bar during a backup or restore.
 
-            # Copy the SQLite database file
-            db_file = self.db_service.calculation_repo.db._db_file
-            if os.path.exists(db_file):
-                shutil.copy2(db_file, backup_dir / "isopgem.db")
+        Args:
+            copied: Pages copied so far
+            total: Total number of pages
+        """
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(copied)
 
+    def _on_backup_completed(self, backup_dir: str):
+        """Handle the end of a backup.
+
+        Args:
+            backup_dir: Backup directory, or an empty string if no backup was made
+        """
+        self._set_backup_running(False)
+        if backup_dir:
             self.status_label.setText(
                 f"Database backed up successfully to {backup_dir}"
             )
-
-            logger.info(f"Database backed up to {backup_dir}")
-
-        except Exception as e:
-            logger.error(f"Error backing up database: {e}")
-            self.status_label.setText(f"Error backing up database: {str(e)}")
+        else:
+            self.status_label.setText("Database backup was cancelled or failed.")
 
     def _restore_database(self):
         """Restore the database from a backup."""
         try:
-            # Get data directory
-            data_dir = Path(self.db_service.calculation_repo.db._db_file).parent
-
-            # Find backup directories
-            backup_dirs = [
-                d
-                for d in data_dir.iterdir()
-                if d.is_dir() and d.name.startswith("backup_")
-            ]
+            backup_dirs = self.backup_service.list_backups()
 
             if not backup_dirs:
                 self.status_label.setText("No backups found to restore.")
                 return
 
-            # Sort backups by name (newest first)
-            backup_dirs.sort(reverse=True)
-
-            # Let user select a backup
-            backup_dir_names = [d.name for d in backup_dirs]
-
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("Restore Database")
             msg_box.setText("Select a backup to restore:")
@@ -441,13 +729,12 @@ class DatabaseMaintenanceWindow(QWidget):
 
             # Add buttons for each backup
             buttons = []
-            for name in backup_dir_names[:5]:  # Show only the 5 most recent backups
+            for backup_dir in backup_dirs[:5]:  # Show only the 5 most recent backups
                 # Convert backup name to a more readable format
-                if name.startswith("backup_"):
-                    date_str = name[7:]  # Remove "backup_" prefix
-                    date_str = date_str.replace("_", " ")
-                    btn = msg_box.addButton(date_str, QMessageBox.ButtonRole.ActionRole)
-                    buttons.append((btn, name))
+                date_str = backup_dir.name[7:]  # Remove "backup_" prefix
+                date_str = date_str.replace("_", " ")
+                btn = msg_box.addButton(date_str, QMessageBox.ButtonRole.ActionRole)
+                buttons.append((btn, backup_dir))
 
             cancel_btn = msg_box.addButton("Cancel", QMessageBox.ButtonRole.RejectRole)
 
@@ -459,67 +746,57 @@ class DatabaseMaintenanceWindow(QWidget):
                 return
 
             # Find which backup was selected
-            selected_backup_name = None
-            for btn, name in buttons:
-                if clicked_button == btn:
-                    selected_backup_name = name
-                    break
-
-            if not selected_backup_name:
-                return
-
-            # Find the backup directory
             selected_backup = None
-            for d in backup_dirs:
-                if d.name == selected_backup_name:
-                    selected_backup = d
+            for btn, backup_dir in buttons:
+                if clicked_button == btn:
+                    selected_backup = backup_dir
                     break
 
             if not selected_backup:
-                self.status_label.setText("Selected backup not found.")
                 return
 
             # Confirm restore
             confirm = QMessageBox.question(
                 self,
                 "Confirm Restore",
-                f"Are you sure you want to restore the database from backup {selected_backup_name}? This will overwrite your current data.",
+                f"Are you sure you want to restore the database from backup {selected_backup.name}? This will overwrite your current data.",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No,
             )
 
             if confirm == QMessageBox.StandardButton.Yes:
-                # Close current database connections
-                self.db_service.calculation_repo.db.close()
-
-                # Create backup of current database before restoring
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                current_backup_dir = data_dir / f"pre_restore_backup_{timestamp}"
-                os.makedirs(current_backup_dir, exist_ok=True)
-
-                db_file = self.db_service.calculation_repo.db._db_file
-                if os.path.exists(db_file):
-                    shutil.copy2(db_file, current_backup_dir / "isopgem.db")
-
-                # Restore from backup
-                backup_db_file = selected_backup / "isopgem.db"
-                if os.path.exists(backup_db_file):
-                    # We need to copy the file and then reopen the connection
-                    shutil.copy2(backup_db_file, db_file)
-
-                    # Reinitialize the database connections
-                    # This is a bit of a hack; in a more robust implementation we would
-                    # have a method to reopen the connections or recreate the service
-                    self.db_service = CalculationDatabaseService()
-
-                    self.status_label.setText(
-                        f"Database restored successfully from {selected_backup_name}"
+                self.restore_worker = RestoreWorker(
+                    self.backup_service, selected_backup
+                )
+                self.restore_worker.progress_updated.connect(self._on_copy_progress)
+                self.restore_worker.restore_completed.connect(
+                    lambda success, name=selected_backup.name: self._on_restore_completed(
+                        success, name
                     )
-                    self._update_stats()
+                )
 
-                    logger.info(f"Database restored from backup {selected_backup_name}")
-                else:
-                    self.status_label.setText("Backup database file not found.")
+                self._set_backup_running(True)
+                self.status_label.setText(
+                    f"Restoring database from {selected_backup.name}..."
+                )
+                self.restore_worker.start()
         except Exception as e:
             logger.error(f"Error restoring database: {e}")
             self.status_label.setText(f"Error restoring database: {str(e)}")
+
+    def _on_restore_completed(self, success: bool, backup_name: str):
+        """Handle the end of a restore.
+
+        Args:
+            success: Whether the restore succeeded
+            backup_name: Name of the restored backup directory
+        """
+        self._set_backup_running(False)
+        if success:
+            self.status_label.setText(
+                f"Database restored successfully from {backup_name}"
+            )
+            self._update_stats()
+            logger.info(f"Database restored from backup {backup_name}")
+        else:
+            self.status_label.setText(f"Error restoring database from {backup_name}.")
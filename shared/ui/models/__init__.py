@@ -0,0 +1,5 @@
+"""Shared item models package."""
+
+from shared.ui.models.keyset_table_model import KeysetTableModel
+
+__all__ = ["KeysetTableModel"]
@@ -0,0 +1,421 @@
+"""
+Purpose: Provides a lazily loaded table model base paging rows in by keyset queries
+
+This file is part of the shared services and serves as a UI model component.
+It is responsible for the paging shared by the database-backed table models:
+rows are fetched page by page with keyset queries as the view scrolls, only a
+sliding window of pages is kept in memory, and sorting is done by the
+database. With a query executor, new queries and sorts are counted and
+loaded on a worker thread while the previous rows stay visible. Subclasses
+only define their columns, their data() and the queries.
+
+Key components:
+- KeysetTableModel: QAbstractTableModel base with incremental fetching,
+  a bounded page cache and background loading
+
+Dependencies:
+- PyQt6: For the item model base class
+- shared.services.query_executor: For loading new results in the background
+
+Related files:
+- gematria/ui/models/calculation_table_model.py: Pages saved calculations
+- document_manager/ui/models/concordance_entry_model.py: Pages concordance entries
+"""
+
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from shared.services.query_executor import QueryExecutor
+
+# View state: (query, sort key, descending); a None query shows nothing
+ViewState = Tuple[Any, str, bool]
+
+
+class _AbstractModelMeta(type(QAbstractTableModel), ABCMeta):
+    """Metaclass combining PyQt's wrapper type with ABCMeta."""
+
+
+class KeysetTableModel(QAbstractTableModel, metaclass=_AbstractModelMeta):
+    """Base of table models that page rows in from the database on demand.
+
+    Subclasses set _HEADERS, _SORT_KEYS and _ROWS_NAME, implement
+    _fetch_page and _count, and call _set_query to show new results. A
+    subclass missing one of the queries cannot be instantiated.
+    """
+
+    # Emitted with the total match count whenever new results are shown
+    results_loaded = pyqtSignal(int)
+
+    # Column headers
+    _HEADERS: List[str] = []
+
+    # Sort key passed to _fetch_page for each sortable view column
+    _SORT_KEYS: Dict[int, str] = {}
+
+    # What the rows are, for log messages
+    _ROWS_NAME = "rows"
+
+    def __init__(
+        self,
+        sort_by: str,
+        descending: bool,
+        page_size: int = 200,
+        max_cached_pages: int = 10,
+        executor: Optional[QueryExecutor] = None,
+        parent=None,
+    ):
+        """Initialize the model, showing nothing until a query is set.
+
+        Args:
+            sort_by: Initial sort key
+            descending: Whether to sort in descending order initially
+            page_size: Number of rows fetched per query
+            max_cached_pages: Number of pages kept in memory at once
+            executor: Executor dedicated to this model; when given, new
+                queries and sorts are loaded on its worker thread
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.page_size = max(1, page_size)
+        self.max_cached_pages = max(1, max_cached_pages)
+
+        self._query: Any = None
+        self._sort_by = sort_by
+        self._descending = descending
+        self._total = 0
+
+        # _anchors[n] is the keyset key of the last row before page n
+        self._anchors: List[Optional[Tuple]] = [None]
+        self._pages: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._row_count = 0
+        self._exhausted = True
+
+        # State requested from the executor but not shown yet
+        self._requested: Optional[ViewState] = None
+        self.executor = executor
+        if executor is not None:
+            executor.result_ready.connect(self._on_results_loaded)
+            executor.query_failed.connect(self._on_load_failed)
+
+    def refresh(self) -> None:
+        """Discard all loaded rows and query the current state again."""
+        self._load(*self._target_state())
+
+    def is_loading(self) -> bool:
+        """Check whether new results are being loaded in the background.
+
+        Returns:
+            True while a query or sort has not delivered its results
+        """
+        return self._requested is not None
+
+    def total_count(self) -> int:
+        """Get the number of rows matching the current query.
+
+        Returns:
+            Total number of matching rows, loaded or not
+        """
+        return self._total
+
+    def row_item(self, row: int) -> Any:
+        """Get the item shown in a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            The item, or None if the row does not exist
+        """
+        if row < 0 or row >= self._row_count:
+            return None
+
+        page = self._get_page(row // self.page_size)
+        offset = row % self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of rows loaded so far."""
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def canFetchMore(self, parent):
+        """Check whether more rows are available from the database."""
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent):
+        """Append the next page of rows."""
+        if parent.isValid() or self._exhausted:
+            return
+
+        page_index = len(self._anchors) - 1
+        try:
+            rows, last_key = self._query_page(page_index)
+        except Exception as e:
+            logger.error(f"Error fetching {self._ROWS_NAME}: {e}")
+            self._exhausted = True
+            return
+
+        if len(rows) < self.page_size:
+            self._exhausted = True
+        else:
+            self._anchors.append(last_key)
+
+        if not rows:
+            return
+
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._cache_page(page_index, rows)
+        self._row_count += len(rows)
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort by a column in the database and reload."""
+        sort_by = self._SORT_KEYS.get(column)
+        if sort_by is None:
+            return
+
+        descending = order == Qt.SortOrder.DescendingOrder
+        query, current_sort, current_descending = self._target_state()
+        if sort_by == current_sort and descending == current_descending:
+            return
+
+        self._load(query, sort_by, descending)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Get the column headers."""
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self._HEADERS)
+        ):
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    @abstractmethod
+    def _fetch_page(
+        self, query: Any, sort_by: str, descending: bool, after: Optional[Tuple]
+    ) -> Tuple[List[Any], Optional[Tuple]]:
+        """Run a keyset query for one page of rows.
+
+        Called on the executor's worker thread for first pages, so it must
+        not touch model state.
+
+        Args:
+            query: Query of the view state (never None)
+            sort_by: Sort key
+            descending: Whether to sort in descending order
+            after: Keyset key of the row before the page, or None
+
+        Returns:
+            Tuple of (up to page_size rows, keyset key of the last row)
+        """
+
+    @abstractmethod
+    def _count(self, query: Any) -> int:
+        """Count the rows matching a query.
+
+        Called on the executor's worker thread, so it must not touch model
+        state.
+
+        Args:
+            query: Query of the view state (never None)
+
+        Returns:
+            Number of matching rows
+        """
+
+    def _load_extras(self, query: Any) -> Dict[str, Any]:
+        """Load data shown alongside the rows of a query (worker thread).
+
+        Args:
+            query: Query of the view state (never None)
+
+        Returns:
+            Entries added to the loaded results
+        """
+        return {}
+
+    def _reset_extras(self, results: Optional[Dict[str, Any]]) -> None:
+        """Take over the extras of newly shown results, inside a model reset.
+
+        Args:
+            results: Loaded results, or None when nothing is shown
+        """
+
+    def _set_query(self, query: Any) -> None:
+        """Show the rows matching a new query, keeping the sort order.
+
+        Args:
+            query: Subclass-specific query, or None to show nothing
+        """
+        _, sort_by, descending = self._target_state()
+        self._load(query, sort_by, descending)
+
+    def _target_state(self) -> ViewState:
+        """Get the most recently requested view state.
+
+        Returns:
+            Tuple of (query, sort key, descending)
+        """
+        if self._requested is not None:
+            return self._requested
+        return self._query, self._sort_by, self._descending
+
+    def _load(self, query: Any, sort_by: str, descending: bool) -> None:
+        """Load the first page of a new view state.
+
+        Without an executor, or when there is nothing to query, the state is
+        loaded and shown immediately. Otherwise the rows shown so far stay
+        visible until the worker delivers the new results.
+
+        Args:
+            query: Query to show, or None to show nothing
+            sort_by: Sort key
+            descending: Whether to sort in descending order
+        """
+        state = (query, sort_by, descending)
+        if self.executor is None or query is None:
+            if self.executor is not None:
+                self.executor.cancel()
+                self._requested = None
+            try:
+                results = self._load_first_page(*state)
+            except Exception as e:
+                logger.error(f"Error loading {self._ROWS_NAME}: {e}")
+                results = None
+            self._show(state, results)
+            return
+
+        self._requested = state
+        self.executor.submit(partial(self._load_first_page, *state))
+
+    def _load_first_page(
+        self, query: Any, sort_by: str, descending: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Query the count and first page of a view state.
+
+        Runs on the executor's worker thread, so it must not touch model state.
+
+        Args:
+            query: Query to show, or None to show nothing
+            sort_by: Sort key
+            descending: Whether to sort in descending order
+
+        Returns:
+            Dictionary with state, total, rows, last_key and the extras,
+            or None if there is nothing to query
+        """
+        if query is None:
+            return None
+
+        rows, last_key = self._fetch_page(query, sort_by, descending, None)
+        if len(rows) < self.page_size:
+            # The first page already holds every match
+            total = len(rows)
+        else:
+            total = self._count(query)
+        return {
+            **self._load_extras(query),
+            "state": (query, sort_by, descending),
+            "total": total,
+            "rows": rows,
+            "last_key": last_key,
+        }
+
+    def _on_results_loaded(self, results: Optional[Dict[str, Any]]) -> None:
+        """Show results delivered by the executor."""
+        if results is None or results["state"] != self._requested:
+            return
+
+        self._requested = None
+        self._show(results["state"], results)
+
+    def _on_load_failed(self, message: str) -> None:
+        """Keep showing the previous results when a background load fails."""
+        self._requested = None
+
+    def _show(self, state: ViewState, results: Optional[Dict[str, Any]]) -> None:
+        """Replace the shown rows with freshly loaded results.
+
+        Args:
+            state: View state of the results
+            results: Loaded results, or None to show nothing
+        """
+        self.beginResetModel()
+        self._query, self._sort_by, self._descending = state
+        self._anchors = [None]
+        self._pages.clear()
+        self._row_count = 0
+        self._total = 0
+        self._exhausted = True
+        self._reset_extras(results)
+
+        if results is not None:
+            rows = results["rows"]
+            self._total = results["total"]
+            if rows:
+                self._cache_page(0, rows)
+                self._row_count = len(rows)
+            if len(rows) == self.page_size:
+                self._anchors.append(results["last_key"])
+                self._exhausted = False
+
+        self.endResetModel()
+        self.results_loaded.emit(self._total)
+
+    def _query_page(self, page_index: int) -> Tuple[List[Any], Optional[Tuple]]:
+        """Run the keyset query for a page of the shown state.
+
+        Args:
+            page_index: Index of the page to load
+
+        Returns:
+            Tuple of (rows, keyset key of the last row)
+        """
+        return self._fetch_page(
+            self._query, self._sort_by, self._descending, self._anchors[page_index]
+        )
+
+    def _get_page(self, page_index: int) -> List[Any]:
+        """Get a page from the cache, reloading it if it was evicted.
+
+        Args:
+            page_index: Index of the page
+
+        Returns:
+            Rows of the page (empty if it could not be loaded)
+        """
+        page = self._pages.get(page_index)
+        if page is not None:
+            self._pages.move_to_end(page_index)
+            return page
+
+        try:
+            page, _ = self._query_page(page_index)
+        except Exception as e:
+            logger.error(f"Error reloading {self._ROWS_NAME} page {page_index}: {e}")
+            page = []
+
+        self._cache_page(page_index, page)
+        return page
+
+    def _cache_page(self, page_index: int, page: List[Any]) -> None:
+        """Store a page, evicting the least recently used pages beyond the limit.
+
+        Args:
+            page_index: Index of the page
+            page: Rows of the page
+        """
+        self._pages[page_index] = page
+        self._pages.move_to_end(page_index)
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
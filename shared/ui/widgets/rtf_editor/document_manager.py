@@ -95,6 +95,9 @@ class DocumentManager(QObject):
             f"DocumentManager initialized with document_id: {self.document_id}"
         )
 
+        # Whether the image manager records images under a saved document's ID
+        self.image_owner_saved = False
+
         # Ensure the default directory exists
         os.makedirs(DEFAULT_DIR, exist_ok=True)
 
@@ -260,6 +263,7 @@ class DocumentManager(QObject):
 
         self.current_path = None
         self.editor_window.text_edit.clear()
+        self._set_image_owner(f"doc_{uuid.uuid4().hex[:8]}", saved=False)
 
         # Call the document_loaded method with empty content
         if hasattr(self.editor_window, "document_loaded"):
@@ -648,6 +652,7 @@ class DocumentManager(QObject):
             if not success:
                 raise Exception("QTextDocumentWriter could not write the document")
 
+            self._set_image_owner(str(path_obj.resolve()))
             self.current_path = str(path_obj)
             self.set_modified(False)
             self.status_updated.emit(f"Saved: {path_obj}")
@@ -860,6 +865,7 @@ class DocumentManager(QObject):
 
             # Update state and store document metadata for auto-save
             self.document_id = doc_format.id
+            self._set_image_owner(doc_format.id)
             self.document_name = doc_format.name
             self.set_modified(False)
             self.document_loaded.emit(content)
@@ -871,6 +877,27 @@ class DocumentManager(QObject):
             logger.error(f"Error loading document format: {str(e)}", exc_info=True)
             return False
 
+    def _set_image_owner(self, owner_id, saved=True):
+        """Record the editor's images under the ID of the current document.
+
+        Images are referenced by the document using them. The references of
+        an unsaved document are handed over to the new ID; those of a saved
+        document are kept, since its file still uses the images.
+
+        Args:
+            owner_id (str): Stable ID of the document, e.g. its resolved path
+            saved (bool): Whether the ID belongs to a saved document
+
+        Returns:
+            None
+        """
+        image_manager = getattr(self.editor_window, "image_manager", None)
+        if image_manager is not None:
+            image_manager.set_document_id(
+                owner_id, keep_previous=self.image_owner_saved
+            )
+        self.image_owner_saved = saved
+
     def _load_file(self, file_path):
         """Load a document from a file.
 
@@ -908,6 +935,7 @@ class DocumentManager(QObject):
                 self.editor_window.document_loaded(content)
 
             # Update state
+            self._set_image_owner(str(Path(file_path).resolve()))
             self.current_path = file_path
             self.set_modified(False)
             self.document_loaded.emit(content)
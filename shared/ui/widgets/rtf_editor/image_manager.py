@@ -1,6 +1,7 @@
 import gc
 import mimetypes
 import os
+import threading
 import uuid
 from pathlib import Path
 
@@ -17,7 +18,10 @@ from PyQt6.QtWidgets import (  # Added QInputDialog
 from shared.ui.widgets.rtf_editor.utils.error_utils import handle_error
 from shared.ui.widgets.rtf_editor.utils.image_storage import (
     cleanup_unused_images,
+    collect_garbage,
     data_uri_to_image_file,
+    move_image_references,
+    register_display_image,
     save_image_to_storage,
 )
 from shared.ui.widgets.rtf_editor.utils.logging_utils import get_logger
@@ -36,6 +40,21 @@ except ImportError:
     logger.warning("Could not import DEFAULT_DIR from document_manager, using fallback")
     DEFAULT_DIR = Path.cwd() / "document_folder"
 
+# Unreferenced stored images are collected once per run, when the first
+# editor opens
+_garbage_collection_started = False
+
+
+def _start_garbage_collection():
+    """Collect unreferenced stored images on a background thread, once."""
+    global _garbage_collection_started
+    if _garbage_collection_started:
+        return
+    _garbage_collection_started = True
+    threading.Thread(
+        target=collect_garbage, name="image-garbage-collection", daemon=True
+    ).start()
+
 
 class ImageManager(QObject):
     """Manages image operations for the RTF editor.
@@ -80,6 +99,34 @@ class ImageManager(QObject):
         self.document_id = document_id or f"doc_{uuid.uuid4().hex[:8]}"
         logger.debug(f"ImageManager initialized with document_id: {self.document_id}")
 
+        _start_garbage_collection()
+
+    def set_document_id(self, document_id, keep_previous=False):
+        """Record the images of the editor under a new document ID.
+
+        Called when the document gets a stable ID, e.g. when it is saved
+        under a path or a saved document is opened, so the image references
+        are not left under an ID that is never used again.
+
+        Args:
+            document_id (str): New identifier for the document
+            keep_previous (bool): Keep the references of the previous ID,
+                for a saved document that still uses its images
+
+        Returns:
+            None
+        """
+        if not document_id or document_id == self.document_id:
+            return
+
+        if not keep_previous:
+            move_image_references(self.document_id, document_id)
+        logger.debug(f"ImageManager document_id changed to: {document_id}")
+        self.document_id = document_id
+
+        # Make the references match the images now in the editor
+        self.cleanup_unused_images()
+
     def add_menu_actions(self, menubar):
         """Add image-related actions to the main menubar.
 
@@ -197,6 +244,9 @@ class ImageManager(QObject):
             image_format.setWidth(width)
             image_format.setHeight(height)
 
+            # Paint from a copy decoded and scaled once to the display size
+            self._register_display_image(storage_path, width, height)
+
             # Store the original path as a custom property for reference
             property_id = 1001  # Custom property ID
             image_format.setProperty(property_id, str(path_obj))
@@ -355,6 +405,9 @@ class ImageManager(QObject):
             image_format.setWidth(width)
             image_format.setHeight(height)
 
+            # Paint from a copy decoded and scaled once to the display size
+            self._register_display_image(storage_path, width, height)
+
             # Store the original path as a custom property for reference
             property_id = 1001  # Custom property ID
             image_format.setProperty(property_id, image_path)
@@ -425,6 +478,11 @@ class ImageManager(QObject):
 
                             # Update the image format
                             image_format.setName(storage_path)
+                            self._register_display_image(
+                                storage_path,
+                                int(image_format.width()) or width,
+                                int(image_format.height()) or height,
+                            )
 
                             # Store document ID as a custom property
                             property_id_doc = 1002  # Custom property ID for document
@@ -459,6 +517,29 @@ class ImageManager(QObject):
             )
             return 0
 
+    def _register_display_image(self, image_path, width, height):
+        """Register a pre-scaled copy of an image for painting in the editor.
+
+        Args:
+            image_path (str): Name of the image in the document
+            width (int): Display width
+            height (int): Display height
+
+        Returns:
+            bool: True if the display image was registered
+        """
+        try:
+            return register_display_image(
+                self.editor.document(),
+                image_path,
+                int(width),
+                int(height),
+                self.editor.devicePixelRatioF(),
+            )
+        except Exception as e:
+            logger.warning(f"Could not register display image: {str(e)}")
+            return False
+
     def cleanup_unused_images(self):
         """Clean up unused images for the current document.
 
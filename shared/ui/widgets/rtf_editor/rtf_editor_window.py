@@ -36,6 +36,7 @@ from .image_editor_dialog import ImageEditorDialog
 from .image_manager import ImageManager
 from .image_properties_dialog import ImagePropertiesDialog
 from .table_manager import TableManager
+from .utils.image_storage import register_display_image
 from .zoom_manager import ZoomManager
 
 
@@ -1200,6 +1201,15 @@ class RTFEditorWindow(QMainWindow):
             print("Inserting new image")
             cursor.insertImage(new_format)
 
+            # Paint from a copy scaled to the new size
+            register_display_image(
+                self.text_edit.document(),
+                new_path,
+                new_width,
+                new_height,
+                self.text_edit.devicePixelRatioF(),
+            )
+
             # Check document after insertion
             after_insert_html = self.text_edit.document().toHtml()
             after_insert_img_count = after_insert_html.count("<img ")
@@ -1389,7 +1399,7 @@ class RTFEditorWindow(QMainWindow):
                 ):
                     # Force an auto-save
                     try:
-                        self.document_manager.auto_save_manager.auto_save()
+                        self.document_manager.auto_save_manager.auto_save(blocking=True)
                         logger.info("Emergency auto-save completed")
                     except Exception as e:
                         logger.error(f"Emergency auto-save failed: {str(e)}")
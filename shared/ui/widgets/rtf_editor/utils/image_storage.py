@@ -5,22 +5,51 @@ This module provides functions for efficiently storing and retrieving images
 used in RTF documents. Instead of embedding images as data URIs, it stores
 them as files and references them by path.
 
+Images are stored once per content: each file is named after the SHA-256
+hash of its bytes, so inserting the same image again, in the same or in
+another document, reuses the stored file. A reference index records which
+documents use each image; an image is deleted when no document references
+it any more. Documents are identified by a stable key, such as the resolved
+path of a saved file. An unsaved document only has an ID for the editing
+session, so its references are moved to the stable key once it is saved or
+replaced by an opened file; otherwise they would go stale and keep their
+images from ever being collected. Downscaled thumbnails are generated when an image is stored,
+and decoded display images and dimensions are kept in bounded LRU caches.
+
 Key features:
-- Stores images in a dedicated directory
-- Generates unique filenames to avoid conflicts
+- Stores images in a dedicated directory, named by content hash
 - Handles image conversion and optimization
-- Provides functions for cleaning up unused images
+- Counts references per document and collects unreferenced images
+- Provides thumbnails and pre-scaled display images for painting
 """
 
 import base64
+import hashlib
+import io
+import json
 import os
 import shutil
-import uuid
-from datetime import datetime
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from PIL import Image
+from PyQt6.QtCore import QUrl, Qt
+from PyQt6.QtGui import QImage, QTextDocument
 
 from shared.ui.widgets.rtf_editor.utils.logging_utils import get_logger
 
@@ -31,18 +60,145 @@ logger = get_logger(__name__)
 IMAGE_DIR = Path(os.path.expanduser("~")) / ".isopgem" / "images"
 IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 
-# Cache for image dimensions
-image_dimensions_cache: Dict[str, Tuple[int, int]] = {}
+# Longest side of the thumbnails generated for stored images
+THUMBNAIL_SIZE = 256
+
+# Unreferenced images younger than this are kept by collect_garbage, since
+# they may belong to a document that has not been saved yet
+GARBAGE_MIN_AGE = 24 * 60 * 60
+
+# Dynamic property of a QTextDocument holding the pixel size of the display
+# image registered for each image name
+_DISPLAY_SIZES_PROPERTY = "display_image_sizes"
+
+
+class LRUCache:
+    """A thread-safe mapping that evicts its least recently used entries.
+
+    The cache holds at most max_entries entries and, if max_cost is given,
+    entries whose costs add up to at most max_cost.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_cost: Optional[int] = None,
+        cost: Callable[[Any], int] = lambda value: 1,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int): Largest number of entries
+            max_cost (int, optional): Largest total cost of the entries
+            cost (Callable): Function giving the cost of a value
+        """
+        self.max_entries = max_entries
+        self.max_cost = max_cost
+        self._cost = cost
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._total_cost = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value, marking it as recently used.
+
+        Args:
+            key (Hashable): Key of the value
+            default (Any): Value returned if the key is not cached
+
+        Returns:
+            Any: The cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used ones if needed.
+
+        Args:
+            key (Hashable): Key of the value
+            value (Any): Value to cache
+        """
+        cost = self._cost(value)
+        with self._lock:
+            self._remove(key)
+            if self.max_cost is not None and cost > self.max_cost:
+                return
+            self._entries[key] = (value, cost)
+            self._total_cost += cost
+            while len(self._entries) > self.max_entries or (
+                self.max_cost is not None and self._total_cost > self.max_cost
+            ):
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self._total_cost -= evicted_cost
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a value if it is cached.
+
+        Args:
+            key (Hashable): Key of the value
+        """
+        with self._lock:
+            self._remove(key)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every value whose key matches a predicate.
+
+        Args:
+            predicate (Callable): Function returning True for keys to remove
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._entries.clear()
+            self._total_cost = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove a value (caller holds the lock)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_cost -= entry[1]
+
+
+# Cache for image dimensions, keyed by path
+image_dimensions_cache = LRUCache(max_entries=4096)
+
+# Decoded images scaled for display, keyed by (path, width, height, ratio)
+display_image_cache = LRUCache(
+    max_entries=512,
+    max_cost=128 * 1024 * 1024,
+    cost=lambda image: image.sizeInBytes(),
+)
+
+# Serializes reads and writes of the reference index
+_references_lock = threading.RLock()
 
 
 def get_image_storage_dir(document_id: str = None) -> Path:
     """Get the directory for storing images.
 
-    If a document_id is provided, images will be stored in a subdirectory
-    specific to that document.
+    Images of all documents share one content-addressed directory. If a
+    document_id is provided, the document's own subdirectory is returned;
+    it holds images stored before content addressing was introduced.
 
     Args:
-        document_id (str, optional): The document ID to create a subdirectory for
+        document_id (str, optional): The document ID to get the subdirectory for
 
     Returns:
         Path: The path to the image storage directory
@@ -52,41 +208,48 @@ def get_image_storage_dir(document_id: str = None) -> Path:
         doc_dir = IMAGE_DIR / document_id
         doc_dir.mkdir(exist_ok=True)
         return doc_dir
-    return IMAGE_DIR
+    return _object_dir()
 
 
-def generate_unique_filename(original_path: str, document_id: str = None) -> str:
-    """Generate a unique filename for an image.
+def _object_dir() -> Path:
+    """Get the directory of the content-addressed images."""
+    return IMAGE_DIR / "objects"
 
-    Creates a filename based on the original filename, current timestamp,
-    and a UUID to ensure uniqueness.
 
-    Args:
-        original_path (str): The original path of the image
-        document_id (str, optional): The document ID for organizing images
+def _thumbnail_dir() -> Path:
+    """Get the directory of the generated thumbnails."""
+    return IMAGE_DIR / "thumbnails"
 
-    Returns:
-        str: A unique filename for the image
+
+def _references_file() -> Path:
+    """Get the file recording which documents use each stored image."""
+    return IMAGE_DIR / "references.json"
+
+
+def _object_path(digest: str, extension: str) -> Path:
+    """Get the path of a stored image from its content hash.
+
+    Images are spread over subdirectories by the first two hash digits, so
+    no single directory grows too large.
     """
-    # Get the original extension
-    path_obj = Path(original_path)
-    extension = path_obj.suffix.lower()
+    return _object_dir() / digest[:2] / f"{digest}{extension}"
 
-    # Generate a unique name using timestamp and UUID
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
 
-    # Use original filename as a base (without extension)
-    base_name = path_obj.stem
+def is_stored_image(image_path: Union[str, Path]) -> bool:
+    """Check whether a path names a content-addressed stored image.
 
-    # Combine to create unique filename
-    unique_name = f"{base_name}_{timestamp}_{unique_id}{extension}"
+    Args:
+        image_path (Union[str, Path]): Path to check
 
-    return unique_name
+    Returns:
+        bool: True if the image is managed by the content-addressed store
+    """
+    path = Path(image_path)
+    return path.parent.parent == _object_dir() and len(path.stem) == 64
 
 
 def save_image_to_storage(
-    image_path: str,
+    image_path: Union[str, BinaryIO],
     document_id: str = None,
     max_width: int = 2000,
     max_height: int = 2000,
@@ -95,11 +258,15 @@ def save_image_to_storage(
     """Save an image to the storage directory with optimization.
 
     Loads the image, optionally resizes it if it exceeds maximum dimensions,
-    and saves it to the storage directory with the specified quality.
+    and encodes it with the specified quality. The result is stored under
+    the hash of its bytes, so an image that is already stored is not
+    written again. The document, if given, is recorded as a user of the
+    image, and a thumbnail is generated for new images.
 
     Args:
-        image_path (str): Path to the original image
-        document_id (str, optional): Document ID for organizing images
+        image_path (Union[str, BinaryIO]): Path to the original image, or a
+            file object with its data
+        document_id (str, optional): Document ID recorded as using the image
         max_width (int): Maximum width for the image
         max_height (int): Maximum height for the image
         quality (int): JPEG quality (0-100) for compression
@@ -111,19 +278,11 @@ def save_image_to_storage(
         ValueError: If the image cannot be loaded or saved
     """
     try:
-        # Get storage directory
-        storage_dir = get_image_storage_dir(document_id)
-
-        # Generate unique filename
-        unique_filename = generate_unique_filename(image_path, document_id)
-
-        # Full path for the stored image
-        storage_path = storage_dir / unique_filename
-
         # Load the image with PIL
         with Image.open(image_path) as img:
             # Get original dimensions
             original_width, original_height = img.size
+            source_format = img.format
 
             # Check if resizing is needed
             if original_width > max_width or original_height > max_height:
@@ -146,41 +305,73 @@ def save_image_to_storage(
 
             # Determine format for saving
             save_format = "PNG"
-            save_options = {}
+            save_options = {"optimize": True}
 
             # Use original format if possible, with optimization
-            if img.format == "JPEG":
+            if source_format == "JPEG":
                 save_format = "JPEG"
                 save_options = {"quality": quality, "optimize": True}
-            elif img.format == "PNG":
-                save_format = "PNG"
-                save_options = {"optimize": True}
 
-            # Save the image
-            img.save(storage_path, format=save_format, **save_options)
+            buffer = io.BytesIO()
+            img.save(buffer, format=save_format, **save_options)
 
-            # Store dimensions in cache
-            image_dimensions_cache[str(storage_path)] = (width, height)
+        data = buffer.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+        extension = ".jpg" if save_format == "JPEG" else ".png"
+        storage_path = _object_path(digest, extension)
 
+        if storage_path.exists():
+            logger.info(f"Image already stored as {storage_path}")
+        else:
+            _write_atomically(storage_path, data)
+            _generate_thumbnail(storage_path)
             logger.info(f"Saved image to {storage_path}")
-            return str(storage_path), width, height
+
+        if document_id:
+            add_image_reference(storage_path, document_id)
+
+        # Store dimensions in cache
+        image_dimensions_cache.put(str(storage_path), (width, height))
+
+        return str(storage_path), width, height
 
     except Exception as e:
         logger.error(f"Error saving image to storage: {str(e)}", exc_info=True)
         raise ValueError(f"Could not save image: {str(e)}")
 
 
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file, so it is never seen half written.
+
+    Args:
+        path (Path): Destination of the data
+        data (bytes): Content of the file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
 def data_uri_to_image_file(
     data_uri: str, document_id: str = None
 ) -> Tuple[str, int, int]:
     """Convert a data URI to an image file and save it to storage.
 
-    Extracts the image data from a data URI, saves it to a temporary file,
-    then processes it with save_image_to_storage.
+    Extracts the image data from a data URI and processes it with
+    save_image_to_storage.
 
     Args:
         data_uri (str): The data URI containing the image data
-        document_id (str, optional): Document ID for organizing images
+        document_id (str, optional): Document ID recorded as using the image
 
     Returns:
         Tuple[str, int, int]: Tuple containing (storage_path, width, height)
@@ -193,36 +384,12 @@ def data_uri_to_image_file(
         if not data_uri.startswith("data:image/"):
             raise ValueError("Invalid data URI format")
 
-        # Extract mime type and base64 data
-        mime_type = data_uri.split(";")[0].split(":")[1]
+        # Extract the base64 data; PIL detects the format from the bytes
         base64_data = data_uri.split(",")[1]
+        data = io.BytesIO(base64.b64decode(base64_data))
 
-        # Determine file extension from mime type
-        extension = ".png"  # Default
-        if mime_type == "image/jpeg":
-            extension = ".jpg"
-        elif mime_type == "image/gif":
-            extension = ".gif"
-
-        # Create a temporary file
-        temp_dir = Path(os.path.expanduser("~")) / ".isopgem" / "temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        temp_file = temp_dir / f"temp_image_{uuid.uuid4()}{extension}"
-
-        # Decode and save the base64 data
-        with open(temp_file, "wb") as f:
-            f.write(base64.b64decode(base64_data))
-
-        # Now save to storage with optimization
         try:
-            result = save_image_to_storage(str(temp_file), document_id)
-
-            # Clean up the temporary file
-            if temp_file.exists():
-                temp_file.unlink()
-
-            return result
+            return save_image_to_storage(data, document_id)
         except Exception as e:
             logger.error(f"Error processing data URI image: {str(e)}", exc_info=True)
             raise
@@ -235,7 +402,7 @@ def data_uri_to_image_file(
 def get_image_dimensions(image_path: str) -> Tuple[int, int]:
     """Get the dimensions of an image.
 
-    Checks the cache first, then loads the image to get its dimensions.
+    Checks the cache first, then reads the image header to get its dimensions.
 
     Args:
         image_path (str): Path to the image
@@ -247,16 +414,17 @@ def get_image_dimensions(image_path: str) -> Tuple[int, int]:
         ValueError: If the image cannot be loaded
     """
     # Check cache first
-    if image_path in image_dimensions_cache:
-        return image_dimensions_cache[image_path]
+    dimensions = image_dimensions_cache.get(image_path)
+    if dimensions is not None:
+        return dimensions
 
     try:
-        # Load with PIL to get dimensions
+        # PIL only reads the header to get the size
         with Image.open(image_path) as img:
             width, height = img.size
 
             # Cache the dimensions
-            image_dimensions_cache[image_path] = (width, height)
+            image_dimensions_cache.put(image_path, (width, height))
 
             return width, height
     except Exception as e:
@@ -264,10 +432,304 @@ def get_image_dimensions(image_path: str) -> Tuple[int, int]:
         raise ValueError(f"Could not get image dimensions: {str(e)}")
 
 
+def _thumbnail_path(image_path: Path, max_size: int) -> Path:
+    """Get the path of a stored image's thumbnail of a given size."""
+    return _thumbnail_dir() / f"{image_path.stem}_{max_size}.png"
+
+
+def _generate_thumbnail(image_path: Path, max_size: int = THUMBNAIL_SIZE) -> Path:
+    """Create the thumbnail of a stored image.
+
+    Images that already fit within the thumbnail size are their own
+    thumbnail.
+
+    Args:
+        image_path (Path): A content-addressed stored image
+        max_size (int): Longest side of the thumbnail
+
+    Returns:
+        Path: The thumbnail, or the image itself if it is small enough
+    """
+    with Image.open(image_path) as img:
+        if max(img.size) <= max_size:
+            return image_path
+        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG", optimize=True)
+
+    thumbnail = _thumbnail_path(image_path, max_size)
+    _write_atomically(thumbnail, buffer.getvalue())
+    return thumbnail
+
+
+def get_thumbnail(
+    image_path: Union[str, Path], max_size: int = THUMBNAIL_SIZE
+) -> Optional[Path]:
+    """Get a downscaled version of a stored image.
+
+    Thumbnails are generated when an image is stored; a missing one is
+    generated on demand.
+
+    Args:
+        image_path (Union[str, Path]): A content-addressed stored image
+        max_size (int): Longest side of the thumbnail
+
+    Returns:
+        Optional[Path]: The thumbnail (the image itself if it is small
+            enough), or None if the path is not a stored image
+    """
+    path = Path(image_path)
+    if not is_stored_image(path) or not path.exists():
+        return None
+
+    thumbnail = _thumbnail_path(path, max_size)
+    if thumbnail.exists():
+        return thumbnail
+    try:
+        return _generate_thumbnail(path, max_size)
+    except Exception as e:
+        logger.error(f"Error creating thumbnail: {str(e)}", exc_info=True)
+        return None
+
+
+def load_display_image(
+    image_path: str, width: int, height: int, device_pixel_ratio: float = 1.0
+) -> QImage:
+    """Load an image scaled to the size it is displayed at.
+
+    The image is decoded and scaled once and kept in an LRU cache, so
+    painting draws it without scaling. A thumbnail is decoded instead of
+    the full image when it is large enough for the display size.
+
+    Args:
+        image_path (str): Path to the image
+        width (int): Display width in device-independent pixels
+        height (int): Display height in device-independent pixels
+        device_pixel_ratio (float): Ratio of device to device-independent pixels
+
+    Returns:
+        QImage: The scaled image, null if the image cannot be loaded
+    """
+    key = (image_path, width, height, device_pixel_ratio)
+    image = display_image_cache.get(key)
+    if image is not None:
+        return image
+
+    pixel_width = max(1, round(width * device_pixel_ratio))
+    pixel_height = max(1, round(height * device_pixel_ratio))
+
+    source = image_path
+    thumbnail = get_thumbnail(image_path)
+    if thumbnail is not None:
+        thumb_width, thumb_height = get_image_dimensions(str(thumbnail))
+        if thumb_width >= pixel_width and thumb_height >= pixel_height:
+            source = str(thumbnail)
+
+    image = QImage(source)
+    if image.isNull():
+        return image
+    if (image.width(), image.height()) != (pixel_width, pixel_height):
+        image = image.scaled(
+            pixel_width,
+            pixel_height,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    image.setDevicePixelRatio(device_pixel_ratio)
+
+    display_image_cache.put(key, image)
+    return image
+
+
+def _has_display_image(
+    document: QTextDocument, image_path: str, pixel_size: Tuple[int, int]
+) -> bool:
+    """Check whether a document still holds a registered display image.
+
+    Args:
+        document (QTextDocument): Document showing the image
+        image_path (str): Name of the image in the document
+        pixel_size (Tuple[int, int]): Size the display image was registered at
+
+    Returns:
+        bool: True if the resource is the registered display image
+    """
+    resource = document.resource(
+        QTextDocument.ResourceType.ImageResource, QUrl(image_path)
+    )
+    return isinstance(resource, QImage) and (
+        resource.width(),
+        resource.height(),
+    ) == tuple(pixel_size)
+
+
+def register_display_image(
+    document: QTextDocument,
+    image_path: str,
+    width: int,
+    height: int,
+    device_pixel_ratio: float = 1.0,
+) -> bool:
+    """Make a document paint an image from a copy scaled to its display size.
+
+    The scaled image is added as the document's resource for the image's
+    name, so the document neither decodes the full image nor scales it on
+    every repaint. The image format must set the display width and height.
+
+    Every use of a name in the document is drawn from the same resource, and
+    stored images are named by content, so the same image inserted twice
+    shares it. The resource is therefore never made smaller than one
+    registered before: it covers the largest size the name was shown at,
+    and smaller uses are scaled down from it instead of up.
+
+    Args:
+        document (QTextDocument): Document showing the image
+        image_path (str): Name of the image in the document
+        width (int): Display width
+        height (int): Display height
+        device_pixel_ratio (float): Ratio of device to device-independent pixels
+
+    Returns:
+        bool: True if the display image was registered
+    """
+    if width <= 0 or height <= 0 or image_path.startswith("data:"):
+        return False
+
+    # Sizes are compared in device pixels, the size the copy is scaled to
+    pixel_width = round(width * device_pixel_ratio)
+    pixel_height = round(height * device_pixel_ratio)
+    sizes = dict(document.property(_DISPLAY_SIZES_PROPERTY) or {})
+    registered = sizes.get(image_path)
+    if registered is not None and not _has_display_image(
+        document, image_path, registered
+    ):
+        # QTextDocument.clear() dropped the resources
+        registered = None
+    if registered is not None:
+        if registered[0] >= pixel_width and registered[1] >= pixel_height:
+            # The registered copy is large enough for this use as well
+            return True
+        pixel_width = max(pixel_width, registered[0])
+        pixel_height = max(pixel_height, registered[1])
+
+    image = load_display_image(image_path, pixel_width, pixel_height)
+    if image.isNull():
+        return False
+    document.addResource(
+        QTextDocument.ResourceType.ImageResource, QUrl(image_path), image
+    )
+    sizes[image_path] = (pixel_width, pixel_height)
+    document.setProperty(_DISPLAY_SIZES_PROPERTY, sizes)
+    return True
+
+
+def _load_references() -> Dict[str, Set[str]]:
+    """Read the reference index (caller holds the lock).
+
+    Returns:
+        Dict[str, Set[str]]: Stored image file names and the IDs of the
+            documents using them
+    """
+    try:
+        with open(_references_file(), "r", encoding="utf-8") as f:
+            return {name: set(docs) for name, docs in json.load(f).items()}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.error(f"Error reading image references: {str(e)}", exc_info=True)
+        return {}
+
+
+def _save_references(references: Dict[str, Set[str]]) -> None:
+    """Write the reference index (caller holds the lock)."""
+    data = {name: sorted(docs) for name, docs in sorted(references.items()) if docs}
+    _write_atomically(_references_file(), json.dumps(data, indent=1).encode("utf-8"))
+
+
+def add_image_reference(image_path: Union[str, Path], document_id: str) -> None:
+    """Record that a document uses a stored image.
+
+    Args:
+        image_path (Union[str, Path]): A content-addressed stored image
+        document_id (str): The document using it
+    """
+    path = Path(image_path)
+    if not is_stored_image(path):
+        return
+
+    with _references_lock:
+        references = _load_references()
+        users = references.setdefault(path.name, set())
+        if document_id not in users:
+            users.add(document_id)
+            _save_references(references)
+
+
+def move_image_references(old_document_id: str, new_document_id: str) -> None:
+    """Hand all image references of a document over to another document ID.
+
+    Args:
+        old_document_id (str): ID the document used so far
+        new_document_id (str): ID the references are recorded under from now on
+    """
+    if old_document_id == new_document_id:
+        return
+
+    with _references_lock:
+        references = _load_references()
+        moved = False
+        for users in references.values():
+            if old_document_id in users:
+                users.discard(old_document_id)
+                users.add(new_document_id)
+                moved = True
+        if moved:
+            _save_references(references)
+
+
+def image_reference_count(image_path: Union[str, Path]) -> int:
+    """Get the number of documents using a stored image.
+
+    Args:
+        image_path (Union[str, Path]): A content-addressed stored image
+
+    Returns:
+        int: Number of documents referencing the image
+    """
+    with _references_lock:
+        return len(_load_references().get(Path(image_path).name, ()))
+
+
+def _delete_stored_image(name: str) -> bool:
+    """Delete a stored image, its thumbnails and its cache entries.
+
+    Args:
+        name (str): File name of the stored image
+
+    Returns:
+        bool: True if the image file was deleted
+    """
+    path = _object_path(Path(name).stem, Path(name).suffix)
+    for thumbnail in _thumbnail_dir().glob(f"{path.stem}_*.png"):
+        thumbnail.unlink(missing_ok=True)
+
+    image_dimensions_cache.pop(str(path))
+    display_image_cache.discard_where(lambda key: key[0] == str(path))
+
+    try:
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
 def cleanup_unused_images(document_id: str, used_images: List[str]) -> int:
     """Clean up unused images for a document.
 
-    Removes images that are no longer referenced by the document.
+    Makes the document's references exactly the stored images it still
+    uses, and deletes images no other document references any more.
+    Images in the document's own directory, from before content
+    addressing, are removed if the document no longer uses them.
 
     Args:
         document_id (str): The document ID
@@ -277,31 +739,39 @@ def cleanup_unused_images(document_id: str, used_images: List[str]) -> int:
         int: Number of images removed
     """
     try:
-        # Get the document's image directory
-        doc_dir = get_image_storage_dir(document_id)
-
-        # Skip if directory doesn't exist
-        if not doc_dir.exists():
-            return 0
-
-        # Convert used_images to absolute paths
-        used_images_abs = [str(Path(path).absolute()) for path in used_images]
-
-        # Find all images in the directory
-        all_images = list(doc_dir.glob("*.*"))
-
-        # Identify unused images
+        used_names = {Path(p).name for p in used_images if is_stored_image(p)}
         removed_count = 0
-        for img_path in all_images:
-            abs_path = str(img_path.absolute())
-            if abs_path not in used_images_abs:
-                # Remove the unused image
-                img_path.unlink()
-                removed_count += 1
 
-                # Remove from cache if present
-                if abs_path in image_dimensions_cache:
-                    del image_dimensions_cache[abs_path]
+        with _references_lock:
+            references = _load_references()
+            released = []
+            for name, users in references.items():
+                if document_id in users and name not in used_names:
+                    users.discard(document_id)
+                    if not users:
+                        released.append(name)
+            for name in used_names:
+                references.setdefault(name, set()).add(document_id)
+
+            for name in released:
+                if _delete_stored_image(name):
+                    removed_count += 1
+            _save_references(references)
+
+        # Images stored per document before content addressing
+        doc_dir = IMAGE_DIR / document_id
+        if doc_dir.is_dir():
+            used_images_abs = {str(Path(path).absolute()) for path in used_images}
+            for img_path in doc_dir.glob("*.*"):
+                abs_path = str(img_path.absolute())
+                if abs_path not in used_images_abs:
+                    # Remove the unused image
+                    img_path.unlink()
+                    removed_count += 1
+
+                    # Remove from caches if present
+                    image_dimensions_cache.pop(abs_path)
+                    display_image_cache.discard_where(lambda key: key[0] == abs_path)
 
         logger.info(
             f"Cleaned up {removed_count} unused images for document {document_id}"
@@ -313,6 +783,45 @@ def cleanup_unused_images(document_id: str, used_images: List[str]) -> int:
         return 0
 
 
+def collect_garbage(min_age: float = GARBAGE_MIN_AGE) -> int:
+    """Delete stored images that no document references.
+
+    Images stored without a document, or by a document that was never
+    cleaned up, are only deleted once they are older than min_age.
+
+    Args:
+        min_age (float): Seconds an unreferenced image is kept
+
+    Returns:
+        int: Number of images removed
+    """
+    removed_count = 0
+    cutoff = time.time() - min_age
+
+    with _references_lock:
+        referenced = {name for name, users in _load_references().items() if users}
+        for path in _object_dir().glob("??/*.*"):
+            if path.name in referenced or not is_stored_image(path):
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            if _delete_stored_image(path.name):
+                removed_count += 1
+
+    # Thumbnails whose image is gone
+    stored = {path.stem for path in _object_dir().glob("??/*.*")}
+    for thumbnail in _thumbnail_dir().glob("*.png"):
+        if thumbnail.stem.rsplit("_", 1)[0] not in stored:
+            thumbnail.unlink(missing_ok=True)
+
+    if removed_count:
+        logger.info(f"Collected {removed_count} unreferenced images")
+    return removed_count
+
+
 def export_document_with_images(document_id: str, export_dir: Path) -> List[str]:
     """Export all images for a document to a specified directory.
 
@@ -327,23 +836,31 @@ def export_document_with_images(document_id: str, export_dir: Path) -> List[str]
         List[str]: List of exported image paths
     """
     try:
-        # Get the document's image directory
-        doc_dir = get_image_storage_dir(document_id)
+        with _references_lock:
+            all_images = [
+                _object_path(Path(name).stem, Path(name).suffix)
+                for name, users in _load_references().items()
+                if document_id in users
+            ]
+
+        # Images stored per document before content addressing
+        doc_dir = IMAGE_DIR / document_id
+        if doc_dir.is_dir():
+            all_images.extend(doc_dir.glob("*.*"))
 
-        # Skip if directory doesn't exist
-        if not doc_dir.exists():
+        if not all_images:
             return []
 
         # Create images subdirectory in export directory
         export_images_dir = export_dir / "images"
         export_images_dir.mkdir(parents=True, exist_ok=True)
 
-        # Find all images in the document directory
-        all_images = list(doc_dir.glob("*.*"))
-
         # Copy each image to the export directory
         exported_paths = []
         for img_path in all_images:
+            if not img_path.exists():
+                continue
+
             # Destination path
             dest_path = export_images_dir / img_path.name
 
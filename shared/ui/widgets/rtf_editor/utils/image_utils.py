@@ -16,6 +16,8 @@ from typing import Optional
 from PyQt6.QtGui import QTextCursor, QTextImageFormat
 from PyQt6.QtWidgets import QTextEdit
 
+from shared.ui.widgets.rtf_editor.utils.image_storage import register_display_image
+
 
 class ImageUtils:
     """Utility class for image handling operations."""
@@ -169,6 +171,15 @@ class ImageUtils:
             new_format.setHeight(height)
             cursor.insertImage(new_format)
 
+            # Paint from a copy scaled to the new size
+            register_display_image(
+                editor.document(),
+                image_path,
+                width,
+                height,
+                editor.devicePixelRatioF(),
+            )
+
             return True
         except Exception as e:
             print(f"Error updating image: {e}")
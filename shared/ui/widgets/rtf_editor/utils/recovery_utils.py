@@ -2,7 +2,7 @@
 
 This module provides functions and classes for implementing consistent error recovery
 throughout the RTF editor. It includes mechanisms for:
-1. Auto-saving documents
+1. Auto-saving documents in the background, with atomic writes
 2. Recovering from crashes
 3. Handling common failure scenarios
 4. Providing graceful fallbacks
@@ -12,13 +12,17 @@ and that the application can recover from errors in a predictable way.
 """
 
 import json
+import os
 import tempfile
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextDocument
 from PyQt6.QtWidgets import QMessageBox, QTextEdit
 
 from shared.ui.widgets.rtf_editor.utils.logging_utils import get_logger
@@ -31,9 +35,17 @@ class AutoSaveManager(QObject):
     """Manages automatic saving of document content to prevent data loss.
 
     This class provides functionality to periodically save document content
-    to temporary files, which can be used to recover content in case of
+    to recovery files, which can be used to recover content in case of
     application crashes or other failures.
 
+    Edits are tracked through the document's contentsChange signal, so a
+    timer tick with no edits since the last save does nothing. When there
+    are edits, the document is cloned on the GUI thread and the clone is
+    serialized to HTML and written on a worker thread, so typing and the
+    timer tick do not wait on the serialization of large documents.
+    Recovery files are written to a temporary file and renamed into place,
+    and old files are rotated out per document and under a total size cap.
+
     Attributes:
         auto_save_triggered (pyqtSignal): Signal emitted when auto-save occurs
         recovery_available (pyqtSignal): Signal emitted when recovery data is found
@@ -42,26 +54,54 @@ class AutoSaveManager(QObject):
     auto_save_triggered = pyqtSignal()
     recovery_available = pyqtSignal(str)  # Path to recovery file
 
-    def __init__(self, editor: QTextEdit, interval: int = 60000):
+    # Delivers a save's number and recovery file (or None) from the worker
+    _save_finished = pyqtSignal(int, object)
+
+    def __init__(
+        self,
+        editor: QTextEdit,
+        interval: int = 60000,
+        max_files: int = 5,
+        max_total_bytes: int = 100 * 1024 * 1024,
+    ):
         """Initialize the AutoSaveManager.
 
         Args:
             editor (QTextEdit): The text editor to monitor and auto-save
             interval (int): Auto-save interval in milliseconds (default: 60000 = 1 minute)
+            max_files (int): Recovery files kept per document
+            max_total_bytes (int): Size cap of the recovery directory in bytes
         """
         super().__init__()
         self.editor = editor
         self.interval = interval
+        self.max_files = max_files
+        self.max_total_bytes = max_total_bytes
         self.timer = QTimer()
         self.timer.timeout.connect(self.auto_save)
         self.recovery_dir = self._get_recovery_directory()
         self.current_document_path = None
-        self.last_save_content = ""
         self.disable_recovery = False  # Flag to disable recovery prompts
 
+        # Document being tracked and the span of characters edited since the
+        # last snapshot, as (first position, end position) or None
+        self._document: Optional[QTextDocument] = None
+        self._dirty_range: Optional[Tuple[int, int]] = None
+
+        # Snapshot being written and its save number; only one save is in
+        # flight at a time
+        self._snapshot: Optional[QTextDocument] = None
+        self._save_id = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rtf-autosave"
+        )
+        self._save_finished.connect(self._on_save_finished)
+
         # Create recovery directory if it doesn't exist
         self.recovery_dir.mkdir(parents=True, exist_ok=True)
 
+        self._track_document()
+
     def _get_recovery_directory(self) -> Path:
         """Get the directory for storing recovery files.
 
@@ -83,10 +123,14 @@ class AutoSaveManager(QObject):
     def cleanup(self):
         """Clean up resources and stop auto-save.
 
-        Call this method when the editor is being destroyed.
+        Call this method when the editor is being destroyed. A save in
+        progress is finished first.
         """
         self.stop()
+        self._untrack_document()
         self.editor = None
+        self._executor.shutdown(wait=True)
+        self._snapshot = None
         logger.debug("Auto-save manager cleaned up")
 
     def set_interval(self, interval: int):
@@ -109,11 +153,73 @@ class AutoSaveManager(QObject):
         """
         self.current_document_path = path
 
-    def auto_save(self):
+    def has_unsaved_changes(self) -> bool:
+        """Check whether the document was edited since the last auto-save.
+
+        Returns:
+            bool: True if there are edits not written to a recovery file
+        """
+        return self._dirty_range is not None
+
+    def dirty_blocks(self) -> Tuple[int, int]:
+        """Get the range of blocks edited since the last auto-save.
+
+        Returns:
+            Tuple[int, int]: First and last edited block numbers, or (-1, -1)
+                if nothing was edited
+        """
+        if self._dirty_range is None or self._document is None:
+            return -1, -1
+        first, end = self._dirty_range
+        return (
+            self._document.findBlock(first).blockNumber(),
+            self._document.findBlock(max(first, end - 1)).blockNumber(),
+        )
+
+    def _track_document(self) -> None:
+        """Follow edits of the editor's current document."""
+        document = self.editor.document() if self.editor else None
+        if document is self._document:
+            return
+
+        self._untrack_document()
+        self._document = document
+        if document is not None:
+            document.contentsChange.connect(self._on_contents_change)
+        self._dirty_range = None
+
+    def _untrack_document(self) -> None:
+        """Stop following the tracked document."""
+        if self._document is not None:
+            try:
+                self._document.contentsChange.disconnect(self._on_contents_change)
+            except (RuntimeError, TypeError):
+                # The document was already deleted or disconnected
+                pass
+        self._document = None
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Widen the edited range; runs on every keystroke, so it stays O(1)."""
+        end = position + added
+        if self._dirty_range is None:
+            self._dirty_range = (position, end)
+        else:
+            first, last = self._dirty_range
+            # Positions after the edit moved by the change in length
+            if last > position:
+                last = max(position, last + added - removed)
+            self._dirty_range = (min(first, position), max(last, end))
+
+    def auto_save(self, blocking: bool = False):
         """Perform auto-save of the current document content.
 
-        Saves the current document content to a temporary file if it has changed
-        since the last save.
+        Saves the current document content to a recovery file if it has been
+        edited since the last save. The HTML is produced and written in the
+        background unless blocking is set.
+
+        Args:
+            blocking (bool): Write the recovery file before returning, e.g.
+                for an emergency save before the application exits
         """
         try:
             # Check if editor still exists
@@ -129,74 +235,173 @@ class AutoSaveManager(QObject):
                 logger.debug("Editor has been deleted, skipping auto-save")
                 return
 
-            # Get current content
-            current_content = self.editor.toHtml()
+            self._track_document()
 
             # Only save if content has changed
-            if current_content != self.last_save_content:
-                # Update last save content even if recovery is disabled
-                self.last_save_content = current_content
-
-                # Skip creating recovery files if recovery is disabled
-                if self.disable_recovery:
-                    logger.debug("Recovery is disabled, skipping auto-save file creation")
-                    self.auto_save_triggered.emit()
+            if self._dirty_range is None:
+                return
+
+            # Skip creating recovery files if recovery is disabled
+            if self.disable_recovery:
+                self._dirty_range = None
+                logger.debug("Recovery is disabled, skipping auto-save file creation")
+                self.auto_save_triggered.emit()
+                return
+
+            if self._snapshot is not None:
+                if not blocking:
+                    # The edits are picked up by the next tick
+                    logger.debug("Previous auto-save still running, skipping")
                     return
+                # Wait for the running save; its late report is ignored
+                self._executor.submit(lambda: None).result()
+                self._snapshot = None
+
+            first_block, last_block = self.dirty_blocks()
+            logger.debug(f"Auto-saving edits in blocks {first_block}-{last_block}")
+
+            # Cloning copies the document's text and formats without
+            # serializing them; the clone is only read by the worker
+            self._snapshot = self._document.clone()
+            self._dirty_range = None
+            self._save_id += 1
+            save_id = self._save_id
+
+            doc_id = "unsaved"
+            if self.current_document_path:
+                doc_id = Path(self.current_document_path).stem
+
+            future = self._executor.submit(
+                self._write_recovery_file,
+                self._snapshot,
+                doc_id,
+                self.current_document_path,
+            )
+            if blocking:
+                self._on_save_finished(save_id, future.result())
+            else:
+                future.add_done_callback(partial(self._deliver, save_id))
+        except Exception as e:
+            logger.error(f"Auto-save failed: {str(e)}", exc_info=True)
 
-                # Generate recovery file name
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                doc_id = "unsaved"
-                if self.current_document_path:
-                    doc_id = Path(self.current_document_path).stem
+    def _deliver(self, save_id: int, future: Future) -> None:
+        """Pass a finished save to the GUI thread (runs in the worker)."""
+        try:
+            self._save_finished.emit(save_id, future.result())
+        except Exception as e:
+            logger.error(f"Auto-save failed: {str(e)}", exc_info=True)
+            self._save_finished.emit(save_id, None)
+
+    def _on_save_finished(self, save_id: int, recovery_file: Optional[Path]) -> None:
+        """Release the snapshot after a save and report it."""
+        if save_id != self._save_id or self._snapshot is None:
+            # Superseded by a blocking save, or the manager was cleaned up
+            return
+
+        # Drop the clone here so it is deleted on the thread that created it
+        self._snapshot = None
+        if recovery_file is not None:
+            self.auto_save_triggered.emit()
+            logger.info(f"Auto-saved document to {recovery_file}")
+        else:
+            # Try again on the next tick
+            self._dirty_range = self._dirty_range or (0, 0)
 
-                recovery_file = self.recovery_dir / f"{doc_id}_{timestamp}.recovery"
+    def _write_recovery_file(
+        self,
+        snapshot: QTextDocument,
+        doc_id: str,
+        original_path: Optional[str],
+    ) -> Optional[Path]:
+        """Serialize a document snapshot into a new recovery file.
 
-                # Save metadata
-                metadata = {
-                    "timestamp": timestamp,
-                    "original_path": self.current_document_path,
-                    "format": "html",
-                }
+        Runs on the worker thread. The file is written under a temporary
+        name and renamed into place, so a crash during the write never
+        leaves a truncated recovery file behind.
 
-                # Save content and metadata
-                with open(recovery_file, "w", encoding="utf-8") as f:
-                    f.write(json.dumps(metadata) + "\n")
-                    f.write(current_content)
+        Args:
+            snapshot (QTextDocument): Clone of the document to save
+            doc_id (str): Document identifier used in the file name
+            original_path (Optional[str]): Path of the document, if saved
 
-                self.auto_save_triggered.emit()
-                logger.info(f"Auto-saved document to {recovery_file}")
+        Returns:
+            Optional[Path]: The recovery file, or None if writing failed
+        """
+        try:
+            content = snapshot.toHtml()
+
+            # Generate recovery file name
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            recovery_file = self.recovery_dir / f"{doc_id}_{timestamp}.recovery"
+
+            # Save metadata
+            metadata = {
+                "timestamp": timestamp,
+                "original_path": original_path,
+                "format": "html",
+            }
 
-                # Clean up old recovery files
-                self._cleanup_old_recovery_files()
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.recovery_dir, prefix=f".{doc_id}_", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(metadata) + "\n")
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_name, recovery_file)
+            except BaseException:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+                raise
+
+            # Clean up old recovery files
+            self._cleanup_old_recovery_files(self.max_files, keep=recovery_file)
+            return recovery_file
         except Exception as e:
             logger.error(f"Auto-save failed: {str(e)}", exc_info=True)
+            return None
 
-    def _cleanup_old_recovery_files(self, max_files: int = 10):
+    def _cleanup_old_recovery_files(
+        self, max_files: int = 5, keep: Optional[Path] = None
+    ):
         """Clean up old recovery files, keeping only the most recent ones.
 
+        At most max_files files are kept per document, and the oldest files
+        are removed until the directory fits within max_total_bytes.
+
         Args:
             max_files (int): Maximum number of recovery files to keep per document
+            keep (Optional[Path]): File never removed, e.g. the one just written
         """
         try:
-            # Group files by document ID
-            recovery_files = {}
+            # Newest first, with their sizes
+            files = []
             for file in self.recovery_dir.glob("*.recovery"):
-                doc_id = file.stem.split("_")[0]
-                if doc_id not in recovery_files:
-                    recovery_files[doc_id] = []
-                recovery_files[doc_id].append(file)
-
-            # For each document, keep only the most recent files
-            for doc_id, files in recovery_files.items():
-                if len(files) > max_files:
-                    # Sort by modification time (newest first)
-                    sorted_files = sorted(
-                        files, key=lambda f: f.stat().st_mtime, reverse=True
-                    )
-                    # Remove older files
-                    for file in sorted_files[max_files:]:
-                        file.unlink()
-                        logger.debug(f"Removed old recovery file: {file}")
+                try:
+                    stat = file.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, file))
+            files.sort(key=lambda entry: entry[0], reverse=True)
+
+            # Group files by document ID; names end in _YYYYmmdd_HHMMSS
+            per_document: Dict[str, int] = {}
+            total = 0
+            for _, size, file in files:
+                doc_id = file.stem.rsplit("_", 2)[0]
+                per_document[doc_id] = per_document.get(doc_id, 0) + 1
+                if file != keep and (
+                    per_document[doc_id] > max_files
+                    or total + size > self.max_total_bytes
+                ):
+                    file.unlink(missing_ok=True)
+                    logger.debug(f"Removed old recovery file: {file}")
+                    continue
+                total += size
         except Exception as e:
             logger.error(f"Error cleaning up recovery files: {str(e)}", exc_info=True)
 
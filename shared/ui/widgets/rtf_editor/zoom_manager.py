@@ -2,6 +2,7 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import QComboBox, QHBoxLayout, QToolButton, QWidget
 
 from shared.ui.widgets.rtf_editor.utils.error_utils import handle_error, handle_warning
+from shared.ui.widgets.rtf_editor.utils.image_storage import register_display_image
 from shared.ui.widgets.rtf_editor.utils.logging_utils import get_logger
 
 # Initialize logger
@@ -396,6 +397,15 @@ class ZoomManager(QWidget):
                         # Apply the new format
                         cursor.setCharFormat(new_fmt)
 
+                        # Paint from a copy scaled to the new size
+                        register_display_image(
+                            document,
+                            name,
+                            new_width,
+                            new_height,
+                            self.editor.devicePixelRatioF(),
+                        )
+
                         # Clear selection and restore position
                         cursor.clearSelection()
                         cursor.setPosition(pos)
@@ -499,6 +509,15 @@ class ZoomManager(QWidget):
                             # Apply the format
                             cursor.setCharFormat(new_fmt)
 
+                            # Paint from a copy scaled to the new size
+                            register_display_image(
+                                document,
+                                name,
+                                new_width,
+                                new_height,
+                                self.editor.devicePixelRatioF(),
+                            )
+
                             logger.debug(
                                 f"Scaled fragment image to {new_width}x{new_height}"
                             )
@@ -0,0 +1,123 @@
+"""
+Purpose: Computes content hashes that identify duplicate calculations
+
+This file is part of the shared utilities. It defines what makes two saved
+calculations "the same": equal normalized input text, calculation method and
+result value. The resulting hash is stored with every calculation and backed
+by a unique index, so duplicates are caught when they are written.
+
+Key components:
+- normalize_calculation_text: Canonical form of calculation input text
+- calculation_content_hash: Hash of the normalized text, method and value
+- DuplicateMergePolicy: How tags and notes of a duplicate are merged
+- merge_duplicate_fields: Applies the merge policies to tags and notes
+
+Dependencies:
+- hashlib: For hashing
+- unicodedata: For Unicode normalization
+
+Related files:
+- shared/repositories/database.py: Backfills hashes for existing databases
+- shared/repositories/sqlite_calculation_repository.py: Merges duplicates on save
+- shared/services/database_maintenance_service.py: Detects legacy duplicates
+"""
+
+import hashlib
+import unicodedata
+from enum import Enum
+from typing import List, Optional, Tuple, Union
+
+
+def normalize_calculation_text(text: Optional[str]) -> str:
+    """Normalize calculation input text for duplicate detection.
+
+    Applies NFC normalization, case folding and whitespace collapsing, so that
+    inputs differing only in composition, case or spacing compare equal.
+
+    Args:
+        text: Input text of a calculation
+
+    Returns:
+        Normalized text
+    """
+    if not text:
+        return ""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def calculation_content_hash(
+    input_text: Optional[str],
+    calculation_type: Optional[str],
+    custom_method_name: Optional[str],
+    result_value: Union[int, str, None],
+) -> str:
+    """Compute the content hash of a calculation.
+
+    Args:
+        input_text: Input text of the calculation
+        calculation_type: Calculation type as stored in the database
+        custom_method_name: Custom cipher name, if any
+        result_value: Calculated value
+
+    Returns:
+        Hex digest identifying the calculation content
+    """
+    parts = (
+        normalize_calculation_text(input_text),
+        calculation_type or "",
+        custom_method_name or "",
+        "" if result_value is None else str(result_value).strip(),
+    )
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DuplicateMergePolicy(str, Enum):
+    """How a field is merged when a duplicate calculation is saved."""
+
+    KEEP_EXISTING = "keep_existing"  # Keep the stored value, ignore the new one
+    REPLACE = "replace"  # Overwrite the stored value with the new one
+    COMBINE = "combine"  # Union of tags / stored notes followed by new notes
+
+
+def merge_duplicate_fields(
+    existing_tags: List[str],
+    existing_notes: Optional[str],
+    new_tags: List[str],
+    new_notes: Optional[str],
+    tag_policy: DuplicateMergePolicy = DuplicateMergePolicy.COMBINE,
+    notes_policy: DuplicateMergePolicy = DuplicateMergePolicy.COMBINE,
+) -> Tuple[List[str], Optional[str]]:
+    """Merge the tags and notes of a duplicate into the stored calculation.
+
+    Args:
+        existing_tags: Tag IDs of the stored calculation
+        existing_notes: Notes of the stored calculation
+        new_tags: Tag IDs of the calculation being saved
+        new_notes: Notes of the calculation being saved
+        tag_policy: Merge policy for tags
+        notes_policy: Merge policy for notes
+
+    Returns:
+        Tuple of (merged tag IDs, merged notes)
+    """
+    if tag_policy == DuplicateMergePolicy.KEEP_EXISTING:
+        tags = list(existing_tags)
+    elif tag_policy == DuplicateMergePolicy.REPLACE:
+        tags = list(dict.fromkeys(new_tags))
+    else:
+        tags = list(dict.fromkeys([*existing_tags, *new_tags]))
+
+    if not new_notes:
+        notes = existing_notes
+    elif not existing_notes:
+        notes = new_notes
+    elif notes_policy == DuplicateMergePolicy.KEEP_EXISTING:
+        notes = existing_notes
+    elif notes_policy == DuplicateMergePolicy.REPLACE:
+        notes = new_notes
+    elif new_notes.strip() in existing_notes:
+        notes = existing_notes
+    else:
+        notes = f"{existing_notes}\n\n{new_notes}"
+
+    return tags, notes
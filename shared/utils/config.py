@@ -7,7 +7,7 @@ various sources (default config, environment variables, etc).
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from loguru import logger
@@ -84,6 +84,9 @@ class GematriaConfig(BaseModel):
 
     enabled: bool = True
     default_methods: List[str] = ["standard", "ordinal", "reduced"]
+    # How tags and notes are merged when a duplicate calculation is saved
+    duplicate_tag_policy: Literal["keep_existing", "replace", "combine"] = "combine"
+    duplicate_notes_policy: Literal["keep_existing", "replace", "combine"] = "combine"
 
 
 class GeometryConfig(BaseModel):
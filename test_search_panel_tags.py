@@ -17,6 +17,7 @@ from PyQt6.QtCore import Qt
 from gematria.services.calculation_database_service import CalculationDatabaseService
 from gematria.services.custom_cipher_service import CustomCipherService
 from gematria.ui.panels.search_panel import SearchPanel
+from search_panel_script_helpers import wait_for_results
 
 
 def test_search_panel_tags():
@@ -50,10 +51,12 @@ def test_search_panel_tags():
     # Search for calculations that have tags
     search_panel.has_tags.setChecked(True)
     search_panel._perform_search()
+    wait_for_results(app, search_panel.results_model)
     
     # Check the results table
     results_table = search_panel.results_table
-    row_count = results_table.rowCount()
+    results_model = search_panel.results_model
+    row_count = results_model.rowCount()
     
     print(f"📊 Found {row_count} results")
     
@@ -62,18 +65,18 @@ def test_search_panel_tags():
         
         for row in range(min(5, row_count)):  # Check first 5 rows
             # Get the tags item
-            tags_item = results_table.item(row, 3)  # Column 3 is tags
+            tags_item = results_model.index(row, 3)  # Column 3 is tags
             
-            if tags_item:
+            if tags_item.isValid():
                 # Get the text displayed
-                displayed_text = tags_item.text()
+                displayed_text = tags_item.data()
                 
                 # Get the tag data stored for the delegate
                 tag_data = tags_item.data(Qt.ItemDataRole.UserRole)
                 
                 # Get the calculation data
-                calc_item = results_table.item(row, 0)
-                calc_data = calc_item.data(Qt.ItemDataRole.UserRole) if calc_item else None
+                calc_item = results_model.index(row, 0)
+                calc_data = calc_item.data(Qt.ItemDataRole.UserRole) if calc_item.isValid() else None
                 
                 print(f"\n  Row {row}:")
                 if calc_data:
@@ -94,15 +97,16 @@ def test_search_panel_tags():
         search_panel._clear_search()
         search_panel.exact_value.setText("719")  # From our previous test
         search_panel._perform_search()
+        wait_for_results(app, search_panel.results_model)
         
-        row_count = results_table.rowCount()
+        row_count = results_model.rowCount()
         print(f"📊 Found {row_count} results for value 719")
         
         if row_count > 0:
             # Check the first result
-            tags_item = results_table.item(0, 3)
-            if tags_item:
-                displayed_text = tags_item.text()
+            tags_item = results_model.index(0, 3)
+            if tags_item.isValid():
+                displayed_text = tags_item.data()
                 tag_data = tags_item.data(Qt.ItemDataRole.UserRole)
                 print(f"    Displayed text: '{displayed_text}'")
                 print(f"    Tag data: {tag_data}")
@@ -6,6 +6,7 @@ This script tests the tag column display to see if width is causing the "..." is
 """
 
 import sys
+import time
 from pathlib import Path
 
 # Add the project root to the Python path
@@ -17,6 +18,7 @@ from PyQt6.QtCore import Qt
 from gematria.services.calculation_database_service import CalculationDatabaseService
 from gematria.services.custom_cipher_service import CustomCipherService
 from gematria.ui.panels.search_panel import SearchPanel
+from search_panel_script_helpers import wait_for_results
 
 
 def test_tag_column_width():
@@ -45,33 +47,35 @@ def test_tag_column_width():
     # Set up search criteria for calculations with tags
     search_panel.has_tags.setChecked(True)
     search_panel._perform_search()
+    wait_for_results(app, search_panel.results_model)
     
     # Check the results table
     results_table = search_panel.results_table
-    row_count = results_table.rowCount()
+    results_model = search_panel.results_model
+    row_count = results_model.rowCount()
     
     print(f"📊 Found {row_count} results")
     
     if row_count > 0:
         # Check column widths
         print("\n📏 Column widths:")
-        for col in range(results_table.columnCount()):
+        for col in range(results_model.columnCount()):
             width = results_table.columnWidth(col)
-            header = results_table.horizontalHeaderItem(col).text()
+            header = results_model.headerData(col, Qt.Orientation.Horizontal)
             print(f"  {header}: {width}px")
         
         # Check tag data in first few rows
         print("\n🏷️ Tag data in first 3 rows:")
         for row in range(min(3, row_count)):
-            text_item = results_table.item(row, 0)
-            tags_item = results_table.item(row, 3)  # Tags column
+            text_item = results_model.index(row, 0)
+            tags_item = results_model.index(row, 3)  # Tags column
             
-            if text_item and tags_item:
-                text = text_item.text()[:30] + "..." if len(text_item.text()) > 30 else text_item.text()
+            if text_item.isValid() and tags_item.isValid():
+                text = text_item.data()[:30] + "..." if len(text_item.data()) > 30 else text_item.data()
                 
                 # Get tag data from UserRole
                 tag_data = tags_item.data(Qt.ItemDataRole.UserRole)
-                display_text = tags_item.text()
+                display_text = tags_item.data()
                 
                 print(f"  Row {row + 1}: '{text}'")
                 print(f"    Display text: '{display_text}'")
@@ -99,7 +103,6 @@ def test_tag_column_width():
         print("   Check if tags are now visible properly")
         
         # Run for a short time to allow visual inspection
-        import time
         app.processEvents()
         time.sleep(2)
         app.processEvents()
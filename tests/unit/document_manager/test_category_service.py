@@ -0,0 +1,153 @@
+"""Unit tests for category hierarchy queries and the cached category tree."""
+
+from pathlib import Path
+
+import pytest
+
+from document_manager.models.document import Document, DocumentType
+from document_manager.models.document_category import DocumentCategory
+from document_manager.repositories.category_repository import CategoryRepository
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.category_service import CategoryService
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    """Get the path of a temporary database."""
+    return str(tmp_path / "isopgem.db")
+
+
+@pytest.fixture
+def service(db_path) -> CategoryService:
+    """Create a category service with a small hierarchy below the defaults.
+
+    Texts
+    ├── Greek
+    │   └── Koine
+    │       └── Septuagint
+    └── Arabic
+    """
+    service = CategoryService(CategoryRepository(db_path))
+    texts = service.create_category("Texts")
+    greek = service.create_category("Greek", parent_id=texts.id)
+    service.create_category("Arabic", parent_id=texts.id)
+    koine = service.create_category("Koine", parent_id=greek.id)
+    service.create_category("Septuagint", parent_id=koine.id)
+    return service
+
+
+def category_id(service: CategoryService, name: str) -> str:
+    """Get the ID of a category by name."""
+    return next(c.id for c in service.get_all_categories() if c.name == name)
+
+
+def names(tree):
+    """Get the names of a tree as nested (name, children) tuples."""
+    return [(node["name"], names(node["children"])) for node in tree]
+
+
+def test_tree_nests_children_by_name(service) -> None:
+    """Test that the tree follows the parent links with sorted children."""
+    orphan = DocumentCategory(name="Orphan", color="#000000", parent_id="missing")
+    service.save_category(orphan)
+
+    tree = names(service.get_category_tree())
+
+    assert [name for name, _ in tree] == sorted(name for name, _ in tree)
+    assert "Orphan" not in str(tree)
+    assert dict(tree)["Texts"] == [
+        ("Arabic", []),
+        ("Greek", [("Koine", [("Septuagint", [])])]),
+    ]
+
+
+def test_tree_is_cached_until_categories_change(service, db_path) -> None:
+    """Test that edits through any service on the database refresh the tree."""
+    tree = service.get_category_tree()
+    assert service.get_category_tree() is tree
+
+    other = CategoryService(CategoryRepository(db_path))
+    other.update_category(category_id(service, "Arabic"), name="Syriac")
+
+    refreshed = service.get_category_tree()
+    assert refreshed is not tree
+    assert dict(names(refreshed))["Texts"][1] == ("Syriac", [])
+
+
+def test_paths_and_descendants(service) -> None:
+    """Test ancestor and descendant queries."""
+    septuagint = category_id(service, "Septuagint")
+    texts = category_id(service, "Texts")
+
+    path = service.get_category_path(septuagint)
+    assert [c.name for c in path] == ["Texts", "Greek", "Koine", "Septuagint"]
+    assert service.get_category_path("missing") == []
+
+    descendants = service.get_descendant_categories(texts)
+    assert [c.name for c in descendants] == ["Arabic", "Greek", "Koine", "Septuagint"]
+    assert service.get_descendant_categories(septuagint) == []
+
+
+def test_moving_a_category_below_itself_is_refused(service) -> None:
+    """Test that an update creating a cycle is rejected."""
+    greek = category_id(service, "Greek")
+    koine = category_id(service, "Koine")
+    septuagint = category_id(service, "Septuagint")
+
+    assert service.update_category(greek, parent_id=septuagint) is None
+    assert service.update_category(koine, parent_id=koine) is None
+    assert service.update_category(septuagint, parent_id=greek).parent_id == greek
+
+
+def test_ancestors_list_each_category_once_on_a_cycle(service, db_path) -> None:
+    """Test that a cycle in stored parent links does not repeat ancestors."""
+    repository = CategoryRepository(db_path)
+    greek = repository.get_by_id(category_id(service, "Greek"))
+    koine = category_id(service, "Koine")
+    greek.parent_id = koine
+    repository.save(greek)
+
+    ancestors = repository.get_ancestors(koine)
+
+    assert [c.name for c in ancestors] == ["Greek", "Koine"]
+
+
+def test_revision_is_shared_across_path_spellings(tmp_path, monkeypatch) -> None:
+    """Test that relative and absolute paths of one database share edits."""
+    monkeypatch.chdir(tmp_path)
+    relative = CategoryRepository("isopgem.db")
+    absolute = CategoryRepository(str(tmp_path / "isopgem.db"))
+
+    revision = absolute.revision
+    relative.save(DocumentCategory(name="Shared", color="#000000"))
+
+    assert absolute.revision == revision + 1
+
+
+def test_deleting_all_categories_refreshes_cached_trees(service, db_path) -> None:
+    """Test that a purge through another repository empties the cached tree."""
+    assert service.get_category_tree()
+
+    assert CategoryRepository(db_path).delete_all() > 0
+
+    assert service.get_category_tree() == []
+
+
+def test_subtree_document_counts(service, db_path) -> None:
+    """Test that documents anywhere below a category are counted."""
+    documents = DocumentRepository(db_path)
+    for i, name in enumerate(["Greek", "Septuagint", "Septuagint", "Arabic"]):
+        document = Document(
+            name=f"doc_{i}.txt",
+            file_path=Path(f"doc_{i}.txt"),
+            file_type=DocumentType.TXT,
+            size_bytes=1,
+            category=category_id(service, name),
+        )
+        documents.save(document)
+    documents.delete(document.id)
+
+    assert service.count_subtree_documents(category_id(service, "Texts")) == 3
+    assert service.count_subtree_documents(category_id(service, "Greek")) == 3
+    assert service.count_subtree_documents(category_id(service, "Koine")) == 2
+    assert service.count_subtree_documents(category_id(service, "Arabic")) == 0
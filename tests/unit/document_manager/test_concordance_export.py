@@ -0,0 +1,107 @@
+"""Unit tests for streamed concordance exports."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from document_manager.models.document import Document, DocumentType
+from document_manager.models.kwic_concordance import (
+    ConcordanceExportFormat,
+    ConcordanceSettings,
+)
+from document_manager.repositories.concordance_repository import ConcordanceRepository
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.concordance_service import ConcordanceService
+from document_manager.services.document_service import DocumentService
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch) -> ConcordanceService:
+    """Create a concordance service over two documents."""
+    monkeypatch.chdir(tmp_path)
+    document_repository = DocumentRepository(tmp_path / "isopgem.db")
+    for name, text in [("b.txt", "The Word and the word."), ("a.txt", "WORD, λόγος.")]:
+        document_repository.save(
+            Document(
+                name=name,
+                file_path=tmp_path / name,
+                file_type=DocumentType.TXT,
+                size_bytes=1,
+                content=text,
+            )
+        )
+    return ConcordanceService(
+        ConcordanceRepository(str(tmp_path / "concordance.db")),
+        DocumentService(document_repository),
+    )
+
+
+@pytest.fixture
+def table(service):
+    """Generate and save a concordance table."""
+    document_ids = [s.id for s in service.document_service.get_document_summaries()]
+    table = service.generate_concordance(
+        "words", ["word"], document_ids, ConcordanceSettings(context_window=10)
+    )
+    service.save_concordance(table)
+    return service.get_concordance(table.id)
+
+
+def test_json_export_matches_whole_table_layout(service, table) -> None:
+    """Test that streamed JSON equals json.dumps of the whole table."""
+    export_format = ConcordanceExportFormat(
+        format_type="json", include_metadata=False, group_by_keyword=True
+    )
+
+    exported = service.export_concordance(table.id, export_format)
+
+    entries = sorted(table.entries, key=lambda e: e.keyword.lower())
+    expected = {
+        "concordance_table": {
+            "id": table.id,
+            "name": table.name,
+            "description": table.description,
+            "created_at": table.created_at.isoformat(),
+            "updated_at": table.updated_at.isoformat(),
+            "keywords": table.keywords,
+            "tags": table.tags,
+        },
+        "entries": [
+            {
+                "keyword": e.keyword,
+                "left_context": e.left_context,
+                "right_context": e.right_context,
+                "position": e.position,
+                "document_name": e.document_name,
+            }
+            for e in entries
+        ],
+        "statistics": table.get_statistics(),
+    }
+    assert exported == json.dumps(expected, indent=2)
+
+
+@pytest.mark.parametrize("file_name", ["words.csv", "words.csv.gz"])
+def test_file_export_streams_same_data(service, table, tmp_path, file_name) -> None:
+    """Test that file exports, compressed or not, hold the exported text."""
+    export_format = ConcordanceExportFormat(format_type="csv", group_by_document=True)
+    path = tmp_path / file_name
+
+    count = service.export_concordance_to_file(table.id, export_format, path)
+
+    opener = gzip.open if file_name.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        assert f.read() == service.export_concordance(table.id, export_format)
+    assert count == len(table.entries) == 3
+
+
+def test_failed_export_leaves_no_file(service, tmp_path) -> None:
+    """Test that an export that fails does not leave a partial file."""
+    with pytest.raises(ValueError):
+        service.export_concordance_to_file(
+            "missing", ConcordanceExportFormat(format_type="txt"), tmp_path / "x.txt"
+        )
+
+    assert not list(tmp_path.glob("x.txt*"))
@@ -0,0 +1,147 @@
+"""Unit tests for indexed concordance entry search and pagination."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from document_manager.models.kwic_concordance import (
+    ConcordanceEntry,
+    ConcordanceFilter,
+    ConcordanceTable,
+)
+from document_manager.repositories.concordance_repository import ConcordanceRepository
+
+CONTEXTS = [
+    ("In the beginning was the", "and the Word was with God"),
+    ("the light shineth in", "darkness; and the darkness"),
+    ("He was in the", "and the world was made by him"),
+    ("full of grace and", "truth, beheld his glory"),
+]
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> ConcordanceRepository:
+    """Create a repository over a temporary database."""
+    return ConcordanceRepository(str(tmp_path / "concordance.db"))
+
+
+def make_table(name: str, entry_count: int) -> ConcordanceTable:
+    """Build a table with entries spread over three documents."""
+    entries = [
+        ConcordanceEntry(
+            keyword=["Word", "word", "light", "Logos"][i % 4],
+            left_context=CONTEXTS[i % 4][0],
+            right_context=CONTEXTS[i % 4][1],
+            position=i * 10,
+            line_number=i + 1,
+            document_id=f"doc-{i % 3}",
+            document_name=f"{'cba'[i % 3]}.txt",
+        )
+        for i in range(entry_count)
+    ]
+    return ConcordanceTable(
+        name=name, keywords=["word", "light", "logos"], document_ids=[], entries=entries
+    )
+
+
+def page_through(repository, table_id, filter_criteria=None, **kwargs):
+    """Collect every entry of a table a few entries at a time."""
+    entries, after = [], None
+    while True:
+        page, after = repository.get_entries_after(
+            table_id, filter_criteria, after=after, limit=7, **kwargs
+        )
+        if not page:
+            return entries
+        entries.extend(page)
+
+
+@pytest.mark.parametrize(
+    "sort_by, key",
+    [
+        ("keyword", lambda e: (e.keyword, e.document_id, e.position)),
+        ("document", lambda e: (e.document_name, e.document_id, e.position, e.keyword)),
+        ("position", lambda e: (e.position, e.document_id, e.keyword)),
+    ],
+)
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_cover_the_table_in_sort_order(repository, sort_by, key, descending) -> None:
+    """Test that keyset pages join up to the whole table in order."""
+    table = make_table("paged", 50)
+    repository.save_concordance_table(table)
+    repository.save_concordance_table(make_table("other", 10))
+
+    entries = page_through(repository, table.id, sort_by=sort_by, descending=descending)
+
+    expected = sorted(table.entries, key=key, reverse=descending)
+    assert [e.id for e in entries] == [e.id for e in expected]
+
+
+def test_filters_use_keywords_documents_and_context_words(repository) -> None:
+    """Test keyword, document and full-text context filters with counts."""
+    table = make_table("filtered", 40)
+    repository.save_concordance_table(table)
+
+    def search(**criteria):
+        filter_criteria = ConcordanceFilter(**criteria)
+        entries = page_through(repository, table.id, filter_criteria)
+        assert repository.count_matching_entries(table.id, filter_criteria) == len(entries)
+        return {e.id for e in entries}
+
+    def expected(predicate):
+        return {e.id for e in table.entries if predicate(e)}
+
+    assert search(keywords=["WOR"]) == expected(lambda e: e.keyword.lower() == "word")
+    assert search(keywords=["missing"]) == set()
+    assert search(document_ids=["doc-1"]) == expected(lambda e: e.document_id == "doc-1")
+    assert search(document_names=["B.TXT"]) == expected(lambda e: e.document_name == "b.txt")
+    assert search(left_context_contains="beginning the") == expected(
+        lambda e: e.left_context.startswith("In the beginning")
+    )
+    assert search(right_context_contains="dark") == expected(
+        lambda e: "darkness" in e.right_context
+    )
+    assert search(keywords=["logos"], right_context_contains="truth") == expected(
+        lambda e: e.keyword == "Logos"
+    )
+    assert search(left_context_contains='"was') == expected(
+        lambda e: "was" in e.left_context.split()
+    )
+
+
+def test_resaved_and_deleted_tables_leave_the_context_index(repository, tmp_path) -> None:
+    """Test that replaced and deleted entries are removed from the index."""
+    table = make_table("indexed", 12)
+    repository.save_concordance_table(table)
+    repository.save_concordance_table(table)
+    light = ConcordanceFilter(left_context_contains="light")
+
+    assert repository.count_matching_entries(table.id, light) == 3
+
+    repository.delete_concordance_table(table.id)
+
+    conn = sqlite3.connect(tmp_path / "concordance.db")
+    assert conn.execute("SELECT COUNT(*) FROM concordance_entries_fts_rows").fetchone() == (0,)
+    assert conn.execute(
+        "SELECT COUNT(*) FROM concordance_entries_fts WHERE concordance_entries_fts MATCH 'light'"
+    ).fetchone() == (0,)
+
+
+def test_existing_entries_are_indexed_on_open(repository, tmp_path) -> None:
+    """Test that a database without the context index gets one filled."""
+    table = make_table("existing", 8)
+    repository.save_concordance_table(table)
+    conn = sqlite3.connect(tmp_path / "concordance.db")
+    conn.executescript(
+        "DROP TABLE concordance_entries_fts; DROP TABLE concordance_entries_fts_rows;"
+    )
+    conn.close()
+
+    reopened = ConcordanceRepository(str(tmp_path / "concordance.db"))
+
+    filter_criteria = ConcordanceFilter(right_context_contains="glory")
+    assert reopened.count_matching_entries(table.id, filter_criteria) == 2
+    assert reopened.get_entry_documents(table.id) == [
+        ("doc-2", "a.txt"), ("doc-1", "b.txt"), ("doc-0", "c.txt")
+    ]
@@ -0,0 +1,90 @@
+"""Unit tests for streamed, multi-process concordance generation."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from document_manager.models.document import Document, DocumentType
+from document_manager.repositories.concordance_repository import ConcordanceRepository
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.concordance_service import ConcordanceService
+from document_manager.services.document_service import DocumentService
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch) -> ConcordanceService:
+    """Create a concordance service over a few documents."""
+    monkeypatch.chdir(tmp_path)
+    document_repository = DocumentRepository(tmp_path / "isopgem.db")
+    for i in range(4):
+        document_repository.save(
+            Document(
+                name=f"doc_{i}.txt",
+                file_path=tmp_path / f"doc_{i}.txt",
+                file_type=DocumentType.TXT,
+                size_bytes=1,
+                content=f"The Logos was spoken.\n\nThe word {i} and the logos.\n" * 20,
+            )
+        )
+    return ConcordanceService(
+        ConcordanceRepository(str(tmp_path / "concordance.db")),
+        DocumentService(document_repository),
+    )
+
+
+def entry_keys(table):
+    """Get the comparable fields of a table's entries."""
+    return sorted(
+        (e.document_id, e.position, e.keyword, e.left_context, e.line_number)
+        for e in table.entries
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_streamed_entries_match_in_memory_generation(service, max_workers) -> None:
+    """Test that streaming in small batches stores every generated entry."""
+    document_ids = [s.id for s in service.document_service.get_document_summaries()]
+    progress = []
+
+    table = service.generate_concordance_streaming(
+        "streamed",
+        ["logos", "word"],
+        document_ids,
+        max_workers=max_workers,
+        batch_size=7,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+    expected = service.generate_concordance("memory", ["logos", "word"], document_ids)
+
+    stored = service.get_concordance(table.id)
+    assert len(stored.entries) == 4 * 20 * 3
+    assert entry_keys(stored) == entry_keys(expected)
+    assert progress[-1] == (4, 4)
+
+
+def test_cancelled_generation_leaves_no_table(service) -> None:
+    """Test that cancelling discards the partly written concordance."""
+    document_ids = [s.id for s in service.document_service.get_document_summaries()]
+    cancel = threading.Event()
+
+    table = service.generate_concordance_streaming(
+        "cancelled",
+        ["logos"],
+        document_ids,
+        max_workers=1,
+        batch_size=1,
+        progress_callback=lambda done, total: cancel.set(),
+        cancel_event=cancel,
+    )
+
+    assert table is None
+    assert service.list_concordances() == []
+
+
+def test_no_valid_documents_creates_no_table(service) -> None:
+    """Test that selecting only unknown documents fails before creating a table."""
+    with pytest.raises(ValueError):
+        service.generate_concordance_streaming("empty", ["logos"], ["missing"])
+
+    assert service.list_concordances() == []
@@ -0,0 +1,123 @@
+"""Unit tests for process-pool document import."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services import document_service as document_service_module
+from document_manager.services.document_extraction_pool import extract_documents
+from document_manager.services.document_service import DocumentService
+from document_manager.services.process_pool import WORKER_CRASHED, run_in_processes
+
+
+def _no_setup() -> None:
+    """Worker initializer doing nothing."""
+
+
+def _square_or_crash(number: int) -> int:
+    """Square a number in a worker, killing the worker for 0."""
+    if number == 0:
+        os._exit(1)
+    return number * number
+
+
+@pytest.fixture
+def text_files(tmp_path: Path, monkeypatch) -> list:
+    """Create a few text files and run inside a scratch directory."""
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "source"
+    source.mkdir()
+
+    paths = []
+    for i in range(5):
+        path = source / f"note_{i}.txt"
+        path.write_text(f"note {i} " * (i + 1), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_import_saves_every_file(tmp_path, text_files, max_workers) -> None:
+    """Test that batch import extracts and saves all files in batches."""
+    repository = DocumentRepository(tmp_path / "isopgem.db")
+    service = DocumentService(repository)
+
+    imported = service.batch_import_documents(
+        text_files, max_workers=max_workers, category_id="notes", batch_size=2
+    )
+
+    assert len(imported) == len(text_files)
+    stored = {document.name: document for document in repository.get_all()}
+    assert sorted(stored) == sorted(path.name for path in text_files)
+    assert stored["note_2.txt"].content.strip() == "note 2 note 2 note 2"
+    assert all(document.category == "notes" for document in stored.values())
+
+
+def test_slow_file_times_out(tmp_path, text_files, monkeypatch) -> None:
+    """Test that a file exceeding the time limit is reported and skipped."""
+    prepare = DocumentService.prepare_document
+
+    def slow_prepare(self, file_path):
+        if Path(file_path).name == "note_0.txt":
+            time.sleep(5)
+        return prepare(self, file_path)
+
+    monkeypatch.setattr(DocumentService, "prepare_document", slow_prepare)
+
+    results = list(
+        extract_documents(
+            text_files, tmp_path / "isopgem.db", max_workers=1, timeout=0.2
+        )
+    )
+
+    errors = {path.name: error for path, _, _, error in results if error}
+    assert list(errors) == ["note_0.txt"]
+    assert "timed out" in errors["note_0.txt"]
+    assert sum(1 for _, document, _, _ in results if document) == 4
+    # The timed out file's storage copy is removed again
+    assert len(list(Path("data/documents").glob("*.txt"))) == 4
+
+
+def test_crashed_worker_fails_only_its_items() -> None:
+    """Test that a worker calling os._exit does not abort the other items."""
+    numbers = [0] + list(range(1, 9))
+
+    results = list(
+        run_in_processes(
+            _square_or_crash, numbers, _no_setup, max_workers=2, max_pending=2
+        )
+    )
+
+    assert sorted(number for number, _, _ in results) == numbers
+    errors = {number: error for number, _, error in results if error}
+    assert errors[0] == WORKER_CRASHED
+    # Only items in flight with the crashing one are lost
+    assert len(errors) <= 2
+    for number, result, error in results:
+        if error is None:
+            assert result == number * number
+
+
+def test_batch_import_saves_extracted_documents_when_interrupted(
+    tmp_path, text_files, monkeypatch
+) -> None:
+    """Test that documents extracted before an error are still saved."""
+    extract = document_service_module.extract_documents
+
+    def interrupted_extract(*args, **kwargs):
+        for i, result in enumerate(extract(*args, **kwargs)):
+            if i == 3:
+                raise RuntimeError("import interrupted")
+            yield result
+
+    monkeypatch.setattr(document_service_module, "extract_documents", interrupted_extract)
+    repository = DocumentRepository(tmp_path / "isopgem.db")
+    service = DocumentService(repository)
+
+    with pytest.raises(RuntimeError):
+        service.batch_import_documents(text_files, max_workers=1, batch_size=10)
+
+    assert len(repository.get_all()) == 3
@@ -0,0 +1,116 @@
+"""Unit tests for fingerprint-based document integrity checks."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch) -> DocumentService:
+    """Create a document service on a scratch database."""
+    monkeypatch.chdir(tmp_path)
+    return DocumentService(DocumentRepository(tmp_path / "isopgem.db"))
+
+
+@pytest.fixture
+def document(service, tmp_path):
+    """Import a small text document."""
+    path = tmp_path / "note.txt"
+    path.write_text("sealed text", encoding="utf-8")
+    return service.import_document(path)
+
+
+def test_unchanged_file_is_not_hashed(service, document, monkeypatch) -> None:
+    """Test that fetching an unchanged document skips hashing its file."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was hashed")
+
+    monkeypatch.setattr(service.integrity_verifier, "schedule", fail)
+
+    fetched = service.get_document(document.id)
+
+    assert fetched.metadata["integrity_status"] == "OK"
+
+
+def test_touched_file_is_verified_in_background(service, document) -> None:
+    """Test that a file with new metadata but same content verifies as OK."""
+    stat = os.stat(document.file_path)
+    os.utime(document.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert service.get_document(document.id).metadata["integrity_status"] == (
+        "UNVERIFIED"
+    )
+    assert service.integrity_verifier.wait_idle(timeout=5)
+
+    assert service.get_document(document.id).metadata["integrity_status"] == "OK"
+
+
+def test_modified_file_is_reported(service, document) -> None:
+    """Test that a file whose content changed is flagged as a mismatch."""
+    Path(document.file_path).write_text("tampered txt", encoding="utf-8")
+
+    service.get_document(document.id)
+    assert service.integrity_verifier.wait_idle(timeout=5)
+
+    fetched = service.get_document(document.id)
+    assert fetched.metadata["integrity_status"] == "CHECKSUM_MISMATCH"
+    assert fetched.checksum == document.checksum
+
+
+def _make_legacy(service, document, md5: str) -> None:
+    """Store a document the way older versions did, with only an MD5 checksum."""
+    conn = service.document_repository._get_connection()
+    with conn:
+        conn.execute(
+            "UPDATE documents SET checksum = NULL, metadata = json_set("
+            "json_remove(metadata, '$.file_fingerprint', '$.verified_status'), "
+            "'$.checksum', ?) WHERE id = ?",
+            (md5, document.id),
+        )
+    conn.close()
+
+
+@pytest.mark.parametrize("tampered", [False, True])
+def test_legacy_checksum_is_checked_before_migration(
+    service, document, tampered
+) -> None:
+    """Test that a legacy MD5 is only replaced if the file still matches it."""
+    legacy_md5 = hashlib.md5(b"sealed text").hexdigest()
+    _make_legacy(service, document, legacy_md5)
+    if tampered:
+        Path(document.file_path).write_text("tampered txt", encoding="utf-8")
+
+    assert service.get_document(document.id).metadata["integrity_status"] == (
+        "UNVERIFIED"
+    )
+    assert service.integrity_verifier.wait_idle(timeout=5)
+
+    fetched = service.get_document(document.id)
+    if tampered:
+        assert fetched.metadata["integrity_status"] == "CHECKSUM_MISMATCH"
+        assert fetched.checksum is None
+        assert fetched.metadata["checksum"] == legacy_md5
+    else:
+        assert fetched.metadata["integrity_status"] == "OK"
+        assert fetched.checksum == document.checksum
+        assert "checksum" not in fetched.metadata
+
+
+def test_size_mismatch_is_not_cleared_by_fingerprint(service, document) -> None:
+    """Test that a matching fingerprint does not hide a recorded size mismatch."""
+    conn = service.document_repository._get_connection()
+    with conn:
+        conn.execute(
+            "UPDATE documents SET size_bytes = 1000 WHERE id = ?", (document.id,)
+        )
+    conn.close()
+
+    fetched = service.get_document(document.id)
+
+    assert fetched.metadata["integrity_status"] == "SIZE_MISMATCH"
@@ -0,0 +1,78 @@
+"""Unit tests for checksum-based incremental document import."""
+
+from pathlib import Path
+
+import pytest
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch) -> DocumentService:
+    """Create a document service on a scratch database."""
+    monkeypatch.chdir(tmp_path)
+    return DocumentService(DocumentRepository(tmp_path / "isopgem.db"))
+
+
+@pytest.fixture
+def note(tmp_path: Path) -> Path:
+    """Create a text file to import."""
+    path = tmp_path / "note.txt"
+    path.write_text("first draft", encoding="utf-8")
+    return path
+
+
+def test_unchanged_file_is_not_extracted_again(service, note, monkeypatch) -> None:
+    """Test that re-importing an unchanged file returns the stored document."""
+    document = service.import_document(note)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged file was extracted again")
+
+    monkeypatch.setattr(DocumentService, "extract_text", fail)
+    again = service.import_document(note)
+
+    assert again.id == document.id
+    assert len(service.document_repository.get_all()) == 1
+
+
+def test_same_content_elsewhere_links_existing_document(
+    service, note, tmp_path
+) -> None:
+    """Test that a copy of an imported file resolves to the same document."""
+    document = service.import_document(note)
+    copy = tmp_path / "copy.txt"
+    copy.write_bytes(note.read_bytes())
+
+    assert service.import_document(copy).id == document.id
+    assert len(service.document_repository.get_all()) == 1
+
+
+def test_changed_file_updates_existing_document(service, note) -> None:
+    """Test that a modified file is re-extracted into the same document."""
+    document = service.import_document(note)
+    document.add_tag("draft")
+    service.document_repository.save(document)
+
+    note.write_text("second draft", encoding="utf-8")
+    updated = service.import_document(note)
+
+    assert updated.id == document.id
+    assert updated.checksum != document.checksum
+    stored = service.document_repository.get_by_id(document.id)
+    assert stored.content.strip() == "second draft"
+    assert stored.tags == {"draft"}
+
+
+def test_batch_import_skips_duplicates(service, note, tmp_path) -> None:
+    """Test that identical files in one batch are stored once."""
+    copy = tmp_path / "copy.txt"
+    copy.write_bytes(note.read_bytes())
+
+    imported = service.batch_import_documents([note, copy], max_workers=1)
+
+    assert len(imported) == 2
+    assert imported[0].id == imported[1].id
+    assert len(service.document_repository.get_all()) == 1
+    assert len(list(service.storage_dir.iterdir())) == 1
@@ -0,0 +1,162 @@
+"""Unit tests for document listing and search queries."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from document_manager.models.document import Document, DocumentSummary, DocumentType
+from document_manager.repositories.document_repository import DocumentRepository
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> DocumentRepository:
+    """Create a repository with a few documents."""
+    repository = DocumentRepository(tmp_path / "isopgem.db")
+    for i, category in enumerate(["alpha", "alpha", "beta"]):
+        document = Document(
+            name=f"doc_{i}.txt",
+            file_path=tmp_path / f"doc_{i}.txt",
+            file_type=DocumentType.TXT,
+            size_bytes=2048,
+            content=f"body of document {i} " * 1000,
+            extracted_text=f"extracted {i}",
+            category=category,
+            word_count=4000,
+        )
+        document.add_tag(f"tag_{i}")
+        repository.save(document)
+    return repository
+
+
+def test_summaries_leave_out_text(repository) -> None:
+    """Test that summaries carry listing fields but no content."""
+    summaries = repository.get_all_summaries()
+
+    assert len(summaries) == 3
+    assert all(isinstance(summary, DocumentSummary) for summary in summaries)
+    assert not hasattr(summaries[0], "content")
+    summary = next(s for s in summaries if s.name == "doc_1.txt")
+    assert summary.tags == {"tag_1"}
+    assert summary.get_file_size_display() == "2.00 KB"
+
+
+def test_summaries_by_category_and_search(repository) -> None:
+    """Test that filtered summary queries match the full document queries."""
+    by_category = repository.get_summaries_by_category("alpha")
+    assert sorted(s.name for s in by_category) == ["doc_0.txt", "doc_1.txt"]
+
+    summaries, total = repository.search_summaries(query="extracted 2")
+    documents, _ = repository.search(query="extracted 2")
+    assert total == 1
+    assert [s.id for s in summaries] == [d.id for d in documents]
+
+
+def test_content_and_tag_lookups(repository) -> None:
+    """Test the lookups that replace loading every document."""
+    assert len(repository.find_ids_with_content("document 1")) == 1
+    assert [d.name for d in repository.get_by_tag("tag_2")] == ["doc_2.txt"]
+
+
+def test_full_text_search_ranks_and_highlights(repository, tmp_path) -> None:
+    """Test stemming, diacritic folding, BM25 ranking and snippets."""
+    for name, text in [
+        ("remarks.txt", "A short remark about running."),
+        ("Running a café.txt", "The café runs all day."),
+    ]:
+        repository.save(
+            Document(
+                name=name,
+                file_path=tmp_path / name,
+                file_type=DocumentType.TXT,
+                size_bytes=1,
+                content=text,
+            )
+        )
+
+    summaries, total = repository.search_summaries(query="cafe run")
+
+    assert total == 1
+    assert summaries[0].name == "Running a café.txt"
+    assert "<b>café</b>" in summaries[0].snippet
+
+    summaries, total = repository.search_summaries(query="running")
+    assert total == 2
+    # A match in the name outranks one in the body
+    assert summaries[0].name == "Running a café.txt"
+
+
+def test_search_filters_tags_before_paging(repository) -> None:
+    """Test that tag filters yield full pages and exact counts."""
+    summaries, total = repository.search_summaries(tags=["tag_2"], limit=1)
+
+    assert total == 1
+    assert [s.name for s in summaries] == ["doc_2.txt"]
+
+    summaries, total = repository.search_summaries(query="extracted", limit=2)
+    assert total == 3
+    assert len(summaries) == 2
+
+
+def test_search_index_follows_updates_and_deletes(repository) -> None:
+    """Test that the index is kept in sync with saved and deleted documents."""
+    document = repository.search(query="extracted 1")[0][0]
+    document.extracted_text = "rewritten"
+    repository.save(document)
+
+    assert repository.search(query="extracted 1")[1] == 0
+    assert repository.search(query="rewritten")[1] == 1
+
+    repository.delete(document.id, permanent=True)
+    assert repository.search(query="rewritten")[1] == 0
+
+
+def test_search_index_is_built_for_existing_database(tmp_path) -> None:
+    """Test that opening a database without the index fills it."""
+    repository = DocumentRepository(tmp_path / "isopgem.db")
+    repository.save(
+        Document(
+            name="old.txt",
+            file_path=tmp_path / "old.txt",
+            file_type=DocumentType.TXT,
+            size_bytes=1,
+            content="legacy text",
+        )
+    )
+    conn = sqlite3.connect(tmp_path / "isopgem.db")
+    conn.executescript(
+        "DROP TABLE documents_fts; DROP TABLE documents_fts_rows;"
+        "DROP TRIGGER documents_fts_insert; DROP TRIGGER documents_fts_update;"
+        "DROP TRIGGER documents_fts_delete;"
+    )
+    conn.close()
+
+    reopened = DocumentRepository(tmp_path / "isopgem.db")
+
+    assert reopened.search(query="legacy")[1] == 1
+
+
+def test_tag_filters_and_counts(repository) -> None:
+    """Test all/any/none tag filters and tag facet counts."""
+    document = repository.search(tags=["tag_0"])[0][0]
+    document.add_tag("shared")
+    repository.save(document)
+    document = repository.search(tags=["tag_1"])[0][0]
+    document.add_tag("shared")
+    repository.save(document)
+
+    def names(**filters):
+        return sorted(s.name for s in repository.search_summaries(**filters)[0])
+
+    assert names(tags=["shared", "tag_1"]) == ["doc_1.txt"]
+    assert names(any_tags=["tag_1", "tag_2"]) == ["doc_1.txt", "doc_2.txt"]
+    assert names(exclude_tags=["shared"]) == ["doc_2.txt"]
+
+    assert repository.tag_counts()["shared"] == 2
+    assert repository.tag_counts(category="beta") == {"tag_2": 1}
+
+    document.remove_tag("shared")
+    repository.save(document)
+    assert repository.tag_counts()["shared"] == 1
+    repository.delete(document.id, permanent=True)
+    assert "tag_1" not in repository.tag_counts()
@@ -0,0 +1,82 @@
+"""Unit tests for single-pass multi-keyword matching."""
+
+import re
+
+import pytest
+
+from document_manager.utils.keyword_matcher import KeywordMatcher
+
+TEXT = (
+    "The theory of the Logos: then the logos spoke.\n"
+    "ΛΌΓΟΣ and λόγος, aaa aa a, c++ and foo-bar foo."
+)
+
+KEYWORDS = ["the", "then", "theo", "logos", "λόγος", "a", "aa", "c++", "foo", "foo-bar"]
+
+
+def separate_searches(keywords, text, case_sensitive, whole_words_only):
+    """Find the keywords with one re.finditer each, in start order."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    found = []
+    for keyword in keywords:
+        pattern = re.escape(keyword)
+        if whole_words_only:
+            pattern = rf"\b{pattern}\b"
+        found.extend(
+            (m.start(), m.end(), keyword) for m in re.finditer(pattern, text, flags)
+        )
+    return sorted(found, key=lambda item: (item[0], len(item[2])))
+
+
+@pytest.mark.parametrize("case_sensitive", [False, True])
+@pytest.mark.parametrize("whole_words_only", [False, True])
+def test_matches_separate_searches(case_sensitive, whole_words_only) -> None:
+    """Test that one scan finds what a search per keyword finds."""
+    matcher = KeywordMatcher(KEYWORDS, case_sensitive, whole_words_only)
+
+    found = sorted(matcher.finditer(TEXT), key=lambda item: (item[0], len(item[2])))
+
+    assert found == separate_searches(KEYWORDS, TEXT, case_sensitive, whole_words_only)
+
+
+def test_occurrences_of_one_keyword_do_not_overlap() -> None:
+    """Test that repeated keywords are reported like re.finditer reports them."""
+    matcher = KeywordMatcher(["aa", "aaa"], whole_words_only=False)
+
+    assert list(matcher.finditer("aaaaa")) == [
+        (0, 2, "aa"),
+        (0, 3, "aaa"),
+        (2, 4, "aa"),
+    ]
+
+
+def test_empty_keyword_list_matches_nothing() -> None:
+    """Test that a matcher without keywords finds nothing."""
+    assert list(KeywordMatcher([]).finditer(TEXT)) == []
+
+
+def test_mixed_case_keywords_find_the_longest_match() -> None:
+    """Test that keywords typed in different cases all match ignoring case."""
+    matcher = KeywordMatcher(["God", "god is"])
+
+    assert list(matcher.finditer("God is love")) == [(0, 3, "God"), (0, 6, "god is")]
+
+
+def test_overlapping_prefixes_match_inside_words() -> None:
+    """Test that a keyword extending another is found when not matching whole words."""
+    matcher = KeywordMatcher(["Word", "wordplay"], whole_words_only=False)
+
+    assert list(matcher.finditer("Wordplay")) == [(0, 4, "Word"), (0, 8, "wordplay")]
+
+
+def test_case_folding_maps_offsets_to_the_original_text() -> None:
+    """Test that characters folding to several letters keep offsets right."""
+    matcher = KeywordMatcher(["strasse", "weg"])
+    text = "Die Straße und der Weg"
+
+    found = list(matcher.finditer(text))
+
+    assert found == [(4, 10, "strasse"), (19, 22, "weg")]
+    assert [text[start:end] for start, end, _ in found] == ["Straße", "Weg"]
+    # A keyword may not match part of a folded character
+    assert list(KeywordMatcher(["s"], whole_words_only=False).finditer("ß")) == []
@@ -0,0 +1,65 @@
+"""Unit tests for page-wise PDF text extraction."""
+
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pytest
+
+from document_manager.models.document import Document
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    """Create a three-page PDF with a page number at the bottom of each page."""
+    path = tmp_path / "book.pdf"
+    pdf = fitz.open()
+    for number in range(1, 4):
+        page = pdf.new_page()
+        page.insert_text((72, 72), f"Chapter {number} begins here.")
+        page.insert_text((72, 760), str(number))
+    pdf.save(path)
+    pdf.close()
+    return path
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch) -> DocumentService:
+    """Create a document service on a scratch database."""
+    monkeypatch.chdir(tmp_path)
+    return DocumentService(DocumentRepository(tmp_path / "isopgem.db"))
+
+
+def test_iter_pdf_pages_yields_each_page(service, pdf_path) -> None:
+    """Test that pages are yielded one by one without page numbers."""
+    pages = list(service.iter_pdf_pages(pdf_path))
+
+    assert len(pages) == 3
+    assert "Chapter 2 begins here." in pages[1]
+    assert not any(line.strip() == "2" for line in pages[1].splitlines())
+
+
+def test_page_offsets_map_positions_to_pages(service, pdf_path) -> None:
+    """Test that recorded page offsets locate text on its page."""
+    document = Document.from_file(pdf_path)
+
+    assert service.extract_text(document, save=False) is document
+
+    assert document.page_count == 3
+    offsets = document.metadata["page_offsets"]
+    assert len(offsets) == 3
+    for number in range(1, 4):
+        position = document.content.index(f"Chapter {number}")
+        assert document.page_number_at(position) == number
+        assert offsets[number - 1] <= position
+
+
+def test_page_offsets_survive_saving(service, pdf_path) -> None:
+    """Test that page offsets are stored with the document metadata."""
+    document = service.import_document(pdf_path)
+
+    loaded = service.document_repository.get_by_id(document.id)
+
+    assert loaded.metadata["page_offsets"] == document.metadata["page_offsets"]
+    assert loaded.page_number_at(len(loaded.content) - 1) == 3
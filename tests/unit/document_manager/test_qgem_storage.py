@@ -0,0 +1,87 @@
+"""Unit tests for compressed QGem HTML storage and type-filtered listings."""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+from document_manager.services.qgem_document_service import QGemDocumentService
+from document_manager.utils.text_compression import (
+    CODEC_NONE,
+    CODEC_ZLIB,
+    compress_text,
+    decompress_text,
+)
+from shared.ui.widgets.rtf_editor.models.document_format import DocumentFormat
+from shared.ui.widgets.rtf_editor.utils import image_storage
+
+HTML = "<p>Ἐν ἀρχῇ ἦν ὁ λόγος <b>bold</b></p>\n" * 500
+
+
+@pytest.fixture
+def qgem_service(tmp_path: Path, monkeypatch) -> QGemDocumentService:
+    """Create a QGem service over a scratch library."""
+    monkeypatch.chdir(tmp_path)
+    repository = DocumentRepository(tmp_path / "isopgem.db")
+    return QGemDocumentService(DocumentService(repository))
+
+
+def test_only_large_texts_are_compressed() -> None:
+    """Test the size threshold and the round trip through each codec."""
+    assert compress_text("short") == (CODEC_NONE, b"short")
+
+    codec, data = compress_text(HTML, codec=CODEC_ZLIB)
+    assert codec == CODEC_ZLIB
+    assert len(data) < len(HTML.encode("utf-8")) // 10
+    assert decompress_text(codec, data) == HTML
+
+    with pytest.raises(ValueError):
+        decompress_text("lz4", data)
+
+
+def test_html_is_stored_compressed_and_loaded_on_open(qgem_service) -> None:
+    """Test that listings skip the HTML and opening a document restores it."""
+    saved = qgem_service.create_document(
+        DocumentFormat(
+            id="logos", name="Logos", html_content=HTML, plain_text="Logos"
+        )
+    )
+    repository = qgem_service.document_repository
+    conn = repository._get_connection()
+    codec, body = conn.execute(
+        "SELECT codec, body FROM document_html WHERE document_id = ?", (saved.id,)
+    ).fetchone()
+    conn.close()
+
+    assert codec != CODEC_NONE and len(body) < len(HTML) // 10
+
+    listed = qgem_service.get_all_qgem_documents()
+    assert [doc.id for doc in listed] == [saved.id]
+    assert listed[0].html_content is None
+    assert [s.name for s in qgem_service.get_qgem_summaries()] == ["Logos"]
+
+    opened = qgem_service.get_document_by_id(saved.id)
+    assert opened.html_content == HTML
+    assert qgem_service.get_document_as_format(saved.id).html_content == HTML
+
+    repository.delete(saved.id, permanent=True)
+    assert repository.get_html_content(saved.id) is None
+
+
+def test_deleting_a_document_releases_its_images(
+    qgem_service, tmp_path, monkeypatch
+) -> None:
+    """Test that images only a deleted document used are removed with it."""
+    monkeypatch.setattr(image_storage, "IMAGE_DIR", tmp_path / "images")
+    picture = tmp_path / "picture.png"
+    Image.new("RGB", (60, 30), (200, 30, 60)).save(picture)
+    saved = qgem_service.create_document(
+        DocumentFormat(id="logos", name="Logos", html_content=HTML, plain_text="")
+    )
+    stored, _, _ = image_storage.save_image_to_storage(str(picture), saved.id)
+
+    assert qgem_service.delete_document(saved.id)
+
+    assert not Path(stored).exists()
@@ -0,0 +1,86 @@
+"""Unit tests for sampled encoding detection and streaming UTF-8 conversion."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+from document_manager.utils.text_encoding import detect_encoding, transcode_to_utf8
+
+TEXT = "Ἐν ἀρχῇ ἦν ὁ λόγος — «café», naïve\r\nsecond line ™\n"
+
+
+@pytest.mark.parametrize(
+    "encoding, expected",
+    [("utf-8-sig", "utf-8-sig"), ("utf-16", "utf-16"), ("utf-32", "utf-32")],
+)
+def test_byte_order_marks_settle_the_encoding(tmp_path, encoding, expected) -> None:
+    """Test that a BOM is recognized without running the detector."""
+    path = tmp_path / "bom.txt"
+    path.write_bytes(TEXT.encode(encoding))
+
+    assert detect_encoding(path) == (expected, 1.0)
+
+
+def test_late_non_ascii_text_is_sampled(tmp_path) -> None:
+    """Test that samples beyond the head see text leaving ASCII late."""
+    path = tmp_path / "late.txt"
+    path.write_bytes(b"plain ascii line\n" * 20000 + "Ἐν ἀρχῇ\n".encode("utf-8") * 50)
+
+    encoding, _ = detect_encoding(path, chunk_size=4096, sample_size=64 * 1024)
+    head_only, _ = detect_encoding(path, chunk_size=4096, sample_size=4096)
+
+    assert encoding == "utf-8"
+    assert head_only == "ascii"
+
+
+def test_transcoding_streams_and_keeps_a_backup(tmp_path) -> None:
+    """Test conversion across buffer boundaries with an atomic replace."""
+    path = tmp_path / "legacy.txt"
+    original = TEXT.encode("utf-16-le") * 50
+    path.write_bytes(original)
+    os.chmod(path, 0o640)
+    backup = tmp_path / "legacy.txt.backup"
+
+    transcode_to_utf8(path, "utf-16-le", backup_path=backup, buffer_size=7)
+
+    assert path.read_bytes() == (TEXT * 50).encode("utf-8")
+    assert backup.read_bytes() == original
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["legacy.txt", "legacy.txt.backup"]
+
+
+def test_failed_transcoding_leaves_the_file_alone(tmp_path) -> None:
+    """Test that an unknown encoding neither touches the file nor leaves files."""
+    path = tmp_path / "legacy.txt"
+    path.write_bytes(b"caf\xe9")
+
+    with pytest.raises(LookupError):
+        transcode_to_utf8(path, "no-such-codec")
+
+    assert path.read_bytes() == b"caf\xe9"
+    assert [p.name for p in tmp_path.iterdir()] == ["legacy.txt"]
+
+
+def test_bulk_conversion_counts_each_file_once(tmp_path: Path, monkeypatch) -> None:
+    """Test parallel bulk conversion over overlapping patterns."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "ascii.txt").write_bytes(b"just ascii\n")
+    (tmp_path / "nested" / "greek.txt").write_bytes(TEXT.encode("utf-16"))
+    (tmp_path / "nested" / "notes.text").write_bytes(TEXT.encode("utf-8-sig"))
+
+    service = DocumentService(DocumentRepository(tmp_path / "isopgem.db"))
+    results = service.bulk_convert_text_files_to_utf8(
+        tmp_path, ["*.txt", "*.text", "greek.*"], max_workers=3
+    )
+
+    assert results["total_files"] == 3
+    assert results["converted_files"] == 2
+    assert results["already_utf8"] == 1
+    assert results["failed_conversions"] == 0
+    with open(tmp_path / "nested" / "greek.txt", encoding="utf-8", newline="") as file:
+        assert file.read() == TEXT
+    assert (tmp_path / "nested" / "notes.text").read_bytes() == TEXT.encode("utf-8")
@@ -0,0 +1,83 @@
+"""Unit tests for document match searches and their highlighting."""
+
+from PyQt6.QtGui import QTextCharFormat
+from PyQt6.QtWidgets import QTextEdit
+
+from document_manager.ui.widgets.match_highlighter import MatchHighlighter
+from document_manager.utils.text_match_finder import (
+    find_phrase_value_matches,
+    find_text_matches,
+    find_value_matches,
+    word_value,
+)
+
+TEXT = "abc AI10 ab c\nBC abc 7   cab"
+
+
+def letter_sum(text: str) -> int:
+    """Value letters a=1, b=2, c=3, ignoring case; z cannot be valued."""
+    if "z" in text:
+        raise ValueError(text)
+    return sum(ord(char) - ord("a") + 1 for char in text.lower())
+
+
+def test_word_value_counts_numbers_at_face_value() -> None:
+    """Test that digits inside a word add their number."""
+    assert word_value("abc", letter_sum) == 6
+    assert word_value("42", letter_sum) == 42
+    assert word_value("a10b2", letter_sum) == 15
+
+
+def test_text_matches_ignore_case() -> None:
+    """Test that text search finds every occurrence regardless of case."""
+    matches = find_text_matches(TEXT, "BC")
+
+    assert [(m.start, m.end, m.text) for m in matches] == [
+        (1, 3, "bc"), (14, 16, "BC"), (18, 20, "bc")
+    ]
+    assert find_text_matches(TEXT, "") == []
+
+
+def test_value_matches_find_single_words() -> None:
+    """Test that words with the target value are found in order."""
+    matches = find_value_matches(TEXT, 6, letter_sum)
+
+    assert [(m.start, m.text) for m in matches] == [(0, "abc"), (17, "abc"), (25, "cab")]
+    assert [m.text for m in find_value_matches("z a", 1, letter_sum)] == ["a"]
+
+
+def test_phrase_matches_join_nearby_words() -> None:
+    """Test that runs of close words summing to the target are found."""
+    matches = find_phrase_value_matches(TEXT, 13, letter_sum, max_gap=3)
+
+    assert [(m.start, m.end, m.text, m.value) for m in matches] == [
+        (17, 22, "abc 7", 13),
+        (21, 28, "7 cab", 13),
+    ]
+    assert len(find_phrase_value_matches(TEXT, 13, letter_sum, max_gap=1)) == 1
+    assert find_phrase_value_matches(TEXT, 13, letter_sum, max_gap=0) == []
+
+
+def test_highlighter_selects_all_or_only_visible_matches(qapp) -> None:
+    """Test batch highlighting and its limit to the visible text."""
+    editor = QTextEdit()
+    editor.resize(300, 100)
+    editor.show()
+    editor.setPlainText("\n".join(f"line {i} word" for i in range(2000)))
+    content = editor.toPlainText()
+    intervals = [(m.start, m.end) for m in find_text_matches(content, "word")]
+
+    highlighter = MatchHighlighter(editor, max_selections=5000)
+    highlighter.set_matches(intervals + [(5, 9)], QTextCharFormat())
+    assert len(editor.extraSelections()) == 2000
+    assert highlighter.match_count() == 2001
+
+    highlighter.max_selections = 100
+    highlighter.set_matches(intervals, QTextCharFormat())
+    visible = editor.extraSelections()
+    assert 0 < len(visible) <= 100
+    assert visible[0].cursor.selectionStart() == intervals[0][0]
+
+    editor.insertPlainText("edit")
+    assert editor.extraSelections() == []
+    assert highlighter.match_count() == 0
@@ -0,0 +1,57 @@
+"""Unit tests for the compiled text normalization pipeline."""
+
+import unicodedata
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+from document_manager.utils.text_normalizer import TextNormalizer
+
+
+def test_pipeline_maps_substitutes_and_normalizes() -> None:
+    """Test that all steps apply in one call, in order."""
+    normalizer = TextNormalizer(
+        char_map={"a": "α", "b": "β", "x": "x"},
+        substitutions=[
+            (r"\s+", " "),
+            (
+                r"(?P<low>\d+)-(?P<high>\d+)",
+                lambda m: str(int(m.group("high")) - int(m.group("low"))),
+            ),
+        ],
+        unicode_form="NFC",
+    )
+    decomposed = unicodedata.normalize("NFD", "ά")
+
+    assert normalizer.normalize(f"ab  x\t3-10 {decomposed}") == "αβ x 7 ά"
+    assert normalizer.count_mapped("abxab") == 4
+
+
+def test_substitutions_do_not_see_each_others_output() -> None:
+    """Test that the fused pattern matches the original text only."""
+    normalizer = TextNormalizer(substitutions=[("a", "b"), ("b", "c")])
+
+    assert normalizer.normalize("ab") == "bc"
+    assert TextNormalizer().normalize("unchanged") == "unchanged"
+
+
+def test_extracted_text_is_converted_and_cleaned(tmp_path, monkeypatch) -> None:
+    """Test the document service pipeline used by every extractor."""
+    monkeypatch.chdir(tmp_path)
+    service = DocumentService(DocumentRepository(tmp_path / "isopgem.db"))
+    decomposed = unicodedata.normalize("NFD", "ό")
+    numbers = "-- 1234567890 -- 1234567890 --"
+    text = f"qeo;V {decomposed}\n\n12\n\n{numbers}\n(Symbol encoding)\n"
+
+    normalized, converted = service._normalize_extracted_text(
+        text, remove_page_numbers=True
+    )
+
+    assert converted
+    assert normalized == f"θεο;ς {decomposed}\n\n{numbers}\n(Σψμβολ ενχοδινγ)\n"
+    assert service._normalize_extracted_text(text, detect_symbols=False) == (
+        text,
+        False,
+    )
+    assert service._normalize_extracted_text(
+        text, detect_symbols=False, normalize_unicode=True
+    ) == (unicodedata.normalize("NFC", text), False)
@@ -0,0 +1,140 @@
+"""Unit tests for the positional token index behind concordance queries."""
+
+from pathlib import Path
+
+import pytest
+
+from document_manager.models.document import Document, DocumentType
+from document_manager.models.kwic_concordance import ConcordanceSettings
+from document_manager.repositories.concordance_repository import ConcordanceRepository
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.concordance_service import ConcordanceService
+from document_manager.services.document_service import DocumentService
+
+TEXTS = [
+    "In the beginning was the Word,\nand the Word was with God.\n\nThe word endures.",
+    "A word to the wise: the WORD was spoken, then the word was written.",
+]
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch) -> ConcordanceService:
+    """Create a concordance service over two documents."""
+    monkeypatch.chdir(tmp_path)
+    document_repository = DocumentRepository(tmp_path / "isopgem.db")
+    for i, text in enumerate(TEXTS):
+        document_repository.save(
+            Document(
+                name=f"doc_{i}.txt",
+                file_path=tmp_path / f"doc_{i}.txt",
+                file_type=DocumentType.TXT,
+                size_bytes=1,
+                content=text,
+            )
+        )
+    return ConcordanceService(
+        ConcordanceRepository(str(tmp_path / "concordance.db")),
+        DocumentService(document_repository),
+    )
+
+
+def document_ids(service):
+    """Get the IDs of all documents."""
+    return [s.id for s in service.document_service.get_document_summaries()]
+
+
+def entry_keys(entries):
+    """Get the comparable fields of concordance entries."""
+    return sorted(
+        (
+            e.document_id,
+            e.position,
+            e.keyword,
+            e.left_context,
+            e.right_context,
+            e.line_number,
+            e.paragraph_number,
+        )
+        for e in entries
+    )
+
+
+@pytest.mark.parametrize("case_sensitive", [False, True])
+def test_index_concordance_matches_text_scan(service, case_sensitive) -> None:
+    """Test that index-backed entries equal those found by scanning the text."""
+    settings = ConcordanceSettings(case_sensitive=case_sensitive, context_window=12)
+    ids = document_ids(service)
+
+    scanned = service.generate_concordance("scan", ["word", "the Word"], ids, settings)
+    indexed = service.generate_concordance(
+        "index", ["word", "the Word"], ids, settings, use_index=True
+    )
+
+    assert entry_keys(indexed.entries) == entry_keys(scanned.entries)
+
+
+def test_phrase_and_proximity_queries(service) -> None:
+    """Test phrase lookups and word-distance queries."""
+    phrases = service.find_phrase("word was")
+    assert len(phrases) == 3
+    assert all(
+        TEXTS[0][o.start : o.end].lower() == "word was"
+        or TEXTS[1][o.start : o.end].lower() == "word was"
+        for o in phrases
+    )
+
+    pairs = service.find_near("word", "spoken", 2, in_order=True)
+    assert len(pairs) == 1
+    first, second = pairs[0]
+    assert TEXTS[1][first.start : second.end] == "WORD was spoken"
+
+
+def test_index_follows_document_changes(service) -> None:
+    """Test that only changed documents are re-indexed, and deletes drop out."""
+    assert service.update_token_index() == 2
+    assert service.update_token_index() == 0
+
+    repository = service.document_service.document_repository
+    document = repository.get_by_id(document_ids(service)[0])
+    document.content = "Nothing remains."
+    repository.save(document)
+
+    assert service.update_token_index() == 1
+    assert service.find_phrase("nothing remains")[0].document_id == document.id
+
+    repository.delete(document.id, permanent=True)
+    assert service.find_phrase("nothing") == []
+
+
+@pytest.mark.parametrize(
+    "keyword, content",
+    [
+        ("c++", "Write c++ or c, then c again."),
+        ("foo-bar", "A foo bar is not a foo-bar."),
+        ("the logos", "Before the\n\nlogos came the logos."),
+    ],
+)
+def test_index_matches_exact_keyword_text(service, keyword, content) -> None:
+    """Test that keywords with non-word characters match as the text scan does."""
+    repository = service.document_service.document_repository
+    document = Document(
+        name="extra.txt",
+        file_path=Path("extra.txt"),
+        file_type=DocumentType.TXT,
+        size_bytes=1,
+        content=content,
+    )
+    repository.save(document)
+
+    scanned = service.generate_concordance("scan", [keyword], [document.id])
+    indexed = service.generate_concordance(
+        "index", [keyword], [document.id], use_index=True
+    )
+    assert entry_keys(indexed.entries) == entry_keys(scanned.entries)
+
+    # Occurrences from the index are checked against the exact text too
+    found = service.keyword_in_context([keyword], [document.id])
+    assert [content[e.position : e.position + len(keyword)] for e in found] == [
+        content[e.position : e.position + len(keyword)] for e in scanned.entries
+    ]
+    assert all(e.keyword == keyword for e in found)
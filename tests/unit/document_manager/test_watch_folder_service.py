@@ -0,0 +1,142 @@
+"""Unit tests for incremental watch-folder ingestion."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+from document_manager.repositories.document_repository import DocumentRepository
+from document_manager.services.document_service import DocumentService
+from document_manager.services.watch_folder_service import WatchFolderService
+
+
+def wait_until_idle(watcher: WatchFolderService, timeout: float = 30.0) -> None:
+    """Process events until the watcher has no batch running."""
+    deadline = time.monotonic() + timeout
+    while watcher.is_busy():
+        assert time.monotonic() < deadline, "ingestion did not finish"
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def watch_setup(qapp, tmp_path: Path, monkeypatch):
+    """Create a watched folder and a service over a scratch library."""
+    monkeypatch.chdir(tmp_path)
+    folder = tmp_path / "inbox"
+    folder.mkdir()
+    service = DocumentService(DocumentRepository(tmp_path / "isopgem.db"))
+    watcher = WatchFolderService(
+        service, debounce_ms=60000, scan_interval_ms=0, max_workers=1
+    )
+    ingested = []
+    watcher.documents_ingested.connect(ingested.extend)
+    yield folder, service, watcher, ingested
+    watcher.stop()
+
+
+def test_changed_files_are_ingested_once_settled(watch_setup) -> None:
+    """Test that new and modified files are imported and unchanged ones skipped."""
+    folder, service, watcher, ingested = watch_setup
+    (folder / "first.txt").write_text("first note", encoding="utf-8")
+    (folder / "~$lock.txt").write_text("lock", encoding="utf-8")
+    (folder / "image.png").write_bytes(b"not a document")
+
+    assert watcher.add_directory(folder)
+    assert watcher.pending_count() == 1
+
+    # Seen again with the same fingerprint: the file has settled
+    watcher.scan()
+    wait_until_idle(watcher)
+    assert [document.name for document in ingested] == ["first.txt"]
+    assert watcher.pending_count() == 0
+
+    ingested.clear()
+    watcher.scan()
+    watcher.scan()
+    assert watcher.pending_count() == 0 and not ingested
+
+    path = folder / "first.txt"
+    path.write_text("first note, revised", encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+    watcher.scan()
+    watcher.scan()
+    wait_until_idle(watcher)
+
+    documents = service.document_repository.get_all()
+    assert len(documents) == 1
+    assert documents[0].content.strip() == "first note, revised"
+
+
+def test_known_files_are_not_ingested_again(watch_setup, monkeypatch) -> None:
+    """Test that fingerprints stored by an earlier run are reused."""
+    folder, service, watcher, ingested = watch_setup
+    path = folder / "known.txt"
+    path.write_text("already imported", encoding="utf-8")
+    document = service.import_document(path)
+
+    fingerprints = service.document_repository.get_source_fingerprints(str(folder))
+    assert fingerprints == {str(path.resolve()): document.metadata["source_fingerprint"]}
+
+    watcher.add_directory(folder)
+    watcher.scan()
+    assert watcher.pending_count() == 0
+
+    # An unchanged file is recognized by its fingerprint without hashing it
+    def no_hashing(file_path):
+        raise AssertionError(f"{file_path} was hashed")
+
+    monkeypatch.setattr(
+        "document_manager.services.document_service.file_checksum", no_hashing
+    )
+    assert service.prepare_document(path) == (
+        service.document_repository.get_by_id(document.id),
+        False,
+    )
+
+
+def test_stop_does_not_wait_for_the_running_batch(watch_setup, monkeypatch) -> None:
+    """Test that stopping returns at once and ignores the batch still running."""
+    folder, service, watcher, ingested = watch_setup
+    release, finished = threading.Event(), threading.Event()
+
+    def slow_import(file_paths, **kwargs):
+        release.wait(10)
+        finished.set()
+        return []
+
+    monkeypatch.setattr(service, "batch_import_documents", slow_import)
+    (folder / "slow.txt").write_text("slow note", encoding="utf-8")
+    watcher.add_directory(folder)
+    watcher.scan()
+    assert watcher.is_busy()
+
+    started = time.monotonic()
+    watcher.stop()
+    assert time.monotonic() - started < 1
+    assert not watcher.is_busy()
+
+    release.set()
+    assert finished.wait(10)
+    time.sleep(0.1)
+    QCoreApplication.processEvents()
+    assert not ingested and not watcher.is_busy()
+
+
+def test_subdirectories_are_watched_once(watch_setup) -> None:
+    """Test that rescans do not add watches again and removal drops them all."""
+    folder, service, watcher, ingested = watch_setup
+    (folder / "nested" / "deeper").mkdir(parents=True)
+
+    watcher.add_directory(folder)
+    watcher.scan()
+    watched = sorted(watcher._watcher.directories())
+
+    assert len(watched) == 3
+    assert sorted(watcher._watched) == watched
+
+    watcher.remove_directory(folder)
+    assert watcher._watcher.directories() == [] and not watcher._watched
@@ -0,0 +1,167 @@
+"""Unit tests for saving and keyset pagination in the SQLite calculation repository."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from gematria.models.calculation_result import CalculationResult
+from shared.repositories.database import Database
+from shared.repositories.sqlite_calculation_repository import (
+    SQLiteCalculationRepository,
+)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> Iterator[SQLiteCalculationRepository]:
+    """Create a repository on a fresh database with 250 calculations."""
+    Database._instance = None
+    repo = SQLiteCalculationRepository(str(tmp_path))
+
+    start = datetime(2024, 1, 1)
+    repo.save_calculations(
+        [
+            CalculationResult(
+                input_text=f"word {i:03d}",
+                calculation_type="HEBREW_STANDARD_VALUE",
+                result_value=i % 40,
+                timestamp=start + timedelta(minutes=i // 2),
+                favorite=i % 7 == 0,
+            )
+            for i in range(250)
+        ]
+    )
+
+    yield repo
+
+    repo.db.close()
+    Database._instance = None
+
+
+def _page_through(repo, criteria, sort_by, descending, limit=32):
+    """Collect all pages of a keyset query."""
+    calculations, after = [], None
+    while True:
+        page, after = repo.get_calculations_after(
+            criteria, sort_by, descending, after, limit
+        )
+        calculations.extend(page)
+        if len(page) < limit:
+            return calculations
+
+
+@pytest.mark.parametrize(
+    "sort_by", ["created_at", "input_text", "result_value", "favorite"]
+)
+@pytest.mark.parametrize("descending", [True, False])
+def test_keyset_pages_cover_every_row_once(repository, sort_by, descending) -> None:
+    """Test that keyset pages return every row exactly once, in order."""
+    calculations = _page_through(repository, {}, sort_by, descending)
+
+    assert len(calculations) == 250
+    assert len({calc.id for calc in calculations}) == 250
+
+    keys = {
+        "created_at": lambda calc: calc.timestamp,
+        "input_text": lambda calc: calc.input_text,
+        "result_value": lambda calc: int(calc.result_value),
+        "favorite": lambda calc: calc.favorite,
+    }[sort_by]
+    values = [keys(calc) for calc in calculations]
+    assert values == sorted(values, reverse=descending)
+
+
+def test_keyset_pages_respect_filters(repository) -> None:
+    """Test that filters are applied consistently to pages and counts."""
+    criteria = {"favorite": True, "input_text_like": "word 1"}
+
+    calculations = _page_through(repository, criteria, "result_value", False, 5)
+
+    assert repository.count_matching_calculations(criteria) == len(calculations)
+    assert calculations
+    assert all(calc.favorite for calc in calculations)
+    assert all(calc.input_text.startswith("word 1") for calc in calculations)
+
+
+def _add_tag(repo, tag_id: str) -> None:
+    """Store a tag the calculations can refer to."""
+    repo.db.execute(
+        "INSERT INTO tags (id, name, color) VALUES (?, ?, ?)",
+        (tag_id, tag_id, "#000000"),
+    )
+
+
+def test_saving_a_duplicate_merges_into_a_copy(repository) -> None:
+    """Test that an equal calculation is merged into the stored one."""
+    _add_tag(repository, "t1")
+    _add_tag(repository, "t2")
+    first = CalculationResult(
+        input_text="Logos",
+        calculation_type="HEBREW_STANDARD_VALUE",
+        result_value=373,
+        notes="first",
+        tags=["t1"],
+    )
+    second = CalculationResult(
+        input_text="logos",
+        calculation_type="HEBREW_STANDARD_VALUE",
+        result_value=373,
+        notes="second",
+        tags=["t2"],
+        favorite=True,
+    )
+
+    assert repository.save_calculation(first)
+    assert repository.save_calculations([second]) == 1
+
+    # The caller's object is not rewritten, and no second row is stored
+    assert second.tags == ["t2"] and second.notes == "second"
+    assert repository.get_calculation(second.id) is None
+    assert repository.count_calculations() == 251
+
+    merged = repository.get_calculation(first.id)
+    assert sorted(merged.tags) == ["t1", "t2"]
+    assert merged.notes == "first\n\nsecond"
+    assert merged.favorite
+
+
+def test_save_returns_the_stored_calculation(repository) -> None:
+    """Test that saving a duplicate returns the row it was merged into."""
+    original = CalculationResult(
+        input_text="Sophia",
+        calculation_type="HEBREW_STANDARD_VALUE",
+        result_value=781,
+        notes="first",
+    )
+    duplicate = CalculationResult(
+        input_text="sophia",
+        calculation_type="HEBREW_STANDARD_VALUE",
+        result_value=781,
+        notes="second",
+    )
+
+    assert repository.save_calculation(original).id == original.id
+    stored = repository.save_calculation(duplicate)
+
+    assert stored.id == original.id
+    assert stored.notes == repository.get_calculation(original.id).notes
+
+
+def test_failed_batch_is_saved_row_by_row(repository) -> None:
+    """Test that one bad calculation does not cost the rest of its batch."""
+    calculations = [
+        CalculationResult(
+            input_text=f"batch {i}",
+            calculation_type="HEBREW_STANDARD_VALUE",
+            result_value=i,
+            # The tag does not exist, so its row violates a foreign key
+            tags=["missing"] if i == 1 else [],
+        )
+        for i in range(3)
+    ]
+
+    assert repository.save_calculations(calculations) == 2
+    assert repository.get_calculation(calculations[0].id) is not None
+    assert repository.get_calculation(calculations[1].id) is None
+    assert repository.get_calculation(calculations[2].id) is not None
@@ -0,0 +1,87 @@
+"""Unit tests for the database backup service.
+
+These tests exercise online backup, compression, rotation, cancellation and
+restore against a temporary WAL-mode database.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from shared.services.database_backup_service import DatabaseBackupService
+
+
+@pytest.fixture
+def wal_database(tmp_path: Path) -> Path:
+    """Create a WAL-mode database with some rows still in the WAL file."""
+    db_path = tmp_path / "isopgem.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE items (value INTEGER)")
+    conn.executemany("INSERT INTO items VALUES (?)", [(i,) for i in range(5000)])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _count_rows(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_backup_is_consistent_and_reports_progress(wal_database: Path) -> None:
+    """Test that a backup contains all committed rows and reports progress."""
+    service = DatabaseBackupService(str(wal_database), pages_per_step=2)
+    progress = []
+
+    backup_dir = service.create_backup(
+        progress_callback=lambda copied, total: progress.append((copied, total))
+    )
+
+    assert backup_dir is not None
+    assert _count_rows(backup_dir / "isopgem.db") == 5000
+    assert len(progress) > 1
+    assert progress[-1][0] == progress[-1][1]
+
+
+def test_compressed_backup_and_restore(wal_database: Path) -> None:
+    """Test that a compressed backup can be restored over modified data."""
+    service = DatabaseBackupService(str(wal_database))
+    backup_dir = service.create_backup(compress=True)
+
+    assert backup_dir is not None
+    assert service.get_backup_file(backup_dir).name == "isopgem.db.gz"
+
+    conn = sqlite3.connect(wal_database)
+    conn.execute("DELETE FROM items")
+    conn.commit()
+    conn.close()
+
+    assert service.restore_backup(backup_dir)
+    assert _count_rows(wal_database) == 5000
+
+
+def test_rotation_keeps_newest_backups(wal_database: Path) -> None:
+    """Test that rotation removes the oldest backups."""
+    service = DatabaseBackupService(str(wal_database))
+    for _ in range(3):
+        service.create_backup()
+
+    newest = service.list_backups()[0]
+    removed = service.rotate_backups(1)
+
+    assert len(removed) == 2
+    assert service.list_backups() == [newest]
+
+
+def test_cancelled_backup_leaves_nothing_behind(wal_database: Path) -> None:
+    """Test that cancelling a backup removes the partial backup."""
+    service = DatabaseBackupService(str(wal_database), pages_per_step=1)
+
+    assert service.create_backup(is_cancelled=lambda: True) is None
+    assert service.list_backups() == []
+    assert not list(wal_database.parent.glob("backup_*"))
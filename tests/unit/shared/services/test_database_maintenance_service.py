@@ -0,0 +1,100 @@
+"""Unit tests for the database maintenance service."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from shared.services.database_maintenance_service import (
+    AUTO_VACUUM_INCREMENTAL,
+    DatabaseMaintenanceService,
+)
+
+
+@pytest.fixture
+def calculations_db(tmp_path: Path) -> Path:
+    """Create a database with duplicated calculations."""
+    db_path = tmp_path / "isopgem.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE calculations (
+            id TEXT PRIMARY KEY,
+            input_text TEXT NOT NULL,
+            calculation_type TEXT NOT NULL,
+            custom_method_name TEXT,
+            result_value TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL
+        )
+        """
+    )
+    rows = [
+        (str(i), f"word{i % 100}", "HEBREW_STANDARD", None, str(i % 100), i)
+        for i in range(1000)
+    ]
+    conn.executemany("INSERT INTO calculations VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_duplicates_keep_newest(calculations_db: Path) -> None:
+    """Test that duplicate detection keeps the newest copy of each input."""
+    service = DatabaseMaintenanceService(str(calculations_db))
+
+    duplicates = list(service.iter_duplicate_calculations(batch_size=64))
+
+    assert len(duplicates) == 900
+    kept_ids = {kept_id for _, kept_id in duplicates}
+    assert kept_ids == {str(i) for i in range(900, 1000)}
+
+
+def test_failed_conversion_is_not_reported_as_cancelled(calculations_db: Path) -> None:
+    """Test that a VACUUM failing on a lock raises instead of returning False."""
+    service = DatabaseMaintenanceService(str(calculations_db), busy_timeout=0.1)
+
+    blocker = sqlite3.connect(calculations_db, isolation_level=None)
+    blocker.execute("BEGIN EXCLUSIVE")
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            service.enable_incremental_vacuum(is_cancelled=lambda: False)
+    finally:
+        blocker.close()
+
+    assert service.get_storage_info()["auto_vacuum"] != AUTO_VACUUM_INCREMENTAL
+
+
+def test_delete_then_incremental_vacuum(calculations_db: Path) -> None:
+    """Test that deleted rows are reclaimed by incremental vacuum."""
+    service = DatabaseMaintenanceService(str(calculations_db))
+    assert service.enable_incremental_vacuum()
+    assert service.get_storage_info()["auto_vacuum"] == AUTO_VACUUM_INCREMENTAL
+
+    ids = [duplicate_id for duplicate_id, _ in service.iter_duplicate_calculations()]
+    assert service.delete_calculations(ids, batch_size=100) == 900
+
+    progress = []
+    result = service.incremental_vacuum(
+        pages_per_step=1,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert result["completed"]
+    assert service.get_storage_info()["freelist_count"] == 0
+    assert progress and progress[-1][0] == progress[-1][1]
+
+
+def test_cancelled_jobs_stop_early(calculations_db: Path) -> None:
+    """Test that cancellation stops scans and deletes."""
+    service = DatabaseMaintenanceService(str(calculations_db))
+
+    assert list(service.iter_duplicate_calculations(is_cancelled=lambda: True)) == []
+    assert service.delete_calculations(["1", "2"], is_cancelled=lambda: True) == 0
+
+
+def test_quick_check_and_optimize(calculations_db: Path) -> None:
+    """Test that a healthy database passes the quick check and can be optimized."""
+    service = DatabaseMaintenanceService(str(calculations_db))
+
+    assert service.quick_check()["ok"]
+    assert service.optimize()
@@ -0,0 +1,75 @@
+"""Unit tests for the background query executor."""
+
+import sqlite3
+import threading
+from typing import Iterator
+
+import pytest
+
+from shared.repositories.database import interruptible_queries, track_connection
+from shared.services.query_executor import QueryExecutor
+
+# Counts forever unless the statement is interrupted
+ENDLESS_QUERY = """
+    WITH RECURSIVE counter(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM counter)
+    SELECT COUNT(*) FROM counter WHERE x < 0
+"""
+
+
+@pytest.fixture
+def executor(qapp) -> Iterator[QueryExecutor]:
+    """Create an executor and stop its worker afterwards."""
+    executor = QueryExecutor()
+    yield executor
+    executor.shutdown()
+
+
+def test_track_connection_only_inside_scope() -> None:
+    """Test that connections are only collected inside interruptible_queries."""
+    conn = sqlite3.connect(":memory:")
+    track_connection(conn)
+
+    with interruptible_queries() as connections:
+        track_connection(conn)
+        track_connection(conn)
+
+    assert connections == [conn]
+    conn.close()
+
+
+def test_new_query_interrupts_running_one(qtbot, executor) -> None:
+    """Test that a newer query aborts a running one and only it is delivered."""
+    started = threading.Event()
+    failures = []
+    executor.query_failed.connect(failures.append)
+
+    def endless():
+        conn = track_connection(sqlite3.connect(":memory:"))
+        started.set()
+        return conn.execute(ENDLESS_QUERY).fetchone()
+
+    executor.submit(endless)
+    assert started.wait(5)
+
+    with qtbot.waitSignal(executor.result_ready, timeout=5000) as blocker:
+        executor.submit(lambda: "latest")
+
+    assert blocker.args == ["latest"]
+    assert not executor.is_busy()
+    assert failures == []
+
+
+def test_cancel_drops_result(qtbot, executor) -> None:
+    """Test that a cancelled query does not deliver its result."""
+    release = threading.Event()
+    results = []
+    executor.result_ready.connect(results.append)
+
+    executor.submit(lambda: release.wait(5) and "stale")
+    executor.cancel()
+    release.set()
+
+    with qtbot.waitSignal(executor.result_ready, timeout=5000):
+        executor.submit(lambda: "fresh")
+
+    assert results == ["fresh"]
@@ -0,0 +1,83 @@
+"""Unit tests for background auto-saving of the RTF editor."""
+
+import json
+import os
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtWidgets import QTextEdit
+
+from shared.ui.widgets.rtf_editor.utils.recovery_utils import AutoSaveManager
+
+
+@pytest.fixture
+def manager(qapp, tmp_path, monkeypatch):
+    """Create an auto-save manager writing into a scratch directory."""
+    monkeypatch.setattr(
+        AutoSaveManager, "_get_recovery_directory", lambda self: tmp_path
+    )
+    editor = QTextEdit()
+    manager = AutoSaveManager(editor, max_files=2)
+    yield manager
+    manager.cleanup()
+
+
+def wait_for_save(manager: AutoSaveManager, timeout: float = 10.0) -> None:
+    """Process events until the running save has been reported."""
+    deadline = time.monotonic() + timeout
+    while manager._snapshot is not None:
+        assert time.monotonic() < deadline, "auto-save did not finish"
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+
+
+def test_only_edited_documents_are_saved(manager, tmp_path) -> None:
+    """Test that ticks without edits do not serialize or write anything."""
+    saved = []
+    manager.auto_save_triggered.connect(lambda: saved.append(True))
+
+    manager.auto_save()
+    assert not list(tmp_path.iterdir())
+
+    manager.editor.setPlainText("first line\nsecond line\nthird line")
+    manager.editor.textCursor().insertText("typed ")
+    assert manager.has_unsaved_changes()
+    assert manager.dirty_blocks() == (0, 2)
+
+    manager.set_document_path("/notes/my_notes.html")
+    manager.auto_save()
+    assert not manager.has_unsaved_changes()
+    wait_for_save(manager)
+
+    files = list(tmp_path.iterdir())
+    assert saved == [True]
+    assert [f.suffix for f in files] == [".recovery"]
+    content, original_path = manager.load_recovery_file(files[0])
+    assert "typed first line" in content
+    assert original_path == "/notes/my_notes.html"
+
+    manager.auto_save()
+    assert saved == [True] and manager._snapshot is None
+
+
+def test_recovery_files_are_rotated_under_a_size_cap(manager, tmp_path) -> None:
+    """Test rotation per document, the total size cap and blocking saves."""
+    for i, name in enumerate(["my_notes", "my_notes", "my_notes", "other"]):
+        path = tmp_path / f"{name}_2024010{i}_120000.recovery"
+        path.write_text(json.dumps({"original_path": None}) + "\nold", "utf-8")
+        os.utime(path, (i, i))
+
+    manager.set_document_path("/notes/my_notes.html")
+    manager.editor.setPlainText("newest")
+    manager.auto_save(blocking=True)
+
+    names = sorted(f.name for f in tmp_path.iterdir())
+    assert len(names) == 3
+    assert "my_notes_20240102_120000.recovery" in names
+    assert "other_20240103_120000.recovery" in names
+
+    newest = max(tmp_path.iterdir(), key=lambda f: f.stat().st_mtime)
+    manager.max_total_bytes = newest.stat().st_size
+    manager._cleanup_old_recovery_files(keep=newest)
+    assert list(tmp_path.iterdir()) == [newest]
@@ -0,0 +1,112 @@
+"""Unit tests for the keyset-paged table model base."""
+
+import time
+from typing import List, Optional, Tuple
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QModelIndex, Qt
+
+from shared.services.query_executor import QueryExecutor
+from shared.ui.models.keyset_table_model import KeysetTableModel
+
+
+class NumberModel(KeysetTableModel):
+    """Pages the numbers below a limit, the query being the limit."""
+
+    _HEADERS = ["Number"]
+    _SORT_KEYS = {0: "value"}
+    _ROWS_NAME = "numbers"
+
+    def __init__(self, **kwargs):
+        super().__init__("value", False, **kwargs)
+        self.page_queries = 0
+
+    def set_limit(self, limit: Optional[int]) -> None:
+        self._set_query(limit)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.row_item(index.row())
+        return None
+
+    def _fetch_page(
+        self, limit: int, sort_by: str, descending: bool, after: Optional[Tuple]
+    ) -> Tuple[List[int], Optional[Tuple]]:
+        self.page_queries += 1
+        numbers = sorted(range(limit), reverse=descending)
+        if after is not None:
+            numbers = [n for n in numbers if (n < after[0] if descending else n > after[0])]
+        page = numbers[: self.page_size]
+        return page, ((page[-1],) if page else None)
+
+    def _count(self, limit: int) -> int:
+        return limit
+
+
+def fetch_all(model: KeysetTableModel) -> List[int]:
+    """Fetch every page and return the shown numbers."""
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    return [model.row_item(row) for row in range(model.rowCount())]
+
+
+def test_pages_are_fetched_and_evicted(qapp) -> None:
+    """Test that rows page in as fetched and evicted pages are reloaded."""
+    model = NumberModel(page_size=10, max_cached_pages=2)
+    totals = []
+    model.results_loaded.connect(totals.append)
+
+    model.set_limit(35)
+
+    assert totals == [35]
+    assert model.rowCount() == 10
+    assert fetch_all(model) == list(range(35))
+    assert len(model._pages) == 2
+
+    queries = model.page_queries
+    assert model.row_item(0) == 0
+    assert model.page_queries == queries + 1
+
+
+def test_sort_reloads_in_database_order(qapp) -> None:
+    """Test that sorting queries again instead of sorting loaded rows."""
+    model = NumberModel(page_size=10)
+    model.set_limit(25)
+
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+
+    assert fetch_all(model) == list(reversed(range(25)))
+    model.set_limit(None)
+    assert model.rowCount() == 0 and model.total_count() == 0
+
+
+def test_executor_keeps_only_the_latest_request(qapp) -> None:
+    """Test that background loads show only the most recent query."""
+    executor = QueryExecutor()
+    model = NumberModel(page_size=10, executor=executor)
+    try:
+        model.set_limit(5)
+        model.set_limit(15)
+        assert model.is_loading()
+
+        deadline = time.monotonic() + 5
+        while model.is_loading():
+            assert time.monotonic() < deadline, "results were not delivered"
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+
+        assert model.total_count() == 15
+        assert fetch_all(model) == list(range(15))
+    finally:
+        executor.shutdown()
+
+
+def test_subclass_without_queries_cannot_be_created(qapp) -> None:
+    """Test that a model missing a query method fails when it is created."""
+
+    class UncountedModel(KeysetTableModel):
+        def _fetch_page(self, query, sort_by, descending, after):
+            return [], None
+
+    with pytest.raises(TypeError):
+        UncountedModel("value", False)
@@ -0,0 +1,64 @@
+"""Unit tests for calculation content hashing and duplicate merging."""
+
+from shared.utils.calculation_hash import (
+    DuplicateMergePolicy,
+    calculation_content_hash,
+    merge_duplicate_fields,
+    normalize_calculation_text,
+)
+
+
+def test_normalization_ignores_case_spacing_and_composition() -> None:
+    """Test that equivalent inputs normalize to the same text."""
+    assert normalize_calculation_text("  Hello   World ") == "hello world"
+    # Decomposed and precomposed forms of "é"
+    assert normalize_calculation_text("é") == normalize_calculation_text("é")
+    assert normalize_calculation_text(None) == ""
+
+
+def test_hash_depends_on_method_and_value() -> None:
+    """Test that the hash distinguishes methods and values but not formatting."""
+    base = calculation_content_hash("Love", "ENGLISH_ORDINAL", None, 54)
+
+    assert base == calculation_content_hash(" love", "ENGLISH_ORDINAL", None, "54")
+    assert base != calculation_content_hash("Love", "ENGLISH_REDUCED", None, 54)
+    assert base != calculation_content_hash("Love", "ENGLISH_ORDINAL", None, 55)
+    assert base != calculation_content_hash("Love", "ENGLISH_ORDINAL", "Mine", 54)
+
+
+def test_combine_policy_merges_tags_and_notes() -> None:
+    """Test the default combine policy."""
+    tags, notes = merge_duplicate_fields(["a", "b"], "first", ["b", "c"], "second")
+
+    assert tags == ["a", "b", "c"]
+    assert notes == "first\n\nsecond"
+
+    # Notes already contained in the stored notes are not repeated
+    _, notes = merge_duplicate_fields([], "first\n\nsecond", [], "second")
+    assert notes == "first\n\nsecond"
+
+
+def test_keep_existing_and_replace_policies() -> None:
+    """Test the keep-existing and replace policies."""
+    tags, notes = merge_duplicate_fields(
+        ["a"],
+        "old",
+        ["b"],
+        "new",
+        tag_policy=DuplicateMergePolicy.KEEP_EXISTING,
+        notes_policy=DuplicateMergePolicy.REPLACE,
+    )
+    assert tags == ["a"]
+    assert notes == "new"
+
+    tags, notes = merge_duplicate_fields(
+        ["a"],
+        None,
+        ["b"],
+        "new",
+        tag_policy=DuplicateMergePolicy.REPLACE,
+        notes_policy=DuplicateMergePolicy.KEEP_EXISTING,
+    )
+    assert tags == ["b"]
+    # Missing notes are filled in regardless of policy
+    assert notes == "new"
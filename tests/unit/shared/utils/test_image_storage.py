@@ -0,0 +1,180 @@
+"""Unit tests for content-addressed image storage of the RTF editor."""
+
+import base64
+import io
+import os
+
+import pytest
+from PIL import Image
+from PyQt6.QtCore import QUrl
+from PyQt6.QtGui import QTextDocument, QTextImageFormat
+from PyQt6.QtWidgets import QTextEdit
+
+from shared.ui.widgets.rtf_editor.utils import image_storage
+from shared.ui.widgets.rtf_editor.utils.image_storage import (
+    LRUCache,
+    cleanup_unused_images,
+    collect_garbage,
+    data_uri_to_image_file,
+    get_thumbnail,
+    image_reference_count,
+    load_display_image,
+    move_image_references,
+    register_display_image,
+    save_image_to_storage,
+)
+from shared.ui.widgets.rtf_editor.zoom_manager import ZoomManager
+
+
+@pytest.fixture
+def image_dir(tmp_path, monkeypatch):
+    """Store images in a scratch directory with empty caches."""
+    store = tmp_path / "images"
+    store.mkdir()
+    monkeypatch.setattr(image_storage, "IMAGE_DIR", store)
+    image_storage.image_dimensions_cache.clear()
+    image_storage.display_image_cache.clear()
+    return store
+
+
+@pytest.fixture
+def picture(tmp_path):
+    """Create a 600x300 PNG picture."""
+    path = tmp_path / "picture.png"
+    Image.new("RGB", (600, 300), (200, 30, 60)).save(path)
+    return path
+
+
+def test_identical_images_are_stored_once(image_dir, picture) -> None:
+    """Test content naming, reference counts and thumbnails."""
+    first, width, height = save_image_to_storage(str(picture), "doc-a")
+    second, _, _ = save_image_to_storage(str(picture), "doc-a")
+
+    buffer = io.BytesIO()
+    Image.open(picture).save(buffer, format="PNG")
+    data_uri = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+    third, _, _ = data_uri_to_image_file(data_uri, "doc-b")
+
+    assert first == second == third
+    assert (width, height) == (600, 300)
+    assert len(list((image_dir / "objects").glob("*/*"))) == 1
+    assert image_reference_count(first) == 2
+
+    thumbnail = get_thumbnail(first)
+    assert Image.open(thumbnail).size == (256, 128)
+
+    resized, width, height = save_image_to_storage(str(picture), max_width=300)
+    assert resized != first and (width, height) == (300, 150)
+
+
+def test_images_are_deleted_with_their_last_reference(image_dir, picture) -> None:
+    """Test cleanup per document and garbage collection of orphans."""
+    shared, _, _ = save_image_to_storage(str(picture), "doc-a")
+    save_image_to_storage(str(picture), "doc-b")
+    orphan, _, _ = save_image_to_storage(str(picture), max_width=100)
+
+    assert cleanup_unused_images("doc-a", []) == 0
+    assert image_reference_count(shared) == 1
+    assert cleanup_unused_images("doc-b", []) == 1
+    assert not os.path.exists(shared)
+    assert not list((image_dir / "thumbnails").iterdir())
+
+    assert collect_garbage() == 0
+    assert collect_garbage(min_age=-1) == 1
+    assert not os.path.exists(orphan)
+
+
+def test_display_images_are_scaled_once_and_cached(qapp, image_dir, picture) -> None:
+    """Test thumbnail use for small display sizes and document registration."""
+    stored, _, _ = save_image_to_storage(str(picture), "doc-a")
+
+    small = load_display_image(stored, 120, 60)
+    assert (small.width(), small.height()) == (120, 60)
+    assert load_display_image(stored, 120, 60) is small
+
+    sharp = load_display_image(stored, 120, 60, device_pixel_ratio=2.0)
+    assert (sharp.width(), sharp.height()) == (240, 120)
+
+    document = QTextDocument()
+    assert register_display_image(document, stored, 300, 150)
+    resource = document.resource(QTextDocument.ResourceType.ImageResource, QUrl(stored))
+    assert (resource.width(), resource.height()) == (300, 150)
+
+
+def test_shared_display_image_covers_the_largest_use(
+    qapp, image_dir, picture
+) -> None:
+    """Test that a smaller copy of an image does not blur a larger one."""
+    stored, _, _ = save_image_to_storage(str(picture), "doc-a")
+    document = QTextDocument()
+
+    def resource_size():
+        resource = document.resource(
+            QTextDocument.ResourceType.ImageResource, QUrl(stored)
+        )
+        return resource.width(), resource.height()
+
+    assert register_display_image(document, stored, 300, 150)
+    assert register_display_image(document, stored, 60, 30)
+    assert resource_size() == (300, 150)
+
+    assert register_display_image(document, stored, 400, 200)
+    assert resource_size() == (400, 200)
+
+    document.clear()
+    assert register_display_image(document, stored, 60, 30)
+    assert resource_size() == (60, 30)
+
+
+def test_references_move_to_a_new_document_id(image_dir, picture) -> None:
+    """Test that a saved document takes over the references of its session."""
+    stored, _, _ = save_image_to_storage(str(picture), "doc-session")
+
+    move_image_references("doc-session", "/documents/note.rtf")
+
+    assert image_reference_count(stored) == 1
+    assert cleanup_unused_images("doc-session", []) == 0
+    assert os.path.exists(stored)
+    assert cleanup_unused_images("/documents/note.rtf", []) == 1
+
+
+def test_zoom_registers_display_image_at_new_size(qapp, image_dir, picture) -> None:
+    """Test that zooming repaints images from a copy scaled to their new size."""
+    stored, _, _ = save_image_to_storage(str(picture), "doc-a")
+    editor = QTextEdit()
+    image_format = QTextImageFormat()
+    image_format.setName(stored)
+    image_format.setWidth(300)
+    image_format.setHeight(150)
+    editor.textCursor().insertImage(image_format)
+    register_display_image(editor.document(), stored, 300, 150)
+
+    ZoomManager(editor).set_zoom(200)
+
+    cursor = editor.textCursor()
+    cursor.setPosition(1)
+    zoomed = cursor.charFormat().toImageFormat()
+    resource = editor.document().resource(
+        QTextDocument.ResourceType.ImageResource, QUrl(stored)
+    )
+    assert zoomed.width() > 300
+    assert (resource.width(), resource.height()) == (
+        int(zoomed.width()),
+        int(zoomed.height()),
+    )
+
+
+def test_lru_cache_evicts_by_count_and_cost() -> None:
+    """Test that the cache keeps the most recently used entries."""
+    cache = LRUCache(max_entries=3, max_cost=10, cost=len)
+    cache.put("a", "xxx")
+    cache.put("b", "xxx")
+    cache.put("c", "xxx")
+    assert cache.get("a") == "xxx"
+
+    cache.put("d", "xx")
+    assert "b" not in cache and len(cache) == 3
+    cache.put("e", "xxxxxx")
+    assert [key for key in "abcde" if key in cache] == ["d", "e"]
+    cache.put("huge", "x" * 11)
+    assert "huge" not in cache
@@ -40,6 +40,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from shared.services.query_executor import QueryExecutor
 from shared.ui.window_management import AuxiliaryWindow
 from tq.services import tq_analysis_service, tq_database_service
 from tq.utils.ternary_converter import decimal_to_ternary
@@ -88,7 +89,9 @@ class NumberDatabaseWindow(AuxiliaryWindow):
         # Add action buttons
         self._create_action_buttons(main_layout)
 
-        # Perform the database lookup
+        # Perform the database lookup in the background
+        self.lookup_executor = QueryExecutor(self)
+        self.lookup_executor.result_ready.connect(self._update_ui_with_results)
         self._perform_lookup()
 
         logger.debug(f"NumberDatabaseWindow initialized for number {number}")
@@ -253,13 +256,12 @@ class NumberDatabaseWindow(AuxiliaryWindow):
         layout.addLayout(buttons_layout)
 
     def _perform_lookup(self):
-        """Perform database lookup for the number."""
+        """Start the database lookup for the number; the UI updates when it completes."""
         # Get the database service
         db_service = tq_database_service.get_instance()
 
-        # Perform lookup and update UI
-        results = db_service.lookup_number(self.number)
-        self._update_ui_with_results(results)
+        number = self.number
+        self.lookup_executor.submit(lambda: db_service.lookup_number(number))
 
     def _update_ui_with_results(self, results: Dict[str, Any]):
         """Update UI with lookup results.
@@ -38,6 +38,7 @@ from gematria.services.calculation_database_service import CalculationDatabaseSe
 from gematria.services.search_service import SearchService
 from geometry.services.polygonal_visualization_service import PolygonalVisualizationService
 from shared.services.number_properties_service import NumberPropertiesService
+from shared.services.query_executor import QueryExecutor
 from shared.services.service_locator import ServiceLocator
 from tq.services.ternary_transition_service import TernaryTransitionService
 from tq.services.tq_grid_service import TQGridService
@@ -316,8 +317,11 @@ class PropertiesTab(QWidget):
         # Store current number
         self.current_number = 0
 
-        # Connect button signal
+        # Connect button signal; lookups run in the background
         self.lookup_button.clicked.connect(self._lookup_in_database)
+        self.lookup_executor = QueryExecutor(self)
+        self.lookup_executor.result_ready.connect(self._show_lookup_results)
+        self.lookup_executor.query_failed.connect(self._show_lookup_error)
 
     def _lookup_in_database(self) -> None:
         """Look up the current number in the calculation database."""
@@ -330,10 +334,30 @@ class PropertiesTab(QWidget):
             calc_service = ServiceLocator.get(CalculationDatabaseService)
             if not calc_service:
                 raise RuntimeError("Calculation database service not available")
+        except Exception as e:
+            logger.error(f"Error looking up in database: {str(e)}")
+            error_msg = "Error looking up words in database."
+            if isinstance(e, RuntimeError):
+                error_msg = str(e)
+            self.results_label.setText(error_msg)
+            self.database.setExpanded(True)
+            return
+
+        # Find calculations with this value on the executor's worker thread
+        number = self.current_number
+        self.results_label.setText(f"Looking up {number}...")
+        self.lookup_executor.submit(
+            lambda: (number, calc_service.find_calculations_by_value(number))
+        )
 
-            # Find calculations with this value
-            results = calc_service.find_calculations_by_value(self.current_number)
+    def _show_lookup_results(self, lookup) -> None:
+        """Show the words found by a database lookup.
 
+        Args:
+            lookup: Tuple of (number, matching calculations)
+        """
+        number, results = lookup
+        try:
             if results:
                 # Format results with better organization
                 results_by_type = {}
@@ -355,20 +379,20 @@ class PropertiesTab(QWidget):
 
                 self.results_label.setText("\n".join(result_text).strip())
             else:
-                self.results_label.setText(
-                    f"No words found with value {self.current_number}."
-                )
+                self.results_label.setText(f"No words found with value {number}.")
 
         except Exception as e:
             logger.error(f"Error looking up in database: {str(e)}")
-            error_msg = "Error looking up words in database."
-            if isinstance(e, RuntimeError):
-                error_msg = str(e)
-            self.results_label.setText(error_msg)
+            self.results_label.setText("Error looking up words in database.")
 
         # Ensure the results are visible
         self.database.setExpanded(True)
 
+    def _show_lookup_error(self, message: str) -> None:
+        """Report a failed database lookup."""
+        self.results_label.setText("Error looking up words in database.")
+        self.database.setExpanded(True)
+
     def _send_to_transitions(self):
         """Send the aliquot sum and abundance/deficiency to the ternary transitions panel."""
         try: